@@ -0,0 +1,101 @@
+"""API v1 sys probes module.
+
+Provide the fast path of the health and readiness endpoints, served ahead of the FastAPI application
+"""
+
+from http import HTTPStatus
+
+from fastapi import FastAPI
+from opentelemetry.trace import SpanKind, TracerProvider
+from starlette.types import Message, Receive, Scope, Send
+
+from .health import HealthResponseModel, HealthStatusEnum
+from .readiness import ReadinessResponseModel, ReadinessStatusEnum, get_not_ready_components
+
+# The paths of the health and readiness routes of the API
+HEALTH_PATH: str = "/api/v1/sys/health"
+READINESS_PATH: str = "/api/v1/sys/readiness"
+
+
+# The start and body messages of a response
+ProbeResponse = tuple[Message, Message]
+
+
+def _encode_response(status: HTTPStatus, model: HealthResponseModel | ReadinessResponseModel) -> ProbeResponse:
+    """Encode the messages of the response of a probe once, the body as the routes of the API serialize it.
+
+    Args:
+        status (HTTPStatus): The status of the response.
+        model (HealthResponseModel | ReadinessResponseModel): The body of the response.
+
+    Returns:
+        ProbeResponse: The start and body messages.
+    """
+    body: bytes = model.model_dump_json().encode()
+    return (
+        {
+            "type": "http.response.start",
+            "status": status.value,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        },
+        {"type": "http.response.body", "body": body},
+    )
+
+
+HEALTHY_RESPONSE: ProbeResponse = _encode_response(HTTPStatus.OK, HealthResponseModel(status=HealthStatusEnum.HEALTHY))
+READY_RESPONSE: ProbeResponse = _encode_response(
+    HTTPStatus.OK, ReadinessResponseModel(status=ReadinessStatusEnum.READY)
+)
+NOT_READY_RESPONSE: ProbeResponse = _encode_response(
+    HTTPStatus.SERVICE_UNAVAILABLE, ReadinessResponseModel(status=ReadinessStatusEnum.NOT_READY)
+)
+
+
+class ProbesFastPath:
+    """ASGI application serving the health and readiness probes, forwarding the other calls to the application.
+
+    The probes are answered with pre-encoded responses, on the event loop, without going through the
+    middlewares, the routing and the validation of the application: the kubelet probes every instance at
+    a high frequency. They are not traced, unless asked for, the instrumentation of the application being
+    skipped as well.
+    """
+
+    def __init__(self, app: FastAPI, traced: bool = False) -> None:
+        """Instantiate the fast path.
+
+        Args:
+            app (FastAPI): The application, its readiness checks being the ones of the readiness probe.
+            traced (bool, optional): Whether a span is recorded by probe, with the tracer provider of the
+                OpenTelemetry plugin. Defaults to False.
+        """
+        self._app: FastAPI = app
+        self._traced: bool = traced
+
+    def _get_response(self, path: str) -> ProbeResponse:
+        if path == HEALTH_PATH:
+            return HEALTHY_RESPONSE
+        return NOT_READY_RESPONSE if len(get_not_ready_components(self._app)) > 0 else READY_RESPONSE
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Serve the probes, and forward the other calls to the application."""
+        if scope["type"] != "http" or scope["method"] != "GET" or scope["path"] not in (HEALTH_PATH, READINESS_PATH):
+            await self._app(scope, receive, send)
+            return
+
+        start, body = self._get_response(scope["path"])
+        tracer_provider: TracerProvider | None = getattr(self._app.state, "tracer_provider", None)
+        if not self._traced or tracer_provider is None:
+            await send(start)
+            await send(body)
+            return
+        with tracer_provider.get_tracer(__name__).start_as_current_span(
+            name=f"GET {scope['path']}",
+            kind=SpanKind.SERVER,
+            attributes={
+                "http.request.method": "GET",
+                "http.route": scope["path"],
+                "http.response.status_code": start["status"],
+            },
+        ):
+            await send(start)
+            await send(body)
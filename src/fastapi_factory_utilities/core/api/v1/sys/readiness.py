@@ -3,14 +3,18 @@
 Provide the Get readiness endpoint
 """
 
+from collections.abc import Callable
 from enum import StrEnum
 from http import HTTPStatus
 
-from fastapi import APIRouter, Response
+from fastapi import APIRouter, FastAPI, Request, Response
 from pydantic import BaseModel
 
 api_v1_sys_readiness = APIRouter(prefix="/readiness")
 
+# A check of the readiness of a component, True when ready
+ReadinessCheck = Callable[[], bool]
+
 
 class ReadinessStatusEnum(StrEnum):
     """Readiness status enum."""
@@ -25,6 +29,32 @@ class ReadinessResponseModel(BaseModel):
     status: ReadinessStatusEnum
 
 
+def add_readiness_check(asgi_app: FastAPI, name: str, check: ReadinessCheck) -> None:
+    """Add a check to the readiness of the application, replacing the check of the same name.
+
+    Args:
+        asgi_app (FastAPI): The ASGI application.
+        name (str): The name of the component checked.
+        check (ReadinessCheck): The check, True when the component is ready.
+    """
+    if not hasattr(asgi_app.state, "readiness_checks"):
+        asgi_app.state.readiness_checks = {}
+    asgi_app.state.readiness_checks[name] = check
+
+
+def get_not_ready_components(asgi_app: FastAPI) -> list[str]:
+    """Get the components of the application which are not ready.
+
+    Args:
+        asgi_app (FastAPI): The ASGI application.
+
+    Returns:
+        list[str]: The names of the components not ready.
+    """
+    checks: dict[str, ReadinessCheck] = getattr(asgi_app.state, "readiness_checks", {})
+    return [name for name, check in checks.items() if not check()]
+
+
 @api_v1_sys_readiness.get(
     path="",
     tags=["sys"],
@@ -34,20 +64,28 @@ class ReadinessResponseModel(BaseModel):
             "model": ReadinessResponseModel,
             "description": "Readiness status.",
         },
+        HTTPStatus.SERVICE_UNAVAILABLE.value: {
+            "model": ReadinessResponseModel,
+            "description": "Not ready, a component is not ready.",
+        },
         HTTPStatus.INTERNAL_SERVER_ERROR.value: {
             "model": ReadinessResponseModel,
             "description": "Internal server error.",
         },
     },
 )
-def get_api_v1_sys_readiness(response: Response) -> ReadinessResponseModel:
+def get_api_v1_sys_readiness(request: Request, response: Response) -> ReadinessResponseModel:
     """Get the readiness of the system.
 
     Args:
+        request (Request): The request object.
         response (Response): The response object.
 
     Returns:
         ReadinessResponse: The readiness status.
     """
+    if len(get_not_ready_components(request.app)) > 0:
+        response.status_code = HTTPStatus.SERVICE_UNAVAILABLE
+        return ReadinessResponseModel(status=ReadinessStatusEnum.NOT_READY)
     response.status_code = HTTPStatus.OK
     return ReadinessResponseModel(status=ReadinessStatusEnum.READY)
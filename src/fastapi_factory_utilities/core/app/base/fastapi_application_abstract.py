@@ -8,6 +8,8 @@ from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, ConfigDict, Field
 
+from fastapi_factory_utilities.core.api.v1.sys.probes import ProbesFastPath
+
 
 class FastAPIConfigAbstract(ABC, BaseModel):
     """Partial configuration for FastAPI."""
@@ -33,6 +35,12 @@ class FastAPIConfigAbstract(ABC, BaseModel):
     reload: bool = Field(default=False, strict=False)
     workers: int = Field(default=1, strict=False)
 
+    # Health and readiness probes, served ahead of the middlewares
+    probes_fast_path: bool = Field(
+        default=True, description="Whether the probes are served as pre-encoded responses ahead of the FastAPI stack."
+    )
+    probes_traced: bool = Field(default=False, description="Whether the probes served by the fast path are traced.")
+
 
 class FastAPIAbstract(ABC):
     """Application integration with FastAPI.
@@ -79,10 +87,17 @@ class FastAPIAbstract(ABC):
         if api_router is not None:
             self._fastapi_app.include_router(router=api_router)
 
+        # The routes of the probes stay in the OpenAPI schema, and serve them without the fast path
+        self._asgi_app: starlette.types.ASGIApp = (
+            ProbesFastPath(app=self._fastapi_app, traced=config.probes_traced)
+            if config.probes_fast_path
+            else self._fastapi_app
+        )
+
     def get_asgi_app(self) -> FastAPI:
         """Get the ASGI application."""
         return self._fastapi_app
 
     async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
-        """Forward the call to the FastAPI app."""
-        return await self._fastapi_app.__call__(scope=scope, receive=receive, send=send)
+        """Forward the call to the FastAPI app, through the fast path of the probes if enabled."""
+        return await self._asgi_app(scope, receive, send)
@@ -1,11 +1,15 @@
 """Plugins manager abstract module."""
 
+import asyncio
+import time
 from abc import ABC
+from collections.abc import Awaitable, Callable
 from importlib import import_module
 from types import ModuleType
-from typing import cast
+from typing import ClassVar, cast
 
 from pydantic import BaseModel, ConfigDict, Field
+from structlog.stdlib import BoundLogger, get_logger
 
 from fastapi_factory_utilities.core.plugins import PluginsEnum
 from fastapi_factory_utilities.core.protocols import (
@@ -20,14 +24,30 @@ from fastapi_factory_utilities.core.utils.configs import (
 
 from .exceptions import ApplicationPluginManagerException
 
+_logger: BoundLogger = get_logger()
+
 
 class PluginsActivationList(BaseModel):
     """Model for the plugins activation list."""
 
+    DEFAULT_PLUGIN_TIMEOUT_IN_SECONDS: ClassVar[float] = 30.0
+
     model_config = ConfigDict(extra="forbid")
 
     activate: list[PluginsEnum] = Field(default=list())
 
+    startup_timeout: float = Field(
+        default=DEFAULT_PLUGIN_TIMEOUT_IN_SECONDS,
+        gt=0,
+        description="The timeout in seconds for the startup of each plugin.",
+    )
+
+    shutdown_timeout: float = Field(
+        default=DEFAULT_PLUGIN_TIMEOUT_IN_SECONDS,
+        gt=0,
+        description="The timeout in seconds for the shutdown of each plugin.",
+    )
+
 
 class ApplicationPluginManagerAbstract(ABC):
     """Abstract class for the application plugin manager.
@@ -35,8 +55,9 @@ class ApplicationPluginManagerAbstract(ABC):
     Responsibilities:
     - Retrieve the plugins for the application.
     - Check the pre-conditions for the plugins.
-    - Perform actions on startup for the plugins.
-    - Perform actions on shutdown for the plugins.
+    - Order the plugins according to their dependencies (DEPENDS_ON).
+    - Perform actions on startup for the plugins, concurrently for independent plugins.
+    - Perform actions on shutdown for the plugins, in the reverse order of the startup.
     """
 
     PACKAGE_NAME: str = ""
@@ -48,7 +69,8 @@ class ApplicationPluginManagerAbstract(ABC):
         if self.PACKAGE_NAME == "":
             raise ValueError("The package name must be set in the concrete plugin manager class.")
 
-        self._plugins: list[PluginProtocol] = []
+        self._plugins: dict[PluginsEnum, PluginProtocol] = {}
+        self._plugins_startup_timings: dict[PluginsEnum, float] = {}
         self._plugins_activation_list: PluginsActivationList
         if plugin_activation_list is not None:
             self._plugins_activation_list = plugin_activation_list
@@ -79,13 +101,68 @@ class ApplicationPluginManagerAbstract(ABC):
             if not plugin_module.pre_conditions_check(application=cast(BaseApplicationProtocol, self)):
                 raise ApplicationPluginManagerException(f"The plugin {plugin.value} does not meet the pre-conditions")
 
-            self._plugins.append(plugin_module)
+            self._plugins[plugin] = plugin_module
+
+        self._plugins = {plugin: self._plugins[plugin] for plugin in self._resolve_plugins_order()}
+
+    def _get_plugin_dependencies(self, plugin: PluginsEnum) -> list[PluginsEnum]:
+        """Get the plugins a plugin depends on.
+
+        Args:
+            plugin (PluginsEnum): The plugin.
+
+        Returns:
+            list[PluginsEnum]: Its DEPENDS_ON, none for the plugins not declaring it.
+        """
+        return list(getattr(self._plugins[plugin], "DEPENDS_ON", []))
+
+    def _resolve_plugins_order(self) -> list[PluginsEnum]:
+        """Resolve the topological order of the activated plugins from their dependencies.
+
+        Returns:
+            list[PluginsEnum]: The plugins, each one after all its dependencies.
+
+        Raises:
+            ApplicationPluginManagerException: If a dependency is not activated
+            or if there is a dependency cycle.
+        """
+        for plugin in self._plugins:
+            for dependency in self._get_plugin_dependencies(plugin):
+                if dependency not in self._plugins:
+                    raise ApplicationPluginManagerException(
+                        f"The plugin {plugin.value} depends on the plugin {dependency.value} which is not activated"
+                    )
+
+        ordered: list[PluginsEnum] = []
+        remaining: list[PluginsEnum] = list(self._plugins)
+        while len(remaining) != 0:
+            ready: list[PluginsEnum] = [
+                plugin
+                for plugin in remaining
+                if all(dependency in ordered for dependency in self._get_plugin_dependencies(plugin))
+            ]
+            if len(ready) == 0:
+                raise ApplicationPluginManagerException(
+                    f"Dependency cycle detected between the plugins {[plugin.value for plugin in remaining]}"
+                )
+            ordered.extend(ready)
+            remaining = [plugin for plugin in remaining if plugin not in ready]
+
+        return ordered
 
     def _on_load(self) -> None:
         """Actions to perform on load for the plugins."""
-        for plugin in self._plugins:
+        for plugin in self._plugins.values():
             plugin.on_load(application=cast(BaseApplicationProtocol, self))
 
+    def get_plugins_startup_timings(self) -> dict[PluginsEnum, float]:
+        """Get the startup duration in seconds of each plugin.
+
+        Returns:
+            dict[PluginsEnum, float]: The startup duration in seconds of each plugin (empty before the startup).
+        """
+        return dict(self._plugins_startup_timings)
+
     def _build_plugins_activation_list(self) -> PluginsActivationList:
         """Build the plugins activation list.
 
@@ -115,22 +192,120 @@ class ApplicationPluginManagerAbstract(ABC):
 
         return config
 
-    async def plugins_on_startup(self) -> None:
-        """Actions to perform on startup for the plugins."""
-        for plugin in self._plugins:
+    async def _run_plugins_hooks(
+        self,
+        hook_name: str,
+        dependencies: dict[PluginsEnum, list[PluginsEnum]],
+        timeout: float,
+        best_effort: bool = False,
+    ) -> dict[PluginsEnum, float]:
+        """Run a hook of all the plugins, each one as soon as its dependencies are done.
+
+        Args:
+            hook_name (str): The name of the hook to run (on_startup or on_shutdown).
+            dependencies (dict[PluginsEnum, list[PluginsEnum]]): The plugins to wait for, by plugin.
+            timeout (float): The timeout in seconds for the hook of each plugin.
+            best_effort (bool, optional): Whether the hooks of all the plugins are run despite the failures,
+                raised together once all are done. Defaults to False (the first failure cancels the others,
+                the dependents of a failed plugin are not run).
+
+        Returns:
+            dict[PluginsEnum, float]: The duration in seconds of the hook of each plugin.
+
+        Raises:
+            ApplicationPluginManagerException: If the hook of a plugin fails or times out.
+        """
+        timings: dict[PluginsEnum, float] = {}
+        tasks: dict[PluginsEnum, asyncio.Task[None]] = {}
+
+        async def run_hook(plugin: PluginsEnum, waits_for: list[asyncio.Task[None]]) -> None:
+            if len(waits_for) != 0:
+                await asyncio.wait(waits_for)
+                if not best_effort and any(task.cancelled() or task.exception() is not None for task in waits_for):
+                    return
+            hook: Callable[..., Awaitable[None]] = getattr(self._plugins[plugin], hook_name)
+            start_timer: float = time.perf_counter()
             try:
-                await plugin.on_startup(application=cast(BaseApplicationProtocol, self))
-            except Exception as exception:
+                await asyncio.wait_for(hook(application=cast(BaseApplicationProtocol, self)), timeout=timeout)
+            except TimeoutError as exception:
                 raise ApplicationPluginManagerException(
-                    f"Error during the startup of the plugin {plugin.__class__.__name__}"
+                    f"Timeout of {timeout}s reached during the {hook_name} of the plugin {plugin.value}"
                 ) from exception
-
-    async def plugins_on_shutdown(self) -> None:
-        """Actions to perform on shutdown for the plugins."""
-        for plugin in self._plugins:
-            try:
-                await plugin.on_shutdown(application=cast(BaseApplicationProtocol, self))
             except Exception as exception:
                 raise ApplicationPluginManagerException(
-                    f"Error during the shutdown of the plugin {plugin.__class__.__name__}"
+                    f"Error during the {hook_name} of the plugin {plugin.value}"
                 ) from exception
+            timings[plugin] = time.perf_counter() - start_timer
+
+        # The dependencies are always scheduled before their dependents
+        for plugin, plugin_dependencies in dependencies.items():
+            tasks[plugin] = asyncio.create_task(
+                run_hook(plugin=plugin, waits_for=[tasks[dependency] for dependency in plugin_dependencies])
+            )
+
+        if best_effort:
+            results: list[BaseException | None] = await asyncio.gather(*tasks.values(), return_exceptions=True)
+            errors: list[BaseException] = [result for result in results if result is not None]
+            for error in errors:
+                _logger.error(str(error), exc_info=error)
+            if len(errors) != 0:
+                raise ApplicationPluginManagerException(
+                    f"{len(errors)} plugin(s) failed during the {hook_name}: {[str(error) for error in errors]}"
+                ) from errors[0]
+            return timings
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+
+        return timings
+
+    async def plugins_on_startup(self) -> None:
+        """Actions to perform on startup for the plugins.
+
+        Independent plugins are started concurrently, a plugin is started once all its dependencies are started.
+
+        Raises:
+            ApplicationPluginManagerException: If the startup of a plugin fails or times out.
+        """
+        start_timer: float = time.perf_counter()
+        self._plugins_startup_timings = await self._run_plugins_hooks(
+            hook_name="on_startup",
+            dependencies={plugin: self._get_plugin_dependencies(plugin) for plugin in self._plugins},
+            timeout=self._plugins_activation_list.startup_timeout,
+        )
+        _logger.info(
+            "Plugins started.",
+            total_duration_s=round(time.perf_counter() - start_timer, 4),
+            plugins_durations_s={
+                plugin.value: round(duration, 4) for plugin, duration in self._plugins_startup_timings.items()
+            },
+        )
+
+    async def plugins_on_shutdown(self) -> None:
+        """Actions to perform on shutdown for the plugins.
+
+        A plugin is stopped once all the plugins depending on it are stopped, or failed to: the shutdown is
+        best effort, each plugin releasing its resources whatever the others do.
+
+        Raises:
+            ApplicationPluginManagerException: If the shutdown of plugins failed or timed out, once all are done.
+        """
+        dependents: dict[PluginsEnum, list[PluginsEnum]] = {
+            plugin: [dependent for dependent in self._plugins if plugin in self._get_plugin_dependencies(dependent)]
+            for plugin in reversed(self._plugins)
+        }
+        timings: dict[PluginsEnum, float] = await self._run_plugins_hooks(
+            hook_name="on_shutdown",
+            dependencies=dependents,
+            timeout=self._plugins_activation_list.shutdown_timeout,
+            best_effort=True,
+        )
+        _logger.debug(
+            "Plugins stopped.",
+            plugins_durations_s={plugin.value: round(duration, 4) for plugin, duration in timings.items()},
+        )
@@ -1,18 +1,30 @@
 """Oriented Data Model (ODM) plugin package."""
 
+import asyncio
+from functools import partial
 from logging import INFO, Logger, getLogger
-from typing import Any
+from typing import Any, cast
 
 from beanie import init_beanie  # pyright: ignore[reportUnknownVariableType]
-from motor.motor_asyncio import AsyncIOMotorClient
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 from structlog.stdlib import BoundLogger, get_logger
 
+from fastapi_factory_utilities.core.api.v1.sys.readiness import add_readiness_check
+from fastapi_factory_utilities.core.plugins import PluginsEnum
 from fastapi_factory_utilities.core.protocols import BaseApplicationProtocol
 
 from .builder import ODMBuilder
+from .change_streams import ChangeStreamInvalidationWatcher
+from .configs import ODMBackend
+from .exceptions import ODMPluginConfigError
+from .indexes import IndexSyncMode, IndexSyncReport, sync_document_models_indexes
+from .resilience import CircuitBreaker, CircuitState, repository_resilience
+from .write_behind import close_write_behind_buffers
 
 _logger: BoundLogger = get_logger()
 
+DEPENDS_ON: list[PluginsEnum] = []
+
 
 def pre_conditions_check(application: BaseApplicationProtocol) -> bool:
     """Check the pre-conditions for the OpenTelemetry plugin.
@@ -47,9 +59,11 @@ async def on_startup(
 ) -> None:
     """Actions to perform on startup for the ODM plugin.
 
+    The client is built at once, the connection and the initialization of the document models run in the
+    background: the server and the other plugins start meanwhile, the application being not ready until then.
+
     Args:
         application (BaseApplicationProtocol): The application.
-        odm_config (ODMConfig): The ODM configuration.
 
     Returns:
         None
@@ -68,21 +82,132 @@ async def on_startup(
     # TODO: Find a way to add type to the state
     application.get_asgi_app().state.odm_client = odm_factory.odm_client
     application.get_asgi_app().state.odm_database = odm_factory.odm_database
+    application.get_asgi_app().state.odm_index_sync_task = None
+    application.get_asgi_app().state.odm_change_stream_watchers = []
+
+    circuit_breaker: CircuitBreaker | None = None
+    if odm_factory.config is not None:
+        if odm_factory.config.circuit_breaker is not None:
+            circuit_breaker = CircuitBreaker(policy=odm_factory.config.circuit_breaker)
+            # Not ready while the circuit is open, the traffic going to the other instances meanwhile
+            add_readiness_check(
+                asgi_app=application.get_asgi_app(),
+                name="odm_circuit_breaker",
+                check=partial(_is_circuit_breaker_closed, circuit_breaker),
+            )
+        repository_resilience.configure(retry_policy=odm_factory.config.retry_policy, circuit_breaker=circuit_breaker)
+
+    startup_task: asyncio.Task[None] = asyncio.create_task(
+        _connect_and_initialize(application=application, odm_factory=odm_factory), name="odm-startup"
+    )
+    startup_task.add_done_callback(_on_background_task_done)
+    add_readiness_check(
+        asgi_app=application.get_asgi_app(), name="odm", check=partial(_is_background_task_succeeded, startup_task)
+    )
+    application.get_asgi_app().state.odm_startup_task = startup_task
+
+
+async def _connect_and_initialize(application: BaseApplicationProtocol, odm_factory: ODMBuilder) -> None:
+    """Await the readiness of the client, then initialize the document models, their indexes and change streams.
+
+    Args:
+        application (BaseApplicationProtocol): The application.
+        odm_factory (ODMBuilder): The ODM factory, its client and database built.
+    """
+    odm_client: AsyncIOMotorClient[Any] = cast(AsyncIOMotorClient[Any], odm_factory.odm_client)
+    odm_database: AsyncIOMotorDatabase[Any] = cast(AsyncIOMotorDatabase[Any], odm_factory.odm_database)
+
+    # Each round of pings is bounded by the connection timeout, the application staying not ready meanwhile
+    while True:
+        try:
+            connection_duration: float = await odm_factory.wait_client_to_be_ready()
+            break
+        except ODMPluginConfigError as exception:
+            _logger.warning(f"ODM client is not ready yet, retrying. {exception}")
 
     # TODO: Find a better way to initialize beanie with the document models of the concrete application
     # through an hook in the application ?
     await init_beanie(
-        database=odm_factory.odm_database,
+        database=odm_database,
         document_models=application.ODM_DOCUMENT_MODELS,
+        # The indexes are synchronized below, according to the index sync mode
+        skip_indexes=True,
+    )
+
+    index_sync_mode: IndexSyncMode = (
+        odm_factory.config.index_sync_mode if odm_factory.config is not None else IndexSyncMode.BLOCKING
     )
+    if index_sync_mode == IndexSyncMode.BACKGROUND:
+        # Serve at once, the application is not ready until the indexes are built
+        index_sync_task: asyncio.Task[list[IndexSyncReport]] = asyncio.create_task(
+            sync_document_models_indexes(application.ODM_DOCUMENT_MODELS, index_sync_mode), name="odm-index-sync"
+        )
+        index_sync_task.add_done_callback(_on_background_task_done)
+        add_readiness_check(
+            asgi_app=application.get_asgi_app(),
+            name="odm_indexes",
+            check=partial(_is_background_task_succeeded, index_sync_task),
+        )
+        application.get_asgi_app().state.odm_index_sync_task = index_sync_task
+    else:
+        await sync_document_models_indexes(application.ODM_DOCUMENT_MODELS, index_sync_mode)
+
+    change_stream_watchers: list[ChangeStreamInvalidationWatcher] = []
+    if odm_factory.config is not None and odm_factory.config.change_stream_invalidation:
+        if odm_factory.config.backend == ODMBackend.MEMORY:
+            # The writes of the in-memory backend are only the ones of the process, seen by its caches
+            _logger.warning("ODM change stream invalidation is not supported by the in-memory backend.")
+        else:
+            change_stream_watchers = [
+                ChangeStreamInvalidationWatcher(collection=document_model.get_motor_collection())
+                for document_model in application.ODM_DOCUMENT_MODELS
+            ]
+            for watcher in change_stream_watchers:
+                watcher.start()
+    application.get_asgi_app().state.odm_change_stream_watchers = change_stream_watchers
 
     _logger.info(
-        f"ODM plugin started. Database: {odm_factory.odm_database.name} - "
-        f"Client: {odm_factory.odm_client.address} - "
+        f"ODM plugin started. Database: {odm_database.name} - "
+        f"Client: {odm_client.address} - "
+        f"Connection duration: {connection_duration:.3f}s - "
         f"Document models: {application.ODM_DOCUMENT_MODELS}"
     )
 
 
+def _is_background_task_succeeded(task: "asyncio.Task[Any]") -> bool:
+    """Check a background task of the startup, the connection or the synchronization of the indexes, succeeded.
+
+    Args:
+        task (asyncio.Task[Any]): The task.
+
+    Returns:
+        bool: True if the task is done without error.
+    """
+    return task.done() and not task.cancelled() and task.exception() is None
+
+
+def _is_circuit_breaker_closed(circuit_breaker: CircuitBreaker) -> bool:
+    """Check the circuit breaker of the repository operations lets them through.
+
+    Args:
+        circuit_breaker (CircuitBreaker): The circuit breaker.
+
+    Returns:
+        bool: True if the circuit is not open, the half-open one letting the probes through.
+    """
+    return circuit_breaker.state != CircuitState.OPEN
+
+
+def _on_background_task_done(task: "asyncio.Task[Any]") -> None:
+    """Log the failure of a background task of the startup, the application stays not ready.
+
+    Args:
+        task (asyncio.Task[Any]): The task.
+    """
+    if not task.cancelled() and task.exception() is not None:
+        _logger.error(f"ODM {task.get_name()} failed. {task.exception()}")
+
+
 async def on_shutdown(application: BaseApplicationProtocol) -> None:
     """Actions to perform on shutdown for the ODM plugin.
 
@@ -92,6 +217,27 @@ async def on_shutdown(application: BaseApplicationProtocol) -> None:
     Returns:
         None
     """
-    client: AsyncIOMotorClient[Any] = application.get_asgi_app().state.odm_client
-    client.close()
+    startup_task: asyncio.Task[None] | None = getattr(application.get_asgi_app().state, "odm_startup_task", None)
+    if startup_task is not None and not startup_task.done():
+        startup_task.cancel()
+        await asyncio.gather(startup_task, return_exceptions=True)
+
+    watchers: list[ChangeStreamInvalidationWatcher] = getattr(
+        application.get_asgi_app().state, "odm_change_stream_watchers", []
+    )
+    await asyncio.gather(*(watcher.stop() for watcher in watchers))
+    # Before closing the client, the entities queued must be written
+    await close_write_behind_buffers()
+
+    index_sync_task: asyncio.Task[list[IndexSyncReport]] | None = getattr(
+        application.get_asgi_app().state, "odm_index_sync_task", None
+    )
+    if index_sync_task is not None and not index_sync_task.done():
+        index_sync_task.cancel()
+
+    repository_resilience.configure(retry_policy=None, circuit_breaker=None)
+
+    client: AsyncIOMotorClient[Any] | None = getattr(application.get_asgi_app().state, "odm_client", None)
+    if client is not None:
+        client.close()
     _logger.debug("ODM plugin shutdown.")
@@ -0,0 +1,130 @@
+"""Provides the builders of the aggregation stages run by `AbstractRepository.aggregate`."""
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+# The stages of an aggregation pipeline, in order
+Pipeline = Sequence[Mapping[str, Any]]
+
+# The name of the field counted by the `$count` stage, and by the `$sum` accumulator of `count_by`
+COUNT_FIELD: str = "count"
+
+
+def field_path(field: str) -> str:
+    """Get the path expression of a field, `id` being the ID of the documents.
+
+    Args:
+        field (str): The field, dotted for an embedded one.
+
+    Returns:
+        str: The path expression, e.g. `$book_type`.
+    """
+    return "$_id" if field == "id" else f"${field}"
+
+
+def match(filters: Mapping[str, Any]) -> dict[str, Any]:
+    """Build a `$match` stage, keeping the documents matching the filters.
+
+    Put first, it selects the documents through the indexes as a find does.
+
+    Args:
+        filters (Mapping[str, Any]): The MongoDB filters.
+
+    Returns:
+        dict[str, Any]: The stage.
+    """
+    return {"$match": dict(filters)}
+
+
+def group(by: str | Mapping[str, str] | None, **accumulators: Mapping[str, Any]) -> dict[str, Any]:
+    """Build a `$group` stage, one output document by distinct key, its `_id`.
+
+    ```python
+    group("book_type", pages={"$sum": "$pages"}, count={"$sum": 1})
+    ```
+
+    Args:
+        by (str | Mapping[str, str] | None): The field grouped by, the output fields and the fields of a
+            compound key, or None for one group of all the documents.
+        **accumulators (Mapping[str, Any]): The accumulators of the output fields (e.g. `{"$sum": 1}`).
+
+    Returns:
+        dict[str, Any]: The stage.
+    """
+    key: Any = None
+    if isinstance(by, str):
+        key = field_path(by)
+    elif by is not None:
+        key = {name: field_path(field) for name, field in by.items()}
+    return {"$group": {"_id": key, **{name: dict(accumulator) for name, accumulator in accumulators.items()}}}
+
+
+def count_by(by: str | Mapping[str, str] | None) -> dict[str, Any]:
+    """Build a `$group` stage counting the documents by key, in the `COUNT_FIELD` field.
+
+    Args:
+        by (str | Mapping[str, str] | None): The field grouped by, or the fields of a compound key.
+
+    Returns:
+        dict[str, Any]: The stage.
+    """
+    return group(by, **{COUNT_FIELD: {"$sum": 1}})
+
+
+def count(field: str = COUNT_FIELD) -> dict[str, Any]:
+    """Build a `$count` stage, one output document with the number of documents, none if there is none.
+
+    Args:
+        field (str, optional): The output field. Defaults to COUNT_FIELD.
+
+    Returns:
+        dict[str, Any]: The stage.
+    """
+    return {"$count": field}
+
+
+def facet(**pipelines: Pipeline) -> dict[str, Any]:
+    """Build a `$facet` stage, running sub-pipelines on the same documents in one command.
+
+    The output document has one field by sub-pipeline, the list of its output documents.
+
+    ```python
+    facet(total=[count()], per_book_type=[count_by("book_type")])
+    ```
+
+    Args:
+        **pipelines (Pipeline): The sub-pipelines, by output field.
+
+    Returns:
+        dict[str, Any]: The stage.
+    """
+    return {"$facet": {name: [dict(stage) for stage in pipeline] for name, pipeline in pipelines.items()}}
+
+
+def sort(*fields: tuple[str, int]) -> dict[str, Any]:
+    """Build a `$sort` stage.
+
+    Args:
+        *fields (tuple[str, int]): The (field, direction) to sort on.
+
+    Returns:
+        dict[str, Any]: The stage.
+    """
+    return {"$sort": {"_id" if field == "id" else field: direction for field, direction in fields}}
+
+
+def limit(size: int) -> dict[str, Any]:
+    """Build a `$limit` stage.
+
+    Args:
+        size (int): The maximum number of documents.
+
+    Returns:
+        dict[str, Any]: The stage.
+
+    Raises:
+        ValueError: If the size is not positive.
+    """
+    if size < 1:
+        raise ValueError(f"The limit must be positive, got {size}.")
+    return {"$limit": size}
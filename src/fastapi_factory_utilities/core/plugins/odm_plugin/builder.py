@@ -1,10 +1,16 @@
 """Provides the module for the ODM plugin."""
 
 import asyncio
+import random
 import time
-from typing import Any, Self
+from typing import Any, Self, cast
 
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from opentelemetry.instrumentation.pymongo import (  # pyright: ignore[reportMissingTypeStubs]
+    PymongoInstrumentor,
+)
+from pymongo import monitoring
+from pymongo.errors import PyMongoError
 from structlog.stdlib import get_logger
 
 from fastapi_factory_utilities.core.protocols import BaseApplicationProtocol
@@ -14,8 +20,11 @@ from fastapi_factory_utilities.core.utils.yaml_reader import (
     YamlFileReader,
 )
 
-from .configs import ODMConfig
+from .configs import S_TO_MS, ODMBackend, ODMConfig
 from .exceptions import ODMPluginConfigError
+from .in_memory import InMemoryClient
+from .listeners import PoolMetricsListener, set_sanitized_statement
+from .slow_queries import SlowQueryListener
 
 _logger = get_logger()
 
@@ -32,12 +41,17 @@ class ODMBuilder:
     # Example of using the ODMFactory
     odm_factory: ODMFactory = ODMFactory(application=application)
     odm_factory.build_all()
+    await odm_factory.wait_client_to_be_ready()
     # Access the ODM database created
     database: AsyncIOMotorDatabase[Any] = odm_factory.database
     ```
 
     """
 
+    # Backoff between two pings of the readiness probe
+    READINESS_BACKOFF_INITIAL_S: float = 0.01
+    READINESS_BACKOFF_MAX_S: float = 1.0
+
     def __init__(
         self,
         application: BaseApplicationProtocol,
@@ -111,6 +125,7 @@ class ODMBuilder:
                 ),
                 yaml_base_key="odm",
                 use_environment_injection=True,
+                use_cache=True,
             ).read()
         except (FileNotFoundError, ImportError, UnableToReadYamlFileError) as exception:
             raise ODMPluginConfigError("Unable to read the application configuration file.") from exception
@@ -122,43 +137,47 @@ class ODMBuilder:
             raise ODMPluginConfigError("Unable to create the application configuration model.") from exception
         return self
 
-    @classmethod
-    def _wait_client_to_be_ready(cls, client: AsyncIOMotorClient[Any], timeout_ms: int) -> None:
-        """Wait for the ODM client to be ready.
+    async def wait_client_to_be_ready(self) -> float:
+        """Wait for the ODM client to be ready without blocking the event loop.
 
-        Args:
-            client (AsyncIOMotorClient): The ODM client.
-            timeout_ms (int): The timeout in milliseconds.
+        The client is pinged with an exponential backoff and full jitter between the attempts,
+        until it answers or the connection timeout of the configuration is reached.
+
+        Returns:
+            float: The duration in seconds until the client was ready.
 
         Raises:
-            ODMPluginConfigError: If the ODM client is not ready.
+            ODMPluginConfigError: If the ODM client is not build or not ready before the deadline.
         """
-        start_timer = time.monotonic()
+        if self._odm_client is None or self._config is None:
+            raise ODMPluginConfigError(
+                "ODM client is not set. Provide the ODM client using build_client method or through parameter."
+            )
 
-        async def is_connected(client: AsyncIOMotorClient[Any]) -> bool:
-            """Check if the client is connected."""
+        start_timer: float = time.monotonic()
+        deadline: float = start_timer + self._config.connection_timeout_ms / S_TO_MS
+        attempt: int = 0
+        while True:
+            remaining: float = deadline - time.monotonic()
+            if remaining <= 0:
+                raise ODMPluginConfigError(
+                    f"ODM client is not ready after {self._config.connection_timeout_ms}ms ({attempt} attempts)."
+                )
             try:
-                await client.admin.command(
-                    command="ping",
-                )  # pyright: ignore
-                return True
-            except Exception:  # pylint: disable=broad-except
-                _logger.debug("ODM client is not ready.")
-                return False
-
-        loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
-
-        while not loop.run_in_executor(None, asyncio.Task(is_connected(client))) and (  # type: ignore
-            (time.monotonic() - start_timer) < timeout_ms
-        ):
-            if time.monotonic() - start_timer > timeout_ms:
-                raise ODMPluginConfigError("ODM client is not ready.")
-            time.sleep(0.01)
-
-        if not loop.run_in_executor(None, asyncio.Task(is_connected(client))):  # type: ignore
-            raise ODMPluginConfigError("ODM client is not ready.")
-
-    def build_client(
+                await asyncio.wait_for(self._odm_client.admin.command("ping"), timeout=remaining)
+                break
+            except (PyMongoError, TimeoutError) as exception:
+                _logger.debug(f"ODM client is not ready. {exception}")
+
+            attempt += 1
+            backoff: float = min(self.READINESS_BACKOFF_MAX_S, self.READINESS_BACKOFF_INITIAL_S * 2**attempt)
+            await asyncio.sleep(min(random.uniform(0, backoff), max(deadline - time.monotonic(), 0)))
+
+        connection_duration: float = time.monotonic() - start_timer
+        _logger.info(f"ODM client is ready after {connection_duration:.3f}s ({attempt + 1} attempts).")
+        return connection_duration
+
+    def build_client(  # noqa: PLR0912
         self,
     ) -> Self:
         """Build the ODM client.
@@ -178,14 +197,59 @@ class ODMBuilder:
                 "build_odm_config method or through parameter."
             )
 
+        if self._config.backend == ODMBackend.MEMORY:
+            # Stands for the Motor client, without any connection, listener or instrumentation
+            self._odm_client = cast(AsyncIOMotorClient[Any], InMemoryClient())
+            return self
+
+        pool_options: dict[str, Any] = {
+            "maxPoolSize": self._config.max_pool_size,
+            "minPoolSize": self._config.min_pool_size,
+            "maxConnecting": self._config.max_connecting,
+        }
+        if self._config.max_idle_time_ms is not None:
+            pool_options["maxIdleTimeMS"] = self._config.max_idle_time_ms
+        if self._config.wait_queue_timeout_ms is not None:
+            pool_options["waitQueueTimeoutMS"] = self._config.wait_queue_timeout_ms
+        if len(self._config.compressors) != 0:
+            pool_options["compressors"] = ",".join(self._config.compressors)
+
+        read_options: dict[str, Any] = {}
+        if self._config.read_options.read_preference is not None:
+            read_options["readPreference"] = self._config.read_options.read_preference.value
+        if self._config.read_options.max_staleness_s is not None:
+            read_options["maxStalenessSeconds"] = self._config.read_options.max_staleness_s
+        if self._config.read_options.read_concern is not None:
+            read_options["readConcernLevel"] = self._config.read_options.read_concern.value
+
+        event_listeners: list[monitoring.ConnectionPoolListener | monitoring.CommandListener] = []
+        if self._config.pool_metrics:
+            event_listeners.append(PoolMetricsListener())
+        slow_query_listener: SlowQueryListener | None = None
+        if self._config.slow_query_threshold_ms is not None:
+            slow_query_listener = SlowQueryListener(
+                threshold_ms=self._config.slow_query_threshold_ms,
+                explain_sample_rate=self._config.slow_query_explain_sample_rate,
+            )
+            event_listeners.append(slow_query_listener)
+        # The instrumentation registers a global listener, followed by the clients created afterwards
+        instrumentor: PymongoInstrumentor = PymongoInstrumentor()
+        if self._config.command_tracing and not instrumentor.is_instrumented_by_opentelemetry:
+            instrumentor.instrument(request_hook=set_sanitized_statement)
+
         self._odm_client = AsyncIOMotorClient(
             host=self._config.uri,
             connect=True,
             connectTimeoutMS=self._config.connection_timeout_ms,
             serverSelectionTimeoutMS=self._config.connection_timeout_ms,
+            event_listeners=event_listeners,
+            # The UUIDs are stored as binary UUIDs, and read back as UUIDs by the raw reads
+            uuidRepresentation="standard",
+            **pool_options,
+            **read_options,
         )
-
-        self._wait_client_to_be_ready(client=self._odm_client, timeout_ms=self._config.connection_timeout_ms)
+        if slow_query_listener is not None:
+            slow_query_listener.attach(self._odm_client)
 
         return self
 
@@ -216,7 +280,7 @@ class ODMBuilder:
 
         if self._odm_client is None:
             raise ODMPluginConfigError(
-                "ODM client is not set. Provide the ODM client using " "build_client method or through parameter."
+                "ODM client is not set. Provide the ODM client using build_client method or through parameter."
             )
 
         self._odm_database = self._odm_client.get_database(name=database_name)
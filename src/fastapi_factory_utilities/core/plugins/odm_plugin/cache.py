@@ -0,0 +1,194 @@
+"""Provides the read-through entity cache of the repositories."""
+
+import asyncio
+import time
+import weakref
+from collections import OrderedDict, defaultdict
+from collections.abc import Awaitable, Callable, Iterable
+from functools import partial
+from typing import Any, Generic, TypeVar
+from uuid import UUID
+
+from opentelemetry import metrics
+from pydantic import BaseModel
+
+EntityGenericType = TypeVar("EntityGenericType", bound=BaseModel)  # pylint: disable=invalid-name
+
+
+class EntityCache(Generic[EntityGenericType]):
+    """Bounded read-through cache of entities keyed by ID, with LRU and TTL eviction.
+
+    Concurrent reads of a missing key share a single load (stampede guard). An invalidation drops the
+    entry and detaches the load in progress, so that a value read before a write is never cached after it.
+    The cache is meant to outlive the repositories: build it once and give it to each repository.
+
+    Metrics:
+    - odm.cache.hits: the reads served by the cache.
+    - odm.cache.misses: the reads sent to the loader.
+    - odm.cache.evictions: the entries evicted, by reason (size or expired).
+    """
+
+    METER_COUNTER_HITS_NAME: str = "odm.cache.hits"
+    METER_COUNTER_MISSES_NAME: str = "odm.cache.misses"
+    METER_COUNTER_EVICTIONS_NAME: str = "odm.cache.evictions"
+
+    EVICTION_REASON_SIZE: str = "size"
+    EVICTION_REASON_EXPIRED: str = "expired"
+
+    DEFAULT_MAX_SIZE: int = 1024
+    DEFAULT_TTL_S: float = 60.0
+
+    def __init__(
+        self,
+        name: str,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl_s: float = DEFAULT_TTL_S,
+        meter: metrics.Meter | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cache and its instruments.
+
+        Args:
+            name (str): The name of the cache, in the attributes of the metrics.
+            max_size (int, optional): The maximum number of entries. Defaults to DEFAULT_MAX_SIZE.
+            ttl_s (float, optional): The time to live of the entries in seconds. Defaults to DEFAULT_TTL_S.
+            meter (metrics.Meter | None, optional): The meter to use. Defaults to None (meter of the global provider).
+            clock (Callable[[], float], optional): The monotonic clock in seconds. Defaults to time.monotonic.
+
+        Raises:
+            ValueError: If the maximum size or the time to live is not positive.
+        """
+        if max_size <= 0 or ttl_s <= 0:
+            raise ValueError(f"The max size and the TTL must be positive, got {max_size} and {ttl_s}.")
+        self._max_size: int = max_size
+        self._ttl_s: float = ttl_s
+        self._clock: Callable[[], float] = clock
+        self._attributes: dict[str, str] = {"cache.name": name}
+        # Entries by ID, from the least to the most recently used: (expiration time, entity)
+        self._entries: OrderedDict[UUID, tuple[float, EntityGenericType]] = OrderedDict()
+        self._loads: dict[UUID, asyncio.Future[EntityGenericType | None]] = {}
+
+        meter = meter if meter is not None else metrics.get_meter(__name__)
+        self._hits: metrics.Counter = meter.create_counter(
+            name=self.METER_COUNTER_HITS_NAME, unit="{read}", description="The number of reads served by the cache."
+        )
+        self._misses: metrics.Counter = meter.create_counter(
+            name=self.METER_COUNTER_MISSES_NAME, unit="{read}", description="The number of reads sent to the loader."
+        )
+        self._evictions: metrics.Counter = meter.create_counter(
+            name=self.METER_COUNTER_EVICTIONS_NAME,
+            unit="{entry}",
+            description="The number of entries evicted by reason.",
+        )
+
+    def __len__(self) -> int:
+        """Get the number of entries, expired or not."""
+        return len(self._entries)
+
+    async def get_or_load(
+        self, key: UUID, loader: Callable[[], Awaitable[EntityGenericType | None]]
+    ) -> EntityGenericType | None:
+        """Get the entity from the cache, or load it and cache it if it exists.
+
+        Args:
+            key (UUID): The ID of the entity.
+            loader (Callable[[], Awaitable[EntityGenericType | None]]): The loader of the entity.
+
+        Returns:
+            EntityGenericType | None: A copy of the entity, or None if the loader does not find it.
+        """
+        entry: tuple[float, EntityGenericType] | None = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > self._clock():
+                self._entries.move_to_end(key)
+                self._hits.add(amount=1, attributes=self._attributes)
+                return entry[1].model_copy()
+            del self._entries[key]
+            self._evictions.add(amount=1, attributes={**self._attributes, "reason": self.EVICTION_REASON_EXPIRED})
+
+        self._misses.add(amount=1, attributes=self._attributes)
+        load: asyncio.Future[EntityGenericType | None] | None = self._loads.get(key)
+        if load is None:
+            load = asyncio.ensure_future(loader())
+            self._loads[key] = load
+            load.add_done_callback(partial(self._on_loaded, key))
+        # Shielded, the load goes on for the other readers if this one is cancelled
+        entity: EntityGenericType | None = await asyncio.shield(load)
+        return entity.model_copy() if entity is not None else None
+
+    def _on_loaded(self, key: UUID, load: "asyncio.Future[EntityGenericType | None]") -> None:
+        """Cache the entity loaded, unless the key was invalidated during the load.
+
+        Args:
+            key (UUID): The ID of the entity.
+            load (asyncio.Future[EntityGenericType | None]): The load done.
+        """
+        detached: bool = self._loads.get(key) is not load
+        if not detached:
+            del self._loads[key]
+        # The exception is retrieved even when detached, the readers may all have been cancelled
+        if load.cancelled() or load.exception() is not None or detached:
+            return
+        entity: EntityGenericType | None = load.result()
+        if entity is None:
+            return
+
+        self._entries[key] = (self._clock() + self._ttl_s, entity)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions.add(amount=1, attributes={**self._attributes, "reason": self.EVICTION_REASON_SIZE})
+
+    def invalidate(self, key: UUID) -> None:
+        """Drop the entry of an entity and detach its load in progress.
+
+        Args:
+            key (UUID): The ID of the entity.
+        """
+        self._entries.pop(key, None)
+        self._loads.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all the entries and detach all the loads in progress."""
+        self._entries.clear()
+        self._loads.clear()
+
+
+class CacheInvalidationBus:
+    """Routes the invalidations of the documents of a collection to the entity caches of this process.
+
+    The caches are held weakly, the repositories subscribe their cache on each instantiation.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the bus without subscriber."""
+        self._caches: defaultdict[str, weakref.WeakSet[EntityCache[Any]]] = defaultdict(weakref.WeakSet)
+
+    def subscribe(self, collection_name: str, cache: EntityCache[Any]) -> None:
+        """Subscribe a cache to the invalidations of a collection.
+
+        Args:
+            collection_name (str): The name of the collection.
+            cache (EntityCache[Any]): The cache of the entities of the collection.
+        """
+        self._caches[collection_name].add(cache)
+
+    def publish(self, collection_name: str, entity_ids: Iterable[UUID] | None = None) -> None:
+        """Invalidate entities of a collection in the caches subscribed.
+
+        Args:
+            collection_name (str): The name of the collection.
+            entity_ids (Iterable[UUID] | None, optional): The IDs of the entities. Defaults to None (all the
+                entities).
+        """
+        caches: list[EntityCache[Any]] = list(self._caches.get(collection_name, ()))
+        if entity_ids is None:
+            for cache in caches:
+                cache.clear()
+            return
+        for entity_id in entity_ids:
+            for cache in caches:
+                cache.invalidate(entity_id)
+
+
+cache_invalidation_bus: CacheInvalidationBus = CacheInvalidationBus()
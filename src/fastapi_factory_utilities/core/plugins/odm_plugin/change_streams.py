@@ -0,0 +1,122 @@
+"""Provides the change stream watchers invalidating the entity caches on the writes of any process."""
+
+import asyncio
+import random
+from collections.abc import Mapping
+from typing import Any
+from uuid import UUID
+
+from bson import Binary
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo.errors import OperationFailure, PyMongoError
+from structlog.stdlib import BoundLogger, get_logger
+
+from .cache import CacheInvalidationBus, cache_invalidation_bus
+
+_logger: BoundLogger = get_logger()
+
+# The operations on a single document, the others (drop, rename, invalidate, ...) invalidate the whole collection
+DOCUMENT_OPERATION_TYPES: frozenset[str] = frozenset({"insert", "update", "replace", "delete"})
+# The resume token is no longer in the oplog (ChangeStreamHistoryLost, ChangeStreamFatalError)
+RESUME_TOKEN_LOST_ERROR_CODES: frozenset[int] = frozenset({280, 286})
+
+
+class ChangeStreamInvalidationWatcher:
+    """Watches the change stream of a collection and publishes the invalidation of the documents written.
+
+    The stream resumes after the last change seen when it reconnects (an election, a network error). The resume
+    token is kept in memory only: a new process starts with empty caches, and watches from now. When the stream
+    starts without a token, or cannot resume, all the entities of the collection are invalidated.
+    The change streams need a replica set or a sharded cluster.
+    """
+
+    RETRY_BACKOFF_INITIAL_S: float = 0.1
+    RETRY_BACKOFF_MAX_S: float = 10.0
+
+    def __init__(
+        self,
+        collection: AsyncIOMotorCollection[Any],
+        bus: CacheInvalidationBus = cache_invalidation_bus,
+    ) -> None:
+        """Initialize the watcher.
+
+        Args:
+            collection (AsyncIOMotorCollection[Any]): The collection to watch.
+            bus (CacheInvalidationBus, optional): The bus of the invalidations. Defaults to cache_invalidation_bus.
+        """
+        self._collection: AsyncIOMotorCollection[Any] = collection
+        self._bus: CacheInvalidationBus = bus
+        self._resume_token: Mapping[str, Any] | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def collection_name(self) -> str:
+        """The name of the collection watched."""
+        return self._collection.name
+
+    def start(self) -> None:
+        """Start watching in a background task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name=f"change-stream-{self.collection_name}")
+
+    async def stop(self) -> None:
+        """Stop watching."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        """Watch until stopped, reconnecting with backoff."""
+        backoff: float = self.RETRY_BACKOFF_INITIAL_S
+        while True:
+            try:
+                await self._watch()
+                backoff = self.RETRY_BACKOFF_INITIAL_S
+            except OperationFailure as error:
+                if error.code in RESUME_TOKEN_LOST_ERROR_CODES:
+                    _logger.warning(f"Change stream of {self.collection_name} cannot resume, restarting: {error}")
+                    self._resume_token = None
+                else:
+                    _logger.warning(f"Change stream of {self.collection_name} failed: {error}")
+            except PyMongoError as error:
+                _logger.warning(f"Change stream of {self.collection_name} failed: {error}")
+            # Full jitter, the replicas must not all reconnect at once
+            await asyncio.sleep(random.uniform(0, backoff))
+            backoff = min(backoff * 2, self.RETRY_BACKOFF_MAX_S)
+
+    async def _watch(self) -> None:
+        """Open the change stream and publish the invalidations until it is closed."""
+        async with self._collection.watch(
+            # Only what the invalidation needs, the documents themselves are not sent
+            pipeline=[{"$project": {"operationType": 1, "documentKey": 1}}],
+            resume_after=self._resume_token,
+        ) as stream:
+            if self._resume_token is None:
+                # The changes before the stream opened are unknown
+                self._bus.publish(self.collection_name)
+            async for change in stream:
+                self._publish(change)
+                self._resume_token = stream.resume_token
+            # The stream was invalidated (drop, rename), it cannot be resumed
+            self._resume_token = None
+
+    def _publish(self, change: Mapping[str, Any]) -> None:
+        """Publish the invalidation of a change.
+
+        Args:
+            change (Mapping[str, Any]): The change event.
+        """
+        if change.get("operationType") not in DOCUMENT_OPERATION_TYPES:
+            self._bus.publish(self.collection_name)
+            return
+
+        document_id: Any = change["documentKey"]["_id"]
+        if isinstance(document_id, Binary):
+            document_id = document_id.as_uuid()
+        if isinstance(document_id, UUID):
+            self._bus.publish(self.collection_name, [document_id])
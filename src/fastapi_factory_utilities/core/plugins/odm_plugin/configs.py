@@ -1,10 +1,26 @@
 """Provides the configuration for the ODM plugin."""
 
-from pydantic import BaseModel, ConfigDict
+from enum import StrEnum
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from .indexes import IndexSyncMode
+from .read_options import ReadOptions
+from .resilience import CircuitBreakerPolicy, RetryPolicy
 
 S_TO_MS = 1000
 
 
+class ODMBackend(StrEnum):
+    """The backends storing the documents."""
+
+    # The MongoDB server of the URI
+    MONGODB = "mongodb"
+    # The memory of the process, for the tests and the benchmarks, the URI is not used
+    MEMORY = "memory"
+
+
 class ODMConfig(BaseModel):
     """Provides the configuration model for the ODM plugin."""
 
@@ -12,6 +28,62 @@ class ODMConfig(BaseModel):
 
     uri: str
 
+    backend: ODMBackend = Field(default=ODMBackend.MONGODB, description="The backend storing the documents.")
+
     database: str = "test"
 
     connection_timeout_ms: int = 1 * S_TO_MS
+
+    # Connection pool (driver defaults when not set)
+    max_pool_size: int = Field(default=100, ge=0, description="The maximum number of connections per server.")
+    min_pool_size: int = Field(default=0, ge=0, description="The number of connections kept open per server.")
+    max_idle_time_ms: int | None = Field(
+        default=None, gt=0, description="The time a connection can stay idle before being closed."
+    )
+    wait_queue_timeout_ms: int | None = Field(
+        default=None, gt=0, description="The time to wait for a connection to be available in the pool."
+    )
+    max_connecting: int = Field(
+        default=2, gt=0, description="The maximum number of connections being established concurrently per server."
+    )
+    compressors: list[Literal["snappy", "zlib", "zstd"]] = Field(
+        default_factory=list, description="The wire compressors to negotiate, in order of preference."
+    )
+
+    pool_metrics: bool = Field(default=True, description="Whether to export the connection pool metrics.")
+    command_tracing: bool = Field(
+        default=True, description="Whether to trace the commands, with their statements sanitized."
+    )
+
+    # Slow-query log, the slow commands sampled are explained to summarize their plans
+    slow_query_threshold_ms: int | None = Field(
+        default=None, ge=0, description="The duration from which a command is logged as slow, None to disable."
+    )
+    slow_query_explain_sample_rate: float = Field(
+        default=0.0, ge=0.0, le=1.0, description="The share of the slow commands explained in the background."
+    )
+
+    read_options: ReadOptions = Field(
+        default_factory=ReadOptions,
+        description="The read preference and read concern of the client, the repositories can route their reads.",
+    )
+
+    index_sync_mode: IndexSyncMode = Field(
+        default=IndexSyncMode.BLOCKING,
+        description="How the indexes of the document models are synchronized on startup.",
+    )
+
+    # Invalidation of the entity caches on the writes of the other processes (needs a replica set)
+    change_stream_invalidation: bool = Field(
+        default=False, description="Whether to watch the change streams of the document models collections."
+    )
+
+    # Resilience of the repository operations to the elections and the outages of the cluster
+    retry_policy: RetryPolicy = Field(
+        default_factory=RetryPolicy,
+        description="The retries of the idempotent repository operations failed with a transient error.",
+    )
+    circuit_breaker: CircuitBreakerPolicy | None = Field(
+        default=None,
+        description="The circuit breaker failing the repository operations fast, None to disable it.",
+    )
@@ -1,16 +1,32 @@
 """Provides base document class for ODM plugins."""
 
 import datetime
-from typing import Annotated
+from copy import copy
+from typing import Annotated, Any, ClassVar
 from uuid import UUID, uuid4
 
 from beanie import Document, Indexed  # pyright: ignore[reportUnknownVariableType]
 from pydantic import Field
-from pymongo import DESCENDING
+from pymongo import DESCENDING, IndexModel
+
+from .ids import ID_FACTORIES, IdStrategy
 
 
 class BaseDocument(Document):
-    """Base document class."""
+    """Base document class.
+
+    The IDs are generated by the ID strategy of the document model, random UUIDs by default. The time-ordered
+    ones keep the inserts at the end of the _id index (stored as binary UUIDs, in the standard representation):
+
+    ```python
+    class EventDocument(BaseDocument):
+        id_strategy: ClassVar[IdStrategy] = IdStrategy.UUID7
+    ```
+
+    The entities generating their own IDs should use the same factory (`uuid7`), their IDs being kept.
+    """
+
+    id_strategy: ClassVar[IdStrategy] = IdStrategy.UUID4
 
     # To be agnostic of MongoDN, we use UUID as the document ID.
     id: UUID = Field(  # pyright: ignore[reportIncompatibleVariableOverride]
@@ -25,7 +41,24 @@ class BaseDocument(Document):
         default_factory=lambda: datetime.datetime.now(tz=datetime.UTC), description="Last update timestamp."
     )
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Generate the IDs of the document model with its ID strategy, unless it declares its own factory."""
+        super().__pydantic_init_subclass__(**kwargs)
+        id_field: Any = cls.model_fields["id"]
+        id_factory: Any = ID_FACTORIES[cls.id_strategy]
+        if id_field.default_factory is not id_factory and id_field.default_factory in ID_FACTORIES.values():
+            id_field = copy(id_field)
+            id_field.default_factory = id_factory
+            cls.model_fields["id"] = id_field
+            cls.model_rebuild(force=True)
+
     class Settings:
         """Meta class for BaseDocument."""
 
         use_revision = True
+
+        # Serves the keyset pagination of the repositories, which sorts on the creation date then on the ID.
+        indexes: ClassVar[list[IndexModel]] = [
+            IndexModel([("created_at", DESCENDING), ("_id", DESCENDING)], name="created_at_id_keyset")
+        ]
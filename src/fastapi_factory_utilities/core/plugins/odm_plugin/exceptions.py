@@ -1,5 +1,8 @@
 """Provides the exceptions for the ODM_Plugin."""
 
+from typing import Any
+from uuid import UUID
+
 
 class ODMPluginBaseException(BaseException):
     """Base exception for the ODM_Plugin."""
@@ -23,3 +26,63 @@ class OperationError(ODMPluginBaseException):
     """Exception for when an operation fails."""
 
     pass
+
+
+class UnableToCreateEntitiesDueToDuplicateKeyError(UnableToCreateEntityDueToDuplicateKeyError):
+    """Exception for when entities of a bulk operation cannot be created due to duplicate key errors.
+
+    Attributes:
+        duplicate_indexes (list[int]): The indexes, in the input, of the entities rejected as duplicates.
+        entities_created (list[Any]): The entities created by the bulk operation despite the duplicates.
+    """
+
+    def __init__(self, message: str, duplicate_indexes: list[int], entities_created: list[Any]) -> None:
+        """Initialize the exception.
+
+        Args:
+            message (str): The error message.
+            duplicate_indexes (list[int]): The indexes of the entities rejected as duplicates.
+            entities_created (list[Any]): The entities created.
+        """
+        super().__init__(message)
+        self.duplicate_indexes: list[int] = duplicate_indexes
+        self.entities_created: list[Any] = entities_created
+
+
+class InvalidPageCursorError(ODMPluginBaseException):
+    """Exception for when a page cursor cannot be decoded."""
+
+    pass
+
+
+class WriteBehindBufferClosedError(OperationError):
+    """Exception for when an entity is inserted in a closed write-behind buffer."""
+
+    pass
+
+
+class CircuitOpenError(OperationError):
+    """Exception for when an operation is failed fast, the circuit breaker being open."""
+
+    pass
+
+
+class RevisionConflictError(ODMPluginBaseException):
+    """Exception for when a document is not updated, its revision not being the one expected.
+
+    Attributes:
+        entity_id (UUID): The ID of the entity.
+        expected_revision (UUID | None): The revision expected.
+    """
+
+    def __init__(self, message: str, entity_id: UUID, expected_revision: UUID | None) -> None:
+        """Initialize the exception.
+
+        Args:
+            message (str): The error message.
+            entity_id (UUID): The ID of the entity.
+            expected_revision (UUID | None): The revision expected.
+        """
+        super().__init__(message)
+        self.entity_id: UUID = entity_id
+        self.expected_revision: UUID | None = expected_revision
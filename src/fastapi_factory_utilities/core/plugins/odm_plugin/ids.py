@@ -0,0 +1,63 @@
+"""Provides the strategies generating the IDs of the documents."""
+
+import os
+import threading
+import time
+from collections.abc import Callable
+from enum import StrEnum
+from uuid import UUID, uuid4
+
+_UUID7_COUNTER_MAX: int = 0xFFF
+_uuid7_lock: threading.Lock = threading.Lock()
+_uuid7_last_timestamp_ms: int = 0
+_uuid7_last_counter: int = 0
+
+
+def uuid7() -> UUID:
+    """Generate a time-ordered UUID (version 7, RFC 9562), monotonic in the process.
+
+    The 48 first bits are the Unix timestamp in milliseconds, so that the IDs generated one after the other
+    are close in the indexes. In the same millisecond, the 12 next bits are a counter started at a random
+    value (method 1 of the RFC), the timestamp being moved forward when the counter overflows. The 62 last
+    bits are random.
+
+    Returns:
+        UUID: The UUID.
+    """
+    global _uuid7_last_timestamp_ms, _uuid7_last_counter  # pylint: disable=global-statement
+    random_bits: int = int.from_bytes(os.urandom(10))
+    with _uuid7_lock:
+        timestamp_ms: int = time.time_ns() // 1_000_000
+        if timestamp_ms > _uuid7_last_timestamp_ms:
+            # Seeded in the lower half, leaving room to count
+            counter: int = (random_bits >> 62) & (_UUID7_COUNTER_MAX >> 1)
+        else:
+            timestamp_ms = _uuid7_last_timestamp_ms
+            counter = _uuid7_last_counter + 1
+            if counter > _UUID7_COUNTER_MAX:
+                timestamp_ms += 1
+                counter = 0
+        _uuid7_last_timestamp_ms, _uuid7_last_counter = timestamp_ms, counter
+
+    return UUID(
+        int=(timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | counter << 64
+        | 0b10 << 62
+        | random_bits & 0x3FFF_FFFF_FFFF_FFFF
+    )
+
+
+class IdStrategy(StrEnum):
+    """How the IDs of the documents are generated."""
+
+    # Random, the inserts are scattered across the _id index
+    UUID4 = "uuid4"
+    # Time-ordered, the inserts are appended to the _id index
+    UUID7 = "uuid7"
+
+
+ID_FACTORIES: dict[IdStrategy, Callable[[], UUID]] = {
+    IdStrategy.UUID4: uuid4,
+    IdStrategy.UUID7: uuid7,
+}
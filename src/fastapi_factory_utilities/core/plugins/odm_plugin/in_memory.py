@@ -0,0 +1,1437 @@
+"""Provides the in-memory backend of the ODM plugin, for the tests and the benchmarks without MongoDB.
+
+The backend stands for the Motor client, database, collections and sessions used by beanie and the
+repositories, so that the repositories keep their whole API (writes, bulk writes, streams, pages, caches,
+loaders, write-behind buffers) without any change. The documents are stored encoded in BSON, with the
+standard UUID representation, and read back as the driver reads them. The indexes are maintained, the
+unique ones enforced and the equality filters on the first field of an index served by it.
+
+It only implements what the repositories and the aggregation builders send, not the MongoDB language:
+
+- the filters: equality (through the arrays and the embedded documents), `$eq`, `$ne`, `$in`, `$nin`,
+  `$gt`, `$gte`, `$lt`, `$lte`, `$exists`, `$and` and `$or`;
+- the updates: `$set`, `$unset`, `$inc`, `$setOnInsert` and the replacement documents;
+- the projections including fields;
+- the aggregation stages: `$match`, `$group` (with `$sum`), `$count`, `$facet`, `$sort`, `$limit`
+  and `$project`.
+
+Anything else raises `OperationFailure`, wrapped in `OperationError` by the repositories, and the methods
+of Motor not used by the repositories are missing. The transactions are rolled back on abort, but are not
+isolated from the concurrent writes.
+"""
+
+import datetime
+import re
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from functools import cmp_to_key
+from itertools import count
+from typing import Any, ClassVar, Self
+
+import bson
+from bson.binary import UuidRepresentation
+from bson.codec_options import CodecOptions
+from bson.regex import Regex
+from pymongo import DeleteMany, DeleteOne, IndexModel, InsertOne, ReplaceOne, UpdateMany, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure
+from pymongo.results import BulkWriteResult, DeleteResult, UpdateResult
+
+# As the client of the ODM plugin decodes the documents
+CODEC_OPTIONS: CodecOptions[dict[str, Any]] = CodecOptions(uuid_representation=UuidRepresentation.STANDARD)
+ID_INDEX_NAME: str = "_id_"
+DUPLICATE_KEY_ERROR_CODE: int = 11000
+BUILD_INFO_VERSION: str = "7.0.0"
+
+# The order of the BSON types, to compare and sort the values of different types
+_TYPE_ORDER_NULL: int = 1
+_TYPE_ORDER_NUMBER: int = 2
+_TYPE_ORDER_STRING: int = 3
+_TYPE_ORDER_OBJECT: int = 4
+_TYPE_ORDER_ARRAY: int = 5
+_TYPE_ORDER_BINARY: int = 6
+_TYPE_ORDER_OBJECT_ID: int = 7
+_TYPE_ORDER_BOOLEAN: int = 8
+_TYPE_ORDER_DATE: int = 9
+_TYPE_ORDER_OTHER: int = 10
+
+_RANGE_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "$gt": lambda value, bound: value > bound,
+    "$gte": lambda value, bound: value >= bound,
+    "$lt": lambda value, bound: value < bound,
+    "$lte": lambda value, bound: value <= bound,
+}
+
+# Value of the paths missing in a document
+_MISSING: Any = object()
+
+
+def _normalize(document: Mapping[str, Any]) -> dict[str, Any]:
+    """Encode and decode a document, to get its values as the driver reads them back.
+
+    Args:
+        document (Mapping[str, Any]): The document, a filter or an update.
+
+    Returns:
+        dict[str, Any]: The document normalized, a deep copy.
+    """
+    return bson.decode(bson.encode(document, codec_options=CODEC_OPTIONS), codec_options=CODEC_OPTIONS)
+
+
+def _sort_key(value: Any) -> tuple[int, Any]:  # noqa: PLR0911
+    """Get the key ordering a value among the values of any BSON type, as MongoDB does.
+
+    Args:
+        value (Any): The value.
+
+    Returns:
+        tuple[int, Any]: The order of its type, then its value.
+    """
+    match value:
+        case None:
+            return (_TYPE_ORDER_NULL, 0)
+        case bool():
+            return (_TYPE_ORDER_BOOLEAN, value)
+        case int() | float():
+            return (_TYPE_ORDER_NUMBER, value)
+        case str():
+            return (_TYPE_ORDER_STRING, value)
+        case Mapping():
+            return (_TYPE_ORDER_OBJECT, tuple((key, _sort_key(item)) for key, item in value.items()))
+        case list():
+            return (_TYPE_ORDER_ARRAY, tuple(_sort_key(item) for item in value))
+        case bytes():
+            return (_TYPE_ORDER_BINARY, (len(value), bytes(value)))
+        case bson.ObjectId():
+            return (_TYPE_ORDER_OBJECT_ID, value.binary)
+        case datetime.datetime():
+            return (_TYPE_ORDER_DATE, value)
+    if hasattr(value, "bytes"):
+        # UUID
+        return (_TYPE_ORDER_BINARY, (len(value.bytes), value.bytes))
+    return (_TYPE_ORDER_OTHER, str(value))
+
+
+def _hashable(value: Any) -> Any:
+    """Get a hashable key equal for the equal values, to index them.
+
+    Args:
+        value (Any): The value.
+
+    Returns:
+        Any: The key.
+    """
+    if isinstance(value, Mapping):
+        return ("object", tuple((key, _hashable(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return ("array", tuple(_hashable(item) for item in value))
+    if isinstance(value, bool):
+        # Not equal to 0 and 1 for MongoDB
+        return ("boolean", value)
+    return value
+
+
+def _get_path(document: Mapping[str, Any], path: str, default: Any = None) -> Any:
+    """Get the value at a dotted path, through the embedded documents.
+
+    Args:
+        document (Mapping[str, Any]): The document.
+        path (str): The path.
+        default (Any, optional): The value of a missing path. Defaults to None.
+
+    Returns:
+        Any: The value.
+    """
+    current: Any = document
+    for part in path.split("."):
+        if not isinstance(current, Mapping) or part not in current:
+            return default
+        current = current[part]
+    return current
+
+
+def _values(document: Mapping[str, Any], path: str) -> list[Any]:
+    """Get the values a condition on a path is matched against: the value, then the items of an array.
+
+    Args:
+        document (Mapping[str, Any]): The document.
+        path (str): The path.
+
+    Returns:
+        list[Any]: The values, none if the path is missing.
+    """
+    value: Any = _get_path(document, path, _MISSING)
+    if value is _MISSING:
+        return []
+    return [value, *value] if isinstance(value, list) else [value]
+
+
+def _set_path(document: dict[str, Any], path: str, value: Any) -> None:
+    """Set a value at a dotted path, creating the embedded documents missing.
+
+    Args:
+        document (dict[str, Any]): The document.
+        path (str): The path.
+        value (Any): The value.
+    """
+    *parents, leaf = path.split(".")
+    current: dict[str, Any] = document
+    for part in parents:
+        current = current.setdefault(part, {})
+    current[leaf] = value
+
+
+def _unset_path(document: dict[str, Any], path: str) -> None:
+    """Remove the value at a dotted path, if any.
+
+    Args:
+        document (dict[str, Any]): The document.
+        path (str): The path.
+    """
+    *parents, leaf = path.split(".")
+    parent: Any = _get_path(document, ".".join(parents)) if len(parents) > 0 else document
+    if isinstance(parent, dict):
+        parent.pop(leaf, None)
+
+
+def _equals(values: list[Any], expected: Any) -> bool:
+    """Check a value at a path equals the value expected, null matching the missing values.
+
+    Args:
+        values (list[Any]): The values at the path.
+        expected (Any): The value expected.
+
+    Returns:
+        bool: Whether a value matches.
+
+    Raises:
+        OperationFailure: If the value expected is a regular expression.
+    """
+    if isinstance(expected, Regex | re.Pattern):
+        raise OperationFailure("Unsupported regular expression by the in-memory backend.")
+    if expected is None and len(values) == 0:
+        return True
+    expected_key: tuple[int, Any] = _sort_key(expected)
+    return any(_sort_key(value) == expected_key for value in values)
+
+
+def _matches_condition(values: list[Any], condition: Any) -> bool:
+    """Check the values at a path match a condition, an expected value or operators.
+
+    Args:
+        values (list[Any]): The values at the path.
+        condition (Any): The condition.
+
+    Returns:
+        bool: Whether the values match.
+
+    Raises:
+        OperationFailure: If an operator is not supported.
+    """
+    if not isinstance(condition, Mapping) or not all(str(key).startswith("$") for key in condition):
+        return _equals(values, condition)
+
+    for operator, operand in condition.items():
+        match operator:
+            case "$eq":
+                matched: bool = _equals(values, operand)
+            case "$ne":
+                matched = not _equals(values, operand)
+            case "$in":
+                matched = any(_equals(values, item) for item in operand)
+            case "$nin":
+                matched = not any(_equals(values, item) for item in operand)
+            case "$gt" | "$gte" | "$lt" | "$lte":
+                bound: tuple[int, Any] = _sort_key(operand)
+                matched = any(
+                    _sort_key(value)[0] == bound[0] and _RANGE_OPERATORS[operator](_sort_key(value), bound)
+                    for value in values
+                )
+            case "$exists":
+                matched = (len(values) > 0) == bool(operand)
+            case _:
+                raise OperationFailure(f"Unsupported query operator by the in-memory backend: {operator}")
+        if not matched:
+            return False
+    return True
+
+
+def _matches(document: Mapping[str, Any], filters: Mapping[str, Any]) -> bool:
+    """Check a document matches the filters.
+
+    Args:
+        document (Mapping[str, Any]): The document.
+        filters (Mapping[str, Any]): The MongoDB filters.
+
+    Returns:
+        bool: Whether the document matches.
+
+    Raises:
+        OperationFailure: If an operator is not supported.
+    """
+    for key, condition in filters.items():
+        match key:
+            case "$and":
+                matched: bool = all(_matches(document, item) for item in condition)
+            case "$or":
+                matched = any(_matches(document, item) for item in condition)
+            case _ if key.startswith("$"):
+                raise OperationFailure(f"Unsupported query operator by the in-memory backend: {key}")
+            case _:
+                matched = _matches_condition(_values(document, key), condition)
+        if not matched:
+            return False
+    return True
+
+
+def _project(document: dict[str, Any], projection: Mapping[str, Any] | None) -> dict[str, Any]:
+    """Project a document on the fields included, the `_id` being included unless excluded.
+
+    Args:
+        document (dict[str, Any]): The document, owned by the caller.
+        projection (Mapping[str, Any] | None): The projection, of top-level or dotted fields.
+
+    Returns:
+        dict[str, Any]: The document projected.
+
+    Raises:
+        OperationFailure: If the projection excludes fields other than `_id`, or has expressions.
+    """
+    if not projection:
+        return document
+    fields: list[str] = [key for key in projection if key != "_id"]
+    if any(not isinstance(value, bool | int) for value in projection.values()) or not all(
+        projection[field] for field in fields
+    ):
+        raise OperationFailure("Unsupported projection by the in-memory backend, only the inclusions are.")
+    keep_id: bool = bool(projection.get("_id", True))
+    if len(fields) == 0 and not keep_id:
+        document.pop("_id", None)
+        return document
+
+    projected: dict[str, Any] = {"_id": document["_id"]} if keep_id and "_id" in document else {}
+    for path in fields:
+        value: Any = _get_path(document, path, _MISSING)
+        if value is not _MISSING:
+            _set_path(projected, path, value)
+    return projected
+
+
+def _apply_update(document: dict[str, Any], update: Mapping[str, Any], is_upsert_insert: bool) -> None:
+    """Apply the update operators to a document.
+
+    Args:
+        document (dict[str, Any]): The document, updated in place.
+        update (Mapping[str, Any]): The update operators.
+        is_upsert_insert (bool): Whether the document is inserted by an upsert, for `$setOnInsert`.
+
+    Raises:
+        OperationFailure: If an operator is not supported.
+    """
+    for operator, fields in update.items():
+        for path, operand in fields.items():
+            match operator:
+                case "$set":
+                    _set_path(document, path, operand)
+                case "$setOnInsert":
+                    if is_upsert_insert:
+                        _set_path(document, path, operand)
+                case "$unset":
+                    _unset_path(document, path)
+                case "$inc":
+                    _set_path(document, path, (_get_path(document, path) or 0) + operand)
+                case _:
+                    raise OperationFailure(f"Unsupported update operator by the in-memory backend: {operator}")
+
+
+def _upsert_seed(filters: Mapping[str, Any]) -> dict[str, Any]:
+    """Get the document seeded by the equality conditions of the filters of an upsert.
+
+    Args:
+        filters (Mapping[str, Any]): The MongoDB filters.
+
+    Returns:
+        dict[str, Any]: The document seeded.
+    """
+    seed: dict[str, Any] = {}
+    for key, condition in filters.items():
+        if key.startswith("$"):
+            continue
+        if not isinstance(condition, Mapping) or not all(str(operator).startswith("$") for operator in condition):
+            _set_path(seed, key, condition)
+        elif "$eq" in condition:
+            _set_path(seed, key, condition["$eq"])
+    return seed
+
+
+def _sort_documents(documents: list[dict[str, Any]], sort: Any) -> list[dict[str, Any]]:
+    """Sort the documents, as MongoDB does.
+
+    Args:
+        documents (list[dict[str, Any]]): The documents.
+        sort (Any): The (field, direction) to sort on, as a list or a mapping.
+
+    Returns:
+        list[dict[str, Any]]: The documents sorted.
+    """
+    keys: list[tuple[str, int]] = list(sort.items()) if isinstance(sort, Mapping) else [tuple(key) for key in sort]
+
+    def compare(first: dict[str, Any], second: dict[str, Any]) -> int:
+        for field, direction in keys:
+            first_key: tuple[int, Any] = _sort_key(_get_path(first, field))
+            second_key: tuple[int, Any] = _sort_key(_get_path(second, field))
+            if first_key != second_key:
+                return (-1 if first_key < second_key else 1) * (1 if direction >= 0 else -1)
+        return 0
+
+    return sorted(documents, key=cmp_to_key(compare))
+
+
+def _evaluate(expression: Any, document: Mapping[str, Any]) -> Any:
+    """Evaluate an expression of an aggregation on a document: a field path, an object or a literal.
+
+    Args:
+        expression (Any): The expression, e.g. `$book_type` or `{"type": "$book_type"}`.
+        document (Mapping[str, Any]): The document.
+
+    Returns:
+        Any: The value, None for a missing field.
+
+    Raises:
+        OperationFailure: If the expression has operators.
+    """
+    if isinstance(expression, str) and expression.startswith("$"):
+        return _get_path(document, expression[1:])
+    if isinstance(expression, Mapping):
+        if any(str(key).startswith("$") for key in expression):
+            raise OperationFailure(f"Unsupported expression by the in-memory backend: {expression}")
+        return {key: _evaluate(value, document) for key, value in expression.items()}
+    return expression
+
+
+def _group(documents: list[dict[str, Any]], specification: Mapping[str, Any]) -> list[dict[str, Any]]:
+    """Run a `$group` stage, its accumulators being `$sum`.
+
+    Args:
+        documents (list[dict[str, Any]]): The input documents.
+        specification (Mapping[str, Any]): The key `_id` and the accumulators of the output fields.
+
+    Returns:
+        list[dict[str, Any]]: One output document by group, in the order of their first document.
+
+    Raises:
+        OperationFailure: If an accumulator is not supported.
+    """
+    accumulators: dict[str, Any] = {field: value for field, value in specification.items() if field != "_id"}
+    for accumulator in accumulators.values():
+        if not isinstance(accumulator, Mapping) or list(accumulator) != ["$sum"]:
+            raise OperationFailure(f"Unsupported accumulator by the in-memory backend: {accumulator}")
+
+    groups: dict[Any, tuple[Any, list[dict[str, Any]]]] = {}
+    for document in documents:
+        key: Any = _evaluate(specification["_id"], document)
+        groups.setdefault(_hashable(key), (key, []))[1].append(document)
+    return [
+        {
+            "_id": key,
+            **{
+                field: sum(
+                    value
+                    for value in (_evaluate(accumulator["$sum"], document) for document in grouped)
+                    if isinstance(value, int | float) and not isinstance(value, bool)
+                )
+                for field, accumulator in accumulators.items()
+            },
+        }
+        for key, grouped in groups.values()
+    ]
+
+
+def _run_pipeline(documents: list[dict[str, Any]], pipeline: Sequence[Mapping[str, Any]]) -> list[dict[str, Any]]:
+    """Run the stages of an aggregation pipeline on documents.
+
+    Args:
+        documents (list[dict[str, Any]]): The input documents, owned by the pipeline.
+        pipeline (Sequence[Mapping[str, Any]]): The stages, normalized.
+
+    Returns:
+        list[dict[str, Any]]: The output documents.
+
+    Raises:
+        OperationFailure: If a stage is not supported.
+    """
+    for stage in pipeline:
+        ((operator, specification),) = stage.items()
+        match operator:
+            case "$match":
+                documents = [document for document in documents if _matches(document, specification)]
+            case "$group":
+                documents = _group(documents, specification)
+            case "$count":
+                documents = [{specification: len(documents)}] if len(documents) > 0 else []
+            case "$facet":
+                documents = [
+                    {
+                        field: _run_pipeline([_normalize(document) for document in documents], sub_pipeline)
+                        for field, sub_pipeline in specification.items()
+                    }
+                ]
+            case "$sort":
+                documents = _sort_documents(documents, specification)
+            case "$limit":
+                documents = documents[:specification]
+            case "$project":
+                documents = [_project(document, specification) for document in documents]
+            case _:
+                raise OperationFailure(f"Unsupported aggregation stage by the in-memory backend: {operator}")
+    return documents
+
+
+class _Index:
+    """An index of a collection, on the values of the first field of its keys."""
+
+    def __init__(self, name: str, keys: list[tuple[str, Any]], unique: bool = False, sparse: bool = False) -> None:
+        """Initialize the empty index.
+
+        Args:
+            name (str): The name of the index.
+            keys (list[tuple[str, Any]]): The (field, direction) of the index.
+            unique (bool, optional): Whether the keys are unique. Defaults to False.
+            sparse (bool, optional): Whether the documents missing the fields are not indexed. Defaults to False.
+        """
+        self.name: str = name
+        self.keys: list[tuple[str, Any]] = keys
+        self.unique: bool = unique
+        self.sparse: bool = sparse
+        self.field: str = keys[0][0]
+        # The documents by value of the first field, the arrays being indexed by item
+        self.entries: dict[Any, set[Any]] = {}
+        # The document by key, for the unique indexes
+        self.unique_entries: dict[Any, Any] = {}
+
+    def information(self) -> dict[str, Any]:
+        """Get the information of the index, as `index_information` describes it.
+
+        Returns:
+            dict[str, Any]: The information.
+        """
+        information: dict[str, Any] = {"v": 2, "key": list(self.keys)}
+        if self.unique and self.name != ID_INDEX_NAME:
+            information["unique"] = True
+        if self.sparse:
+            information["sparse"] = True
+        return information
+
+    def _unique_key(self, document: Mapping[str, Any]) -> Any | None:
+        """Get the key of a document in the unique index.
+
+        Args:
+            document (Mapping[str, Any]): The document.
+
+        Returns:
+            Any | None: The key, or None if the document is not indexed.
+        """
+        values: list[Any] = [_get_path(document, field) for field, _ in self.keys]
+        if self.sparse and all(value is None for value in values):
+            return None
+        return tuple(_hashable(value) for value in values)
+
+    def _entry_keys(self, document: Mapping[str, Any]) -> list[Any]:
+        """Get the entries of a document in the index.
+
+        Args:
+            document (Mapping[str, Any]): The document.
+
+        Returns:
+            list[Any]: The hashable values of the first field, none if the document is not indexed.
+        """
+        values: list[Any] = _values(document, self.field)
+        if len(values) == 0:
+            return [] if self.sparse else [None]
+        return [_hashable(value) for value in values]
+
+    def check(self, document_key: Any | None, document: Mapping[str, Any], namespace: str) -> None:
+        """Check a document does not duplicate the key of another one.
+
+        Args:
+            document_key (Any | None): The key of the document in the collection, None if inserted.
+            document (Mapping[str, Any]): The document.
+            namespace (str): The namespace of the collection.
+
+        Raises:
+            DuplicateKeyError: If the key is taken by another document.
+        """
+        if not self.unique:
+            return
+        unique_key: Any | None = self._unique_key(document)
+        if (
+            unique_key is not None
+            and unique_key in self.unique_entries
+            and self.unique_entries[unique_key] != document_key
+        ):
+            key_value: dict[str, Any] = {field: _get_path(document, field) for field, _ in self.keys}
+            message: str = f"E11000 duplicate key error collection: {namespace} index: {self.name} dup key: {key_value}"
+            raise DuplicateKeyError(
+                message,
+                code=DUPLICATE_KEY_ERROR_CODE,
+                details={"code": DUPLICATE_KEY_ERROR_CODE, "errmsg": message, "keyValue": key_value},
+            )
+
+    def add(self, document_key: Any, document: Mapping[str, Any]) -> None:
+        """Index a document.
+
+        Args:
+            document_key (Any): The key of the document in the collection.
+            document (Mapping[str, Any]): The document.
+        """
+        for entry_key in self._entry_keys(document):
+            self.entries.setdefault(entry_key, set()).add(document_key)
+        if self.unique:
+            unique_key: Any | None = self._unique_key(document)
+            if unique_key is not None:
+                self.unique_entries[unique_key] = document_key
+
+    def remove(self, document_key: Any, document: Mapping[str, Any]) -> None:
+        """Remove a document from the index.
+
+        Args:
+            document_key (Any): The key of the document in the collection.
+            document (Mapping[str, Any]): The document.
+        """
+        for entry_key in self._entry_keys(document):
+            documents: set[Any] | None = self.entries.get(entry_key)
+            if documents is not None:
+                documents.discard(document_key)
+                if len(documents) == 0:
+                    del self.entries[entry_key]
+        if self.unique:
+            unique_key: Any | None = self._unique_key(document)
+            if unique_key is not None and self.unique_entries.get(unique_key) == document_key:
+                del self.unique_entries[unique_key]
+
+    def lookup(self, condition: Any) -> set[Any] | None:
+        """Get the documents which can match an equality or `$in` condition on the first field of the index.
+
+        Args:
+            condition (Any): The condition on the field.
+
+        Returns:
+            set[Any] | None: The keys of the documents, or None if the index cannot serve the condition.
+        """
+        expected: list[Any]
+        if isinstance(condition, Mapping) and all(str(operator).startswith("$") for operator in condition):
+            if "$eq" in condition:
+                expected = [condition["$eq"]]
+            elif "$in" in condition:
+                expected = list(condition["$in"])
+            else:
+                return None
+        else:
+            expected = [condition]
+        if any(isinstance(value, list | Regex | re.Pattern) or (value is None and self.sparse) for value in expected):
+            return None
+        candidates: set[Any] = set()
+        for value in expected:
+            candidates |= self.entries.get(_hashable(value), set())
+        return candidates
+
+
+class InMemoryCursor:
+    """Cursor of the documents found in an in-memory collection, found on the first iteration as Motor does."""
+
+    def __init__(self, find: Callable[[], Iterable[dict[str, Any]]]) -> None:
+        """Initialize the cursor.
+
+        Args:
+            find (Callable[[], Iterable[dict[str, Any]]]): Find the documents, owned by the cursor, its errors
+                being raised by the first iteration.
+        """
+        self._find: Callable[[], Iterable[dict[str, Any]]] | None = find
+        self._documents: Iterator[dict[str, Any]] = iter([])
+
+    def _iterator(self) -> Iterator[dict[str, Any]]:
+        """Get the iterator of the documents, finding them on the first call.
+
+        Returns:
+            Iterator[dict[str, Any]]: The iterator.
+        """
+        if self._find is not None:
+            find, self._find = self._find, None
+            self._documents = iter(find())
+        return self._documents
+
+    def __aiter__(self) -> Self:
+        """Iterate over the documents."""
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        """Get the next document.
+
+        Returns:
+            dict[str, Any]: The document.
+        """
+        try:
+            return next(self._iterator())
+        except StopIteration as error:
+            raise StopAsyncIteration from error
+
+    async def to_list(self, length: int | None = None) -> list[dict[str, Any]]:
+        """Get the documents left.
+
+        Args:
+            length (int | None, optional): The maximum number of documents. Defaults to None (all).
+
+        Returns:
+            list[dict[str, Any]]: The documents.
+        """
+        if length is None:
+            return list(self._iterator())
+        return [document for _, document in zip(range(length), self._iterator(), strict=False)]
+
+    async def close(self) -> None:
+        """Close the cursor."""
+        self._find = None
+        self._documents = iter([])
+
+
+# The parameters are named after the ones of Motor, called by keyword by beanie
+# pylint: disable=redefined-builtin
+class InMemoryCollection:
+    """In-memory collection, with the methods of `AsyncIOMotorCollection` called by the repositories and beanie."""
+
+    def __init__(self, database: "InMemoryDatabase", name: str) -> None:
+        """Initialize the empty collection.
+
+        Args:
+            database (InMemoryDatabase): The database.
+            name (str): The name of the collection.
+        """
+        self.database: InMemoryDatabase = database
+        self.name: str = name
+        self.codec_options: CodecOptions[dict[str, Any]] = CODEC_OPTIONS
+        # The documents encoded, by hashable ID, in their insertion order
+        self._documents: dict[Any, bytes] = {}
+        # The documents decoded, to match the filters, never handed out
+        self._decoded: dict[Any, dict[str, Any]] = {}
+        self._sequence: dict[Any, int] = {}
+        self._counter: Iterator[int] = count()
+        self._indexes: dict[str, _Index] = {ID_INDEX_NAME: _Index(ID_INDEX_NAME, [("_id", 1)], unique=True)}
+
+    @property
+    def full_name(self) -> str:
+        """The namespace of the collection."""
+        return f"{self.database.name}.{self.name}"
+
+    def with_options(self, **kwargs: Any) -> Self:
+        """Get the collection with other options, which have no effect in memory.
+
+        Args:
+            **kwargs (Any): The options.
+
+        Returns:
+            Self: The collection.
+        """
+        del kwargs
+        return self
+
+    # Storage
+
+    def _find_keys(self, filters: Mapping[str, Any]) -> list[Any]:
+        """Find the documents matching the filters, served by an index when it can.
+
+        Args:
+            filters (Mapping[str, Any]): The MongoDB filters, normalized.
+
+        Returns:
+            list[Any]: The keys of the documents, in their insertion order.
+        """
+        candidates: set[Any] | None = None
+        for field, condition in filters.items():
+            for index in self._indexes.values():
+                if index.field != field:
+                    continue
+                found: set[Any] | None = index.lookup(condition)
+                if found is not None and (candidates is None or len(found) < len(candidates)):
+                    candidates = found
+        if candidates is None:
+            return [key for key, document in self._decoded.items() if _matches(document, filters)]
+        return sorted(
+            (key for key in candidates if _matches(self._decoded[key], filters)), key=self._sequence.__getitem__
+        )
+
+    def _find(
+        self,
+        filters: Mapping[str, Any] | None,
+        sort: Any = None,
+        skip: int = 0,
+        limit: int = 0,
+    ) -> list[Any]:
+        """Find the documents matching the filters, sorted and sliced.
+
+        Args:
+            filters (Mapping[str, Any] | None): The MongoDB filters.
+            sort (Any, optional): The (field, direction) to sort on. Defaults to None.
+            skip (int, optional): The number of documents to skip. Defaults to 0.
+            limit (int, optional): The maximum number of documents, 0 for no limit. Defaults to 0.
+
+        Returns:
+            list[Any]: The keys of the documents.
+        """
+        keys: list[Any] = self._find_keys(_normalize(filters or {}))
+        if sort:
+            by_key: dict[int, Any] = {id(self._decoded[key]): key for key in keys}
+            keys = [by_key[id(document)] for document in _sort_documents([self._decoded[key] for key in keys], sort)]
+        keys = keys[skip:]
+        return keys[:limit] if limit else keys
+
+    def _read(self, key: Any, projection: Mapping[str, Any] | None = None) -> dict[str, Any]:
+        """Read a document, decoded for the caller.
+
+        Args:
+            key (Any): The key of the document.
+            projection (Mapping[str, Any] | None, optional): The projection. Defaults to None.
+
+        Returns:
+            dict[str, Any]: The document.
+        """
+        return _project(bson.decode(self._documents[key], codec_options=CODEC_OPTIONS), projection)
+
+    def _write(self, document: Mapping[str, Any], previous_key: Any | None = None) -> Any:
+        """Write a document, inserted or replacing another one, checking the unique indexes.
+
+        Args:
+            document (Mapping[str, Any]): The document.
+            previous_key (Any | None, optional): The key of the document replaced. Defaults to None (insert).
+
+        Returns:
+            Any: The key of the document.
+
+        Raises:
+            DuplicateKeyError: If the document duplicates the key of another one.
+            OperationFailure: If the ID of the document replaced is changed.
+        """
+        encoded: bytes = bson.encode(document, codec_options=CODEC_OPTIONS)
+        decoded: dict[str, Any] = bson.decode(encoded, codec_options=CODEC_OPTIONS)
+        key: Any = _hashable(decoded["_id"])
+        if previous_key is not None and key != previous_key:
+            raise OperationFailure("Performing an update on the path '_id' would modify the immutable field '_id'")
+        for index in self._indexes.values():
+            index.check(previous_key, decoded, self.full_name)
+
+        if previous_key is not None:
+            for index in self._indexes.values():
+                index.remove(key, self._decoded[key])
+        else:
+            self._sequence[key] = next(self._counter)
+        self._documents[key] = encoded
+        self._decoded[key] = decoded
+        for index in self._indexes.values():
+            index.add(key, decoded)
+        return key
+
+    def _delete(self, key: Any) -> None:
+        """Delete a document.
+
+        Args:
+            key (Any): The key of the document.
+        """
+        for index in self._indexes.values():
+            index.remove(key, self._decoded[key])
+        del self._documents[key]
+        del self._decoded[key]
+        del self._sequence[key]
+
+    def _export(self) -> dict[Any, bytes]:
+        """Export the documents, to restore them on the abort of a transaction.
+
+        Returns:
+            dict[Any, bytes]: The documents encoded, by key.
+        """
+        return dict(self._documents)
+
+    def _restore(self, documents: Mapping[Any, bytes]) -> None:
+        """Restore the documents exported, and rebuild the indexes.
+
+        Args:
+            documents (Mapping[Any, bytes]): The documents encoded, by key.
+        """
+        self._documents, self._decoded, self._sequence = {}, {}, {}
+        for index in self._indexes.values():
+            index.entries.clear()
+            index.unique_entries.clear()
+        for encoded in documents.values():
+            document: dict[str, Any] = bson.decode(encoded, codec_options=CODEC_OPTIONS)
+            self._write(document)
+
+    def _update(
+        self,
+        filters: Mapping[str, Any],
+        update: Mapping[str, Any] | Sequence[Mapping[str, Any]],
+        upsert: bool,
+        multi: bool,
+        replace: bool,
+    ) -> tuple[int, int, Any | None, list[Any]]:
+        """Update or replace the documents matching the filters.
+
+        Args:
+            filters (Mapping[str, Any]): The MongoDB filters.
+            update (Mapping[str, Any] | Sequence[Mapping[str, Any]]): The update operators, or the replacement
+                document, the pipelines being not supported.
+            upsert (bool): Whether to insert a document when none matches.
+            multi (bool): Whether to update all the documents matching, or the first one only.
+            replace (bool): Whether the update is a replacement document.
+
+        Returns:
+            tuple[int, int, Any | None, list[Any]]: The numbers of documents matched and modified, the ID of the
+                document upserted, and the keys of the documents written.
+
+        Raises:
+            OperationFailure: If the update is not supported, or changes the ID of a document.
+            DuplicateKeyError: If a document duplicates the key of another one.
+        """
+        if not isinstance(update, Mapping):
+            raise OperationFailure("Unsupported update pipeline by the in-memory backend.")
+        operators: bool = len(update) > 0 and all(key.startswith("$") for key in update)
+        if operators == replace:
+            raise ValueError(
+                "The replacement must not contain operators." if replace else "The update must only contain operators."
+            )
+
+        keys: list[Any] = self._find(filters, limit=0 if multi else 1)
+        written: list[Any] = []
+        modified: int = 0
+        for key in keys:
+            document: dict[str, Any] = self._read(key)
+            if replace:
+                updated: dict[str, Any] = {"_id": document["_id"], **update}
+            else:
+                updated = self._read(key)
+                _apply_update(updated, _normalize(update), is_upsert_insert=False)
+            if _normalize(updated) != document:
+                self._write(updated, previous_key=key)
+                modified += 1
+            written.append(key)
+
+        if len(keys) > 0 or not upsert:
+            return len(keys), modified, None, written
+
+        inserted: dict[str, Any] = _upsert_seed(_normalize(filters))
+        if replace:
+            inserted = {**({"_id": inserted["_id"]} if "_id" in inserted else {}), **update}
+        else:
+            _apply_update(inserted, _normalize(update), is_upsert_insert=True)
+        inserted.setdefault("_id", bson.ObjectId())
+        written.append(self._write(inserted))
+        return 0, 0, inserted["_id"], written
+
+    # Reads
+
+    def find(
+        self,
+        filter: Mapping[str, Any] | None = None,
+        projection: Mapping[str, Any] | None = None,
+        *,
+        sort: Any = None,
+        skip: int = 0,
+        limit: int = 0,
+        **kwargs: Any,
+    ) -> InMemoryCursor:
+        """Find the documents matching the filters.
+
+        Args:
+            filter (Mapping[str, Any] | None, optional): The MongoDB filters. Defaults to None (all documents).
+            projection (Mapping[str, Any] | None, optional): The projection. Defaults to None.
+            sort (Any, optional): The (field, direction) to sort on. Defaults to None.
+            skip (int, optional): The number of documents to skip. Defaults to 0.
+            limit (int, optional): The maximum number of documents, 0 for no limit. Defaults to 0.
+            **kwargs (Any): The other options (session, batch size), without effect in memory.
+
+        Returns:
+            InMemoryCursor: The cursor of the documents.
+        """
+        del kwargs
+        return InMemoryCursor(
+            lambda: [self._read(key, projection) for key in self._find(filter, sort=sort, skip=skip, limit=limit)]
+        )
+
+    async def find_one(
+        self,
+        filter: Mapping[str, Any] | None = None,
+        projection: Mapping[str, Any] | None = None,
+        *,
+        sort: Any = None,
+        **kwargs: Any,
+    ) -> dict[str, Any] | None:
+        """Find the first document matching the filters.
+
+        Args:
+            filter (Mapping[str, Any] | None, optional): The MongoDB filters. Defaults to None (all documents).
+            projection (Mapping[str, Any] | None, optional): The projection. Defaults to None.
+            sort (Any, optional): The (field, direction) to sort on. Defaults to None.
+            **kwargs (Any): The other options, without effect in memory.
+
+        Returns:
+            dict[str, Any] | None: The document, or None if none matches.
+        """
+        del kwargs
+        keys: list[Any] = self._find(filter, sort=sort, limit=1)
+        return self._read(keys[0], projection) if len(keys) > 0 else None
+
+    async def count_documents(self, filter: Mapping[str, Any], limit: int = 0, **kwargs: Any) -> int:
+        """Count the documents matching the filters.
+
+        Args:
+            filter (Mapping[str, Any]): The MongoDB filters.
+            limit (int, optional): The maximum number of documents counted, 0 for no limit. Defaults to 0.
+            **kwargs (Any): The other options, without effect in memory.
+
+        Returns:
+            int: The number of documents.
+        """
+        del kwargs
+        return len(self._find(filter, limit=limit))
+
+    async def distinct(
+        self,
+        key: str,
+        filter: Mapping[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> list[Any]:
+        """Get the distinct values of a field among the documents matching the filters.
+
+        Args:
+            key (str): The field.
+            filter (Mapping[str, Any] | None, optional): The MongoDB filters. Defaults to None (all documents).
+            **kwargs (Any): The other options, without effect in memory.
+
+        Returns:
+            list[Any]: The distinct values, the arrays being expanded.
+        """
+        del kwargs
+        values: dict[Any, Any] = {}
+        for document_key in self._find(filter):
+            for value in _values(self._decoded[document_key], key):
+                if not isinstance(value, list):
+                    values.setdefault(_hashable(value), value)
+        return list(values.values())
+
+    def aggregate(self, pipeline: Sequence[Mapping[str, Any]], **kwargs: Any) -> InMemoryCursor:
+        """Run an aggregation pipeline, its leading `$match` stage being served by the indexes.
+
+        Args:
+            pipeline (Sequence[Mapping[str, Any]]): The stages, see the module for the ones supported.
+            **kwargs (Any): The other options (session, batch size), without effect in memory.
+
+        Returns:
+            InMemoryCursor: The cursor of the output documents.
+
+        Raises:
+            OperationFailure: If a stage is not supported.
+        """
+        del kwargs
+        stages: list[dict[str, Any]] = [_normalize(stage) for stage in pipeline]
+        filters: Mapping[str, Any] | None = None
+        if len(stages) > 0 and "$match" in stages[0]:
+            filters = stages.pop(0)["$match"]
+        return InMemoryCursor(lambda: _run_pipeline([self._read(key) for key in self._find(filters)], stages))
+
+    # Writes
+
+    async def update_one(
+        self,
+        filter: Mapping[str, Any],
+        update: Mapping[str, Any],
+        upsert: bool = False,
+        **kwargs: Any,
+    ) -> UpdateResult:
+        """Update the first document matching the filters.
+
+        Args:
+            filter (Mapping[str, Any]): The MongoDB filters.
+            update (Mapping[str, Any]): The update operators.
+            upsert (bool, optional): Whether to insert a document when none matches. Defaults to False.
+            **kwargs (Any): The other options, without effect in memory.
+
+        Returns:
+            UpdateResult: The result.
+        """
+        del kwargs
+        matched, modified, upserted_id, _ = self._update(filter, update, upsert=upsert, multi=False, replace=False)
+        raw_result: dict[str, Any] = {"n": matched + (1 if upserted_id is not None else 0), "nModified": modified}
+        if upserted_id is not None:
+            raw_result["upserted"] = upserted_id
+        return UpdateResult(raw_result, acknowledged=True)
+
+    async def delete_one(self, filter: Mapping[str, Any], **kwargs: Any) -> DeleteResult:
+        """Delete the first document matching the filters.
+
+        Args:
+            filter (Mapping[str, Any]): The MongoDB filters.
+            **kwargs (Any): The other options, without effect in memory.
+
+        Returns:
+            DeleteResult: The result.
+        """
+        del kwargs
+        keys: list[Any] = self._find(filter, limit=1)
+        for key in keys:
+            self._delete(key)
+        return DeleteResult({"n": len(keys)}, acknowledged=True)
+
+    async def find_one_and_update(
+        self,
+        filter: Mapping[str, Any],
+        update: Mapping[str, Any],
+        sort: Any = None,
+        upsert: bool = False,
+        return_document: bool = False,
+        **kwargs: Any,
+    ) -> dict[str, Any] | None:
+        """Update the first document matching the filters and get it, as beanie saves the documents.
+
+        Args:
+            filter (Mapping[str, Any]): The MongoDB filters.
+            update (Mapping[str, Any]): The update operators.
+            sort (Any, optional): The order to pick the first document. Defaults to None.
+            upsert (bool, optional): Whether to insert a document when none matches. Defaults to False.
+            return_document (bool, optional): Get the document after the update (ReturnDocument.AFTER), else
+                before. Defaults to False.
+            **kwargs (Any): The other options, without effect in memory.
+
+        Returns:
+            dict[str, Any] | None: The document, or None if none matches (and none is upserted before).
+        """
+        del kwargs
+        keys: list[Any] = self._find(filter, sort=sort, limit=1)
+        before: dict[str, Any] | None = self._read(keys[0]) if len(keys) > 0 else None
+        target: Mapping[str, Any] = {"_id": self._decoded[keys[0]]["_id"]} if len(keys) > 0 else filter
+        _, _, _, written = self._update(target, update, upsert=upsert, multi=False, replace=False)
+        if not return_document or len(written) == 0:
+            return before
+        return self._read(written[0])
+
+    async def find_one_and_delete(
+        self,
+        filter: Mapping[str, Any],
+        sort: Any = None,
+        **kwargs: Any,
+    ) -> dict[str, Any] | None:
+        """Delete the first document matching the filters and get it.
+
+        Args:
+            filter (Mapping[str, Any]): The MongoDB filters.
+            sort (Any, optional): The order to pick the first document. Defaults to None.
+            **kwargs (Any): The other options, without effect in memory.
+
+        Returns:
+            dict[str, Any] | None: The document, or None if none matches.
+        """
+        del kwargs
+        keys: list[Any] = self._find(filter, sort=sort, limit=1)
+        if len(keys) == 0:
+            return None
+        document: dict[str, Any] = self._read(keys[0])
+        self._delete(keys[0])
+        return document
+
+    async def bulk_write(self, requests: Sequence[Any], ordered: bool = True, **kwargs: Any) -> BulkWriteResult:
+        """Execute the write operations.
+
+        Args:
+            requests (Sequence[Any]): The pymongo write operations.
+            ordered (bool, optional): Stop at the first error (True) or execute all the operations (False).
+                Defaults to True.
+            **kwargs (Any): The other options, without effect in memory.
+
+        Returns:
+            BulkWriteResult: The result.
+
+        Raises:
+            BulkWriteError: If operations fail, with the per-operation errors.
+            OperationFailure: If an operation is not supported.
+        """
+        del kwargs
+        result: dict[str, Any] = {
+            "writeErrors": [],
+            "writeConcernErrors": [],
+            "nInserted": 0,
+            "nUpserted": 0,
+            "nMatched": 0,
+            "nModified": 0,
+            "nRemoved": 0,
+            "upserted": [],
+        }
+        # pylint: disable=protected-access
+        for index, request in enumerate(requests):
+            try:
+                match request:
+                    case InsertOne():
+                        document: Mapping[str, Any] = request._doc  # pyright: ignore[reportPrivateUsage]
+                        self._write({"_id": bson.ObjectId(), **document} if "_id" not in document else document)
+                        result["nInserted"] += 1
+                    case UpdateOne() | UpdateMany() | ReplaceOne():
+                        matched, modified, upserted_id, _ = self._update(
+                            request._filter,  # pyright: ignore[reportPrivateUsage]
+                            request._doc,  # pyright: ignore[reportPrivateUsage]
+                            upsert=bool(request._upsert),  # pyright: ignore[reportPrivateUsage]
+                            multi=isinstance(request, UpdateMany),
+                            replace=isinstance(request, ReplaceOne),
+                        )
+                        result["nMatched"] += matched
+                        result["nModified"] += modified
+                        if upserted_id is not None:
+                            result["nUpserted"] += 1
+                            result["upserted"].append({"index": index, "_id": upserted_id})
+                    case DeleteOne() | DeleteMany():
+                        keys: list[Any] = self._find(
+                            request._filter,  # pyright: ignore[reportPrivateUsage]
+                            limit=1 if isinstance(request, DeleteOne) else 0,
+                        )
+                        for key in keys:
+                            self._delete(key)
+                        result["nRemoved"] += len(keys)
+                    case _:
+                        raise OperationFailure(f"Unsupported write operation by the in-memory backend: {request}")
+            except DuplicateKeyError as error:
+                result["writeErrors"].append(
+                    {"index": index, "code": error.code, "errmsg": str(error), "op": getattr(request, "_doc", None)}
+                )
+                if ordered:
+                    break
+        if len(result["writeErrors"]) > 0:
+            raise BulkWriteError(result)
+        return BulkWriteResult(result, acknowledged=True)
+
+    # Indexes
+
+    async def create_indexes(self, indexes: Sequence[IndexModel], **kwargs: Any) -> list[str]:
+        """Create indexes, and index the documents.
+
+        Args:
+            indexes (Sequence[IndexModel]): The indexes.
+            **kwargs (Any): The other options, without effect in memory.
+
+        Returns:
+            list[str]: The names of the indexes.
+
+        Raises:
+            DuplicateKeyError: If the documents duplicate the keys of a unique index.
+        """
+        del kwargs
+        names: list[str] = []
+        for model in indexes:
+            specification: Mapping[str, Any] = model.document
+            index: _Index = _Index(
+                name=specification["name"],
+                keys=list(specification["key"].items()),
+                unique=bool(specification.get("unique", False)),
+                sparse=bool(specification.get("sparse", False)),
+            )
+            for key, document in self._decoded.items():
+                index.check(key, document, self.full_name)
+                index.add(key, document)
+            self._indexes[index.name] = index
+            names.append(index.name)
+        return names
+
+    async def index_information(self, **kwargs: Any) -> dict[str, Any]:
+        """Get the information of the indexes.
+
+        Args:
+            **kwargs (Any): The options, without effect in memory.
+
+        Returns:
+            dict[str, Any]: The information, by index name.
+        """
+        del kwargs
+        return {name: index.information() for name, index in self._indexes.items()}
+
+
+class InMemoryDatabase:
+    """In-memory database, with the methods of `AsyncIOMotorDatabase` called by the ODM plugin and beanie."""
+
+    def __init__(self, client: "InMemoryClient", name: str) -> None:
+        """Initialize the empty database.
+
+        Args:
+            client (InMemoryClient): The client.
+            name (str): The name of the database.
+        """
+        self.client: InMemoryClient = client
+        self.name: str = name
+        self._collections: dict[str, InMemoryCollection] = {}
+
+    def __getitem__(self, name: str) -> InMemoryCollection:
+        """Get a collection, created on the first access.
+
+        Args:
+            name (str): The name of the collection.
+
+        Returns:
+            InMemoryCollection: The collection.
+        """
+        collection: InMemoryCollection | None = self._collections.get(name)
+        if collection is None:
+            collection = InMemoryCollection(database=self, name=name)
+            self._collections[name] = collection
+        return collection
+
+    async def command(self, command: str | Mapping[str, Any], *args: Any, **kwargs: Any) -> dict[str, Any]:
+        """Run the commands of the server checked by beanie and the ODM plugin.
+
+        Args:
+            command (str | Mapping[str, Any]): The command, `ping` or `buildInfo`.
+            *args (Any): The arguments, without effect in memory.
+            **kwargs (Any): The options, without effect in memory.
+
+        Returns:
+            dict[str, Any]: The reply.
+
+        Raises:
+            OperationFailure: If the command is not supported.
+        """
+        del args, kwargs
+        name: str = command if isinstance(command, str) else next(iter(command))
+        if name == "ping":
+            return {"ok": 1.0}
+        if name == "buildInfo":
+            return {"version": BUILD_INFO_VERSION, "ok": 1.0}
+        raise OperationFailure(f"Unsupported command by the in-memory backend: {name}")
+
+
+class InMemorySession:
+    """Session of the in-memory client, its transactions restoring the documents on abort."""
+
+    def __init__(self, client: "InMemoryClient") -> None:
+        """Initialize the session.
+
+        Args:
+            client (InMemoryClient): The client.
+        """
+        self.client: InMemoryClient = client
+        self._snapshot: dict[tuple[str, str], dict[Any, bytes]] | None = None
+        self.has_ended: bool = False
+
+    @property
+    def in_transaction(self) -> bool:
+        """Whether a transaction is in progress."""
+        return self._snapshot is not None
+
+    def start_transaction(self, **kwargs: Any) -> None:
+        """Start a transaction, taking a snapshot of the documents.
+
+        Args:
+            **kwargs (Any): The options, without effect in memory.
+        """
+        del kwargs
+        self._snapshot = self.client.export_collections()
+
+    async def commit_transaction(self) -> None:
+        """Commit the transaction, the writes being already applied."""
+        self._snapshot = None
+
+    async def abort_transaction(self) -> None:
+        """Abort the transaction, restoring the documents of its start."""
+        if self._snapshot is not None:
+            self.client.restore_collections(self._snapshot)
+        self._snapshot = None
+
+    async def end_session(self) -> None:
+        """End the session, aborting its transaction if any."""
+        await self.abort_transaction()
+        self.has_ended = True
+
+    async def __aenter__(self) -> Self:
+        """Enter the session."""
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """End the session."""
+        await self.end_session()
+
+
+class InMemoryClient:
+    """In-memory client, with the methods of `AsyncIOMotorClient` called by the ODM plugin.
+
+    ```python
+    client = InMemoryClient()
+    await init_beanie(database=client["library"], document_models=[BookDocument])
+    books = BookRepository(database=client["library"])
+    ```
+    """
+
+    address: ClassVar[tuple[str, int]] = ("memory", 0)
+
+    def __init__(self) -> None:
+        """Initialize the client, without any database."""
+        self._databases: dict[str, InMemoryDatabase] = {}
+
+    def __getitem__(self, name: str) -> InMemoryDatabase:
+        """Get a database, created on the first access.
+
+        Args:
+            name (str): The name of the database.
+
+        Returns:
+            InMemoryDatabase: The database.
+        """
+        database: InMemoryDatabase | None = self._databases.get(name)
+        if database is None:
+            database = InMemoryDatabase(client=self, name=name)
+            self._databases[name] = database
+        return database
+
+    def get_database(self, name: str, **kwargs: Any) -> InMemoryDatabase:
+        """Get a database, its options having no effect in memory.
+
+        Args:
+            name (str): The name of the database.
+            **kwargs (Any): The options.
+
+        Returns:
+            InMemoryDatabase: The database.
+        """
+        del kwargs
+        return self[name]
+
+    @property
+    def admin(self) -> InMemoryDatabase:
+        """The admin database, answering the pings."""
+        return self["admin"]
+
+    async def start_session(self, **kwargs: Any) -> InMemorySession:
+        """Start a session.
+
+        Args:
+            **kwargs (Any): The options, without effect in memory.
+
+        Returns:
+            InMemorySession: The session.
+        """
+        del kwargs
+        return InMemorySession(client=self)
+
+    def export_collections(self) -> dict[tuple[str, str], dict[Any, bytes]]:
+        """Export the documents of all the collections.
+
+        Returns:
+            dict[tuple[str, str], dict[Any, bytes]]: The documents encoded, by (database, collection).
+        """
+        # pylint: disable=protected-access
+        return {
+            (database.name, collection.name): collection._export()
+            for database in self._databases.values()
+            for collection in database._collections.values()
+        }
+
+    def restore_collections(self, snapshot: Mapping[tuple[str, str], Mapping[Any, bytes]]) -> None:
+        """Restore the documents of all the collections, the ones created since the export being emptied.
+
+        Args:
+            snapshot (Mapping[tuple[str, str], Mapping[Any, bytes]]): The documents exported.
+        """
+        # pylint: disable=protected-access
+        for database in self._databases.values():
+            for collection in database._collections.values():
+                collection._restore(snapshot.get((database.name, collection.name), {}))
+
+    def close(self) -> None:
+        """Close the client, the documents are kept."""
@@ -0,0 +1,140 @@
+"""Provides the synchronization of the indexes declared by the document models with the collections."""
+
+import asyncio
+import time
+from collections.abc import Sequence
+from enum import StrEnum
+from typing import Any
+
+from beanie import Document
+from beanie.odm.fields import IndexModelField
+from beanie.odm.utils.typing import get_index_attributes
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pydantic import BaseModel, Field
+from pymongo import IndexModel
+from pymongo.errors import PyMongoError
+from structlog.stdlib import BoundLogger, get_logger
+
+from .exceptions import OperationError
+
+_logger: BoundLogger = get_logger()
+
+
+class IndexSyncMode(StrEnum):
+    """How the indexes are synchronized on startup."""
+
+    # Build the missing indexes before serving
+    BLOCKING = "blocking"
+    # Serve at once, build the missing indexes in a task, ready when they are built
+    BACKGROUND = "background"
+    # Only report the differences between the declared and the existing indexes
+    VERIFY_ONLY = "verify_only"
+
+
+class IndexSyncReport(BaseModel):
+    """Report of the synchronization of the indexes of a collection."""
+
+    collection: str
+    mode: IndexSyncMode
+    duration_s: float = Field(description="The duration of the synchronization, in seconds.")
+    missing: list[str] = Field(default_factory=list, description="The indexes declared but not existing.")
+    extra: list[str] = Field(default_factory=list, description="The indexes existing but not declared.")
+    created: list[str] = Field(default_factory=list, description="The indexes created.")
+
+
+def get_declared_indexes(document_model: type[Document]) -> list[IndexModelField]:
+    """Get the indexes declared by a document model, on its fields and in its settings, as beanie does.
+
+    Args:
+        document_model (type[Document]): The document model, initialized.
+
+    Returns:
+        list[IndexModelField]: The indexes declared.
+    """
+    indexes: list[IndexModelField] = []
+    for name, field in document_model.model_fields.items():
+        index_attributes: tuple[int, dict[str, Any]] | None = get_index_attributes(field)
+        if index_attributes is not None:
+            indexes.append(
+                IndexModelField(IndexModel([(field.alias or name, index_attributes[0])], **index_attributes[1]))
+            )
+
+    if document_model.get_settings().merge_indexes:
+        # The indexes of the parent document models are inherited
+        for parent_model in reversed(document_model.mro()):
+            if issubclass(parent_model, Document) and parent_model is not Document:
+                indexes = IndexModelField.merge_indexes(indexes, parent_model.get_settings().indexes)
+        return indexes
+    return IndexModelField.merge_indexes(indexes, document_model.get_settings().indexes)
+
+
+async def sync_indexes(document_model: type[Document], mode: IndexSyncMode) -> IndexSyncReport:
+    """Compare the declared indexes of a document model with the existing ones, and build the missing ones.
+
+    The indexes existing but not declared are only reported, never dropped.
+
+    Args:
+        document_model (type[Document]): The document model, initialized.
+        mode (IndexSyncMode): The synchronization mode, the missing indexes are not built in `VERIFY_ONLY`.
+
+    Returns:
+        IndexSyncReport: The report of the synchronization.
+
+    Raises:
+        OperationError: If the indexes cannot be read or built.
+    """
+    start: float = time.monotonic()
+    collection: AsyncIOMotorCollection[Any] = document_model.get_motor_collection()
+    declared: list[IndexModelField] = get_declared_indexes(document_model)
+    try:
+        existing: list[IndexModelField] = IndexModelField.from_motor_index_information(
+            dict(await collection.index_information())
+        )
+        missing: list[IndexModelField] = IndexModelField.list_difference(declared, existing)
+        created: list[str] = []
+        if mode != IndexSyncMode.VERIFY_ONLY and len(missing) > 0:
+            created = await collection.create_indexes(IndexModelField.list_to_index_model(missing))
+    except PyMongoError as error:
+        raise OperationError(f"Failed to synchronize the indexes of {collection.name}: {error}") from error
+
+    return IndexSyncReport(
+        collection=collection.name,
+        mode=mode,
+        duration_s=time.monotonic() - start,
+        missing=[index.name for index in missing],
+        extra=[index.name for index in IndexModelField.list_difference(existing, declared)],
+        created=created,
+    )
+
+
+async def sync_document_models_indexes(
+    document_models: Sequence[type[Document]], mode: IndexSyncMode
+) -> list[IndexSyncReport]:
+    """Synchronize the indexes of the document models concurrently, and log the report of each collection.
+
+    Args:
+        document_models (Sequence[type[Document]]): The document models, initialized.
+        mode (IndexSyncMode): The synchronization mode.
+
+    Returns:
+        list[IndexSyncReport]: The reports, in the order of the document models.
+
+    Raises:
+        OperationError: If the indexes of a collection cannot be read or built.
+    """
+    start: float = time.monotonic()
+    reports: list[IndexSyncReport] = list(
+        await asyncio.gather(*(sync_indexes(document_model, mode) for document_model in document_models))
+    )
+    for report in reports:
+        if mode == IndexSyncMode.VERIFY_ONLY and len(report.missing) + len(report.extra) > 0:
+            _logger.warning(
+                f"ODM indexes of {report.collection} differ from the declared ones. "
+                f"Missing: {report.missing} - Extra: {report.extra}"
+            )
+        _logger.info(
+            f"ODM indexes of {report.collection} synchronized ({mode}) in {report.duration_s:.3f}s. "
+            f"Created: {report.created} - Missing: {report.missing} - Extra: {report.extra}"
+        )
+    _logger.info(f"ODM indexes of {len(reports)} collections synchronized ({mode}) in {time.monotonic() - start:.3f}s.")
+    return reports
@@ -0,0 +1,171 @@
+"""Provides the pymongo event listeners exporting the ODM telemetry."""
+
+import json
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from opentelemetry import metrics
+from opentelemetry.semconv.trace import SpanAttributes
+from opentelemetry.trace import Span
+from pymongo import monitoring
+
+SANITIZED_VALUE: str = "?"
+# The fields of the commands holding the values of the application, sanitized in the statements
+SANITIZED_COMMAND_FIELDS: frozenset[str] = frozenset(
+    {"filter", "query", "q", "pipeline", "update", "u", "updates", "deletes", "documents"}
+)
+# The fields of the commands describing the query, kept in the statements
+KEPT_COMMAND_FIELDS: frozenset[str] = frozenset({"sort", "projection", "hint", "limit"})
+
+
+class PoolMetricsListener(monitoring.ConnectionPoolListener):
+    """Export the connection pool events as OpenTelemetry metrics.
+
+    Metrics:
+    - db.client.connections.wait_time: the duration to check out a connection.
+    - db.client.connections.usage: the connections in the pool by state (idle or used).
+    - db.client.connections.checkout_failures: the failed check outs by reason.
+    """
+
+    METER_HISTOGRAM_WAIT_TIME_NAME: str = "db.client.connections.wait_time"
+    METER_UP_DOWN_COUNTER_USAGE_NAME: str = "db.client.connections.usage"
+    METER_COUNTER_CHECKOUT_FAILURES_NAME: str = "db.client.connections.checkout_failures"
+
+    STATE_IDLE: str = "idle"
+    STATE_USED: str = "used"
+
+    def __init__(self, meter: metrics.Meter | None = None) -> None:
+        """Initialize the listener and its instruments.
+
+        Args:
+            meter (metrics.Meter | None, optional): The meter to use. Defaults to None (meter of the global provider).
+        """
+        self._meter: metrics.Meter = meter if meter is not None else metrics.get_meter(__name__)
+        self._wait_time: metrics.Histogram = self._meter.create_histogram(
+            name=self.METER_HISTOGRAM_WAIT_TIME_NAME,
+            unit="s",
+            description="The time it took to obtain a connection from the pool.",
+        )
+        self._usage: metrics.UpDownCounter = self._meter.create_up_down_counter(
+            name=self.METER_UP_DOWN_COUNTER_USAGE_NAME,
+            unit="{connection}",
+            description="The number of connections in the pool by state.",
+        )
+        self._checkout_failures: metrics.Counter = self._meter.create_counter(
+            name=self.METER_COUNTER_CHECKOUT_FAILURES_NAME,
+            unit="{failure}",
+            description="The number of failed connection check outs.",
+        )
+
+    @staticmethod
+    def _pool_name(address: tuple[str, int | None]) -> str:
+        """Build the pool name from the server address.
+
+        Args:
+            address (tuple[str, int | None]): The server address.
+
+        Returns:
+            str: The pool name.
+        """
+        return f"{address[0]}:{address[1]}"
+
+    def pool_created(self, event: monitoring.PoolCreatedEvent) -> None:
+        """Nothing to record when a pool is created."""
+
+    def pool_ready(self, event: monitoring.PoolReadyEvent) -> None:
+        """Nothing to record when a pool is ready."""
+
+    def pool_cleared(self, event: monitoring.PoolClearedEvent) -> None:
+        """Nothing to record when a pool is cleared, the connections closed are recorded one by one."""
+
+    def pool_closed(self, event: monitoring.PoolClosedEvent) -> None:
+        """Nothing to record when a pool is closed, the connections closed are recorded one by one."""
+
+    def connection_created(self, event: monitoring.ConnectionCreatedEvent) -> None:
+        """Record a new idle connection in the pool."""
+        self._usage.add(amount=1, attributes={"pool.name": self._pool_name(event.address), "state": self.STATE_IDLE})
+
+    def connection_ready(self, event: monitoring.ConnectionReadyEvent) -> None:
+        """Nothing to record when a connection is ready."""
+
+    def connection_closed(self, event: monitoring.ConnectionClosedEvent) -> None:
+        """Remove the closed connection (always checked in before being closed) from the pool."""
+        self._usage.add(amount=-1, attributes={"pool.name": self._pool_name(event.address), "state": self.STATE_IDLE})
+
+    def connection_check_out_started(self, event: monitoring.ConnectionCheckOutStartedEvent) -> None:
+        """Nothing to record when a check out starts, the duration is provided on completion."""
+
+    def connection_check_out_failed(self, event: monitoring.ConnectionCheckOutFailedEvent) -> None:
+        """Record the failed check out and its wait time."""
+        pool_name: str = self._pool_name(event.address)
+        self._checkout_failures.add(amount=1, attributes={"pool.name": pool_name, "reason": str(event.reason)})
+        if event.duration is not None:
+            self._wait_time.record(amount=event.duration, attributes={"pool.name": pool_name})
+
+    def connection_checked_out(self, event: monitoring.ConnectionCheckedOutEvent) -> None:
+        """Record the wait time and move the connection from idle to used."""
+        pool_name: str = self._pool_name(event.address)
+        if event.duration is not None:
+            self._wait_time.record(amount=event.duration, attributes={"pool.name": pool_name})
+        self._usage.add(amount=-1, attributes={"pool.name": pool_name, "state": self.STATE_IDLE})
+        self._usage.add(amount=1, attributes={"pool.name": pool_name, "state": self.STATE_USED})
+
+    def connection_checked_in(self, event: monitoring.ConnectionCheckedInEvent) -> None:
+        """Move the connection from used to idle."""
+        pool_name: str = self._pool_name(event.address)
+        self._usage.add(amount=-1, attributes={"pool.name": pool_name, "state": self.STATE_USED})
+        self._usage.add(amount=1, attributes={"pool.name": pool_name, "state": self.STATE_IDLE})
+
+
+def sanitize_value(value: Any) -> Any:
+    """Replace the values of a command field by placeholders, keeping the field names and operators.
+
+    The items of a sequence with the same shape are kept once, e.g. `{"$in": ["?"]}` for any list of IDs.
+
+    Args:
+        value (Any): The value of a command field.
+
+    Returns:
+        Any: The value sanitized.
+    """
+    if isinstance(value, Mapping):
+        return {key: sanitize_value(item) for key, item in value.items()}
+    if isinstance(value, Sequence) and not isinstance(value, str | bytes):
+        shapes: dict[str, Any] = {}
+        for item in value:
+            sanitized: Any = sanitize_value(item)
+            shapes.setdefault(json.dumps(sanitized, sort_keys=True, default=str), sanitized)
+        return list(shapes.values())
+    return SANITIZED_VALUE
+
+
+def sanitize_command(command_name: str, command: Mapping[str, Any]) -> str:
+    """Build the statement of a command, without the values of the application.
+
+    Args:
+        command_name (str): The name of the command.
+        command (Mapping[str, Any]): The command.
+
+    Returns:
+        str: The statement, e.g. `find {"filter": {"title": "?"}, "limit": 10}`.
+    """
+    statement: dict[str, Any] = {}
+    for key, value in command.items():
+        if key in SANITIZED_COMMAND_FIELDS:
+            statement[key] = sanitize_value(value)
+        elif key in KEPT_COMMAND_FIELDS:
+            statement[key] = value
+    if len(statement) == 0:
+        return command_name
+    return f"{command_name} {json.dumps(statement, default=str)}"
+
+
+def set_sanitized_statement(span: Span, event: monitoring.CommandStartedEvent) -> None:
+    """Set the sanitized statement of the command on its span, hook of the pymongo instrumentation.
+
+    Args:
+        span (Span): The span of the command.
+        event (monitoring.CommandStartedEvent): The event of the command started.
+    """
+    if span.is_recording():
+        span.set_attribute(SpanAttributes.DB_STATEMENT, sanitize_command(event.command_name, event.command))
@@ -0,0 +1,261 @@
+"""Provides the request-scoped entity loader, batching the reads by ID of the repositories."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Generic, TypeVar
+from uuid import UUID
+
+from pydantic import BaseModel
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from .exceptions import ODMPluginBaseException
+
+EntityGenericType = TypeVar("EntityGenericType", bound=BaseModel)  # pylint: disable=invalid-name
+
+BatchLoadFunction = Callable[[list[UUID]], Awaitable[Mapping[UUID, EntityGenericType]]]
+
+
+class EntityLoader(Generic[EntityGenericType]):
+    """Batches the loads by ID requested in the same event loop iteration into one query.
+
+    The IDs are deduplicated and the entities kept in an identity map: a second load of an ID returns the
+    same entity without any query. The loader is meant to live for one request. Inside `using_entity_loaders`,
+    the repositories load their entities by ID with one, see `AbstractRepository.get_one_by_id`. It can also
+    be built in a dependency:
+
+    ```python
+    def get_book_loader(request: Request) -> EntityLoader[BookEntity]:
+        return EntityLoader(batch_load=BookRepository(request.app.state.odm_database).get_many_by_ids)
+
+
+    books = await asyncio.gather(*(book_loader.load(book_id) for book_id in book_ids))
+    ```
+
+    The writes are not tracked by a loader built by hand, `clear` the entities written during the request
+    before loading them again.
+    """
+
+    DEFAULT_MAX_BATCH_SIZE: int = 1000
+
+    def __init__(
+        self,
+        batch_load: BatchLoadFunction[EntityGenericType],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ) -> None:
+        """Initialize the loader.
+
+        Args:
+            batch_load (BatchLoadFunction[EntityGenericType]): Loads the entities of IDs, in one query,
+                returning them by ID (the missing ones are absent), e.g. `AbstractRepository.get_many_by_ids`.
+            max_batch_size (int, optional): The maximum number of IDs per query. Defaults to DEFAULT_MAX_BATCH_SIZE.
+
+        Raises:
+            ValueError: If the maximum batch size is not positive.
+        """
+        if max_batch_size <= 0:
+            raise ValueError(f"The max batch size must be positive, got {max_batch_size}")
+        self._batch_load: BatchLoadFunction[EntityGenericType] = batch_load
+        self._max_batch_size: int = max_batch_size
+        # Identity map, the loads in progress and done by ID
+        self._loads: dict[UUID, asyncio.Future[EntityGenericType | None]] = {}
+        self._queue: list[UUID] = []
+        # Strong references to the batches in progress, the event loop only keeps weak ones
+        self._batches: set[asyncio.Task[None]] = set()
+
+    async def load(self, entity_id: UUID) -> EntityGenericType | None:
+        """Load an entity by its ID, in the batch of the current event loop iteration.
+
+        Args:
+            entity_id (UUID): The ID of the entity.
+
+        Returns:
+            EntityGenericType | None: The entity, or None if not found.
+
+        Raises:
+            OperationError: If the query of the batch fails.
+        """
+        load: asyncio.Future[EntityGenericType | None] | None = self._loads.get(entity_id)
+        if load is None:
+            loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+            load = loop.create_future()
+            self._loads[entity_id] = load
+            if len(self._queue) == 0:
+                # After the callbacks already scheduled, so that the loads requested alongside join the batch
+                loop.call_soon(self._dispatch)
+            self._queue.append(entity_id)
+        # Shielded, the load is shared with the other readers of the ID
+        return await asyncio.shield(load)
+
+    async def load_many(self, entity_ids: Iterable[UUID]) -> list[EntityGenericType | None]:
+        """Load entities by their IDs, in one batch.
+
+        Args:
+            entity_ids (Iterable[UUID]): The IDs of the entities.
+
+        Returns:
+            list[EntityGenericType | None]: The entities, None for the ones not found, in the order of the IDs.
+        """
+        return list(await asyncio.gather(*(self.load(entity_id) for entity_id in entity_ids)))
+
+    def clear(self, entity_id: UUID | None = None) -> None:
+        """Forget an entity, or all of them, to load them again.
+
+        Args:
+            entity_id (UUID | None, optional): The ID of the entity. Defaults to None (all the entities).
+        """
+        if entity_id is None:
+            self._loads.clear()
+        else:
+            self._loads.pop(entity_id, None)
+
+    def _dispatch(self) -> None:
+        """Send the queries of the IDs queued."""
+        queue: list[UUID] = self._queue
+        self._queue = []
+        for offset in range(0, len(queue), self._max_batch_size):
+            batch: dict[UUID, asyncio.Future[EntityGenericType | None]] = {
+                entity_id: self._loads[entity_id]
+                for entity_id in queue[offset : offset + self._max_batch_size]
+                if entity_id in self._loads
+            }
+            task: asyncio.Task[None] = asyncio.create_task(self._load_batch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _load_batch(self, batch: dict[UUID, "asyncio.Future[EntityGenericType | None]"]) -> None:
+        """Query a batch of IDs and resolve their loads.
+
+        Args:
+            batch (dict[UUID, asyncio.Future[EntityGenericType | None]]): The loads by ID.
+        """
+        try:
+            entities: Mapping[UUID, EntityGenericType] = await self._batch_load(list(batch))
+        except asyncio.CancelledError:
+            self._forget(batch)
+            for load in batch.values():
+                load.cancel()
+            raise
+        except (Exception, ODMPluginBaseException) as error:  # pylint: disable=broad-except
+            self._forget(batch)
+            for load in batch.values():
+                if not load.done():
+                    load.set_exception(error)
+                    # Retrieved, none of the readers may be left
+                    load.exception()
+            return
+
+        for entity_id, load in batch.items():
+            if not load.done():
+                load.set_result(entities.get(entity_id))
+
+    def _forget(self, batch: dict[UUID, "asyncio.Future[EntityGenericType | None]"]) -> None:
+        """Remove the loads of a failed batch from the identity map, so that a next load tries again.
+
+        Args:
+            batch (dict[UUID, asyncio.Future[EntityGenericType | None]]): The loads by ID.
+        """
+        for entity_id, load in batch.items():
+            if self._loads.get(entity_id) is load:
+                del self._loads[entity_id]
+
+
+# Loaders of the request in progress in the current context, by collection and by repository
+_entity_loaders: ContextVar[dict[str, dict[Hashable, EntityLoader[Any]]] | None] = ContextVar(
+    "_entity_loaders", default=None
+)
+
+
+@contextmanager
+def using_entity_loaders() -> Iterator[None]:
+    """Batch the reads by ID of the repositories made inside the block, a request usually.
+
+    The `get_one_by_id` of a repository made in the same event loop iteration are sent as one `$in` query,
+    and the entities loaded are kept until the end of the block, or until the repositories write them. The
+    reads in a transaction are not batched. Outside of a block, each read by ID is its own query: the requests
+    enter one through the `EntityLoadersMiddleware` of the application.
+
+    ```python
+    with using_entity_loaders():
+        authors = await asyncio.gather(*(author_repository.get_one_by_id(book.author_id) for book in books))
+    ```
+
+    Yields:
+        None: Nothing.
+    """
+    token = _entity_loaders.set({})
+    try:
+        yield
+    finally:
+        _entity_loaders.reset(token)
+
+
+class EntityLoadersMiddleware:
+    """ASGI middleware running each request in `using_entity_loaders`, batching its reads by ID.
+
+    The reads by ID of the repositories are only batched inside the middleware, added by the application:
+
+    ```python
+    application.get_asgi_app().add_middleware(EntityLoadersMiddleware)
+    ```
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Instantiate the middleware.
+
+        Args:
+            app (ASGIApp): The application.
+        """
+        self._app: ASGIApp = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Forward the requests to the application in their own entity loaders, and the other calls as is."""
+        if scope["type"] not in ("http", "websocket"):
+            await self._app(scope, receive, send)
+            return
+        with using_entity_loaders():
+            await self._app(scope, receive, send)
+
+
+def get_entity_loader(
+    collection_name: str, key: Hashable, batch_load: BatchLoadFunction[EntityGenericType]
+) -> EntityLoader[EntityGenericType] | None:
+    """Get the loader of a repository in the current context, built on its first use.
+
+    Args:
+        collection_name (str): The name of the collection of the repository.
+        key (Hashable): The key of the loader in the collection, e.g. the entity type and the read options.
+        batch_load (BatchLoadFunction[EntityGenericType]): The batch load of the loader, if built.
+
+    Returns:
+        EntityLoader[EntityGenericType] | None: The loader, or None outside of `using_entity_loaders`.
+    """
+    loaders: dict[str, dict[Hashable, EntityLoader[Any]]] | None = _entity_loaders.get()
+    if loaders is None:
+        return None
+    collection_loaders: dict[Hashable, EntityLoader[Any]] = loaders.setdefault(collection_name, {})
+    loader: EntityLoader[Any] | None = collection_loaders.get(key)
+    if loader is None:
+        loader = EntityLoader(batch_load=batch_load)
+        collection_loaders[key] = loader
+    return loader
+
+
+def clear_entity_loaders(collection_name: str, entity_ids: Iterable[UUID] | None = None) -> None:
+    """Forget entities of a collection, or all of them, in the loaders of the current context.
+
+    Args:
+        collection_name (str): The name of the collection.
+        entity_ids (Iterable[UUID] | None, optional): The IDs of the entities. Defaults to None (all the
+            entities).
+    """
+    loaders: dict[str, dict[Hashable, EntityLoader[Any]]] | None = _entity_loaders.get()
+    if loaders is None:
+        return
+    for loader in loaders.get(collection_name, {}).values():
+        if entity_ids is None:
+            loader.clear()
+            continue
+        for entity_id in entity_ids:
+            loader.clear(entity_id)
@@ -0,0 +1,133 @@
+"""Provides the mapper between the documents and the entities of the repositories."""
+
+from functools import cache
+from typing import Any, Generic, TypeVar
+
+from pydantic import BaseModel
+
+from .documents import BaseDocument
+
+DocumentGenericType = TypeVar("DocumentGenericType", bound=BaseDocument)  # pylint: disable=invalid-name
+EntityGenericType = TypeVar("EntityGenericType", bound=BaseModel)  # pylint: disable=invalid-name
+
+
+class DocumentEntityMapper(Generic[DocumentGenericType, EntityGenericType]):
+    """Maps the entities to the documents and back, compiled once per (document, entity) pair.
+
+    The entities are validated against the document when they are written, it is the trust boundary.
+    The documents were validated when they were loaded from the database or built from an entity, so
+    when the entity layout allows it, the entities are built from their values without a second
+    validation nor the intermediate dictionary of `model_dump` (trusted construction).
+
+    A layout allows it when the fields shared by the document and the entity have the same annotation,
+    the entity has no validator, no alias, no private attribute, no `model_post_init`, does not keep
+    the extra fields, and defaults all the fields that the document does not have. Otherwise, the
+    mapper falls back to the validation of the dump.
+    """
+
+    def __init__(self, document_type: type[DocumentGenericType], entity_type: type[EntityGenericType]) -> None:
+        """Compile the mapper.
+
+        Args:
+            document_type (type[DocumentGenericType]): The document type.
+            entity_type (type[EntityGenericType]): The entity type.
+        """
+        self._document_type: type[DocumentGenericType] = document_type
+        self._entity_type: type[EntityGenericType] = entity_type
+
+        document_fields: dict[str, Any] = document_type.model_fields
+        entity_fields: dict[str, Any] = entity_type.model_fields
+        self._shared_fields: tuple[str, ...] = tuple(name for name in entity_fields if name in document_fields)
+        self._defaulted_fields: tuple[tuple[str, Any], ...] = tuple(
+            (name, field) for name, field in entity_fields.items() if name not in document_fields
+        )
+
+        self._maps_revision: bool = "revision_id" in entity_fields
+        # Same annotations: the values of the one are valid values of the other as is
+        self._same_layout: bool = all(
+            entity_fields[name].annotation == document_fields[name].annotation for name in self._shared_fields
+        )
+        decorators: Any = entity_type.__pydantic_decorators__
+        self._trusted_construction: bool = (
+            self._same_layout
+            and not (
+                decorators.validators
+                or decorators.field_validators
+                or decorators.root_validators
+                or decorators.model_validators
+            )
+            and entity_type.model_config.get("extra") != "allow"
+            and not entity_type.__private_attributes__
+            and entity_type.__pydantic_post_init__ is None
+            and all(field.alias is None for field in entity_fields.values())
+            and all(not field.is_required() for _, field in self._defaulted_fields)
+        )
+
+    @property
+    def trusted_construction(self) -> bool:
+        """Whether the entities are built from the documents without validation."""
+        return self._trusted_construction
+
+    def to_document(self, entity: EntityGenericType) -> DocumentGenericType:
+        """Build and validate the document of an entity.
+
+        Args:
+            entity (EntityGenericType): The entity.
+
+        Returns:
+            DocumentGenericType: The document.
+
+        Raises:
+            ValueError: If the entity is not a valid document.
+        """
+        if self._same_layout:
+            # Shallow, the nested values are validated by the document as they are
+            return self._document_type(**entity.__dict__, **(entity.__pydantic_extra__ or {}))
+        return self._document_type(**entity.model_dump())
+
+    def to_entity(self, document: DocumentGenericType) -> EntityGenericType:
+        """Build the entity of a document.
+
+        Args:
+            document (DocumentGenericType): The document, from the database or built by `to_document`.
+
+        Returns:
+            EntityGenericType: The entity.
+
+        Raises:
+            ValueError: If the document is not a valid entity.
+        """
+        if not self._trusted_construction:
+            dumped_values: dict[str, Any] = document.model_dump()
+            if self._maps_revision:
+                # Excluded from the dumps by beanie
+                dumped_values["revision_id"] = document.revision_id
+            return self._entity_type(**dumped_values)
+
+        # Same as `model_construct`, without the checks already done once for all at the compilation
+        document_values: dict[str, Any] = document.__dict__
+        values: dict[str, Any] = {name: document_values[name] for name in self._shared_fields}
+        for name, field in self._defaulted_fields:
+            values[name] = field.get_default(call_default_factory=True)
+        entity: EntityGenericType = self._entity_type.__new__(self._entity_type)
+        object.__setattr__(entity, "__dict__", values)
+        object.__setattr__(entity, "__pydantic_fields_set__", set(self._shared_fields))
+        object.__setattr__(entity, "__pydantic_extra__", None)
+        object.__setattr__(entity, "__pydantic_private__", None)
+        return entity
+
+
+@cache
+def get_mapper(
+    document_type: type[DocumentGenericType], entity_type: type[EntityGenericType]
+) -> DocumentEntityMapper[DocumentGenericType, EntityGenericType]:
+    """Get the mapper of a (document, entity) pair, compiled on the first call.
+
+    Args:
+        document_type (type[DocumentGenericType]): The document type.
+        entity_type (type[EntityGenericType]): The entity type.
+
+    Returns:
+        DocumentEntityMapper[DocumentGenericType, EntityGenericType]: The mapper.
+    """
+    return DocumentEntityMapper(document_type=document_type, entity_type=entity_type)
@@ -0,0 +1,55 @@
+"""Provides the metrics of the repository operations."""
+
+from opentelemetry import metrics
+
+
+class RepositoryMetrics:
+    """Records the latency and the errors of the repository operations, by collection and operation.
+
+    Metrics:
+    - odm.repository.operation.duration: the duration of the operations.
+    - odm.repository.operation.errors: the operations failed, by error type.
+    """
+
+    METER_HISTOGRAM_DURATION_NAME: str = "odm.repository.operation.duration"
+    METER_COUNTER_ERRORS_NAME: str = "odm.repository.operation.errors"
+
+    ATTRIBUTE_COLLECTION: str = "db.collection.name"
+    ATTRIBUTE_OPERATION: str = "db.operation.name"
+    ATTRIBUTE_ERROR_TYPE: str = "error.type"
+
+    def __init__(self, meter: metrics.Meter | None = None) -> None:
+        """Initialize the instruments.
+
+        Args:
+            meter (metrics.Meter | None, optional): The meter to use. Defaults to None (meter of the global provider).
+        """
+        meter = meter if meter is not None else metrics.get_meter(__name__)
+        self._duration: metrics.Histogram = meter.create_histogram(
+            name=self.METER_HISTOGRAM_DURATION_NAME,
+            unit="s",
+            description="The duration of the repository operations.",
+        )
+        self._errors: metrics.Counter = meter.create_counter(
+            name=self.METER_COUNTER_ERRORS_NAME,
+            unit="{operation}",
+            description="The number of repository operations failed.",
+        )
+
+    def record(self, collection: str, operation: str, duration_s: float, error: BaseException | None = None) -> None:
+        """Record an operation.
+
+        Args:
+            collection (str): The name of the collection.
+            operation (str): The name of the operation.
+            duration_s (float): The duration of the operation, in seconds.
+            error (BaseException | None, optional): The error of the operation. Defaults to None (succeeded).
+        """
+        attributes: dict[str, str] = {self.ATTRIBUTE_COLLECTION: collection, self.ATTRIBUTE_OPERATION: operation}
+        self._duration.record(amount=duration_s, attributes=attributes)
+        if error is not None:
+            self._errors.add(amount=1, attributes={**attributes, self.ATTRIBUTE_ERROR_TYPE: type(error).__name__})
+
+
+# The metrics of the repositories, from the meter provider set globally by the OpenTelemetry plugin
+repository_metrics: RepositoryMetrics = RepositoryMetrics()
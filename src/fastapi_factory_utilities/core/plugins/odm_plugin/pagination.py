@@ -0,0 +1,77 @@
+"""Provides the keyset pagination primitives for the repositories."""
+
+import base64
+import binascii
+import datetime
+from typing import Any, Generic, TypeVar
+from uuid import UUID
+
+from beanie import SortDirection
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+from .exceptions import InvalidPageCursorError
+
+ItemGenericType = TypeVar("ItemGenericType", bound=BaseModel)  # pylint: disable=invalid-name
+
+# Order of the pages, newest first; the ID breaks the ties between documents created at the same time.
+KEYSET_SORT: list[tuple[str, SortDirection]] = [
+    ("created_at", SortDirection.DESCENDING),
+    ("_id", SortDirection.DESCENDING),
+]
+
+
+class PageCursor(BaseModel):
+    """Position after the last document of a page, exchanged with the clients as an opaque token."""
+
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+
+    created_at: datetime.datetime = Field(alias="c")
+    id: UUID = Field(alias="i")
+
+    def encode(self) -> str:
+        """Encode the cursor as an URL safe opaque token.
+
+        Returns:
+            str: The token.
+        """
+        return base64.urlsafe_b64encode(self.model_dump_json(by_alias=True).encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "PageCursor":
+        """Decode a token built by `encode`.
+
+        Args:
+            token (str): The token.
+
+        Returns:
+            PageCursor: The cursor.
+
+        Raises:
+            InvalidPageCursorError: If the token is not a valid cursor.
+        """
+        try:
+            return cls.model_validate_json(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+        except (binascii.Error, ValidationError, ValueError) as error:
+            raise InvalidPageCursorError(f"Invalid page cursor: {token}") from error
+
+    def to_filter(self) -> dict[str, Any]:
+        """Build the filter selecting the documents after the cursor in the `KEYSET_SORT` order.
+
+        Returns:
+            dict[str, Any]: The MongoDB filter.
+        """
+        return {
+            "$or": [
+                {"created_at": {"$lt": self.created_at}},
+                {"created_at": self.created_at, "_id": {"$lt": self.id}},
+            ]
+        }
+
+
+class Page(BaseModel, Generic[ItemGenericType]):
+    """Page of items of a keyset pagination."""
+
+    items: list[ItemGenericType] = Field(description="The items of the page.")
+    next_cursor: str | None = Field(
+        default=None, description="The token to fetch the next page, None if this page is the last one."
+    )
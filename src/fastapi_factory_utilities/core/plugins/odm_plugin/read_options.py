@@ -0,0 +1,170 @@
+"""Provides the read preferences and read concerns of the repository reads."""
+
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import StrEnum
+from functools import wraps
+from typing import Any, ParamSpec, Self, TypeVar
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pymongo.read_concern import ReadConcern
+from pymongo.read_preferences import (
+    Nearest,
+    Primary,
+    PrimaryPreferred,
+    Secondary,
+    SecondaryPreferred,
+)
+
+ParamsGenericType = ParamSpec("ParamsGenericType")  # pylint: disable=invalid-name
+ResultGenericType = TypeVar("ResultGenericType")  # pylint: disable=invalid-name
+
+# The smallest staleness accepted by the servers
+MIN_MAX_STALENESS_S: int = 90
+
+DriverReadPreference = Primary | PrimaryPreferred | Secondary | SecondaryPreferred | Nearest
+
+
+class ReadPreferenceMode(StrEnum):
+    """The members of the replica set a read can be sent to."""
+
+    PRIMARY = "primary"
+    PRIMARY_PREFERRED = "primaryPreferred"
+    SECONDARY = "secondary"
+    SECONDARY_PREFERRED = "secondaryPreferred"
+    NEAREST = "nearest"
+
+
+class ReadConcernLevel(StrEnum):
+    """The consistency and isolation of the data read."""
+
+    LOCAL = "local"
+    AVAILABLE = "available"
+    MAJORITY = "majority"
+    LINEARIZABLE = "linearizable"
+    SNAPSHOT = "snapshot"
+
+
+class ReadOptions(BaseModel):
+    """The read preference and read concern of a read, None keeps the ones of the client.
+
+    ```python
+    # The listings can lag a little behind the primary
+    LISTING_READS = ReadOptions(read_preference=ReadPreferenceMode.SECONDARY_PREFERRED, max_staleness_s=120)
+    ```
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    read_preference: ReadPreferenceMode | None = None
+    max_staleness_s: int | None = Field(
+        default=None,
+        ge=MIN_MAX_STALENESS_S,
+        description="How far behind the primary a secondary can be to be read from, not for the primary mode.",
+    )
+    read_concern: ReadConcernLevel | None = None
+
+    @model_validator(mode="after")
+    def _check_max_staleness(self) -> Self:
+        """Check the staleness is only given with a mode reading from the secondaries."""
+        if self.max_staleness_s is not None and self.read_preference in (None, ReadPreferenceMode.PRIMARY):
+            raise ValueError("The max staleness needs a read preference reading from the secondaries.")
+        return self
+
+    def get_read_preference(self) -> DriverReadPreference | None:
+        """Get the read preference of the driver.
+
+        Returns:
+            DriverReadPreference | None: The read preference, or None to keep the one of the client.
+        """
+        max_staleness: int = self.max_staleness_s if self.max_staleness_s is not None else -1
+        match self.read_preference:
+            case None:
+                return None
+            case ReadPreferenceMode.PRIMARY:
+                return Primary()
+            case ReadPreferenceMode.PRIMARY_PREFERRED:
+                return PrimaryPreferred(max_staleness=max_staleness)
+            case ReadPreferenceMode.SECONDARY:
+                return Secondary(max_staleness=max_staleness)
+            case ReadPreferenceMode.SECONDARY_PREFERRED:
+                return SecondaryPreferred(max_staleness=max_staleness)
+            case ReadPreferenceMode.NEAREST:
+                return Nearest(max_staleness=max_staleness)
+
+    def get_read_concern(self) -> ReadConcern | None:
+        """Get the read concern of the driver.
+
+        Returns:
+            ReadConcern | None: The read concern, or None to keep the one of the client.
+        """
+        return ReadConcern(level=self.read_concern.value) if self.read_concern is not None else None
+
+
+# Read options of the reads in progress in the current context, used by the reads which are not given any
+_read_options: ContextVar[ReadOptions | None] = ContextVar("_read_options", default=None)
+
+
+def get_read_options() -> ReadOptions | None:
+    """Get the read options of the reads in progress in the current context.
+
+    Returns:
+        ReadOptions | None: The read options, or None outside of `using_read_options`.
+    """
+    return _read_options.get()
+
+
+@contextmanager
+def using_read_options(read_options: ReadOptions) -> Iterator[ReadOptions]:
+    """Route the repository reads made inside the block with the read options.
+
+    The reads given their own read options, and the reads in a transaction (always on the primary), are not routed.
+
+    ```python
+    with using_read_options(LISTING_READS):
+        page = await book_repository.find_page(limit=20)
+    ```
+
+    Args:
+        read_options (ReadOptions): The read options.
+
+    Yields:
+        ReadOptions: The read options.
+    """
+    token = _read_options.set(read_options)
+    try:
+        yield read_options
+    finally:
+        _read_options.reset(token)
+
+
+def with_read_options(
+    read_options: ReadOptions,
+) -> Callable[
+    [Callable[ParamsGenericType, Awaitable[ResultGenericType]]],
+    Callable[ParamsGenericType, Awaitable[ResultGenericType]],
+]:
+    """Decorator routing the repository reads of the coroutine function with the read options.
+
+    ```python
+    @with_read_options(LISTING_READS)
+    async def get_books_page(self, limit: int, cursor: str | None) -> Page[BookEntity]:
+        return await self.book_repository.find_page(limit=limit, cursor=cursor)
+    ```
+
+    Args:
+        read_options (ReadOptions): The read options, see `using_read_options`.
+    """
+
+    def decorator(
+        func: Callable[ParamsGenericType, Awaitable[ResultGenericType]],
+    ) -> Callable[ParamsGenericType, Awaitable[ResultGenericType]]:
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> ResultGenericType:
+            with using_read_options(read_options):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
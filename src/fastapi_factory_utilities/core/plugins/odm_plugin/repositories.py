@@ -1,28 +1,97 @@
 """Provides the abstract classes for the repositories."""
 
+import asyncio
+import datetime
+import time
 from abc import ABC
-from collections.abc import AsyncGenerator, Callable
-from contextlib import asynccontextmanager
-from typing import Any, Generic, TypeVar, get_args
-from uuid import UUID
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable, Mapping, Sequence
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from functools import partial, wraps
+from inspect import isasyncgenfunction
+from typing import Any, Generic, TypeVar, get_args, overload
+from uuid import UUID, uuid4
 
-from motor.motor_asyncio import AsyncIOMotorClientSession, AsyncIOMotorDatabase
-from pydantic import BaseModel
-from pymongo.errors import DuplicateKeyError, PyMongoError
-from pymongo.results import DeleteResult
+from beanie.exceptions import RevisionIdWasChanged
+from beanie.odm.utils.dump import get_dict
+from beanie.odm.utils.encoder import Encoder
+from beanie.odm.utils.parsing import parse_obj
+from beanie.odm.utils.projection import get_projection
+from bson.raw_bson import RawBSONDocument
+from motor.motor_asyncio import (
+    AsyncIOMotorClientSession,
+    AsyncIOMotorCollection,
+    AsyncIOMotorCommandCursor,
+    AsyncIOMotorCursor,
+    AsyncIOMotorDatabase,
+)
+from pydantic import BaseModel, Field
+from pymongo import DeleteMany, DeleteOne, InsertOne, ReplaceOne, ReturnDocument, UpdateMany, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError, PyMongoError
+from pymongo.results import DeleteResult, UpdateResult
 
+from .aggregations import Pipeline
+from .cache import EntityCache, cache_invalidation_bus
 from .documents import BaseDocument
-from .exceptions import OperationError, UnableToCreateEntityDueToDuplicateKeyError
+from .exceptions import (
+    OperationError,
+    RevisionConflictError,
+    UnableToCreateEntitiesDueToDuplicateKeyError,
+    UnableToCreateEntityDueToDuplicateKeyError,
+)
+from .loaders import EntityLoader, clear_entity_loaders, get_entity_loader
+from .mappers import DocumentEntityMapper, get_mapper
+from .metrics import RepositoryMetrics, repository_metrics
+from .pagination import KEYSET_SORT, Page, PageCursor
+from .read_options import ReadOptions, get_read_options
+from .resilience import Resilience, repository_resilience
+from .unit_of_work import (
+    DEFAULT_MAX_ATTEMPTS,
+    call_after_commit,
+    get_unit_of_work_session,
+    run_in_unit_of_work,
+    unit_of_work,
+)
+from .write_behind import WriteBehindBuffer
 
 DocumentGenericType = TypeVar("DocumentGenericType", bound=BaseDocument)  # pylint: disable=invalid-name
 EntityGenericType = TypeVar("EntityGenericType", bound=BaseModel)  # pylint: disable=invalid-name
+ProjectionGenericType = TypeVar("ProjectionGenericType", bound=BaseModel)  # pylint: disable=invalid-name
+ResultGenericType = TypeVar("ResultGenericType")  # pylint: disable=invalid-name
+
+SortSpecification = Sequence[tuple[str, int]]
+
+WriteOperation = InsertOne[Any] | ReplaceOne[Any] | UpdateOne | UpdateMany | DeleteOne | DeleteMany
+
+DUPLICATE_KEY_ERROR_CODE: int = 11000
+
+
+class BulkWriteItemError(BaseModel):
+    """Error of one operation of a bulk write."""
+
+    index: int = Field(description="The index of the operation in the input.")
+    code: int = Field(description="The MongoDB error code.")
+    message: str = Field(description="The MongoDB error message.")
+
+
+class BulkWriteSummary(BaseModel):
+    """Summary of a bulk write executed in one or several batches."""
+
+    inserted_count: int = 0
+    upserted_count: int = 0
+    matched_count: int = 0
+    modified_count: int = 0
+    deleted_count: int = 0
+    # Index after the last operation executed (the operations after it were not executed in ordered mode)
+    executed_until: int = 0
+    write_errors: list[BulkWriteItemError] = Field(default_factory=list)
 
 
 def managed_session() -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """Decorator to manage the session.
 
     It will introspect the function arguments and check if the session is passed as a keyword argument.
-    If it is not, it will create a new session and pass it to the function.
+    If it is not, it will pass the session of the unit of work in progress, if any, or no session at all:
+    the driver then uses an implicit session, without the checkout of an explicit one for each call.
     """
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
@@ -30,8 +99,112 @@ def managed_session() -> Callable[[Callable[..., Any]], Callable[..., Any]]:
             if "session" in kwargs:
                 return await func(*args, **kwargs)
 
-            async with args[0].get_session() as session:
-                return await func(*args, **kwargs, session=session)
+            return await func(*args, **kwargs, session=get_unit_of_work_session())
+
+        return wrapper
+
+    return decorator
+
+
+def measured(operation: str | None = None) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorator recording the duration and the errors of a repository method in the repository metrics.
+
+    The cancellations are not counted as errors. The duration of an async generator runs until it is
+    exhausted or closed.
+
+    Args:
+        operation (str | None, optional): The name of the operation. Defaults to None (the name of the method).
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        operation_name: str = operation if operation is not None else func.__name__
+
+        def record(self: "AbstractRepository[Any, Any]", start: float, error: BaseException | None) -> None:
+            self._repository_metrics.record(
+                collection=self._document_type.get_collection_name(),
+                operation=operation_name,
+                duration_s=time.perf_counter() - start,
+                error=None if isinstance(error, asyncio.CancelledError | GeneratorExit) else error,
+            )
+
+        if isasyncgenfunction(func):
+
+            @wraps(func)
+            async def generator_wrapper(self: "AbstractRepository[Any, Any]", *args: Any, **kwargs: Any) -> Any:
+                start: float = time.perf_counter()
+                error: BaseException | None = None
+                try:
+                    async for item in func(self, *args, **kwargs):
+                        yield item
+                except BaseException as exception:
+                    error = exception
+                    raise
+                finally:
+                    record(self, start, error)
+
+            return generator_wrapper
+
+        @wraps(func)
+        async def wrapper(self: "AbstractRepository[Any, Any]", *args: Any, **kwargs: Any) -> Any:
+            start: float = time.perf_counter()
+            error: BaseException | None = None
+            try:
+                return await func(self, *args, **kwargs)
+            except BaseException as exception:
+                error = exception
+                raise
+            finally:
+                record(self, start, error)
+
+        return wrapper
+
+    return decorator
+
+
+def resilient(retry: bool = False) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorator running a repository method behind the circuit breaker, retrying its transient errors.
+
+    Only the reads are retried, the writes relying on the retryable writes of the driver: a write retried
+    after a lost reply would not tell its own outcome apart (e.g. a delete finding nothing to delete).
+    The operations of a session are not retried, a transaction being aborted by a transient error: the
+    unit of work is retried as a whole by `run_in_unit_of_work`. The async generators are not retried,
+    their items being yielded already.
+
+    Args:
+        retry (bool, optional): Whether the method is idempotent, retried. Defaults to False.
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        def attributes(self: "AbstractRepository[Any, Any]") -> dict[str, str]:
+            return {
+                RepositoryMetrics.ATTRIBUTE_COLLECTION: self._document_type.get_collection_name(),
+                RepositoryMetrics.ATTRIBUTE_OPERATION: func.__name__,
+            }
+
+        if isasyncgenfunction(func):
+
+            @wraps(func)
+            async def generator_wrapper(self: "AbstractRepository[Any, Any]", *args: Any, **kwargs: Any) -> Any:
+                self._resilience.acquire(attributes(self))
+                error: BaseException | None = None
+                try:
+                    async for item in func(self, *args, **kwargs):
+                        yield item
+                except BaseException as exception:
+                    error = exception
+                    raise
+                finally:
+                    self._resilience.release(error)
+
+            return generator_wrapper
+
+        @wraps(func)
+        async def wrapper(self: "AbstractRepository[Any, Any]", *args: Any, **kwargs: Any) -> Any:
+            return await self._resilience.run(
+                partial(func, self, *args, **kwargs),
+                attributes=attributes(self),
+                retry=retry and kwargs.get("session") is None,
+            )
 
         return wrapper
 
@@ -41,14 +214,177 @@ def managed_session() -> Callable[[Callable[..., Any]], Callable[..., Any]]:
 class AbstractRepository(ABC, Generic[DocumentGenericType, EntityGenericType]):
     """Abstract class for the repository."""
 
-    def __init__(self, database: AsyncIOMotorDatabase[Any]) -> None:
-        """Initialize the repository."""
+    DEFAULT_BULK_BATCH_SIZE: int = 1000
+    DEFAULT_FIND_BATCH_SIZE: int = 500
+    DEFAULT_PAGE_LIMIT: int = 50
+
+    def __init__(
+        self,
+        database: AsyncIOMotorDatabase[Any],
+        entity_cache: EntityCache[EntityGenericType] | None = None,
+        read_options: ReadOptions | None = None,
+        metrics: RepositoryMetrics | None = None,
+        resilience: Resilience | None = None,
+    ) -> None:
+        """Initialize the repository.
+
+        Args:
+            database (AsyncIOMotorDatabase[Any]): The database.
+            entity_cache (EntityCache[EntityGenericType] | None, optional): The read-through cache of
+                `get_one_by_id`, invalidated by the writes of the repositories of the collection. Defaults to None
+                (no cache).
+            read_options (ReadOptions | None, optional): The read preference and read concern of the reads
+                of the repository. Defaults to None (the ones of the client).
+            metrics (RepositoryMetrics | None, optional): The metrics of the operations of the repository.
+                Defaults to None (the metrics shared by the repositories).
+            resilience (Resilience | None, optional): The retries and the circuit breaker of the operations of
+                the repository. Defaults to None (the ones shared by the repositories, configured by the plugin).
+        """
         super().__init__()
         self._database: AsyncIOMotorDatabase[Any] = database
+        self._entity_cache: EntityCache[EntityGenericType] | None = entity_cache
+        self._read_options: ReadOptions | None = read_options
+        self._repository_metrics: RepositoryMetrics = metrics if metrics is not None else repository_metrics
+        self._resilience: Resilience = resilience if resilience is not None else repository_resilience
+        # The collections routed by read options, with the collection they derive from
+        self._read_collections: dict[ReadOptions, tuple[AsyncIOMotorCollection[Any], AsyncIOMotorCollection[Any]]] = {}
         # Retrieve the generic concrete types
         generic_args: tuple[Any, ...] = get_args(self.__orig_bases__[0])  # type: ignore
         self._document_type: type[DocumentGenericType] = generic_args[0]
         self._entity_type: type[EntityGenericType] = generic_args[1]
+        self._mapper: DocumentEntityMapper[DocumentGenericType, EntityGenericType] = get_mapper(
+            self._document_type, self._entity_type
+        )
+        if entity_cache is not None:
+            # Invalidated by the writes of the repositories of the collection, and of the other processes when the
+            # change streams are watched
+            cache_invalidation_bus.subscribe(self._document_type.get_collection_name(), entity_cache)
+
+    def _invalidate_cache(self, entity_ids: Iterable[UUID] | None = None) -> None:
+        """Publish the invalidation of the entities written to the entity caches of the collection.
+
+        The caches of all the repositories of the collection are invalidated, not only the one of this
+        repository, as well as the entity loaders of the context. In a unit of work, the invalidation is
+        published once the transaction is committed: a read outside of the transaction would otherwise cache
+        the value preceding the commit.
+
+        Args:
+            entity_ids (Iterable[UUID] | None, optional): The IDs of the entities. Defaults to None (all entries).
+        """
+        collection_name: str = self._document_type.get_collection_name()
+        written_ids: list[UUID] | None = list(entity_ids) if entity_ids is not None else None
+        call_after_commit(partial(cache_invalidation_bus.publish, collection_name, written_ids))
+        call_after_commit(partial(clear_entity_loaders, collection_name, written_ids))
+
+    def _get_read_collection(
+        self, session: AsyncIOMotorClientSession | None, read_options: ReadOptions | None
+    ) -> AsyncIOMotorCollection[Any]:
+        """Get the collection to read from, with the read options of the read.
+
+        The read options are the ones given, else the ones of the context (see `using_read_options`), else
+        the ones of the repository, else the ones of the client.
+
+        Args:
+            session (AsyncIOMotorClientSession | None): The session of the read.
+            read_options (ReadOptions | None): The read options given to the read.
+
+        Returns:
+            AsyncIOMotorCollection[Any]: The collection.
+        """
+        collection: AsyncIOMotorCollection[Any] = self._document_type.get_motor_collection()
+        # A property, typed as a method by the motor stubs
+        if session is not None and session.in_transaction:  # type: ignore[truthy-function]
+            # The reads of a transaction go to the primary, with the read concern of the transaction
+            return collection
+        for candidate in (read_options, get_read_options(), self._read_options):
+            if candidate is not None:
+                read_options = candidate
+                break
+        else:
+            return collection
+
+        base_collection, routed_collection = self._read_collections.get(read_options, (None, None))
+        if base_collection is not collection or routed_collection is None:
+            routed_collection = collection.with_options(
+                read_preference=read_options.get_read_preference(),  # type: ignore[arg-type]
+                read_concern=read_options.get_read_concern(),
+            )
+            self._read_collections[read_options] = (collection, routed_collection)
+        return routed_collection
+
+    def _find_cursor(  # noqa: PLR0913
+        self,
+        filters: Mapping[str, Any] | None,
+        *,
+        session: AsyncIOMotorClientSession | None,
+        read_options: ReadOptions | None,
+        sort: SortSpecification | None = None,
+        limit: int | None = None,
+        batch_size: int | None = None,
+        projection: type[BaseModel] | None = None,
+        fields: Sequence[str] | None = None,
+        raw_bson: bool = False,
+    ) -> AsyncIOMotorCursor[Any]:
+        """Open a cursor on the documents matching the filters, encoded and projected as beanie does.
+
+        Args:
+            filters (Mapping[str, Any] | None): The MongoDB filters.
+            session (AsyncIOMotorClientSession | None): The session of the read.
+            read_options (ReadOptions | None): The read options given to the read.
+            sort (SortSpecification | None, optional): The (field, direction) to sort on. Defaults to None.
+            limit (int | None, optional): The maximum number of results. Defaults to None (no limit).
+            batch_size (int | None, optional): The number of documents per round trip. Defaults to None.
+            projection (type[BaseModel] | None, optional): The model to project the documents on. Defaults to None.
+            fields (Sequence[str] | None, optional): The fields to project the documents on, when no model is
+                given. Defaults to None (all the fields).
+            raw_bson (bool, optional): Whether to read the documents as `RawBSONDocument`. Defaults to False.
+
+        Returns:
+            AsyncIOMotorCursor[Any]: The cursor of the raw documents.
+        """
+        # Beanie builds the query, the routed collection runs it
+        find_options: dict[str, Any] = {
+            "projection_model": projection,
+            "sort": list(sort) if sort is not None else None,
+        }
+        query: Any = self._document_type.find(dict(filters or {}), **find_options)
+        cursor_options: dict[str, Any] = {}
+        if batch_size is not None:
+            cursor_options["batch_size"] = batch_size
+        field_projection: dict[str, int] | None = None
+        if fields is not None:
+            field_projection = {"_id" if field == "id" else field: 1 for field in fields}
+        collection: AsyncIOMotorCollection[Any] = self._get_read_collection(session=session, read_options=read_options)
+        if raw_bson:
+            collection = collection.with_options(
+                codec_options=collection.codec_options.with_options(document_class=RawBSONDocument)
+            )
+        return collection.find(
+            filter=query.get_filter_query(),
+            sort=query.sort_expressions or None,
+            projection=get_projection(query.projection_model) if projection is not None else field_projection,
+            limit=limit or 0,
+            session=session,
+            **cursor_options,
+        )
+
+    def _to_entity(self, raw_document: Mapping[str, Any]) -> EntityGenericType:
+        """Build the entity of a raw document read.
+
+        Args:
+            raw_document (Mapping[str, Any]): The raw document.
+
+        Returns:
+            EntityGenericType: The entity.
+
+        Raises:
+            ValueError: If the entity cannot be created from the document.
+        """
+        try:
+            document: DocumentGenericType = parse_obj(self._document_type, raw_document)  # type: ignore
+            return self._mapper.to_entity(document)
+        except ValueError as error:
+            raise ValueError(f"Failed to create entity from document: {error}") from error
 
     @asynccontextmanager
     async def get_session(self) -> AsyncGenerator[AsyncIOMotorClientSession, None]:
@@ -59,7 +395,36 @@ class AbstractRepository(ABC, Generic[DocumentGenericType, EntityGenericType]):
         except PyMongoError as error:
             raise OperationError(f"Failed to create session: {error}") from error
 
+    def unit_of_work(self) -> AbstractAsyncContextManager[AsyncIOMotorClientSession]:
+        """Open a unit of work, sharing one session and transaction across the repository calls inside it.
+
+        The calls of any repository of the same client join it without being given the session.
+
+        Returns:
+            AbstractAsyncContextManager[AsyncIOMotorClientSession]: The unit of work, yielding its session.
+        """
+        return unit_of_work(client=self._database.client)
+
+    async def run_in_unit_of_work(
+        self, callback: Callable[[], Awaitable[ResultGenericType]], max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    ) -> ResultGenericType:
+        """Run the callback in a unit of work, retried from the start on transient transaction errors.
+
+        Args:
+            callback (Callable[[], Awaitable[ResultGenericType]]): The repository calls to run, must be re-runnable.
+            max_attempts (int, optional): The maximum number of attempts. Defaults to DEFAULT_MAX_ATTEMPTS.
+
+        Returns:
+            ResultGenericType: The result of the callback.
+
+        Raises:
+            OperationError: If the unit of work fails.
+        """
+        return await run_in_unit_of_work(client=self._database.client, callback=callback, max_attempts=max_attempts)
+
     @managed_session()
+    @measured()
+    @resilient()
     async def insert(
         self, entity: EntityGenericType, session: AsyncIOMotorClientSession | None = None
     ) -> EntityGenericType:
@@ -78,7 +443,7 @@ class AbstractRepository(ABC, Generic[DocumentGenericType, EntityGenericType]):
             OperationError: If the operation fails.
         """
         try:
-            document: DocumentGenericType = self._document_type(**entity.model_dump())
+            document: DocumentGenericType = self._mapper.to_document(entity)
         except ValueError as error:
             raise ValueError(f"Failed to create document from entity: {error}") from error
 
@@ -86,57 +451,956 @@ class AbstractRepository(ABC, Generic[DocumentGenericType, EntityGenericType]):
             document_created: DocumentGenericType = await document.save(session=session)
         except DuplicateKeyError as error:
             raise UnableToCreateEntityDueToDuplicateKeyError(f"Failed to insert document: {error}") from error
+        except RevisionIdWasChanged as error:
+            # The revisions being used, beanie reports the duplicate keys of the upsert as a revision change
+            if not isinstance(error.__context__, DuplicateKeyError):
+                raise
+            raise UnableToCreateEntityDueToDuplicateKeyError(
+                f"Failed to insert document: {error.__context__}"
+            ) from error.__context__
         except PyMongoError as error:
             raise OperationError(f"Failed to insert document: {error}") from error
+        finally:
+            self._invalidate_cache([document.id])
 
         try:
-            entity_created: EntityGenericType = self._entity_type(**document_created.model_dump())
+            entity_created: EntityGenericType = self._mapper.to_entity(document_created)
         except ValueError as error:
             raise ValueError(f"Failed to create entity from document: {error}") from error
 
         return entity_created
 
+    def _to_bulk_document(self, entity: EntityGenericType) -> tuple[DocumentGenericType, dict[str, Any]]:
+        """Build the document to write in a bulk operation from an entity.
+
+        Args:
+            entity (EntityGenericType): The entity.
+
+        Returns:
+            tuple[DocumentGenericType, dict[str, Any]]: The document and its encoding for the database.
+
+        Raises:
+            ValueError: If the document cannot be created from the entity.
+        """
+        try:
+            document: DocumentGenericType = self._mapper.to_document(entity)
+        except ValueError as error:
+            raise ValueError(f"Failed to create document from entity: {error}") from error
+        if document.get_settings().use_revision:
+            document.revision_id = uuid4()
+        return document, get_dict(document, to_db=True, keep_nulls=document.get_settings().keep_nulls)
+
     @managed_session()
+    @measured()
+    @resilient()
+    async def bulk_write(
+        self,
+        operations: Sequence[WriteOperation],
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+        ordered: bool = True,
+        session: AsyncIOMotorClientSession | None = None,
+    ) -> BulkWriteSummary:
+        """Execute the write operations in batches of bulk writes.
+
+        Args:
+            operations (Sequence[WriteOperation]): The pymongo write operations.
+            batch_size (int, optional): The number of operations per round trip. Defaults to DEFAULT_BULK_BATCH_SIZE.
+            ordered (bool, optional): Stop at the first error (True) or execute all the operations (False).
+                Defaults to True.
+            session (AsyncIOMotorClientSession | None): The session to use. Defaults to None. (managed by decorator)
+
+        Returns:
+            BulkWriteSummary: The counts and the per-operation errors (with their index in the input).
+
+        Raises:
+            ValueError: If the batch size is not positive.
+            OperationError: If the operation fails for another reason than write errors.
+        """
+        try:
+            return await self._bulk_write(
+                operations=operations, batch_size=batch_size, ordered=ordered, session=session
+            )
+        finally:
+            # The operations can write any document
+            self._invalidate_cache()
+
+    async def _bulk_write(
+        self,
+        operations: Sequence[WriteOperation],
+        batch_size: int,
+        ordered: bool,
+        session: AsyncIOMotorClientSession | None,
+    ) -> BulkWriteSummary:
+        """Execute the write operations in batches of bulk writes, see `bulk_write`."""
+        if batch_size <= 0:
+            raise ValueError(f"The batch size must be positive, got {batch_size}")
+
+        summary: BulkWriteSummary = BulkWriteSummary()
+        for offset in range(0, len(operations), batch_size):
+            batch: list[WriteOperation] = list(operations[offset : offset + batch_size])
+            try:
+                result: Mapping[str, Any] = (
+                    await self._document_type.get_motor_collection().bulk_write(batch, ordered=ordered, session=session)
+                ).bulk_api_result
+            except BulkWriteError as error:
+                result = error.details
+            except PyMongoError as error:
+                raise OperationError(f"Failed to bulk write documents: {error}") from error
+
+            summary.inserted_count += result.get("nInserted", 0)
+            summary.upserted_count += result.get("nUpserted", 0)
+            summary.matched_count += result.get("nMatched", 0)
+            summary.modified_count += result.get("nModified", 0)
+            summary.deleted_count += result.get("nRemoved", 0)
+            summary.write_errors.extend(
+                BulkWriteItemError(index=offset + error["index"], code=error["code"], message=error.get("errmsg", ""))
+                for error in result.get("writeErrors", [])
+            )
+            if ordered and len(summary.write_errors) != 0:
+                summary.executed_until = summary.write_errors[0].index + 1
+                break
+            summary.executed_until = offset + len(batch)
+
+        return summary
+
+    async def _write_entities_in_bulk(
+        self,
+        documents: list[DocumentGenericType],
+        operations: list[WriteOperation],
+        batch_size: int,
+        ordered: bool,
+        session: AsyncIOMotorClientSession | None,
+    ) -> list[EntityGenericType]:
+        """Write the documents in bulk and build the entities written from them.
+
+        Args:
+            documents (list[DocumentGenericType]): The documents built from the entities.
+            operations (list[WriteOperation]): The write operation of each document.
+            batch_size (int): The number of operations per round trip.
+            ordered (bool): Stop at the first error (True) or write all the entities (False).
+            session (AsyncIOMotorClientSession | None): The session to use.
+
+        Returns:
+            list[EntityGenericType]: The entities written, in the input order.
+
+        Raises:
+            UnableToCreateEntitiesDueToDuplicateKeyError: If entities are rejected as duplicates.
+            OperationError: If the operation fails.
+        """
+        try:
+            summary: BulkWriteSummary = await self._bulk_write(
+                operations=operations, batch_size=batch_size, ordered=ordered, session=session
+            )
+        finally:
+            self._invalidate_cache(document.id for document in documents)
+        failed_indexes: set[int] = {error.index for error in summary.write_errors}
+        try:
+            entities_written: list[EntityGenericType] = [
+                self._mapper.to_entity(document)
+                for index, document in enumerate(documents[: summary.executed_until])
+                if index not in failed_indexes
+            ]
+        except ValueError as error:
+            raise ValueError(f"Failed to create entity from document: {error}") from error
+
+        if len(summary.write_errors) == 0:
+            return entities_written
+
+        if all(error.code == DUPLICATE_KEY_ERROR_CODE for error in summary.write_errors):
+            raise UnableToCreateEntitiesDueToDuplicateKeyError(
+                f"Failed to write {len(failed_indexes)} of {len(documents)} documents due to duplicate keys.",
+                duplicate_indexes=sorted(failed_indexes),
+                entities_created=entities_written,
+            )
+        raise OperationError(f"Failed to write documents: {summary.write_errors}")
+
+    @managed_session()
+    @measured()
+    @resilient()
+    async def insert_many(
+        self,
+        entities: Sequence[EntityGenericType],
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+        ordered: bool = True,
+        session: AsyncIOMotorClientSession | None = None,
+    ) -> list[EntityGenericType]:
+        """Insert the entities into the database in batches.
+
+        Args:
+            entities (Sequence[EntityGenericType]): The entities to insert.
+            batch_size (int, optional): The number of entities per round trip. Defaults to DEFAULT_BULK_BATCH_SIZE.
+            ordered (bool, optional): Stop at the first error (True) or insert all the other entities (False).
+                Defaults to True.
+            session (AsyncIOMotorClientSession | None): The session to use. Defaults to None. (managed by decorator)
+
+        Returns:
+            list[EntityGenericType]: The entities created, in the input order.
+
+        Raises:
+            ValueError: If a document cannot be created from an entity.
+            UnableToCreateEntitiesDueToDuplicateKeyError: If entities are rejected as duplicates,
+                with their indexes and the entities created.
+            OperationError: If the operation fails.
+        """
+        documents: list[tuple[DocumentGenericType, dict[str, Any]]] = [
+            self._to_bulk_document(entity) for entity in entities
+        ]
+        return await self._write_entities_in_bulk(
+            documents=[document for document, _ in documents],
+            operations=[InsertOne(encoded) for _, encoded in documents],
+            batch_size=batch_size,
+            ordered=ordered,
+            session=session,
+        )
+
+    @measured(operation="write_behind")
+    async def _insert_batch(self, entities: list[EntityGenericType]) -> list[EntityGenericType | BaseException]:
+        """Insert the entities in one unordered bulk write, outside of any session, see `write_behind`.
+
+        Args:
+            entities (list[EntityGenericType]): The entities to insert.
+
+        Returns:
+            list[EntityGenericType | BaseException]: The entity created, or the error, of each entity in the input
+            order: `ValueError` if its document cannot be created, `UnableToCreateEntityDueToDuplicateKeyError` if
+            it is rejected as a duplicate, `OperationError` if it is rejected otherwise.
+
+        Raises:
+            OperationError: If the bulk write fails as a whole.
+        """
+        outcomes: list[EntityGenericType | BaseException] = list(entities)
+        positions: list[int] = []
+        documents: list[DocumentGenericType] = []
+        operations: list[WriteOperation] = []
+        for position, entity in enumerate(entities):
+            try:
+                document, encoded = self._to_bulk_document(entity)
+            except ValueError as error:
+                outcomes[position] = error
+                continue
+            positions.append(position)
+            documents.append(document)
+            operations.append(InsertOne(encoded))
+        if len(operations) == 0:
+            return outcomes
+
+        try:
+            summary: BulkWriteSummary = await self._bulk_write(
+                operations=operations, batch_size=len(operations), ordered=False, session=None
+            )
+        finally:
+            self._invalidate_cache(document.id for document in documents)
+
+        write_errors: dict[int, BulkWriteItemError] = {error.index: error for error in summary.write_errors}
+        for index, (position, document) in enumerate(zip(positions, documents, strict=True)):
+            write_error: BulkWriteItemError | None = write_errors.get(index)
+            if write_error is None:
+                try:
+                    outcomes[position] = self._mapper.to_entity(document)
+                except ValueError as error:
+                    outcomes[position] = ValueError(f"Failed to create entity from document: {error}")
+            elif write_error.code == DUPLICATE_KEY_ERROR_CODE:
+                outcomes[position] = UnableToCreateEntityDueToDuplicateKeyError(
+                    f"Failed to insert document: {write_error.message}"
+                )
+            else:
+                outcomes[position] = OperationError(f"Failed to insert document: {write_error.message}")
+        return outcomes
+
+    def write_behind(
+        self,
+        max_batch_size: int = WriteBehindBuffer.DEFAULT_MAX_BATCH_SIZE,
+        max_delay_s: float = WriteBehindBuffer.DEFAULT_MAX_DELAY_S,
+        max_pending: int = WriteBehindBuffer.DEFAULT_MAX_PENDING,
+    ) -> WriteBehindBuffer[EntityGenericType]:
+        """Create a write-behind buffer, coalescing the inserts into unordered bulk writes.
+
+        For the entities which can be written a few milliseconds late, the buffer trades the latency of the
+        insert for one round trip per batch. The buffer is meant to outlive the repository: build it once.
+
+        Args:
+            max_batch_size (int, optional): The number of entities which triggers a write.
+                Defaults to WriteBehindBuffer.DEFAULT_MAX_BATCH_SIZE.
+            max_delay_s (float, optional): The time an entity can wait for its batch to fill, in seconds.
+                Defaults to WriteBehindBuffer.DEFAULT_MAX_DELAY_S.
+            max_pending (int, optional): The maximum number of entities queued or being written, the inserts
+                wait beyond it. Defaults to WriteBehindBuffer.DEFAULT_MAX_PENDING.
+
+        Returns:
+            WriteBehindBuffer[EntityGenericType]: The buffer, closed on the shutdown of the ODM plugin.
+
+        Raises:
+            ValueError: If a threshold is not valid.
+        """
+        return WriteBehindBuffer(
+            write_batch=self._insert_batch,
+            max_batch_size=max_batch_size,
+            max_delay_s=max_delay_s,
+            max_pending=max_pending,
+        )
+
+    @managed_session()
+    @measured()
+    @resilient()
+    async def upsert_many(
+        self,
+        entities: Sequence[EntityGenericType],
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+        ordered: bool = True,
+        session: AsyncIOMotorClientSession | None = None,
+    ) -> list[EntityGenericType]:
+        """Insert or replace (by ID) the entities in the database in batches.
+
+        Args:
+            entities (Sequence[EntityGenericType]): The entities to upsert.
+            batch_size (int, optional): The number of entities per round trip. Defaults to DEFAULT_BULK_BATCH_SIZE.
+            ordered (bool, optional): Stop at the first error (True) or upsert all the other entities (False).
+                Defaults to True.
+            session (AsyncIOMotorClientSession | None): The session to use. Defaults to None. (managed by decorator)
+
+        Returns:
+            list[EntityGenericType]: The entities upserted, in the input order.
+
+        Raises:
+            ValueError: If a document cannot be created from an entity.
+            UnableToCreateEntitiesDueToDuplicateKeyError: If entities are rejected as duplicates
+                (on another unique index), with their indexes and the entities upserted.
+            OperationError: If the operation fails.
+        """
+        documents: list[tuple[DocumentGenericType, dict[str, Any]]] = [
+            self._to_bulk_document(entity) for entity in entities
+        ]
+        return await self._write_entities_in_bulk(
+            documents=[document for document, _ in documents],
+            operations=[ReplaceOne({"_id": encoded["_id"]}, encoded, upsert=True) for _, encoded in documents],
+            batch_size=batch_size,
+            ordered=ordered,
+            session=session,
+        )
+
+    @managed_session()
+    @measured()
+    @resilient(retry=True)
     async def get_one_by_id(
         self,
         entity_id: UUID,
         session: AsyncIOMotorClientSession | None = None,
+        read_options: ReadOptions | None = None,
     ) -> EntityGenericType | None:
         """Get the entity by its ID.
 
         Args:
             entity_id (UUID): The ID of the entity.
             session (AsyncIOMotorClientSession | None): The session to use. Defaults to None. (managed by decorator)
+            read_options (ReadOptions | None, optional): The read preference and read concern of the read.
+                Defaults to None (the ones of the context or of the repository).
 
         Returns:
             EntityGenericType | None: The entity or None if not found.
+            Served by the entity cache, if any, outside of a session. Inside `using_entity_loaders`, the
+            entity is loaded with the reads by ID of the same event loop iteration, in one query, and kept
+            until the end of the block (see `EntityLoader`).
 
         Raises:
             OperationError: If the operation fails.
 
         """
+        # The reads in a session bypass the cache and the loaders, they must see the writes of their transaction
+        if session is not None:
+            return await self._load_one_by_id(entity_id=entity_id, session=session, read_options=read_options)
+
+        loader: EntityLoader[EntityGenericType] | None = get_entity_loader(
+            collection_name=self._document_type.get_collection_name(),
+            key=(self._database.name, self._entity_type, read_options),
+            batch_load=partial(self._load_many_by_ids, read_options=read_options),
+        )
+        load: Callable[[], Awaitable[EntityGenericType | None]] = (
+            partial(loader.load, entity_id)
+            if loader is not None
+            else partial(self._load_one_by_id, entity_id, read_options=read_options)
+        )
+        if self._entity_cache is not None:
+            return await self._entity_cache.get_or_load(entity_id, load)
+        return await load()
+
+    async def _load_one_by_id(
+        self,
+        entity_id: UUID,
+        session: AsyncIOMotorClientSession | None = None,
+        read_options: ReadOptions | None = None,
+    ) -> EntityGenericType | None:
+        """Load the entity by its ID from the database, see `get_one_by_id`."""
         try:
-            document: DocumentGenericType | None = await self._document_type.get(document_id=entity_id, session=session)
+            raw_document: Mapping[str, Any] | None = await self._get_read_collection(
+                session=session, read_options=read_options
+            ).find_one(self._encode({"_id": entity_id}), session=session)
         except PyMongoError as error:
             raise OperationError(f"Failed to get document: {error}") from error
 
         # If no document is found, return None
-        if document is None:
+        if raw_document is None:
             return None
 
-        # Convert the document to an entity
+        return self._to_entity(raw_document)
+
+    @managed_session()
+    @measured()
+    @resilient(retry=True)
+    async def get_many_by_ids(
+        self,
+        entity_ids: Iterable[UUID],
+        session: AsyncIOMotorClientSession | None = None,
+        read_options: ReadOptions | None = None,
+    ) -> dict[UUID, EntityGenericType]:
+        """Get the entities by their IDs, in a single `$in` query.
+
+        Args:
+            entity_ids (Iterable[UUID]): The IDs of the entities, deduplicated.
+            session (AsyncIOMotorClientSession | None): The session to use. Defaults to None. (managed by decorator)
+            read_options (ReadOptions | None, optional): The read preference and read concern of the read.
+                Defaults to None (the ones of the context or of the repository).
+
+        Returns:
+            dict[UUID, EntityGenericType]: The entities by ID, the ones not found are absent.
+
+        Raises:
+            ValueError: If an entity cannot be created from its document.
+            OperationError: If the operation fails.
+        """
+        return await self._load_many_by_ids(entity_ids=entity_ids, session=session, read_options=read_options)
+
+    async def _load_many_by_ids(
+        self,
+        entity_ids: Iterable[UUID],
+        session: AsyncIOMotorClientSession | None = None,
+        read_options: ReadOptions | None = None,
+    ) -> dict[UUID, EntityGenericType]:
+        """Load the entities by their IDs from the database, see `get_many_by_ids`.
+
+        Also the batch load of the entity loaders, run within the resilience of `get_one_by_id`.
+        """
+        unique_ids: list[UUID] = list(dict.fromkeys(entity_ids))
+        if len(unique_ids) == 0:
+            return {}
+
+        try:
+            raw_documents: list[Mapping[str, Any]] = await self._find_cursor(
+                {"_id": {"$in": unique_ids}}, session=session, read_options=read_options
+            ).to_list(length=None)
+        except PyMongoError as error:
+            raise OperationError(f"Failed to get documents: {error}") from error
+
+        try:
+            documents: list[DocumentGenericType] = [
+                parse_obj(self._document_type, raw_document)  # type: ignore
+                for raw_document in raw_documents
+            ]
+            return {document.id: self._mapper.to_entity(document) for document in documents}
+        except ValueError as error:
+            raise ValueError(f"Failed to create entity from document: {error}") from error
+
+    @overload
+    def find(
+        self,
+        filters: Mapping[str, Any] | None = None,
+        *,
+        sort: SortSpecification | None = None,
+        limit: int | None = None,
+        batch_size: int = DEFAULT_FIND_BATCH_SIZE,
+        projection: None = None,
+        session: AsyncIOMotorClientSession | None = None,
+        read_options: ReadOptions | None = None,
+    ) -> AsyncGenerator[EntityGenericType, None]: ...
+
+    @overload
+    def find(
+        self,
+        filters: Mapping[str, Any] | None = None,
+        *,
+        sort: SortSpecification | None = None,
+        limit: int | None = None,
+        batch_size: int = DEFAULT_FIND_BATCH_SIZE,
+        projection: type[ProjectionGenericType],
+        session: AsyncIOMotorClientSession | None = None,
+        read_options: ReadOptions | None = None,
+    ) -> AsyncGenerator[ProjectionGenericType, None]: ...
+
+    @measured()
+    @resilient()
+    async def find(  # noqa: PLR0913
+        self,
+        filters: Mapping[str, Any] | None = None,
+        *,
+        sort: SortSpecification | None = None,
+        limit: int | None = None,
+        batch_size: int = DEFAULT_FIND_BATCH_SIZE,
+        projection: type[BaseModel] | None = None,
+        session: AsyncIOMotorClientSession | None = None,
+        read_options: ReadOptions | None = None,
+    ) -> AsyncGenerator[Any, None]:
+        """Stream the entities matching the filters, fetched lazily from the cursor in batches.
+
+        ```python
+        async for book in book_repository.find(filters={"book_type": BookType.FANTASY}, batch_size=100):
+            ...
+        ```
+
+        Args:
+            filters (Mapping[str, Any] | None, optional): The MongoDB filters. Defaults to None (all documents).
+            sort (SortSpecification | None, optional): The (field, direction) to sort on. Defaults to None.
+            limit (int | None, optional): The maximum number of results. Defaults to None (no limit).
+            batch_size (int, optional): The number of documents per round trip. Defaults to DEFAULT_FIND_BATCH_SIZE.
+            projection (type[BaseModel] | None, optional): The model to project the documents on, only its fields
+                are fetched and it is yielded instead of the entity. Defaults to None.
+            session (AsyncIOMotorClientSession | None, optional): The session to use. Defaults to None.
+            read_options (ReadOptions | None, optional): The read preference and read concern of the read.
+                Defaults to None (the ones of the context or of the repository).
+
+        Yields:
+            EntityGenericType | ProjectionGenericType: The entities, or the projections if a projection is provided.
+
+        Raises:
+            ValueError: If the entity cannot be created from the document.
+            OperationError: If the operation fails.
+        """
+        if session is None:
+            session = get_unit_of_work_session()
+        cursor: AsyncIOMotorCursor[Any] = self._find_cursor(
+            filters,
+            session=session,
+            read_options=read_options,
+            sort=sort,
+            limit=limit,
+            batch_size=batch_size,
+            projection=projection,
+        )
+        try:
+            while True:
+                try:
+                    raw_document: dict[str, Any] = await anext(cursor)
+                except StopAsyncIteration:
+                    return
+                except PyMongoError as error:
+                    raise OperationError(f"Failed to find documents: {error}") from error
+
+                if projection is not None:
+                    yield parse_obj(projection, raw_document)
+                    continue
+
+                yield self._to_entity(raw_document)
+        finally:
+            await cursor.close()
+
+    @measured()
+    @resilient()
+    async def find_raw(  # noqa: PLR0913
+        self,
+        filters: Mapping[str, Any] | None = None,
+        *,
+        fields: Sequence[str] | None = None,
+        sort: SortSpecification | None = None,
+        limit: int | None = None,
+        batch_size: int = DEFAULT_FIND_BATCH_SIZE,
+        raw_bson: bool = False,
+        session: AsyncIOMotorClientSession | None = None,
+        read_options: ReadOptions | None = None,
+    ) -> AsyncGenerator[Mapping[str, Any], None]:
+        """Stream the raw documents matching the filters, without building any document, entity or model.
+
+        For the read-only paths which only serialize what they read, e.g. with `BSONJSONResponse`. The documents
+        are the stored ones: their ID is `_id` and their values are BSON values.
+
+        ```python
+        books = [book async for book in book_repository.find_raw(fields=["id", "title"], limit=100)]
+        return BSONJSONResponse(content=books)
+        ```
+
+        Args:
+            filters (Mapping[str, Any] | None, optional): The MongoDB filters. Defaults to None (all documents).
+            fields (Sequence[str] | None, optional): The fields to fetch, `id` being the ID. Defaults to None (all).
+            sort (SortSpecification | None, optional): The (field, direction) to sort on. Defaults to None.
+            limit (int | None, optional): The maximum number of results. Defaults to None (no limit).
+            batch_size (int, optional): The number of documents per round trip. Defaults to DEFAULT_FIND_BATCH_SIZE.
+            raw_bson (bool, optional): Whether to yield `RawBSONDocument`, decoded lazily, instead of dicts.
+                Defaults to False.
+            session (AsyncIOMotorClientSession | None, optional): The session to use. Defaults to None.
+            read_options (ReadOptions | None, optional): The read preference and read concern of the read.
+                Defaults to None (the ones of the context or of the repository).
+
+        Yields:
+            Mapping[str, Any]: The raw documents.
+
+        Raises:
+            OperationError: If the operation fails.
+        """
+        if session is None:
+            session = get_unit_of_work_session()
+        cursor: AsyncIOMotorCursor[Any] = self._find_cursor(
+            filters,
+            session=session,
+            read_options=read_options,
+            sort=sort,
+            limit=limit,
+            batch_size=batch_size,
+            fields=fields,
+            raw_bson=raw_bson,
+        )
         try:
-            entity: EntityGenericType = self._entity_type(**document.model_dump())
+            while True:
+                try:
+                    raw_document: Mapping[str, Any] = await anext(cursor)
+                except StopAsyncIteration:
+                    return
+                except PyMongoError as error:
+                    raise OperationError(f"Failed to find documents: {error}") from error
+                yield raw_document
+        finally:
+            await cursor.close()
+
+    @managed_session()
+    @measured()
+    @resilient(retry=True)
+    async def find_page(
+        self,
+        filters: Mapping[str, Any] | None = None,
+        *,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+        session: AsyncIOMotorClientSession | None = None,
+        read_options: ReadOptions | None = None,
+    ) -> Page[EntityGenericType]:
+        """Get a page of the entities matching the filters, newest first.
+
+        The pages are selected by keyset on (`created_at`, `id`) instead of `skip`, so any page costs
+        the same as the first one, and the pages stay consistent when documents are inserted meanwhile.
+
+        Args:
+            filters (Mapping[str, Any] | None, optional): The MongoDB filters. Defaults to None (all documents).
+            limit (int, optional): The maximum number of entities in the page. Defaults to DEFAULT_PAGE_LIMIT.
+            cursor (str | None, optional): The `next_cursor` of the previous page. Defaults to None (first page).
+            session (AsyncIOMotorClientSession | None, optional): The session to use. Defaults to None.
+            (managed by decorator)
+            read_options (ReadOptions | None, optional): The read preference and read concern of the read.
+                Defaults to None (the ones of the context or of the repository).
+
+        Returns:
+            Page[EntityGenericType]: The page, with the cursor of the next one if any.
+
+        Raises:
+            ValueError: If the limit is not positive or the entity cannot be created from the document.
+            InvalidPageCursorError: If the cursor is not valid.
+            OperationError: If the operation fails.
+        """
+        if limit < 1:
+            raise ValueError(f"The limit must be positive, got {limit}.")
+
+        query: dict[str, Any] = dict(filters or {})
+        if cursor is not None:
+            keyset_filter: dict[str, Any] = PageCursor.decode(cursor).to_filter()
+            query = {"$and": [query, keyset_filter]} if query else keyset_filter
+
+        try:
+            # One more document than requested tells whether a next page exists
+            raw_documents: list[Mapping[str, Any]] = await self._find_cursor(
+                query, session=session, read_options=read_options, sort=KEYSET_SORT, limit=limit + 1
+            ).to_list(length=None)
+        except PyMongoError as error:
+            raise OperationError(f"Failed to find documents: {error}") from error
+
+        has_next_page: bool = len(raw_documents) > limit
+        try:
+            documents: list[DocumentGenericType] = [
+                parse_obj(self._document_type, raw_document)  # type: ignore
+                for raw_document in raw_documents[:limit]
+            ]
+            entities: list[EntityGenericType] = [self._mapper.to_entity(document) for document in documents]
         except ValueError as error:
             raise ValueError(f"Failed to create entity from document: {error}") from error
 
-        return entity
+        next_cursor: str | None = None
+        if has_next_page:
+            next_cursor = PageCursor(created_at=documents[-1].created_at, id=documents[-1].id).encode()
+
+        return Page[EntityGenericType](items=entities, next_cursor=next_cursor)
+
+    @overload
+    def aggregate(
+        self,
+        pipeline: Pipeline,
+        *,
+        projection: None = None,
+        batch_size: int = DEFAULT_FIND_BATCH_SIZE,
+        session: AsyncIOMotorClientSession | None = None,
+        read_options: ReadOptions | None = None,
+    ) -> AsyncGenerator[EntityGenericType, None]: ...
+
+    @overload
+    def aggregate(
+        self,
+        pipeline: Pipeline,
+        *,
+        projection: type[ProjectionGenericType],
+        batch_size: int = DEFAULT_FIND_BATCH_SIZE,
+        session: AsyncIOMotorClientSession | None = None,
+        read_options: ReadOptions | None = None,
+    ) -> AsyncGenerator[ProjectionGenericType, None]: ...
+
+    @measured()
+    @resilient()
+    async def aggregate(
+        self,
+        pipeline: Pipeline,
+        *,
+        projection: type[BaseModel] | None = None,
+        batch_size: int = DEFAULT_FIND_BATCH_SIZE,
+        session: AsyncIOMotorClientSession | None = None,
+        read_options: ReadOptions | None = None,
+    ) -> AsyncGenerator[Any, None]:
+        """Stream the output documents of an aggregation pipeline, run by the server.
+
+        The counts, sums and facets are computed next to the data, only their results are transferred. The
+        output documents are the entities, for the pipelines keeping the documents (e.g. `$match`, `$sort`),
+        or the projections, e.g. of the groups keyed by `_id`:
+
+        ```python
+        class BooksPerType(BaseModel):
+            book_type: BookType = Field(alias="_id")
+            count: int
+
+
+        pipeline = [match({"pages": {"$gte": 100}}), count_by("book_type")]
+        async for books_per_type in book_repository.aggregate(pipeline, projection=BooksPerType):
+            ...
+        ```
+
+        Args:
+            pipeline (Pipeline): The stages, see the builders of the `aggregations` module.
+            projection (type[BaseModel] | None, optional): The model of the output documents, only its fields
+                are kept and it is yielded instead of the entity. Defaults to None.
+            batch_size (int, optional): The number of documents per round trip. Defaults to DEFAULT_FIND_BATCH_SIZE.
+            session (AsyncIOMotorClientSession | None, optional): The session to use. Defaults to None.
+            read_options (ReadOptions | None, optional): The read preference and read concern of the read.
+                Defaults to None (the ones of the context or of the repository).
+
+        Yields:
+            EntityGenericType | ProjectionGenericType: The entities, or the projections if a projection is provided.
+
+        Raises:
+            ValueError: If the entity or the projection cannot be created from an output document.
+            OperationError: If the operation fails.
+        """
+        if session is None:
+            session = get_unit_of_work_session()
+        stages: list[dict[str, Any]] = [self._encode(stage) for stage in pipeline]
+        if projection is not None:
+            stages.append({"$project": get_projection(projection)})
+        collection: AsyncIOMotorCollection[Any] = self._get_read_collection(session=session, read_options=read_options)
+        cursor: AsyncIOMotorCommandCursor[Any] = collection.aggregate(stages, session=session, batchSize=batch_size)
+        try:
+            while True:
+                try:
+                    raw_document: dict[str, Any] = await anext(cursor)
+                except StopAsyncIteration:
+                    return
+                except PyMongoError as error:
+                    raise OperationError(f"Failed to aggregate documents: {error}") from error
+
+                if projection is None:
+                    yield self._to_entity(raw_document)
+                    continue
+                try:
+                    yield parse_obj(projection, raw_document)
+                except ValueError as error:
+                    raise ValueError(f"Failed to create projection from document: {error}") from error
+        finally:
+            await cursor.close()
+
+    async def _count(
+        self,
+        filters: Mapping[str, Any] | None,
+        limit: int | None,
+        session: AsyncIOMotorClientSession | None,
+        read_options: ReadOptions | None,
+    ) -> int:
+        """Count the documents matching the filters, on the server.
+
+        Args:
+            filters (Mapping[str, Any] | None): The MongoDB filters.
+            limit (int | None): The number of documents from which to stop counting.
+            session (AsyncIOMotorClientSession | None): The session to use.
+            read_options (ReadOptions | None): The read options given to the read.
+
+        Returns:
+            int: The number of documents.
+
+        Raises:
+            OperationError: If the operation fails.
+        """
+        options: dict[str, Any] = {"limit": limit} if limit is not None else {}
+        try:
+            return await self._get_read_collection(session=session, read_options=read_options).count_documents(
+                self._encode(filters or {}), session=session, **options
+            )
+        except PyMongoError as error:
+            raise OperationError(f"Failed to count documents: {error}") from error
+
+    @managed_session()
+    @measured()
+    @resilient(retry=True)
+    async def count(
+        self,
+        filters: Mapping[str, Any] | None = None,
+        *,
+        limit: int | None = None,
+        session: AsyncIOMotorClientSession | None = None,
+        read_options: ReadOptions | None = None,
+    ) -> int:
+        """Count the documents matching the filters, on the server.
+
+        With filters on the fields of an index only, the server counts the index keys without fetching any
+        document.
+
+        Args:
+            filters (Mapping[str, Any] | None, optional): The MongoDB filters. Defaults to None (all documents).
+            limit (int | None, optional): The number of documents from which to stop counting. Defaults to None.
+            session (AsyncIOMotorClientSession | None, optional): The session to use. Defaults to None.
+            (managed by decorator)
+            read_options (ReadOptions | None, optional): The read preference and read concern of the read.
+                Defaults to None (the ones of the context or of the repository).
+
+        Returns:
+            int: The number of documents, at most the limit.
+
+        Raises:
+            ValueError: If the limit is not positive.
+            OperationError: If the operation fails.
+        """
+        if limit is not None and limit < 1:
+            raise ValueError(f"The limit must be positive, got {limit}.")
+        return await self._count(filters, limit=limit, session=session, read_options=read_options)
 
     @managed_session()
+    @measured()
+    @resilient(retry=True)
+    async def exists(
+        self,
+        filters: Mapping[str, Any],
+        *,
+        session: AsyncIOMotorClientSession | None = None,
+        read_options: ReadOptions | None = None,
+    ) -> bool:
+        """Check a document matches the filters, the server stopping at the first one.
+
+        Args:
+            filters (Mapping[str, Any]): The MongoDB filters.
+            session (AsyncIOMotorClientSession | None, optional): The session to use. Defaults to None.
+            (managed by decorator)
+            read_options (ReadOptions | None, optional): The read preference and read concern of the read.
+                Defaults to None (the ones of the context or of the repository).
+
+        Returns:
+            bool: Whether a document matches.
+
+        Raises:
+            OperationError: If the operation fails.
+        """
+        return await self._count(filters, limit=1, session=session, read_options=read_options) > 0
+
+    @managed_session()
+    @measured()
+    @resilient(retry=True)
+    async def distinct(
+        self,
+        field: str,
+        filters: Mapping[str, Any] | None = None,
+        *,
+        session: AsyncIOMotorClientSession | None = None,
+        read_options: ReadOptions | None = None,
+    ) -> list[Any]:
+        """Get the distinct values of a field among the documents matching the filters.
+
+        On an indexed field, the server reads the values from the index without fetching any document.
+
+        Args:
+            field (str): The field, `id` being the ID, dotted for an embedded one.
+            filters (Mapping[str, Any] | None, optional): The MongoDB filters. Defaults to None (all documents).
+            session (AsyncIOMotorClientSession | None, optional): The session to use. Defaults to None.
+            (managed by decorator)
+            read_options (ReadOptions | None, optional): The read preference and read concern of the read.
+                Defaults to None (the ones of the context or of the repository).
+
+        Returns:
+            list[Any]: The distinct values, as stored (e.g. the values of the enums), the arrays being expanded.
+
+        Raises:
+            OperationError: If the operation fails.
+        """
+        try:
+            return await self._get_read_collection(session=session, read_options=read_options).distinct(
+                "_id" if field == "id" else field, self._encode(filters or {}), session=session
+            )
+        except PyMongoError as error:
+            raise OperationError(f"Failed to get the distinct values: {error}") from error
+
+    def _encode(self, value: Mapping[str, Any]) -> dict[str, Any]:
+        """Encode a filter or an update for the collection, as beanie encodes its queries.
+
+        Args:
+            value (Mapping[str, Any]): The filter or the update.
+
+        Returns:
+            dict[str, Any]: The value encoded.
+        """
+        return Encoder(custom_encoders=self._document_type.get_settings().bson_encoders).encode(dict(value))
+
+    def _with_update_tracking(self, update: Mapping[str, Any]) -> dict[str, Any]:
+        """Add the update of the `updated_at` timestamp (and of the revision) to an update.
+
+        Args:
+            update (Mapping[str, Any]): The update, made of update operators (e.g. `{"$set": {...}}`).
+
+        Returns:
+            dict[str, Any]: The update with the tracking fields set.
+
+        Raises:
+            ValueError: If the update is not made of update operators only.
+        """
+        if len(update) == 0 or not all(operator.startswith("$") for operator in update):
+            raise ValueError(f"The update must only contain update operators, got {list(update)}")
+
+        tracking: dict[str, Any] = {"updated_at": datetime.datetime.now(tz=datetime.UTC)}
+        if self._document_type.get_settings().use_revision:
+            tracking["revision_id"] = uuid4()
+        return {**update, "$set": {**update.get("$set", {}), **tracking}}
+
+    def _to_entity_from_raw(self, raw_document: Mapping[str, Any] | None) -> EntityGenericType | None:
+        """Build the entity of a raw document written by a command, and invalidate its cache entry.
+
+        Args:
+            raw_document (Mapping[str, Any] | None): The raw document, if any.
+
+        Returns:
+            EntityGenericType | None: The entity, or None if there is no document.
+
+        Raises:
+            ValueError: If the entity cannot be created from the document.
+        """
+        if raw_document is None:
+            return None
+        try:
+            document: DocumentGenericType = parse_obj(self._document_type, raw_document)  # type: ignore
+            self._invalidate_cache([document.id])
+            return self._mapper.to_entity(document)
+        except ValueError as error:
+            raise ValueError(f"Failed to create entity from document: {error}") from error
+
+    @managed_session()
+    @measured()
+    @resilient()
     async def delete_one_by_id(
         self, entity_id: UUID, raise_if_not_found: bool = False, session: AsyncIOMotorClientSession | None = None
     ) -> None:
-        """Delete a document by its ID.
+        """Delete a document by its ID, in a single command.
 
         Args:
             entity_id (UUID): The ID of the entity.
@@ -150,23 +1414,225 @@ class AbstractRepository(ABC, Generic[DocumentGenericType, EntityGenericType]):
 
         """
         try:
-            document_to_delete: DocumentGenericType | None = await self._document_type.get(
-                document_id=entity_id, session=session
+            delete_result: DeleteResult = await self._document_type.get_motor_collection().delete_one(
+                self._encode({"_id": entity_id}), session=session
             )
         except PyMongoError as error:
-            raise OperationError(f"Failed to get document to delete: {error}") from error
+            raise OperationError(f"Failed to delete document: {error}") from error
+        finally:
+            self._invalidate_cache([entity_id])
+
+        if not delete_result.acknowledged:
+            raise OperationError("Failed to delete document.")
 
-        if document_to_delete is None:
-            if raise_if_not_found:
-                raise ValueError(f"Failed to find document with ID {entity_id}")
-            return
+        if delete_result.deleted_count == 0 and raise_if_not_found:
+            raise ValueError(f"Failed to find document with ID {entity_id}")
 
+    @managed_session()
+    @measured()
+    @resilient()
+    async def update_one_by_id(
+        self,
+        entity_id: UUID,
+        update: Mapping[str, Any],
+        raise_if_not_found: bool = False,
+        session: AsyncIOMotorClientSession | None = None,
+    ) -> None:
+        """Update a document by its ID, in a single command.
+
+        The `updated_at` timestamp and the revision of the document are updated along.
+
+        Args:
+            entity_id (UUID): The ID of the entity.
+            update (Mapping[str, Any]): The MongoDB update operators (e.g. `{"$set": {"title": "..."}}`).
+            raise_if_not_found (bool, optional): Raise an exception if the document is not found. Defaults to False.
+            session (AsyncIOMotorClientSession | None, optional): The session to use.
+            Defaults to None. (managed by decorator)
+
+        Raises:
+            ValueError: If the update is not made of operators, or if the document is not found
+                and raise_if_not_found is True.
+            OperationError: If the operation fails.
+        """
         try:
-            delete_result: DeleteResult | None = await document_to_delete.delete()
+            update_result: UpdateResult = await self._document_type.get_motor_collection().update_one(
+                self._encode({"_id": entity_id}), self._encode(self._with_update_tracking(update)), session=session
+            )
+        except PyMongoError as error:
+            raise OperationError(f"Failed to update document: {error}") from error
+        finally:
+            self._invalidate_cache([entity_id])
+
+        if not update_result.acknowledged:
+            raise OperationError("Failed to update document.")
+
+        if update_result.matched_count == 0 and raise_if_not_found:
+            raise ValueError(f"Failed to find document with ID {entity_id}")
+
+    @managed_session()
+    @measured()
+    @resilient()
+    async def update(
+        self,
+        entity: EntityGenericType,
+        expected_revision: UUID | None,
+        session: AsyncIOMotorClientSession | None = None,
+    ) -> EntityGenericType:
+        """Update the document of an entity if its revision is the one expected, in a single command.
+
+        The fields of the entity are set on the document only if no other writer updated it since it was read
+        (optimistic concurrency), without any transaction. The `updated_at` timestamp and the revision are
+        updated along. The entities get their revision through a `revision_id: UUID | None` field:
+
+        ```python
+        book = await book_repository.get_one_by_id(book_id)
+        book = await book_repository.update(book.model_copy(update={"title": title}), book.revision_id)
+        ```
+
+        Args:
+            entity (EntityGenericType): The entity, with the values to write.
+            expected_revision (UUID | None): The revision of the document the entity was read from.
+            session (AsyncIOMotorClientSession | None, optional): The session to use.
+                Defaults to None. (managed by decorator)
+
+        Returns:
+            EntityGenericType: The entity updated, with its new revision.
+
+        Raises:
+            ValueError: If the documents have no revision, or the document cannot be created from the entity.
+            RevisionConflictError: If the document does not exist or its revision is not the one expected.
+            OperationError: If the operation fails.
+        """
+        if not self._document_type.get_settings().use_revision:
+            raise ValueError(f"The documents of {self._document_type.__name__} have no revision.")
+        try:
+            document: DocumentGenericType = self._mapper.to_document(entity)
+        except ValueError as error:
+            raise ValueError(f"Failed to create document from entity: {error}") from error
+        document.revision_id = uuid4()
+        document.updated_at = datetime.datetime.now(tz=datetime.UTC)
+        encoded_document: dict[str, Any] = get_dict(document, to_db=True, keep_nulls=document.get_settings().keep_nulls)
+        # The fields of the entity only, the creation date and the other fields of the document are kept
+        updated_fields: set[str] = {
+            field.alias or name
+            for name, field in self._document_type.model_fields.items()
+            if name in type(entity).model_fields and name not in ("id", "created_at")
+        } | {"updated_at", "revision_id"}
+
+        try:
+            update_result: UpdateResult = await self._document_type.get_motor_collection().update_one(
+                self._encode({"_id": document.id, "revision_id": expected_revision}),
+                {"$set": {key: value for key, value in encoded_document.items() if key in updated_fields}},
+                session=session,
+            )
+        except PyMongoError as error:
+            raise OperationError(f"Failed to update document: {error}") from error
+        finally:
+            self._invalidate_cache([document.id])
+
+        if not update_result.acknowledged:
+            raise OperationError("Failed to update document.")
+
+        if update_result.matched_count == 0:
+            raise RevisionConflictError(
+                f"Failed to update document with ID {document.id}, not found at revision {expected_revision}",
+                entity_id=document.id,
+                expected_revision=expected_revision,
+            )
+
+        try:
+            return self._mapper.to_entity(document)
+        except ValueError as error:
+            raise ValueError(f"Failed to create entity from document: {error}") from error
+
+    @managed_session()
+    @measured()
+    @resilient()
+    async def find_one_and_update(
+        self,
+        filters: Mapping[str, Any],
+        update: Mapping[str, Any],
+        sort: SortSpecification | None = None,
+        raise_if_not_found: bool = False,
+        session: AsyncIOMotorClientSession | None = None,
+    ) -> EntityGenericType | None:
+        """Update the first document matching the filters and get its entity after the update, atomically.
+
+        The `updated_at` timestamp and the revision of the document are updated along.
+
+        Args:
+            filters (Mapping[str, Any]): The MongoDB filters.
+            update (Mapping[str, Any]): The MongoDB update operators (e.g. `{"$inc": {"counter": 1}}`).
+            sort (SortSpecification | None, optional): The order to pick the first document. Defaults to None.
+            raise_if_not_found (bool, optional): Raise an exception if no document matches. Defaults to False.
+            session (AsyncIOMotorClientSession | None, optional): The session to use.
+            Defaults to None. (managed by decorator)
+
+        Returns:
+            EntityGenericType | None: The entity updated, or None if no document matches.
+
+        Raises:
+            ValueError: If the update is not made of operators, if no document matches and raise_if_not_found
+                is True, or if the entity cannot be created from the document.
+            OperationError: If the operation fails.
+        """
+        collection: AsyncIOMotorCollection[Any] = self._document_type.get_motor_collection()
+        try:
+            raw_document: Mapping[str, Any] | None = await collection.find_one_and_update(
+                self._encode(filters),
+                self._encode(self._with_update_tracking(update)),
+                sort=list(sort) if sort is not None else None,
+                return_document=ReturnDocument.AFTER,
+                session=session,
+            )
+        except PyMongoError as error:
+            # The document updated, if any, is unknown
+            self._invalidate_cache()
+            raise OperationError(f"Failed to update document: {error}") from error
+
+        if raw_document is None and raise_if_not_found:
+            raise ValueError(f"Failed to find document matching {dict(filters)}")
+
+        return self._to_entity_from_raw(raw_document)
+
+    @managed_session()
+    @measured()
+    @resilient()
+    async def find_one_and_delete(
+        self,
+        filters: Mapping[str, Any],
+        sort: SortSpecification | None = None,
+        raise_if_not_found: bool = False,
+        session: AsyncIOMotorClientSession | None = None,
+    ) -> EntityGenericType | None:
+        """Delete the first document matching the filters and get its entity, atomically.
+
+        Args:
+            filters (Mapping[str, Any]): The MongoDB filters.
+            sort (SortSpecification | None, optional): The order to pick the first document. Defaults to None.
+            raise_if_not_found (bool, optional): Raise an exception if no document matches. Defaults to False.
+            session (AsyncIOMotorClientSession | None, optional): The session to use.
+            Defaults to None. (managed by decorator)
+
+        Returns:
+            EntityGenericType | None: The entity deleted, or None if no document matches.
+
+        Raises:
+            ValueError: If no document matches and raise_if_not_found is True,
+                or if the entity cannot be created from the document.
+            OperationError: If the operation fails.
+        """
+        collection: AsyncIOMotorCollection[Any] = self._document_type.get_motor_collection()
+        try:
+            raw_document: Mapping[str, Any] | None = await collection.find_one_and_delete(
+                self._encode(filters), sort=list(sort) if sort is not None else None, session=session
+            )
         except PyMongoError as error:
+            # The document deleted, if any, is unknown
+            self._invalidate_cache()
             raise OperationError(f"Failed to delete document: {error}") from error
 
-        if delete_result is not None and delete_result.deleted_count == 1 and delete_result.acknowledged:
-            return
+        if raw_document is None and raise_if_not_found:
+            raise ValueError(f"Failed to find document matching {dict(filters)}")
 
-        raise OperationError("Failed to delete document.")
+        return self._to_entity_from_raw(raw_document)
@@ -0,0 +1,344 @@
+"""Provides the retries and the circuit breaker of the repository operations.
+
+The transient errors of the cluster (network errors, elections, shutdowns) are retried with a decorrelated
+jitter, spreading the retries of the clients instead of hammering the new primary in waves. When they keep
+failing, the circuit breaker opens: the operations fail fast without reaching the cluster, until a probe
+succeeds after the open duration.
+"""
+
+import asyncio
+import random
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from enum import StrEnum
+from typing import TypeVar
+
+from opentelemetry import metrics
+from pydantic import BaseModel, ConfigDict, Field
+from pymongo.errors import ConnectionFailure, OperationFailure
+
+from .exceptions import CircuitOpenError
+
+ResultGenericType = TypeVar("ResultGenericType")  # pylint: disable=invalid-name
+
+# The codes of the server errors retried by the drivers (elections, shutdowns, network errors)
+RETRYABLE_ERROR_CODES: frozenset[int] = frozenset({6, 7, 89, 91, 189, 262, 9001, 10107, 11600, 11602, 13435, 13436})
+RETRYABLE_WRITE_ERROR_LABEL: str = "RetryableWriteError"
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """Check an error, or one of its causes, is a transient error of the cluster.
+
+    Args:
+        error (BaseException): The error, an `OperationError` wrapping the driver error for instance.
+
+    Returns:
+        bool: True if the operation may succeed once retried.
+    """
+    cause: BaseException | None = error
+    while cause is not None:
+        # Including the server selection timeouts, the not primary and the network errors
+        if isinstance(cause, ConnectionFailure):
+            return True
+        if isinstance(cause, OperationFailure) and (
+            cause.code in RETRYABLE_ERROR_CODES or cause.has_error_label(RETRYABLE_WRITE_ERROR_LABEL)
+        ):
+            return True
+        cause = cause.__cause__
+    return False
+
+
+class RetryPolicy(BaseModel):
+    """The retries of the operations failed with a transient error, with a decorrelated jitter."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    max_attempts: int = Field(default=3, ge=1, description="The maximum number of attempts, 1 disables the retries.")
+    base_delay_s: float = Field(default=0.05, gt=0, description="The minimum delay before a retry, in seconds.")
+    max_delay_s: float = Field(default=2.0, gt=0, description="The maximum delay before a retry, in seconds.")
+
+    def next_delay(self, previous_delay_s: float | None = None) -> float:
+        """Draw the delay before the next retry, growing with the previous one without being correlated to it.
+
+        Args:
+            previous_delay_s (float | None, optional): The delay before the previous retry. Defaults to None
+                (first retry).
+
+        Returns:
+            float: The delay, in seconds, between the base and the maximum delays.
+        """
+        previous_delay_s = previous_delay_s if previous_delay_s is not None else self.base_delay_s
+        return min(self.max_delay_s, random.uniform(self.base_delay_s, previous_delay_s * 3))
+
+
+class CircuitBreakerPolicy(BaseModel):
+    """When the circuit breaker opens, and for how long."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    failure_rate_threshold: float = Field(
+        default=0.5, gt=0.0, le=1.0, description="The share of the operations failed opening the circuit."
+    )
+    minimum_calls: int = Field(
+        default=20, ge=1, description="The number of operations in the window before the failure rate is considered."
+    )
+    window_s: float = Field(default=10.0, gt=0, description="The sliding window of the failure rate, in seconds.")
+    open_duration_s: float = Field(
+        default=5.0, gt=0, description="The duration the circuit stays open before letting probes through, in seconds."
+    )
+    half_open_max_calls: int = Field(
+        default=1, ge=1, description="The number of probes let through at once when the circuit is half-open."
+    )
+
+
+class CircuitState(StrEnum):
+    """The states of a circuit breaker."""
+
+    # The operations go through, their outcomes are counted
+    CLOSED = "closed"
+    # The operations fail fast, until the open duration elapses
+    OPEN = "open"
+    # Probes go through, closing the circuit if they succeed, opening it again otherwise
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Circuit breaker on the failure rate of the operations in a sliding time window.
+
+    Only the transient errors of the cluster are failures: an operation rejected by the server for another
+    reason (e.g. a duplicate key) shows the cluster is up.
+    """
+
+    def __init__(self, policy: CircuitBreakerPolicy | None = None, clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialize the circuit breaker, closed.
+
+        Args:
+            policy (CircuitBreakerPolicy | None, optional): The policy. Defaults to None (the default policy).
+            clock (Callable[[], float], optional): The clock, in seconds. Defaults to time.monotonic.
+        """
+        self._policy: CircuitBreakerPolicy = policy if policy is not None else CircuitBreakerPolicy()
+        self._clock: Callable[[], float] = clock
+        self._state: CircuitState = CircuitState.CLOSED
+        # The (time, failed) outcomes of the operations in the window, when closed
+        self._outcomes: deque[tuple[float, bool]] = deque()
+        self._failures: int = 0
+        self._opened_at: float = 0.0
+        self._probes_in_flight: int = 0
+
+    @property
+    def policy(self) -> CircuitBreakerPolicy:
+        """The policy of the circuit breaker."""
+        return self._policy
+
+    @property
+    def state(self) -> CircuitState:
+        """The state of the circuit, half-open once the open duration elapsed."""
+        if self._state == CircuitState.OPEN and self._clock() - self._opened_at >= self._policy.open_duration_s:
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+
+    def _transition(self, state: CircuitState) -> None:
+        self._state = state
+        self._outcomes.clear()
+        self._failures = 0
+        self._probes_in_flight = 0
+        if state == CircuitState.OPEN:
+            self._opened_at = self._clock()
+
+    def acquire(self) -> None:
+        """Let an operation through, its outcome must then be recorded or released.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with all its probes in flight.
+        """
+        state: CircuitState = self.state
+        if state == CircuitState.OPEN:
+            raise CircuitOpenError("The circuit breaker of the ODM operations is open.")
+        if state == CircuitState.HALF_OPEN:
+            if self._probes_in_flight >= self._policy.half_open_max_calls:
+                raise CircuitOpenError("The circuit breaker of the ODM operations is half-open, probing.")
+            self._probes_in_flight += 1
+
+    def release(self) -> None:
+        """Release an operation let through without an outcome, e.g. cancelled."""
+        if self._state == CircuitState.HALF_OPEN:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+
+    def record(self, failed: bool) -> None:
+        """Record the outcome of an operation let through.
+
+        Args:
+            failed (bool): Whether the operation failed with a transient error of the cluster.
+        """
+        if self._state == CircuitState.HALF_OPEN:
+            self._transition(CircuitState.OPEN if failed else CircuitState.CLOSED)
+            return
+        if self._state == CircuitState.OPEN:
+            # Let through before the circuit opened
+            return
+
+        now: float = self._clock()
+        self._outcomes.append((now, failed))
+        self._failures += failed
+        while self._outcomes and now - self._outcomes[0][0] > self._policy.window_s:
+            _, expired_failed = self._outcomes.popleft()
+            self._failures -= expired_failed
+        if (
+            len(self._outcomes) >= self._policy.minimum_calls
+            and self._failures / len(self._outcomes) >= self._policy.failure_rate_threshold
+        ):
+            self._transition(CircuitState.OPEN)
+
+
+class Resilience:
+    """Runs the repository operations with the retry policy, behind the circuit breaker.
+
+    Metrics:
+    - odm.repository.operation.retries: the operations retried, by error type.
+    - odm.circuit_breaker.state: the state of the circuit breaker (0 closed, 1 half-open, 2 open).
+    - odm.circuit_breaker.rejections: the operations failed fast by the circuit breaker.
+    """
+
+    METER_COUNTER_RETRIES_NAME: str = "odm.repository.operation.retries"
+    METER_GAUGE_CIRCUIT_STATE_NAME: str = "odm.circuit_breaker.state"
+    METER_COUNTER_REJECTIONS_NAME: str = "odm.circuit_breaker.rejections"
+
+    ATTRIBUTE_ERROR_TYPE: str = "error.type"
+
+    CIRCUIT_STATE_VALUES: Mapping[CircuitState, int] = {
+        CircuitState.CLOSED: 0,
+        CircuitState.HALF_OPEN: 1,
+        CircuitState.OPEN: 2,
+    }
+
+    def __init__(
+        self,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        meter: metrics.Meter | None = None,
+    ) -> None:
+        """Initialize the resilience and its instruments.
+
+        Args:
+            retry_policy (RetryPolicy | None, optional): The retry policy. Defaults to None (no retry).
+            circuit_breaker (CircuitBreaker | None, optional): The circuit breaker. Defaults to None (none).
+            meter (metrics.Meter | None, optional): The meter to use. Defaults to None (meter of the global provider).
+        """
+        self._retry_policy: RetryPolicy = retry_policy if retry_policy is not None else RetryPolicy(max_attempts=1)
+        self._circuit_breaker: CircuitBreaker | None = circuit_breaker
+        meter = meter if meter is not None else metrics.get_meter(__name__)
+        self._retries: metrics.Counter = meter.create_counter(
+            name=self.METER_COUNTER_RETRIES_NAME,
+            unit="{retry}",
+            description="The number of repository operations retried after a transient error.",
+        )
+        self._rejections: metrics.Counter = meter.create_counter(
+            name=self.METER_COUNTER_REJECTIONS_NAME,
+            unit="{operation}",
+            description="The number of repository operations failed fast by the circuit breaker.",
+        )
+        meter.create_observable_gauge(
+            name=self.METER_GAUGE_CIRCUIT_STATE_NAME,
+            callbacks=[self._observe_circuit_state],
+            unit="1",
+            description="The state of the circuit breaker (0 closed, 1 half-open, 2 open).",
+        )
+
+    def configure(self, retry_policy: RetryPolicy | None, circuit_breaker: CircuitBreaker | None) -> None:
+        """Replace the retry policy and the circuit breaker.
+
+        Args:
+            retry_policy (RetryPolicy | None): The retry policy, None for no retry.
+            circuit_breaker (CircuitBreaker | None): The circuit breaker, None for none.
+        """
+        self._retry_policy = retry_policy if retry_policy is not None else RetryPolicy(max_attempts=1)
+        self._circuit_breaker = circuit_breaker
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        """The retry policy."""
+        return self._retry_policy
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker | None:
+        """The circuit breaker, if any."""
+        return self._circuit_breaker
+
+    def _observe_circuit_state(self, options: metrics.CallbackOptions) -> Iterable[metrics.Observation]:
+        del options
+        if self._circuit_breaker is None:
+            return []
+        return [metrics.Observation(self.CIRCUIT_STATE_VALUES[self._circuit_breaker.state])]
+
+    def acquire(self, attributes: Mapping[str, str]) -> None:
+        """Let an operation through the circuit breaker, if any.
+
+        Args:
+            attributes (Mapping[str, str]): The attributes of the operation in the metrics.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker fails the operation fast.
+        """
+        if self._circuit_breaker is None:
+            return
+        try:
+            self._circuit_breaker.acquire()
+        except CircuitOpenError:
+            self._rejections.add(amount=1, attributes=attributes)
+            raise
+
+    def release(self, error: BaseException | None) -> None:
+        """Record the outcome of an operation let through, in the circuit breaker if any.
+
+        Args:
+            error (BaseException | None): The error of the operation, None if it succeeded.
+        """
+        if self._circuit_breaker is None:
+            return
+        # Without an outcome of the cluster, e.g. a nested operation failed fast while this one holds the probe
+        if isinstance(error, asyncio.CancelledError | GeneratorExit | CircuitOpenError):
+            self._circuit_breaker.release()
+            return
+        self._circuit_breaker.record(failed=error is not None and is_retryable_error(error))
+
+    async def run(
+        self,
+        operation: Callable[[], Awaitable[ResultGenericType]],
+        attributes: Mapping[str, str],
+        retry: bool = True,
+    ) -> ResultGenericType:
+        """Run an operation, retrying its transient errors.
+
+        Args:
+            operation (Callable[[], Awaitable[ResultGenericType]]): The operation, run again on each attempt.
+            attributes (Mapping[str, str]): The attributes of the operation in the metrics.
+            retry (bool, optional): Whether the operation can be retried, being idempotent. Defaults to True.
+
+        Returns:
+            ResultGenericType: The result of the operation.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker fails the operation fast.
+        """
+        attempt: int = 1
+        delay_s: float | None = None
+        while True:
+            self.acquire(attributes)
+            try:
+                result: ResultGenericType = await operation()
+            except BaseException as error:
+                self.release(error)
+                if not retry or attempt >= self._retry_policy.max_attempts or not is_retryable_error(error):
+                    raise
+                self._retries.add(amount=1, attributes={**attributes, self.ATTRIBUTE_ERROR_TYPE: type(error).__name__})
+                delay_s = self._retry_policy.next_delay(delay_s)
+                attempt += 1
+                await asyncio.sleep(delay_s)
+                continue
+            self.release(None)
+            return result
+
+
+# The resilience of the repositories, configured by the ODM plugin (no retry nor circuit breaker until then)
+repository_resilience: Resilience = Resilience()
@@ -0,0 +1,78 @@
+"""Provides the response serializing the raw documents of the repositories straight to JSON."""
+
+import base64
+import datetime
+import json
+from collections.abc import Mapping
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+from bson import Binary, Decimal128, ObjectId
+from bson.binary import UUID_SUBTYPE, UuidRepresentation
+from fastapi.responses import JSONResponse
+
+# The subtype of the UUIDs stored by the legacy drivers
+_LEGACY_UUID_SUBTYPE: int = 3
+
+
+def encode_bson_value(value: Any) -> Any:  # noqa: PLR0911
+    """Encode a value the JSON encoder does not know, as the API would serialize it.
+
+    Args:
+        value (Any): The value, a BSON value or a mapping which is not a dict (e.g. a `RawBSONDocument`).
+
+    Returns:
+        Any: The value, encodable by the JSON encoder.
+
+    Raises:
+        TypeError: If the value cannot be encoded.
+    """
+    match value:
+        case Mapping():
+            return dict(value)
+        case Binary() if value.subtype == UUID_SUBTYPE:
+            return str(value.as_uuid())
+        case Binary() if value.subtype == _LEGACY_UUID_SUBTYPE:
+            return str(value.as_uuid(UuidRepresentation.PYTHON_LEGACY))
+        case bytes():
+            return base64.b64encode(value).decode("ascii")
+        case UUID() | ObjectId():
+            return str(value)
+        case datetime.datetime() | datetime.date():
+            return value.isoformat()
+        case Decimal128():
+            return str(value.to_decimal())
+        case Enum():
+            return value.value
+        case set() | frozenset() | tuple():
+            return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class BSONJSONResponse(JSONResponse):
+    """JSON response of the raw documents read by the repositories, without any model in between.
+
+    The content is encoded by the JSON encoder, the documents read as `RawBSONDocument` being decoded
+    only there, and the BSON values (UUID binaries, datetimes, object IDs, decimals) encoded as strings.
+    The content is not validated against the response model of the route:
+
+    ```python
+    @router.get(path="", response_class=BSONJSONResponse)
+    async def get_books(book_repository: BookRepository = Depends(...)) -> BSONJSONResponse:
+        return BSONJSONResponse(content=[book async for book in book_repository.find_raw(fields=["id", "title"])])
+    ```
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Render the content to JSON.
+
+        Args:
+            content (Any): The content, of raw documents.
+
+        Returns:
+            bytes: The JSON.
+        """
+        return json.dumps(
+            content, default=encode_bson_value, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+        ).encode("utf-8")
@@ -0,0 +1,294 @@
+"""Provides the slow-query log, explaining a sample of the slow commands to summarize their plans."""
+
+import asyncio
+import random
+from collections.abc import Iterator, Mapping
+from contextvars import Context
+from typing import Any
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from opentelemetry import trace
+from pydantic import BaseModel, Field
+from pymongo import monitoring
+from pymongo.errors import PyMongoError
+from structlog.stdlib import BoundLogger, get_logger
+
+from .listeners import sanitize_command
+
+_logger: BoundLogger = get_logger()
+
+# The commands which can be explained, the other ones are only logged
+EXPLAINABLE_COMMANDS: frozenset[str] = frozenset(
+    {"find", "aggregate", "count", "distinct", "findAndModify", "update", "delete"}
+)
+# The fields of the commands bound to their session, transaction or connection, removed from the explained commands
+_UNEXPLAINABLE_FIELDS: frozenset[str] = frozenset(
+    {"lsid", "txnNumber", "autocommit", "startTransaction", "readConcern", "writeConcern"}
+)
+# The stages of the aggregations which cannot be explained with their execution statistics
+_WRITE_STAGES: frozenset[str] = frozenset({"$out", "$merge"})
+COLLECTION_SCAN_STAGE: str = "COLLSCAN"
+
+
+class QueryPlanSummary(BaseModel):
+    """Summary of the winning plan of a command explained with its execution statistics."""
+
+    stages: list[str] = Field(default_factory=list, description="The stages of the plan, from the root.")
+    indexes: list[str] = Field(default_factory=list, description="The indexes used by the plan.")
+    docs_examined: int | None = Field(default=None, description="The number of documents examined.")
+    keys_examined: int | None = Field(default=None, description="The number of index keys examined.")
+    docs_returned: int | None = Field(default=None, description="The number of documents returned.")
+
+    @property
+    def collection_scan(self) -> bool:
+        """Whether the plan scans the whole collection, usually for a missing index."""
+        return COLLECTION_SCAN_STAGE in self.stages
+
+
+def _iter_plan_stages(plan: Any) -> Iterator[Mapping[str, Any]]:
+    """Iterate over the stages of a plan, whatever the nesting of the server version or the topology.
+
+    Args:
+        plan (Any): The plan, or a part of it.
+
+    Yields:
+        Mapping[str, Any]: The stages, from the root.
+    """
+    if isinstance(plan, Mapping):
+        if isinstance(plan.get("stage"), str):
+            yield plan
+        for value in plan.values():
+            yield from _iter_plan_stages(value)
+    elif isinstance(plan, list):
+        for item in plan:
+            yield from _iter_plan_stages(item)
+
+
+def summarize_explain(explain: Mapping[str, Any]) -> QueryPlanSummary:
+    """Summarize the output of the explain of a command, in the `executionStats` verbosity.
+
+    Args:
+        explain (Mapping[str, Any]): The output of the explain.
+
+    Returns:
+        QueryPlanSummary: The summary of the winning plan.
+    """
+    # The plans of the aggregations not pushed down to the query layer are in their $cursor stage
+    if "queryPlanner" not in explain:
+        for stage in explain.get("stages", []):
+            if "$cursor" in stage:
+                explain = stage["$cursor"]
+                break
+
+    stages: list[str] = []
+    indexes: list[str] = []
+    for stage in _iter_plan_stages(explain.get("queryPlanner", {}).get("winningPlan", {})):
+        if stage["stage"] not in stages:
+            stages.append(stage["stage"])
+        if isinstance(stage.get("indexName"), str) and stage["indexName"] not in indexes:
+            indexes.append(stage["indexName"])
+
+    execution_stats: Mapping[str, Any] = explain.get("executionStats", {})
+    return QueryPlanSummary(
+        stages=stages,
+        indexes=indexes,
+        docs_examined=execution_stats.get("totalDocsExamined"),
+        keys_examined=execution_stats.get("totalKeysExamined"),
+        docs_returned=execution_stats.get("nReturned"),
+    )
+
+
+def build_explain_command(command_name: str, command: Mapping[str, Any]) -> dict[str, Any] | None:
+    """Build the explain of a command, without the fields bound to its session or connection.
+
+    Args:
+        command_name (str): The name of the command.
+        command (Mapping[str, Any]): The command.
+
+    Returns:
+        dict[str, Any] | None: The explain command, or None if the command cannot be explained.
+    """
+    if command_name not in EXPLAINABLE_COMMANDS:
+        return None
+    # The explain of the writes is limited to one statement
+    if len(command.get("updates", [None])) != 1 or len(command.get("deletes", [None])) != 1:
+        return None
+    if any(len(_WRITE_STAGES.intersection(stage)) > 0 for stage in command.get("pipeline", [])):
+        return None
+    explained: dict[str, Any] = {
+        key: value for key, value in command.items() if key not in _UNEXPLAINABLE_FIELDS and not key.startswith("$")
+    }
+    return {"explain": explained, "verbosity": "executionStats"}
+
+
+class SlowQueryListener(monitoring.CommandListener):
+    """Log the commands slower than a threshold, and explain a sample of them in the background.
+
+    Each slow command is logged with its sanitized statement and added as an event to the span in progress.
+    The sampled ones are explained on the event loop of the client, at most `max_concurrent_explains` at
+    once, and their plan summary (stages, indexes used, documents examined and returned) is logged and
+    added to the span if it is still in progress. The listener is registered by the ODM plugin, according
+    to `ODMConfig.slow_query_threshold_ms`:
+
+    ```python
+    listener = SlowQueryListener(threshold_ms=100, explain_sample_rate=0.1)
+    client = AsyncIOMotorClient(host=uri, event_listeners=[listener])
+    listener.attach(client)
+    ```
+    """
+
+    SPAN_EVENT_SLOW_QUERY_NAME: str = "odm.slow_query"
+    SPAN_EVENT_QUERY_PLAN_NAME: str = "odm.slow_query.plan"
+
+    DEFAULT_MAX_CONCURRENT_EXPLAINS: int = 2
+
+    def __init__(
+        self,
+        threshold_ms: int,
+        explain_sample_rate: float = 0.0,
+        max_concurrent_explains: int = DEFAULT_MAX_CONCURRENT_EXPLAINS,
+    ) -> None:
+        """Initialize the listener.
+
+        Args:
+            threshold_ms (int): The duration from which a command is slow, in milliseconds.
+            explain_sample_rate (float, optional): The share of the slow commands explained, between 0 and 1.
+                Defaults to 0.0 (none).
+            max_concurrent_explains (int, optional): The maximum number of explains in progress, the slow
+                commands sampled beyond are not explained. Defaults to DEFAULT_MAX_CONCURRENT_EXPLAINS.
+
+        Raises:
+            ValueError: If the threshold is negative, or the sample rate is not between 0 and 1.
+        """
+        if threshold_ms < 0 or not 0 <= explain_sample_rate <= 1:
+            raise ValueError(
+                "The threshold must be positive, and the explain sample rate between 0 and 1, "
+                f"got {threshold_ms} and {explain_sample_rate}."
+            )
+        self._threshold_micros: int = threshold_ms * 1000
+        self._explain_sample_rate: float = explain_sample_rate
+        self._max_concurrent_explains: int = max_concurrent_explains
+        self._client: AsyncIOMotorClient[Any] | None = None
+        # The commands in progress, by request and connection
+        self._commands: dict[tuple[int, Any], Mapping[str, Any]] = {}
+        # Strong references to the explains in progress, the event loop only keeps weak ones
+        self._explains: set[asyncio.Task[None]] = set()
+
+    def attach(self, client: AsyncIOMotorClient[Any]) -> None:
+        """Attach the client running the explains, the one the listener is registered on.
+
+        Args:
+            client (AsyncIOMotorClient[Any]): The client.
+        """
+        self._client = client
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        """Keep the command until its end, to log it if slow.
+
+        Args:
+            event (monitoring.CommandStartedEvent): The event.
+        """
+        self._commands[(event.request_id, event.connection_id)] = event.command
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        """Log the command if slow.
+
+        Args:
+            event (monitoring.CommandSucceededEvent): The event.
+        """
+        self._on_command_done(event)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        """Log the command if slow.
+
+        Args:
+            event (monitoring.CommandFailedEvent): The event.
+        """
+        self._on_command_done(event)
+
+    def _on_command_done(self, event: monitoring.CommandSucceededEvent | monitoring.CommandFailedEvent) -> None:
+        """Log the command if slow, and schedule its explain if sampled.
+
+        Args:
+            event (monitoring.CommandSucceededEvent | monitoring.CommandFailedEvent): The event.
+        """
+        command: Mapping[str, Any] | None = self._commands.pop((event.request_id, event.connection_id), None)
+        if command is None or event.duration_micros < self._threshold_micros:
+            return
+
+        statement: str = sanitize_command(event.command_name, command)
+        attributes: dict[str, Any] = {
+            "db.namespace": event.database_name,
+            "db.operation.name": event.command_name,
+            "db.query.text": statement,
+            "duration_ms": event.duration_micros / 1000,
+        }
+        _logger.warning("ODM slow query", **attributes)
+        # The listeners run in the context of the operation, the span in progress is the one of the caller
+        span: trace.Span = trace.get_current_span()
+        if span.is_recording():
+            span.add_event(self.SPAN_EVENT_SLOW_QUERY_NAME, attributes=attributes)
+
+        if self._client is None or random.random() >= self._explain_sample_rate:
+            return
+        explain_command: dict[str, Any] | None = build_explain_command(event.command_name, command)
+        if explain_command is not None:
+            self._client.get_io_loop().call_soon_threadsafe(
+                self._start_explain, event.database_name, explain_command, attributes, span
+            )
+
+    def _start_explain(
+        self, database_name: str, explain_command: dict[str, Any], attributes: dict[str, Any], span: trace.Span
+    ) -> None:
+        """Start the explain of a slow command, on the event loop of the client.
+
+        Args:
+            database_name (str): The database of the command.
+            explain_command (dict[str, Any]): The explain of the command.
+            attributes (dict[str, Any]): The attributes of the slow command.
+            span (trace.Span): The span the command was run in.
+        """
+        if len(self._explains) >= self._max_concurrent_explains:
+            return
+        # Empty context, the explain must not join the unit of work of the command
+        task: asyncio.Task[None] = asyncio.get_running_loop().create_task(
+            self._explain(database_name, explain_command, attributes, span), name="odm-explain", context=Context()
+        )
+        self._explains.add(task)
+        task.add_done_callback(self._explains.discard)
+
+    async def _explain(
+        self, database_name: str, explain_command: dict[str, Any], attributes: dict[str, Any], span: trace.Span
+    ) -> None:
+        """Explain a slow command, and log the summary of its plan.
+
+        Args:
+            database_name (str): The database of the command.
+            explain_command (dict[str, Any]): The explain of the command.
+            attributes (dict[str, Any]): The attributes of the slow command.
+            span (trace.Span): The span the command was run in.
+        """
+        if self._client is None:
+            return
+        try:
+            explain: Mapping[str, Any] = await self._client[database_name].command(explain_command)
+        except PyMongoError as error:
+            _logger.debug(f"ODM slow query explain failed: {error}")
+            return
+
+        summary: QueryPlanSummary = summarize_explain(explain)
+        plan_attributes: dict[str, Any] = {
+            **attributes,
+            "plan.stages": summary.stages,
+            "plan.indexes": summary.indexes,
+            "plan.collection_scan": summary.collection_scan,
+            "plan.docs_examined": summary.docs_examined,
+            "plan.keys_examined": summary.keys_examined,
+            "plan.docs_returned": summary.docs_returned,
+        }
+        _logger.warning("ODM slow query explained", **plan_attributes)
+        if span.is_recording():
+            span.add_event(
+                self.SPAN_EVENT_QUERY_PLAN_NAME,
+                attributes={key: value for key, value in plan_attributes.items() if value is not None},
+            )
@@ -0,0 +1,190 @@
+"""Provides the unit of work, sharing one session and transaction across several repository calls."""
+
+import asyncio
+import random
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorClientSession
+from pymongo.errors import PyMongoError
+
+from .exceptions import OperationError
+
+ResultGenericType = TypeVar("ResultGenericType")  # pylint: disable=invalid-name
+
+TRANSIENT_TRANSACTION_ERROR_LABEL: str = "TransientTransactionError"
+UNKNOWN_TRANSACTION_COMMIT_RESULT_LABEL: str = "UnknownTransactionCommitResult"
+
+DEFAULT_MAX_COMMIT_ATTEMPTS: int = 3
+DEFAULT_MAX_ATTEMPTS: int = 3
+RETRY_BACKOFF_BASE_S: float = 0.01
+
+# Session of the unit of work in progress, used by the repository calls which are not given a session
+_unit_of_work_session: ContextVar[AsyncIOMotorClientSession | None] = ContextVar("_unit_of_work_session", default=None)
+# Callbacks of the unit of work in progress, called once its transaction is committed
+_unit_of_work_after_commit: ContextVar[list[Callable[[], None]] | None] = ContextVar(
+    "_unit_of_work_after_commit", default=None
+)
+
+
+def get_unit_of_work_session() -> AsyncIOMotorClientSession | None:
+    """Get the session of the unit of work in progress in the current context.
+
+    Returns:
+        AsyncIOMotorClientSession | None: The session, or None outside of a unit of work.
+    """
+    return _unit_of_work_session.get()
+
+
+def call_after_commit(callback: Callable[[], None]) -> None:
+    """Call the callback once the unit of work in progress is committed, or at once outside of a unit of work.
+
+    The callbacks are called as well when the result of the commit is unknown, not when the unit of work is
+    aborted.
+
+    Args:
+        callback (Callable[[], None]): The callback, e.g. the invalidation of the entities written.
+    """
+    callbacks: list[Callable[[], None]] | None = _unit_of_work_after_commit.get()
+    if callbacks is None:
+        callback()
+        return
+    callbacks.append(callback)
+
+
+def has_error_label(error: BaseException, label: str) -> bool:
+    """Check if an error, or one of its causes, is a MongoDB error with the label.
+
+    Args:
+        error (BaseException): The error, the repositories wrap the MongoDB errors in `OperationError`.
+        label (str): The error label.
+
+    Returns:
+        bool: True if the error has the label.
+    """
+    cause: BaseException | None = error
+    while cause is not None:
+        if isinstance(cause, PyMongoError) and cause.has_error_label(label):
+            return True
+        cause = cause.__cause__
+    return False
+
+
+async def _commit(session: AsyncIOMotorClientSession, max_commit_attempts: int) -> None:
+    """Commit the transaction, retried while its result is unknown.
+
+    Args:
+        session (AsyncIOMotorClientSession): The session of the transaction.
+        max_commit_attempts (int): The maximum number of attempts.
+
+    Raises:
+        OperationError: If the commit fails.
+    """
+    for attempt in range(1, max_commit_attempts + 1):
+        try:
+            await session.commit_transaction()
+            return
+        except PyMongoError as error:
+            if attempt < max_commit_attempts and error.has_error_label(UNKNOWN_TRANSACTION_COMMIT_RESULT_LABEL):
+                continue
+            raise OperationError(f"Failed to commit transaction: {error}") from error
+
+
+@asynccontextmanager
+async def unit_of_work(
+    client: AsyncIOMotorClient[Any], max_commit_attempts: int = DEFAULT_MAX_COMMIT_ATTEMPTS
+) -> AsyncGenerator[AsyncIOMotorClientSession, None]:
+    """Open a session and a transaction shared by the repository calls made inside the block.
+
+    The transaction is committed at the end of the block, or aborted if the block raises. A unit of work
+    opened inside another one joins it. The block itself is not retried, see `run_in_unit_of_work`.
+    The invalidations of the entity caches by the writes of the block are published once the transaction
+    is committed, see `call_after_commit`.
+
+    ```python
+    async with unit_of_work(client):
+        await book_repository.insert(entity=book)
+        await author_repository.update_one_by_id(entity_id=author_id, update={"$inc": {"books": 1}})
+    ```
+
+    Args:
+        client (AsyncIOMotorClient[Any]): The client of the repositories.
+        max_commit_attempts (int, optional): The maximum number of attempts of the commit when its result is
+            unknown. Defaults to DEFAULT_MAX_COMMIT_ATTEMPTS.
+
+    Yields:
+        AsyncIOMotorClientSession: The session of the unit of work.
+
+    Raises:
+        OperationError: If the session or the transaction fails.
+    """
+    outer_session: AsyncIOMotorClientSession | None = _unit_of_work_session.get()
+    if outer_session is not None:
+        yield outer_session
+        return
+
+    try:
+        session: AsyncIOMotorClientSession = await client.start_session()
+    except PyMongoError as error:
+        raise OperationError(f"Failed to create session: {error}") from error
+
+    async with session:
+        session.start_transaction()
+        callbacks: list[Callable[[], None]] = []
+        session_token = _unit_of_work_session.set(session)
+        callbacks_token = _unit_of_work_after_commit.set(callbacks)
+        try:
+            yield session
+        except BaseException:
+            try:
+                await session.abort_transaction()
+            except PyMongoError:
+                # The transaction is aborted by the server anyway, the original error matters
+                pass
+            raise
+        finally:
+            _unit_of_work_after_commit.reset(callbacks_token)
+            _unit_of_work_session.reset(session_token)
+        try:
+            await _commit(session=session, max_commit_attempts=max_commit_attempts)
+        finally:
+            # Even when the commit fails, its result may be unknown and the writes committed
+            for callback in callbacks:
+                callback()
+
+
+async def run_in_unit_of_work(
+    client: AsyncIOMotorClient[Any],
+    callback: Callable[[], Awaitable[ResultGenericType]],
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+) -> ResultGenericType:
+    """Run the callback in a unit of work, retried from the start on transient transaction errors.
+
+    Args:
+        client (AsyncIOMotorClient[Any]): The client of the repositories.
+        callback (Callable[[], Awaitable[ResultGenericType]]): The repository calls to run, must be re-runnable.
+        max_attempts (int, optional): The maximum number of attempts. Defaults to DEFAULT_MAX_ATTEMPTS.
+
+    Returns:
+        ResultGenericType: The result of the callback.
+
+    Raises:
+        OperationError: If the unit of work fails.
+    """
+    if _unit_of_work_session.get() is not None:
+        # Retrying inside the outer unit of work is pointless, its transaction is aborted
+        return await callback()
+
+    for attempt in range(1, max_attempts + 1):
+        try:
+            async with unit_of_work(client):
+                return await callback()
+        except (OperationError, PyMongoError) as error:
+            if attempt == max_attempts or not has_error_label(error, TRANSIENT_TRANSACTION_ERROR_LABEL):
+                raise
+        # Full jitter, to spread the retries of the conflicting transactions
+        await asyncio.sleep(random.uniform(0, RETRY_BACKOFF_BASE_S * 2**attempt))
+
+    raise OperationError("Failed to run the unit of work.")
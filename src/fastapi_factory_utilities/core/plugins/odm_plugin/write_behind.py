@@ -0,0 +1,221 @@
+"""Provides the write-behind buffer, coalescing the inserts of the repositories into bulk writes."""
+
+import asyncio
+import weakref
+from collections import deque
+from collections.abc import Awaitable, Callable, Sequence
+from contextvars import Context
+from typing import Any, Generic, TypeVar
+
+from pydantic import BaseModel
+from structlog.stdlib import BoundLogger, get_logger
+
+from .exceptions import ODMPluginBaseException, WriteBehindBufferClosedError
+
+_logger: BoundLogger = get_logger()
+
+EntityGenericType = TypeVar("EntityGenericType", bound=BaseModel)  # pylint: disable=invalid-name
+
+# Writes a batch of entities, returning the entity written or the error of each one, in the input order
+WriteBatchFunction = Callable[[list[EntityGenericType]], Awaitable[Sequence[EntityGenericType | BaseException]]]
+
+
+class WriteBehindBuffer(Generic[EntityGenericType]):
+    """Queues the entities to insert and writes them in batches, when the batch is full or has waited long enough.
+
+    Each entity queued has a future, resolved with the entity written (or its error) once its batch is
+    acknowledged. The entities queued and in flight are bounded: when `max_pending` is reached, `insert`
+    waits for a batch to be written (backpressure). The buffers are closed, and flushed, on the shutdown of
+    the ODM plugin. The buffer is created by `AbstractRepository.write_behind`:
+
+    ```python
+    buffer: WriteBehindBuffer[EventEntity] = EventRepository(database).write_behind(max_delay_s=0.01)
+    ack: asyncio.Future[EventEntity] = await buffer.insert(event)  # Returns once queued
+    event_written: EventEntity = await ack  # Returns once written
+    ```
+
+    The writes are made outside of any unit of work, and are lost if the process dies before a flush.
+    """
+
+    DEFAULT_MAX_BATCH_SIZE: int = 1000
+    DEFAULT_MAX_DELAY_S: float = 0.005
+    DEFAULT_MAX_PENDING: int = 10_000
+
+    def __init__(
+        self,
+        write_batch: WriteBatchFunction[EntityGenericType],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_delay_s: float = DEFAULT_MAX_DELAY_S,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ) -> None:
+        """Initialize the buffer.
+
+        Args:
+            write_batch (WriteBatchFunction[EntityGenericType]): Writes a batch of entities.
+            max_batch_size (int, optional): The number of entities which triggers a write. Defaults to
+                DEFAULT_MAX_BATCH_SIZE.
+            max_delay_s (float, optional): The time an entity can wait for its batch to fill, in seconds.
+                Defaults to DEFAULT_MAX_DELAY_S.
+            max_pending (int, optional): The maximum number of entities queued or being written. Defaults to
+                DEFAULT_MAX_PENDING.
+
+        Raises:
+            ValueError: If a threshold is not positive, or the batch size exceeds the pending entities.
+        """
+        if max_batch_size <= 0 or max_delay_s <= 0 or max_pending < max_batch_size:
+            raise ValueError(
+                "The batch size and the delay must be positive, and the pending entities at least a batch, "
+                f"got {max_batch_size}, {max_delay_s} and {max_pending}."
+            )
+        self._write_batch: WriteBatchFunction[EntityGenericType] = write_batch
+        self._max_batch_size: int = max_batch_size
+        self._max_delay_s: float = max_delay_s
+        self._slots: asyncio.Semaphore = asyncio.Semaphore(max_pending)
+        # Entities queued, with the time they were queued at and their future
+        self._queue: deque[tuple[float, EntityGenericType, asyncio.Future[EntityGenericType]]] = deque()
+        self._not_empty: asyncio.Event = asyncio.Event()
+        self._batch_ready: asyncio.Event = asyncio.Event()
+        self._closed: bool = False
+        self._task: asyncio.Task[None] | None = None
+        write_behind_buffers.add(self)
+
+    def __len__(self) -> int:
+        """Get the number of entities queued, not being written."""
+        return len(self._queue)
+
+    async def insert(self, entity: EntityGenericType) -> "asyncio.Future[EntityGenericType]":
+        """Queue an entity to insert, waiting for room if the buffer is full.
+
+        Args:
+            entity (EntityGenericType): The entity to insert.
+
+        Returns:
+            asyncio.Future[EntityGenericType]: Resolved with the entity written once its batch is acknowledged,
+            or with the error of the entity (e.g. `UnableToCreateEntityDueToDuplicateKeyError`).
+
+        Raises:
+            WriteBehindBufferClosedError: If the buffer is closed.
+        """
+        if self._closed:
+            raise WriteBehindBufferClosedError("The write-behind buffer is closed.")
+        await self._slots.acquire()
+        if self._closed:
+            self._slots.release()
+            raise WriteBehindBufferClosedError("The write-behind buffer is closed.")
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        written: asyncio.Future[EntityGenericType] = loop.create_future()
+        self._queue.append((loop.time(), entity, written))
+        self._not_empty.set()
+        if len(self._queue) >= self._max_batch_size:
+            self._batch_ready.set()
+        if self._task is None or self._task.done():
+            # Empty context, the writes must not join the unit of work of the first caller
+            self._task = loop.create_task(self._run(), name="odm-write-behind", context=Context())
+            self._task.add_done_callback(_on_task_done)
+        return written
+
+    async def close(self) -> None:
+        """Write the entities queued and stop, the entities inserted afterwards are refused."""
+        self._closed = True
+        self._not_empty.set()
+        self._batch_ready.set()
+        # A task stopped on an error failed its entities queued, the next insert starting another one
+        if self._task is not None and not self._task.done():
+            await self._task
+
+    async def _run(self) -> None:
+        """Write the batches, until closed and empty, failing the entities queued if stopped on an error."""
+        try:
+            await self._write_batches()
+        except BaseException as error:
+            self._fail_queued(error)
+            raise
+
+    async def _write_batches(self) -> None:
+        """Write the batches, until closed and empty."""
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        while True:
+            if len(self._queue) == 0:
+                if self._closed:
+                    return
+                self._not_empty.clear()
+                await self._not_empty.wait()
+                continue
+
+            if len(self._queue) < self._max_batch_size and not self._closed:
+                self._batch_ready.clear()
+                delay: float = self._queue[0][0] + self._max_delay_s - loop.time()
+                try:
+                    await asyncio.wait_for(self._batch_ready.wait(), timeout=max(delay, 0))
+                except TimeoutError:
+                    pass
+
+            batch: list[tuple[float, EntityGenericType, asyncio.Future[EntityGenericType]]] = [
+                self._queue.popleft() for _ in range(min(self._max_batch_size, len(self._queue)))
+            ]
+            await self._write(batch)
+
+    def _fail_queued(self, error: BaseException) -> None:
+        """Fail the entities queued, with the error stopping the task writing them, cancelled if cancelled.
+
+        Args:
+            error (BaseException): The error.
+        """
+        while len(self._queue) > 0:
+            _, _, written = self._queue.popleft()
+            self._slots.release()
+            if written.done():
+                continue
+            if isinstance(error, asyncio.CancelledError):
+                written.cancel()
+            else:
+                written.set_exception(error)
+
+    async def _write(self, batch: list[tuple[float, EntityGenericType, "asyncio.Future[EntityGenericType]"]]) -> None:
+        """Write a batch and resolve the futures of its entities.
+
+        Args:
+            batch (list[tuple[float, EntityGenericType, asyncio.Future[EntityGenericType]]]): The entities queued.
+        """
+        try:
+            outcomes: Sequence[EntityGenericType | BaseException] = await self._write_batch(
+                [entity for _, entity, _ in batch]
+            )
+        except asyncio.CancelledError:
+            for _, _, written in batch:
+                written.cancel()
+            raise
+        except (Exception, ODMPluginBaseException) as error:  # pylint: disable=broad-except
+            _logger.warning(f"ODM write-behind batch of {len(batch)} entities failed: {error}")
+            outcomes = [error] * len(batch)
+        finally:
+            for _ in batch:
+                self._slots.release()
+
+        for (_, _, written), outcome in zip(batch, outcomes, strict=True):
+            if written.done():
+                continue
+            if isinstance(outcome, BaseException):
+                written.set_exception(outcome)
+            else:
+                written.set_result(outcome)
+
+
+def _on_task_done(task: "asyncio.Task[None]") -> None:
+    """Log the failure of the task of a buffer, its entities queued being failed.
+
+    Args:
+        task (asyncio.Task[None]): The task.
+    """
+    if not task.cancelled() and task.exception() is not None:
+        _logger.error(f"ODM {task.get_name()} failed. {task.exception()}")
+
+
+# The buffers alive, closed on the shutdown of the ODM plugin
+write_behind_buffers: "weakref.WeakSet[WriteBehindBuffer[Any]]" = weakref.WeakSet()
+
+
+async def close_write_behind_buffers() -> None:
+    """Close all the write-behind buffers alive, writing the entities queued."""
+    await asyncio.gather(*(buffer.close() for buffer in list(write_behind_buffers)))
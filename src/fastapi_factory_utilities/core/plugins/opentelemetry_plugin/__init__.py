@@ -10,6 +10,7 @@ from opentelemetry.sdk.metrics import MeterProvider
 from opentelemetry.sdk.trace import TracerProvider
 from structlog.stdlib import BoundLogger, get_logger
 
+from fastapi_factory_utilities.core.plugins import PluginsEnum
 from fastapi_factory_utilities.core.protocols import BaseApplicationProtocol
 
 from .builder import OpenTelemetryPluginBuilder
@@ -25,6 +26,8 @@ __all__: list[str] = [
 
 _logger: BoundLogger = get_logger()
 
+DEPENDS_ON: list[PluginsEnum] = []
+
 
 def pre_conditions_check(application: BaseApplicationProtocol) -> bool:
     """Check the pre-conditions for the OpenTelemetry plugin.
@@ -127,6 +127,7 @@ class OpenTelemetryPluginBuilder:
                 ),
                 yaml_base_key="opentelemetry",
                 use_environment_injection=True,
+                use_cache=True,
             ).read()
         except (FileNotFoundError, ImportError, UnableToReadYamlFileError) as exception:
             raise OpenTelemetryPluginConfigError("Unable to read the application configuration file.") from exception
@@ -1,8 +1,9 @@
 """Provides helper functions for the OpenTelemetry plugin."""
 
+import inspect
 from collections.abc import Callable
 from functools import wraps
-from typing import ParamSpec, TypeVar
+from typing import Any, ParamSpec, TypeVar, cast
 
 from opentelemetry import trace
 from opentelemetry.context import Context
@@ -19,22 +20,34 @@ def trace_span(
     kind: SpanKind = SpanKind.INTERNAL,
     attributes: types.Attributes = None,
 ) -> Callable[[Callable[Param, RetType]], Callable[Param, RetType]]:
-    """Decorator to trace a function using OpenTelemetry."""
+    """Decorator to trace a function using OpenTelemetry, the coroutine functions until they return."""
 
     def decorator(func: Callable[Param, RetType]) -> Callable[Param, RetType]:
-        @wraps(wrapped=func)
-        def wrapper(*args: Param.args, **kwargs: Param.kwargs) -> RetType:
+        def start_span() -> Any:
             # Get Tracer from the instrumented function's module
             tracer: trace.Tracer = trace.get_tracer(instrumenting_module_name=func.__module__)
             # Use the function's name as the span name if no name is provided
             trace_name: str = name if name is not None else func.__name__
             # Start a span with the provided name
-            with tracer.start_as_current_span(
+            return tracer.start_as_current_span(
                 name=trace_name,
                 kind=kind,
                 context=context,
                 attributes=attributes,
-            ):
+            )
+
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(wrapped=func)
+            async def async_wrapper(*args: Param.args, **kwargs: Param.kwargs) -> Any:
+                with start_span():
+                    return await func(*args, **kwargs)
+
+            return cast(Callable[Param, RetType], async_wrapper)
+
+        @wraps(wrapped=func)
+        def wrapper(*args: Param.args, **kwargs: Param.kwargs) -> RetType:
+            with start_span():
                 return func(*args, **kwargs)
 
         return wrapper
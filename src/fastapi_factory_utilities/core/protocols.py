@@ -1,7 +1,7 @@
 """Protocols for the base application."""
 
 from abc import abstractmethod
-from typing import TYPE_CHECKING, ClassVar, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, ClassVar, Protocol, runtime_checkable
 
 from beanie import Document
 from fastapi import FastAPI
@@ -27,6 +27,10 @@ class BaseApplicationProtocol(Protocol):
     def get_asgi_app(self) -> FastAPI:
         """Get the ASGI application."""
 
+    @abstractmethod
+    async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+        """Serve an ASGI call, the application being the one served by the server."""
+
 
 @runtime_checkable
 class PluginProtocol(Protocol):
@@ -34,6 +38,8 @@ class PluginProtocol(Protocol):
 
     Attributes:
         INJECTOR_MODULE (type[Module]): The module for the plugin.
+        DEPENDS_ON (list[PluginsEnum], optional): The plugins which must be started before this plugin
+            (and stopped after it). Defaults to none when not declared.
 
     """
 
@@ -67,6 +67,7 @@ def build_config_from_file_in_package(
             ),
             yaml_base_key=yaml_base_key,
             use_environment_injection=True,
+            use_cache=True,
         ).read()
     except (FileNotFoundError, ImportError, UnableToReadYamlFileError) as exception:
         raise UnableToReadConfigFileError("Unable to read the application configuration file.") from exception
@@ -29,7 +29,8 @@ class UvicornUtils:
             uvicorn.Config: The Uvicorn configuration.
         """
         config = uvicorn.Config(
-            app=self._app.get_asgi_app(),
+            # The application itself, serving the probes ahead of the FastAPI stack
+            app=self._app,
             host=self._app.get_config().host,
             port=self._app.get_config().port,
             reload=self._app.get_config().reload,
@@ -4,6 +4,8 @@
 
 import os
 import re
+import threading
+from copy import deepcopy
 from pathlib import Path
 from typing import Any, cast
 
@@ -26,6 +28,107 @@ class UnableToReadYamlFileError(Exception):
         super().__init__(f"Error reading YAML file: {file_path} - {message}")
 
 
+class YamlDocumentsCache:
+    """Process-wide cache of the parsed YAML documents.
+
+    A document is parsed once per file path, modification time and size. The sections read from it
+    are cached with the values of the environment variables referenced while injecting them, and
+    are reused as long as these values are unchanged.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the cache."""
+        self._lock: threading.Lock = threading.Lock()
+        # file path -> (modification time in ns, size, parsed document)
+        self._documents: dict[Path, tuple[int, int, dict[str, Any]]] = {}
+        # (file path, base key) -> (referenced environment variables, section with environment injected)
+        self._sections: dict[tuple[Path, str | None], tuple[dict[str, str | None], dict[str, Any]]] = {}
+
+    def get_document(self, file_path: Path, file_stat: os.stat_result) -> dict[str, Any] | None:
+        """Get the parsed document if the file is unchanged.
+
+        Args:
+            file_path (Path): The path to the YAML file.
+            file_stat (os.stat_result): The current stat of the file.
+
+        Returns:
+            dict | None: The parsed document or None if not cached or outdated.
+        """
+        with self._lock:
+            entry: tuple[int, int, dict[str, Any]] | None = self._documents.get(file_path)
+        if entry is None or entry[0] != file_stat.st_mtime_ns or entry[1] != file_stat.st_size:
+            return None
+        return entry[2]
+
+    def set_document(self, file_path: Path, file_stat: os.stat_result, document: dict[str, Any]) -> None:
+        """Store the parsed document and drop the sections read from a previous version.
+
+        Args:
+            file_path (Path): The path to the YAML file.
+            file_stat (os.stat_result): The stat of the file taken before parsing it.
+            document (dict): The parsed document.
+        """
+        with self._lock:
+            self._documents[file_path] = (file_stat.st_mtime_ns, file_stat.st_size, document)
+            for key in [key for key in self._sections if key[0] == file_path]:
+                del self._sections[key]
+
+    def get_section(self, file_path: Path, yaml_base_key: str | None) -> dict[str, Any] | None:
+        """Get the section with environment injected if the referenced variables are unchanged.
+
+        Args:
+            file_path (Path): The path to the YAML file.
+            yaml_base_key (str | None): The base key of the section.
+
+        Returns:
+            dict | None: The section or None if not cached or outdated.
+        """
+        with self._lock:
+            entry: tuple[dict[str, str | None], dict[str, Any]] | None = self._sections.get((file_path, yaml_base_key))
+        if entry is None:
+            return None
+        environment, section = entry
+        if any(os.getenv(key) != value for key, value in environment.items()):
+            return None
+        return section
+
+    def set_section(
+        self,
+        file_path: Path,
+        yaml_base_key: str | None,
+        environment: dict[str, str | None],
+        section: dict[str, Any],
+    ) -> None:
+        """Store the section with environment injected.
+
+        Args:
+            file_path (Path): The path to the YAML file.
+            yaml_base_key (str | None): The base key of the section.
+            environment (dict[str, str | None]): The environment variables referenced by the section.
+            section (dict): The section with environment injected.
+        """
+        with self._lock:
+            self._sections[(file_path, yaml_base_key)] = (environment, section)
+
+    def invalidate(self, file_path: Path | None = None) -> None:
+        """Invalidate the cache.
+
+        Args:
+            file_path (Path | None, optional): The file to invalidate. Defaults to None (all files).
+        """
+        with self._lock:
+            if file_path is None:
+                self._documents.clear()
+                self._sections.clear()
+                return
+            self._documents.pop(file_path, None)
+            for key in [key for key in self._sections if key[0] == file_path]:
+                del self._sections[key]
+
+
+yaml_documents_cache: YamlDocumentsCache = YamlDocumentsCache()
+
+
 class YamlFileReader:
     """Handles reading YAML files and converting them to Pydantic models."""
 
@@ -36,6 +139,7 @@ class YamlFileReader:
         file_path: Path,
         yaml_base_key: str | None = None,
         use_environment_injection: bool = True,
+        use_cache: bool = False,
     ) -> None:
         """Initializes the YAML file reader.
 
@@ -45,6 +149,8 @@ class YamlFileReader:
           in the YAML file to read from. Defaults to None.
           use_environment_injection (bool, optional): Whether to use
           environment injection. Defaults to True.
+          use_cache (bool, optional): Whether to use the process-wide
+          documents cache. Defaults to False.
         """
         # Store the file path and base key for YAML reading
         self._yaml_base_key: str | None = yaml_base_key
@@ -52,6 +158,11 @@ class YamlFileReader:
 
         # Store whether to use environment injection
         self._use_environment_injection: bool = use_environment_injection
+        # Environment variables looked up during the injection
+        self._referenced_environment: dict[str, str | None] = {}
+
+        # Store whether to use the documents cache
+        self._use_cache: bool = use_cache
 
     def _filter_data_with_base_key(self, yaml_data: dict[str, Any]) -> dict[str, Any] | None:
         """Extracts the data from the YAML file with the base key.
@@ -72,7 +183,7 @@ class YamlFileReader:
                 try:
                     yaml_data = yaml_data[key]
                 except KeyError:
-                    logger.warning(f"Base key {key}" " not found in YAML file" + " from {self._yaml_base_key}")
+                    logger.warning(f"Base key {key} not found in YAML file from {self._yaml_base_key}")
                     return dict()
         return yaml_data
 
@@ -134,18 +245,64 @@ class YamlFileReader:
                     break
                 env_key = match.group(1)
                 env_default = match.group(2)
+                self._referenced_environment[env_key] = os.getenv(env_key)
                 env_value = os.getenv(env_key, env_default)
                 yaml_data = yaml_data.replace(match.group(0), env_value)
         else:
             raise ValueError(f"Type not supported: {type(yaml_data)}")
         return yaml_data
 
+    def _read_with_cache(self) -> dict[str, Any]:
+        """Reads the section from the documents cache, parsing the file only when it changed.
+
+        Returns:
+            dict: The section with env injected (a copy owned by the caller).
+
+        Raises:
+            UnableToReadYamlFileError: If there is an error reading the file.
+        """
+        try:
+            file_stat: os.stat_result = os.stat(self._file_path)
+        except OSError as exception:
+            raise UnableToReadYamlFileError(file_path=self._file_path, message=str(exception)) from exception
+
+        section: dict[str, Any] | None = yaml_documents_cache.get_section(
+            file_path=self._file_path, yaml_base_key=self._yaml_base_key
+        )
+        document: dict[str, Any] | None = yaml_documents_cache.get_document(
+            file_path=self._file_path, file_stat=file_stat
+        )
+        if section is not None and document is not None:
+            return deepcopy(section)
+
+        if document is None:
+            try:
+                document = self._read_yaml_file(file_path=self._file_path) or dict()
+            except (FileNotFoundError, ValueError) as exception:
+                raise UnableToReadYamlFileError(file_path=self._file_path, message=str(exception)) from exception
+            yaml_documents_cache.set_document(file_path=self._file_path, file_stat=file_stat, document=document)
+
+        # The injection works in place, so it is done on a copy of the cached document
+        yaml_data: dict[str, Any] | None = self._filter_data_with_base_key(deepcopy(document))
+        self._referenced_environment = {}
+        section = cast(dict[str, Any], self._inject_environment_variables(yaml_data)) if yaml_data else dict()
+        yaml_documents_cache.set_section(
+            file_path=self._file_path,
+            yaml_base_key=self._yaml_base_key,
+            environment=dict(self._referenced_environment),
+            section=section,
+        )
+        return deepcopy(section)
+
     def read(self) -> dict[str, Any]:
         """Reads the YAML file and converts it to a Pydantic model with env injected.
 
         Raises:
             UnableToReadYamlFileError: If there is an error reading the file.
         """
+        if self._use_cache and self._use_environment_injection:
+            return self._read_with_cache()
+
         # Read the YAML file and filter the data with the base key
         try:
             yaml_data: dict[str, Any] | None = self._filter_data_with_base_key(
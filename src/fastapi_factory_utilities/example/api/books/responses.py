@@ -24,3 +24,13 @@ class BookListReponse(BaseModel):
 
     books: list[BookResponseModel]
     size: int
+    next_cursor: str | None = None
+
+
+class BookStatsResponse(BaseModel):
+    """Book statistics response."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    total: int
+    per_book_type: dict[BookType, int]
@@ -1,15 +1,18 @@
 """Provides the Books API."""
 
+from http import HTTPStatus
 from typing import cast
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 
-from fastapi_factory_utilities.example.entities.books import BookEntity
+from fastapi_factory_utilities.core.plugins.odm_plugin.exceptions import InvalidPageCursorError
+from fastapi_factory_utilities.core.plugins.odm_plugin.pagination import Page
+from fastapi_factory_utilities.example.entities.books import BookEntity, BookType
 from fastapi_factory_utilities.example.models.books.repository import BookRepository
 from fastapi_factory_utilities.example.services.books import BookService
 
-from .responses import BookListReponse, BookResponseModel
+from .responses import BookListReponse, BookResponseModel, BookStatsResponse
 
 api_v1_books_router: APIRouter = APIRouter(prefix="/books")
 api_v2_books_router: APIRouter = APIRouter(prefix="/books")
@@ -17,34 +20,62 @@ api_v2_books_router: APIRouter = APIRouter(prefix="/books")
 
 def get_book_service(request: Request) -> BookService:
     """Provide Book Service."""
-    return BookService(book_repository=BookRepository(request.app.state.odm_client))
+    return BookService(book_repository=BookRepository(request.app.state.odm_database))
 
 
 @api_v1_books_router.get(path="", response_model=BookListReponse)
-def get_books(
+async def get_books(
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = Query(default=None),
     books_service: BookService = Depends(get_book_service),
 ) -> BookListReponse:
-    """Get all books.
+    """Get a page of books, newest first.
 
     Args:
+        limit (int): Maximum number of books in the page.
+        cursor (str | None): Cursor of the page, the `next_cursor` of the previous one.
         books_service (BookService): Book service.
 
     Returns:
         BookListReponse: List of books
+
+    Raises:
+        HTTPException: If the cursor is not valid.
     """
-    books: list[BookEntity] = books_service.get_all_books()
+    try:
+        page: Page[BookEntity] = await books_service.get_books_page(limit=limit, cursor=cursor)
+    except InvalidPageCursorError as error:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(error)) from error
 
     return BookListReponse(
         books=cast(
             list[BookResponseModel],
-            map(lambda book: BookResponseModel(**book.model_dump()), books),
+            map(lambda book: BookResponseModel(**book.model_dump()), page.items),
         ),
-        size=len(books),
+        size=len(page.items),
+        next_cursor=page.next_cursor,
     )
 
 
+@api_v1_books_router.get(path="/stats", response_model=BookStatsResponse)
+async def get_books_stats(
+    books_service: BookService = Depends(get_book_service),
+) -> BookStatsResponse:
+    """Get the number of books, by type.
+
+    Args:
+        books_service (BookService): Book service.
+
+    Returns:
+        BookStatsResponse: Book statistics
+    """
+    per_book_type: dict[BookType, int] = await books_service.count_books_per_type()
+
+    return BookStatsResponse(total=sum(per_book_type.values()), per_book_type=per_book_type)
+
+
 @api_v1_books_router.get(path="/{book_id}", response_model=BookResponseModel)
-def get_book(
+async def get_book(
     book_id: UUID,
     books_service: BookService = Depends(get_book_service),
 ) -> BookResponseModel:
@@ -56,7 +87,13 @@ def get_book(
 
     Returns:
         BookResponseModel: Book
+
+    Raises:
+        HTTPException: If the book does not exist.
     """
-    book: BookEntity = books_service.get_book(book_id)
+    try:
+        book: BookEntity = await books_service.get_book(book_id)
+    except ValueError as error:
+        raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail=str(error)) from error
 
     return BookResponseModel(**book.model_dump())
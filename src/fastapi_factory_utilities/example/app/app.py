@@ -8,6 +8,7 @@ from fastapi_factory_utilities.core.app import BaseApplication
 from fastapi_factory_utilities.core.app.base.plugins_manager_abstract import (
     PluginsActivationList,
 )
+from fastapi_factory_utilities.core.plugins.odm_plugin.loaders import EntityLoadersMiddleware
 from fastapi_factory_utilities.example.models.books.document import BookDocument
 
 from .config import AppConfig
@@ -35,3 +36,5 @@ class App(BaseApplication):
         from ..api import api_router  # pylint: disable=import-outside-toplevel
 
         self.get_asgi_app().include_router(router=api_router)
+        # The reads by ID of the repositories of a request are batched, see `using_entity_loaders`
+        self.get_asgi_app().add_middleware(EntityLoadersMiddleware)
@@ -1,11 +1,32 @@
 """Repository for books."""
 
+from pydantic import BaseModel, Field
+
+from fastapi_factory_utilities.core.plugins.odm_plugin.aggregations import count_by
 from fastapi_factory_utilities.core.plugins.odm_plugin.repositories import (
     AbstractRepository,
 )
-from fastapi_factory_utilities.example.entities.books import BookEntity
+from fastapi_factory_utilities.example.entities.books import BookEntity, BookType
 from fastapi_factory_utilities.example.models.books.document import BookDocument
 
 
+class BookTypeCount(BaseModel):
+    """Number of books of a type."""
+
+    book_type: BookType = Field(alias="_id")
+    count: int
+
+
 class BookRepository(AbstractRepository[BookDocument, BookEntity]):
     """Repository for books."""
+
+    async def count_per_book_type(self) -> dict[BookType, int]:
+        """Count the books of each type, in one aggregation run by the server.
+
+        Returns:
+            dict[BookType, int]: The number of books, by type having books.
+        """
+        return {
+            book_type_count.book_type: book_type_count.count
+            async for book_type_count in self.aggregate([count_by("book_type")], projection=BookTypeCount)
+        }
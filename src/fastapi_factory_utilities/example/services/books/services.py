@@ -1,25 +1,23 @@
 """Provides services for books."""
 
-from typing import ClassVar
 from uuid import UUID
 
 from opentelemetry import metrics
 
+from fastapi_factory_utilities.core.plugins.odm_plugin.exceptions import UnableToCreateEntityDueToDuplicateKeyError
+from fastapi_factory_utilities.core.plugins.odm_plugin.pagination import Page
 from fastapi_factory_utilities.core.plugins.opentelemetry_plugin.helpers import (
     trace_span,
 )
 from fastapi_factory_utilities.example.entities.books import (
     BookEntity,
-    BookName,
     BookType,
 )
 from fastapi_factory_utilities.example.models.books.repository import BookRepository
 
 
 class BookService:
-    """Provides services for books."""
-
-    book_store: ClassVar[dict[UUID, BookEntity]] = {}
+    """Provides services for books, stored by the book repository."""
 
     # Metrics Definitions
     METER_COUNTER_BOOK_GET_NAME: str = "book_get"
@@ -53,42 +51,12 @@ class BookService:
         """Initialize the service.
 
         Args:
-            book_repository (injector.Inject[BookRepository]): The book repository.
-            meter (metrics.Meter, optional): The meter. Defaults to None use for testing purpose.
-
-        Raises:
-            ValueError: If the book already exists.
-
+            book_repository (BookRepository): The book repository, storing the books.
         """
         self.book_repository: BookRepository = book_repository
 
-        # Build the book store if it is empty
-        if len(self.book_store) == 0:
-            self.build_book_store()
-
-    @classmethod
-    def build_default_book_store(cls) -> list[BookEntity]:
-        """Build the default book store."""
-        return [
-            BookEntity(title=BookName("Book 1"), book_type=BookType.FANTASY),
-            BookEntity(title=BookName("Book 2"), book_type=BookType.MYSTERY),
-            BookEntity(title=BookName("Book 3"), book_type=BookType.SCIENCE_FICTION),
-        ]
-
-    @classmethod
-    def build_book_store(cls, books: list[BookEntity] | None = None) -> None:
-        """Build the book store.
-
-        Args:
-            books (list[BookEntity], optional): The books to add. Defaults to None.
-        """
-        if books is None:
-            books = cls.build_default_book_store()
-
-        cls.book_store = {book.id: book for book in books}
-
     @trace_span(name="Add Book")
-    def add_book(self, book: BookEntity) -> None:
+    async def add_book(self, book: BookEntity) -> None:
         """Add a book.
 
         Args:
@@ -97,14 +65,14 @@ class BookService:
         Raises:
             ValueError: If the book already exists.
         """
-        if book.id in self.book_store:
-            raise ValueError(f"Book with id {book.id} already exists.")
-
-        self.book_store[book.id] = book
+        try:
+            await self.book_repository.insert(entity=book)
+        except UnableToCreateEntityDueToDuplicateKeyError as error:
+            raise ValueError(f"Book with id {book.id} or title {book.title} already exists.") from error
 
         self.METER_COUNTER_BOOK_ADD.add(amount=1)
 
-    def get_book(self, book_id: UUID) -> BookEntity:
+    async def get_book(self, book_id: UUID) -> BookEntity:
         """Get a book.
 
         Args:
@@ -116,24 +84,51 @@ class BookService:
         Raises:
             ValueError: If the book does not exist.
         """
-        if book_id not in self.book_store:
+        book: BookEntity | None = await self.book_repository.get_one_by_id(entity_id=book_id)
+        if book is None:
             raise ValueError(f"Book with id {book_id} does not exist.")
 
         self.METER_COUNTER_BOOK_GET.add(amount=1, attributes={"book_count": 1})
 
-        return self.book_store[book_id]
+        return book
 
-    def get_all_books(self) -> list[BookEntity]:
+    async def get_all_books(self) -> list[BookEntity]:
         """Get all books.
 
         Returns:
             list[BookEntity]: All books
         """
-        self.METER_COUNTER_BOOK_GET.add(amount=1, attributes={"book_count": len(self.book_store)})
-        return list(self.book_store.values())
+        books: list[BookEntity] = [book async for book in self.book_repository.find()]
+        self.METER_COUNTER_BOOK_GET.add(amount=1, attributes={"book_count": len(books)})
+        return books
+
+    async def get_books_page(self, limit: int, cursor: str | None = None) -> Page[BookEntity]:
+        """Get a page of books, newest first.
+
+        Args:
+            limit (int): The maximum number of books in the page.
+            cursor (str | None, optional): The cursor of the page, from the previous one. Defaults to None.
+
+        Returns:
+            Page[BookEntity]: The books and the cursor of the next page.
+
+        Raises:
+            InvalidPageCursorError: If the cursor is not valid.
+        """
+        page: Page[BookEntity] = await self.book_repository.find_page(limit=limit, cursor=cursor)
+        self.METER_COUNTER_BOOK_GET.add(amount=1, attributes={"book_count": len(page.items)})
+        return page
+
+    async def count_books_per_type(self) -> dict[BookType, int]:
+        """Count the books of each type.
+
+        Returns:
+            dict[BookType, int]: The number of books, by type having books.
+        """
+        return await self.book_repository.count_per_book_type()
 
     @trace_span(name="Remove Book")
-    def remove_book(self, book_id: UUID) -> None:
+    async def remove_book(self, book_id: UUID) -> None:
         """Remove a book.
 
         Args:
@@ -142,15 +137,15 @@ class BookService:
         Raises:
             ValueError: If the book does not exist.
         """
-        if book_id not in self.book_store:
-            raise ValueError(f"Book with id {book_id} does not exist.")
-
-        del self.book_store[book_id]
+        try:
+            await self.book_repository.delete_one_by_id(entity_id=book_id, raise_if_not_found=True)
+        except ValueError as error:
+            raise ValueError(f"Book with id {book_id} does not exist.") from error
 
         self.METER_COUNTER_BOOK_REMOVE.add(amount=1)
 
     @trace_span(name="Update Book")
-    def update_book(self, book: BookEntity) -> None:
+    async def update_book(self, book: BookEntity) -> None:
         """Update a book.
 
         Args:
@@ -159,9 +154,13 @@ class BookService:
         Raises:
             ValueError: If the book does not exist.
         """
-        if book.id not in self.book_store:
-            raise ValueError(f"Book with id {book.id} does not exist.")
-
-        self.book_store[book.id] = book
+        try:
+            await self.book_repository.update_one_by_id(
+                entity_id=book.id,
+                update={"$set": book.model_dump(mode="json", exclude={"id"})},
+                raise_if_not_found=True,
+            )
+        except ValueError as error:
+            raise ValueError(f"Book with id {book.id} does not exist.") from error
 
         self.METER_COUNTER_BOOK_UPDATE.add(amount=1)
@@ -0,0 +1,36 @@
+"""Provide tests for the synchronization of the indexes."""
+
+from typing import Annotated, Any
+
+import pytest
+from beanie import Indexed, init_beanie  # pyright: ignore[reportUnknownVariableType]
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from fastapi_factory_utilities.core.plugins.odm_plugin.documents import BaseDocument
+from fastapi_factory_utilities.core.plugins.odm_plugin.indexes import IndexSyncMode, sync_indexes
+
+
+class IndexedDocumentForTest(BaseDocument):
+    """Document for test."""
+
+    my_field: Annotated[str, Indexed(unique=True)]
+
+
+class TestSyncIndexes:
+    """Test the synchronization of the indexes."""
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_sync_indexes(self, async_motor_database: AsyncIOMotorDatabase[Any]) -> None:
+        """Test the missing indexes are reported, then built, then verified."""
+        await init_beanie(database=async_motor_database, document_models=[IndexedDocumentForTest], skip_indexes=True)
+
+        report = await sync_indexes(IndexedDocumentForTest, IndexSyncMode.VERIFY_ONLY)
+        assert "my_field_1" in report.missing
+        assert report.created == []
+
+        report = await sync_indexes(IndexedDocumentForTest, IndexSyncMode.BLOCKING)
+        assert set(report.created) == set(report.missing)
+
+        report = await sync_indexes(IndexedDocumentForTest, IndexSyncMode.VERIFY_ONLY)
+        assert report.missing == []
+        assert report.extra == []
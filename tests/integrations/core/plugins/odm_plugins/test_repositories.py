@@ -1,17 +1,37 @@
 """Provide tests for AbstractRepository class."""
 
-from typing import Any
+import json
+from collections.abc import Mapping
+from typing import Annotated, Any
 from uuid import UUID, uuid4
 
 import pytest
-from beanie import init_beanie  # pyright: ignore[reportUnknownVariableType]
+from beanie import Indexed, init_beanie  # pyright: ignore[reportUnknownVariableType]
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from pydantic import BaseModel, Field
+from pymongo import ASCENDING, DESCENDING
 
+from fastapi_factory_utilities.core.plugins.odm_plugin.aggregations import count_by, match, sort
+from fastapi_factory_utilities.core.plugins.odm_plugin.cache import EntityCache
 from fastapi_factory_utilities.core.plugins.odm_plugin.documents import BaseDocument
+from fastapi_factory_utilities.core.plugins.odm_plugin.exceptions import (
+    RevisionConflictError,
+    UnableToCreateEntitiesDueToDuplicateKeyError,
+    UnableToCreateEntityDueToDuplicateKeyError,
+)
+from fastapi_factory_utilities.core.plugins.odm_plugin.loaders import EntityLoader
+from fastapi_factory_utilities.core.plugins.odm_plugin.pagination import KEYSET_SORT, Page
+from fastapi_factory_utilities.core.plugins.odm_plugin.read_options import (
+    ReadConcernLevel,
+    ReadOptions,
+    ReadPreferenceMode,
+    using_read_options,
+)
 from fastapi_factory_utilities.core.plugins.odm_plugin.repositories import (
     AbstractRepository,
 )
+from fastapi_factory_utilities.core.plugins.odm_plugin.responses import BSONJSONResponse
+from fastapi_factory_utilities.core.plugins.odm_plugin.write_behind import WriteBehindBuffer
 
 
 class DocumentForTest(BaseDocument):
@@ -20,6 +40,12 @@ class DocumentForTest(BaseDocument):
     my_field: str = Field(description="My field.")
 
 
+class UniqueDocumentForTest(BaseDocument):
+    """Test document class with a unique field."""
+
+    my_field: Annotated[str, Indexed(unique=True)] = Field(description="My unique field.")
+
+
 class EntityForTest(BaseModel):
     """Test entity class."""
 
@@ -27,12 +53,45 @@ class EntityForTest(BaseModel):
     my_field: str
 
 
+class RevisionedEntityForTest(BaseModel):
+    """Test entity class carrying the revision of its document."""
+
+    id: UUID
+    my_field: str
+    revision_id: UUID | None = None
+
+
+class ProjectionForTest(BaseModel):
+    """Test projection class."""
+
+    my_field: str
+
+
+class FieldCountForTest(BaseModel):
+    """Test projection class of the number of documents by value."""
+
+    my_field: str = Field(alias="_id")
+    count: int
+
+
 class RepositoryForTest(AbstractRepository[DocumentForTest, EntityForTest]):
     """Test repository class."""
 
     pass
 
 
+class RevisionedRepositoryForTest(AbstractRepository[DocumentForTest, RevisionedEntityForTest]):
+    """Test repository class with entities carrying their revision."""
+
+    pass
+
+
+class UniqueRepositoryForTest(AbstractRepository[UniqueDocumentForTest, EntityForTest]):
+    """Test repository class with a unique field."""
+
+    pass
+
+
 class TestAbstractRepository:
     """Test AbstractRepository class."""
 
@@ -70,3 +129,322 @@ class TestAbstractRepository:
         entity: EntityForTest = EntityForTest(id=entity_id, my_field="my_field")
         entity_created: EntityForTest = await repository.insert(entity=entity)
         await repository.delete_one_by_id(entity_id=entity_created.id)
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_insert_many(self, async_motor_database: AsyncIOMotorDatabase[Any]) -> None:
+        """Test insert_many method over several batches."""
+        await init_beanie(database=async_motor_database, document_models=[DocumentForTest])
+        repository: RepositoryForTest = RepositoryForTest(database=async_motor_database)
+        entities: list[EntityForTest] = [EntityForTest(id=uuid4(), my_field=f"my_field_{i}") for i in range(25)]
+
+        entities_created: list[EntityForTest] = await repository.insert_many(entities=entities, batch_size=10)
+
+        assert entities_created == entities
+        for entity in entities:
+            assert await repository.get_one_by_id(entity_id=entity.id) == entity
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_insert_many_with_duplicates_unordered(self, async_motor_database: AsyncIOMotorDatabase[Any]) -> None:
+        """Test insert_many method reports the duplicates and inserts the other entities."""
+        await init_beanie(database=async_motor_database, document_models=[UniqueDocumentForTest])
+        repository: UniqueRepositoryForTest = UniqueRepositoryForTest(database=async_motor_database)
+        existing: EntityForTest = await repository.insert(entity=EntityForTest(id=uuid4(), my_field="existing"))
+        entities: list[EntityForTest] = [
+            EntityForTest(id=uuid4(), my_field="first"),
+            EntityForTest(id=uuid4(), my_field=existing.my_field),
+            EntityForTest(id=uuid4(), my_field="last"),
+        ]
+
+        with pytest.raises(UnableToCreateEntitiesDueToDuplicateKeyError) as exception_info:
+            await repository.insert_many(entities=entities, ordered=False)
+
+        assert exception_info.value.duplicate_indexes == [1]
+        assert exception_info.value.entities_created == [entities[0], entities[2]]
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_upsert_many(self, async_motor_database: AsyncIOMotorDatabase[Any]) -> None:
+        """Test upsert_many method replaces the existing entities and inserts the new ones."""
+        await init_beanie(database=async_motor_database, document_models=[DocumentForTest])
+        repository: RepositoryForTest = RepositoryForTest(database=async_motor_database)
+        existing: EntityForTest = await repository.insert(entity=EntityForTest(id=uuid4(), my_field="before"))
+        entities: list[EntityForTest] = [
+            EntityForTest(id=existing.id, my_field="after"),
+            EntityForTest(id=uuid4(), my_field="new"),
+        ]
+
+        entities_upserted: list[EntityForTest] = await repository.upsert_many(entities=entities)
+
+        assert entities_upserted == entities
+        assert await repository.get_one_by_id(entity_id=existing.id) == entities[0]
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_find(self, async_motor_database: AsyncIOMotorDatabase[Any]) -> None:
+        """Test find method streams the filtered and sorted entities over several batches."""
+        await init_beanie(database=async_motor_database, document_models=[DocumentForTest])
+        repository: RepositoryForTest = RepositoryForTest(database=async_motor_database)
+        entities: list[EntityForTest] = await repository.insert_many(
+            entities=[EntityForTest(id=uuid4(), my_field=f"my_field_{i:02d}") for i in range(25)]
+        )
+
+        entities_found: list[EntityForTest] = [
+            entity
+            async for entity in repository.find(
+                filters={"my_field": {"$gte": "my_field_10"}}, sort=[("my_field", DESCENDING)], batch_size=4
+            )
+        ]
+
+        assert entities_found == list(reversed(entities[10:]))
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_find_with_projection_and_limit(self, async_motor_database: AsyncIOMotorDatabase[Any]) -> None:
+        """Test find method yields the projections up to the limit."""
+        await init_beanie(database=async_motor_database, document_models=[DocumentForTest])
+        repository: RepositoryForTest = RepositoryForTest(database=async_motor_database)
+        await repository.insert_many(entities=[EntityForTest(id=uuid4(), my_field=f"my_field_{i}") for i in range(5)])
+
+        projections: list[ProjectionForTest] = [
+            projection
+            async for projection in repository.find(
+                sort=[("my_field", ASCENDING)], limit=2, projection=ProjectionForTest
+            )
+        ]
+
+        assert projections == [ProjectionForTest(my_field="my_field_0"), ProjectionForTest(my_field="my_field_1")]
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_find_raw(self, async_motor_database: AsyncIOMotorDatabase[Any]) -> None:
+        """Test find_raw method yields the raw documents with the fields requested only."""
+        await init_beanie(database=async_motor_database, document_models=[DocumentForTest])
+        repository: RepositoryForTest = RepositoryForTest(database=async_motor_database)
+        entity: EntityForTest = await repository.insert(EntityForTest(id=uuid4(), my_field="raw"))
+
+        raw_documents: list[Mapping[str, Any]] = [
+            raw_document
+            async for raw_document in repository.find_raw(filters={"my_field": "raw"}, fields=["id", "my_field"])
+        ]
+
+        assert len(raw_documents) == 1
+        assert set(raw_documents[0]) == {"_id", "my_field"}
+        assert json.loads(BSONJSONResponse(content=raw_documents).body) == [{"_id": str(entity.id), "my_field": "raw"}]
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_find_page(self, async_motor_database: AsyncIOMotorDatabase[Any]) -> None:
+        """Test find_page method walks through all the entities, newest first, page by page."""
+        await init_beanie(database=async_motor_database, document_models=[DocumentForTest])
+        repository: RepositoryForTest = RepositoryForTest(database=async_motor_database)
+        filters: dict[str, Any] = {"my_field": "my_paginated_field"}
+        entities: list[EntityForTest] = [EntityForTest(id=uuid4(), my_field="my_paginated_field") for _ in range(7)]
+        for entity in entities:
+            await repository.insert(entity=entity)
+        entities_in_order: list[EntityForTest] = [
+            entity async for entity in repository.find(filters=filters, sort=KEYSET_SORT)
+        ]
+
+        pages: list[Page[EntityForTest]] = [await repository.find_page(filters=filters, limit=3)]
+        while pages[-1].next_cursor is not None:
+            pages.append(await repository.find_page(filters=filters, limit=3, cursor=pages[-1].next_cursor))
+
+        assert [len(page.items) for page in pages] == [3, 3, 1]
+        assert [entity for page in pages for entity in page.items] == entities_in_order
+        assert {entity.id for entity in entities_in_order} == {entity.id for entity in entities}
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_delete_one_by_id_not_found(self, async_motor_database: AsyncIOMotorDatabase[Any]) -> None:
+        """Test delete_one_by_id method raises only when asked to if the document does not exist."""
+        await init_beanie(database=async_motor_database, document_models=[DocumentForTest])
+        repository: RepositoryForTest = RepositoryForTest(database=async_motor_database)
+
+        await repository.delete_one_by_id(entity_id=uuid4())
+        with pytest.raises(ValueError):
+            await repository.delete_one_by_id(entity_id=uuid4(), raise_if_not_found=True)
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_update_one_by_id(self, async_motor_database: AsyncIOMotorDatabase[Any]) -> None:
+        """Test update_one_by_id method updates the document and its tracking fields."""
+        await init_beanie(database=async_motor_database, document_models=[DocumentForTest])
+        repository: RepositoryForTest = RepositoryForTest(database=async_motor_database)
+        entity: EntityForTest = await repository.insert(entity=EntityForTest(id=uuid4(), my_field="my_field"))
+        document_before: DocumentForTest | None = await DocumentForTest.get(entity.id)
+
+        await repository.update_one_by_id(entity_id=entity.id, update={"$set": {"my_field": "my_updated_field"}})
+
+        document_after: DocumentForTest | None = await DocumentForTest.get(entity.id)
+        assert document_before is not None and document_after is not None
+        assert document_after.my_field == "my_updated_field"
+        assert document_after.updated_at >= document_before.updated_at
+        assert document_after.revision_id != document_before.revision_id
+        with pytest.raises(ValueError):
+            await repository.update_one_by_id(
+                entity_id=uuid4(), update={"$set": {"my_field": "my_updated_field"}}, raise_if_not_found=True
+            )
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_update_with_expected_revision(self, async_motor_database: AsyncIOMotorDatabase[Any]) -> None:
+        """Test update method writes the entity at the revision expected only, and bumps the revision."""
+        await init_beanie(database=async_motor_database, document_models=[DocumentForTest])
+        repository: RevisionedRepositoryForTest = RevisionedRepositoryForTest(database=async_motor_database)
+        entity: RevisionedEntityForTest = await repository.insert(
+            RevisionedEntityForTest(id=uuid4(), my_field="my_field")
+        )
+        document_inserted: DocumentForTest | None = await DocumentForTest.get(entity.id)
+        assert document_inserted is not None
+        assert entity.revision_id is not None
+
+        entity_updated: RevisionedEntityForTest = await repository.update(
+            entity.model_copy(update={"my_field": "my_field_updated"}), expected_revision=entity.revision_id
+        )
+
+        assert entity_updated.my_field == "my_field_updated"
+        assert entity_updated.revision_id not in (None, entity.revision_id)
+        document_updated: DocumentForTest | None = await DocumentForTest.get(entity.id)
+        assert document_updated is not None
+        assert document_updated.my_field == "my_field_updated"
+        assert document_updated.revision_id == entity_updated.revision_id
+        assert document_updated.created_at == document_inserted.created_at
+        assert document_updated.updated_at > document_inserted.updated_at
+        # A writer still holding the first revision is refused
+        with pytest.raises(RevisionConflictError):
+            await repository.update(
+                entity.model_copy(update={"my_field": "my_field_stale"}), expected_revision=entity.revision_id
+            )
+        with pytest.raises(RevisionConflictError):
+            await repository.update(
+                RevisionedEntityForTest(id=uuid4(), my_field="my_field"), expected_revision=entity.revision_id
+            )
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_find_one_and_update(self, async_motor_database: AsyncIOMotorDatabase[Any]) -> None:
+        """Test find_one_and_update method returns the entity after the update."""
+        await init_beanie(database=async_motor_database, document_models=[DocumentForTest])
+        repository: RepositoryForTest = RepositoryForTest(database=async_motor_database)
+        entity: EntityForTest = await repository.insert(entity=EntityForTest(id=uuid4(), my_field="my_field"))
+
+        entity_updated: EntityForTest | None = await repository.find_one_and_update(
+            filters={"_id": entity.id}, update={"$set": {"my_field": "my_updated_field"}}
+        )
+
+        assert entity_updated == EntityForTest(id=entity.id, my_field="my_updated_field")
+        assert await repository.find_one_and_update(filters={"_id": uuid4()}, update={"$set": {"my_field": ""}}) is None
+        with pytest.raises(ValueError):
+            await repository.find_one_and_update(filters={"_id": entity.id}, update={"my_field": "replacement"})
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_find_one_and_delete(self, async_motor_database: AsyncIOMotorDatabase[Any]) -> None:
+        """Test find_one_and_delete method returns the entity deleted."""
+        await init_beanie(database=async_motor_database, document_models=[DocumentForTest])
+        repository: RepositoryForTest = RepositoryForTest(database=async_motor_database)
+        entity: EntityForTest = await repository.insert(entity=EntityForTest(id=uuid4(), my_field="my_field"))
+
+        entity_deleted: EntityForTest | None = await repository.find_one_and_delete(filters={"_id": entity.id})
+
+        assert entity_deleted == entity
+        assert await repository.get_one_by_id(entity_id=entity.id) is None
+        with pytest.raises(ValueError):
+            await repository.find_one_and_delete(filters={"_id": entity.id}, raise_if_not_found=True)
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_get_one_by_id_with_entity_cache(self, async_motor_database: AsyncIOMotorDatabase[Any]) -> None:
+        """Test get_one_by_id method reads through the cache, invalidated by the writes of the repository."""
+        await init_beanie(database=async_motor_database, document_models=[DocumentForTest])
+        entity_cache: EntityCache[EntityForTest] = EntityCache(name="test")
+        repository: RepositoryForTest = RepositoryForTest(database=async_motor_database, entity_cache=entity_cache)
+        entity: EntityForTest = await repository.insert(entity=EntityForTest(id=uuid4(), my_field="my_field"))
+
+        assert await repository.get_one_by_id(entity_id=entity.id) == entity
+        await DocumentForTest.find_one({"_id": entity.id}).update({"$set": {"my_field": "updated_elsewhere"}})
+        assert await repository.get_one_by_id(entity_id=entity.id) == entity
+
+        await repository.update_one_by_id(entity_id=entity.id, update={"$set": {"my_field": "my_updated_field"}})
+        assert await repository.get_one_by_id(entity_id=entity.id) == EntityForTest(
+            id=entity.id, my_field="my_updated_field"
+        )
+
+        await repository.delete_one_by_id(entity_id=entity.id)
+        assert await repository.get_one_by_id(entity_id=entity.id) is None
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_get_many_by_ids_with_entity_loader(self, async_motor_database: AsyncIOMotorDatabase[Any]) -> None:
+        """Test get_many_by_ids method serves the batches of an entity loader."""
+        await init_beanie(database=async_motor_database, document_models=[DocumentForTest])
+        repository: RepositoryForTest = RepositoryForTest(database=async_motor_database)
+        entities: list[EntityForTest] = await repository.insert_many(
+            entities=[EntityForTest(id=uuid4(), my_field=f"my_field_{index}") for index in range(3)]
+        )
+        missing_id: UUID = uuid4()
+
+        entities_by_id: dict[UUID, EntityForTest] = await repository.get_many_by_ids(
+            entity_ids=[entities[0].id, entities[1].id, entities[0].id, missing_id]
+        )
+        assert entities_by_id == {entities[0].id: entities[0], entities[1].id: entities[1]}
+
+        entity_loader: EntityLoader[EntityForTest] = EntityLoader(batch_load=repository.get_many_by_ids)
+        assert await entity_loader.load_many([entity.id for entity in entities] + [missing_id]) == [
+            *entities,
+            None,
+        ]
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_reads_with_read_options(self, async_motor_database: AsyncIOMotorDatabase[Any]) -> None:
+        """Test the reads routed with read options."""
+        await init_beanie(database=async_motor_database, document_models=[DocumentForTest])
+        repository: RepositoryForTest = RepositoryForTest(
+            database=async_motor_database,
+            read_options=ReadOptions(read_preference=ReadPreferenceMode.SECONDARY_PREFERRED),
+        )
+        entity: EntityForTest = await repository.insert(entity=EntityForTest(id=uuid4(), my_field="my_field"))
+        local_reads: ReadOptions = ReadOptions(
+            read_preference=ReadPreferenceMode.NEAREST, read_concern=ReadConcernLevel.LOCAL
+        )
+
+        assert await repository.get_one_by_id(entity_id=entity.id) == entity
+        assert await repository.get_many_by_ids(entity_ids=[entity.id], read_options=local_reads) == {entity.id: entity}
+        with using_read_options(local_reads):
+            assert [found async for found in repository.find(filters={"_id": entity.id})] == [entity]
+            assert entity in (await repository.find_page(limit=100)).items
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_write_behind(self, async_motor_database: AsyncIOMotorDatabase[Any]) -> None:
+        """Test the inserts of the write-behind buffer are written in one batch, with an outcome per entity."""
+        await init_beanie(database=async_motor_database, document_models=[UniqueDocumentForTest])
+        repository: UniqueRepositoryForTest = UniqueRepositoryForTest(database=async_motor_database)
+        buffer: WriteBehindBuffer[EntityForTest] = repository.write_behind(max_batch_size=3, max_delay_s=60)
+        entities: list[EntityForTest] = [
+            EntityForTest(id=uuid4(), my_field="first"),
+            EntityForTest(id=uuid4(), my_field="first"),
+            EntityForTest(id=uuid4(), my_field="second"),
+        ]
+
+        written = [await buffer.insert(entity) for entity in entities]
+
+        assert await written[0] == entities[0]
+        with pytest.raises(UnableToCreateEntityDueToDuplicateKeyError):
+            await written[1]
+        assert await written[2] == entities[2]
+        assert await repository.get_many_by_ids(entity_ids=[entity.id for entity in entities]) == {
+            entities[0].id: entities[0],
+            entities[2].id: entities[2],
+        }
+        await buffer.close()
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_aggregate_and_count(self, async_motor_database: AsyncIOMotorDatabase[Any]) -> None:
+        """Test the aggregations yield the projections, and the counts and distinct values are server-side."""
+        await init_beanie(database=async_motor_database, document_models=[DocumentForTest])
+        repository: RepositoryForTest = RepositoryForTest(database=async_motor_database)
+        entities: list[EntityForTest] = await repository.insert_many(
+            entities=[EntityForTest(id=uuid4(), my_field=value) for value in ("a", "b", "a")]
+        )
+
+        field_counts: list[FieldCountForTest] = [
+            field_count
+            async for field_count in repository.aggregate(
+                [count_by("my_field"), sort(("id", ASCENDING))], projection=FieldCountForTest
+            )
+        ]
+
+        assert [(field_count.my_field, field_count.count) for field_count in field_counts] == [("a", 2), ("b", 1)]
+        assert [entity async for entity in repository.aggregate([match({"my_field": "b"})])] == [entities[1]]
+        assert await repository.count({"my_field": "a"}) == 2  # noqa: PLR2004
+        assert await repository.exists({"my_field": "b"})
+        assert not await repository.exists({"my_field": "c"})
+        assert sorted(await repository.distinct("my_field")) == ["a", "b"]
@@ -1,6 +1,7 @@
 """Tests for the routes of the books API."""
 
 import os
+import time
 from http import HTTPStatus
 from typing import Any
 from unittest.mock import patch
@@ -15,6 +16,20 @@ from fastapi_factory_utilities.example.app.app import App
 
 _logger = get_logger(__package__)
 
+READINESS_TIMEOUT_S: float = 10.0
+
+
+def wait_until_ready(client: TestClient) -> None:
+    """Wait for the application to be ready, the ODM plugin connecting in the background.
+
+    Args:
+        client (TestClient): The client of the application, started.
+    """
+    deadline: float = time.monotonic() + READINESS_TIMEOUT_S
+    while client.get("/api/v1/sys/readiness").status_code != HTTPStatus.OK:
+        assert time.monotonic() < deadline, "The application is not ready."
+        time.sleep(0.05)
+
 
 class TestBooksRoutes:
     """Tests for the routes of the books API."""
@@ -33,5 +48,6 @@ class TestBooksRoutes:
             _logger.debug(f"MONGO_URI={os.getenv('MONGO_URI')}")
 
             with TestClient(App.build()) as client:
+                wait_until_ready(client)
                 response: Response = client.get("/api/v1/books")
                 assert response.status_code == HTTPStatus.OK
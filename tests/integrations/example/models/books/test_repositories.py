@@ -90,3 +90,22 @@ class TestBookRepository:
         )
 
         assert book_entity_retrieved is None
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_count_per_book_type(self, async_motor_database: AsyncIOMotorDatabase[Any]) -> None:
+        """Test count_per_book_type method.
+
+        Args:
+            async_motor_database (AsyncIOMotorDatabase): The async motor database.
+        """
+        await beanie.init_beanie(database=async_motor_database, document_models=[BookDocument])  # pyright: ignore
+        book_repository = BookRepository(database=async_motor_database)
+        await book_repository.insert_many(
+            entities=[
+                BookEntity(id=uuid4(), title=BookName("The Hobbit"), book_type=BookType.FANTASY),
+                BookEntity(id=uuid4(), title=BookName("The Silmarillion"), book_type=BookType.FANTASY),
+                BookEntity(id=uuid4(), title=BookName("Dune"), book_type=BookType.SCIENCE_FICTION),
+            ]
+        )
+
+        assert await book_repository.count_per_book_type() == {BookType.FANTASY: 2, BookType.SCIENCE_FICTION: 1}
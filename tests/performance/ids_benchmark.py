@@ -0,0 +1,61 @@
+"""Benchmarks the insert throughput and the _id index size of the ID strategies of the documents.
+
+Inserts the same documents with random (uuid4) then time-ordered (uuid7) IDs, stored as binary UUIDs,
+in a scratch database of a local mongod, dropped afterwards:
+
+    MONGO_URI=mongodb://localhost:27017 python tests/performance/ids_benchmark.py
+
+The gap grows with the size of the collection: the random IDs touch pages all over the _id index once it
+no longer fits in the cache, the time-ordered ones only its last pages.
+"""
+
+import os
+import time
+from collections.abc import Callable
+from typing import Any
+from uuid import UUID
+
+from pymongo import MongoClient
+from pymongo.database import Database
+
+from fastapi_factory_utilities.core.plugins.odm_plugin.ids import ID_FACTORIES, IdStrategy
+
+DOCUMENTS: int = 500_000
+BATCH_SIZE: int = 1000
+DATABASE_NAME: str = "ids_benchmark"
+
+
+def _insert(database: Database[Any], strategy: IdStrategy) -> None:
+    id_factory: Callable[[], UUID] = ID_FACTORIES[strategy]
+    collection = database[strategy.value]
+    collection.drop()
+
+    start: float = time.perf_counter()
+    for _ in range(DOCUMENTS // BATCH_SIZE):
+        collection.insert_many(
+            [{"_id": id_factory(), "title": "Book", "pages": 100} for _ in range(BATCH_SIZE)], ordered=False
+        )
+    duration: float = time.perf_counter() - start
+
+    stats: dict[str, Any] = database.command("collStats", strategy.value)
+    print(
+        f"{strategy.value:<6} {DOCUMENTS / duration:9.0f} inserts/s"
+        f" | _id index {stats['indexSizes']['_id_'] / 2**20:7.1f} MiB"
+    )
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    client: MongoClient[Any] = MongoClient(
+        os.environ.get("MONGO_URI", "mongodb://localhost:27017"), uuidRepresentation="standard"
+    )
+    try:
+        for strategy in IdStrategy:
+            _insert(client[DATABASE_NAME], strategy)
+    finally:
+        client.drop_database(DATABASE_NAME)
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,9 +4,13 @@ from locust import HttpUser, constant_throughput, task  # pyright: ignore
 
 
 class SystemUser(HttpUser):
-    """Provides locust performance tests for the API."""
+    """Provides locust performance tests for the API, probing as the kubelet does on every instance.
 
-    wait_time = constant_throughput(1)  # pyright: ignore
+    Compare the latencies, and the CPU of the server, with the probes served by the fast path
+    (APPLICATION_PROBES_FAST_PATH=true, the default) and by the FastAPI stack (APPLICATION_PROBES_FAST_PATH=false).
+    """
+
+    wait_time = constant_throughput(10)  # pyright: ignore
 
     @task(1)
     def health(self) -> None:
@@ -0,0 +1,50 @@
+"""Benchmarks the per-object cost of the document/entity mapping of the repositories.
+
+Compares the `DocumentEntityMapper` with the previous `Model(**other.model_dump())` path:
+
+    python tests/performance/mappers_benchmark.py
+"""
+
+import timeit
+from collections.abc import Callable
+from unittest.mock import patch
+
+from beanie.odm.settings.document import DocumentSettings
+
+from fastapi_factory_utilities.core.plugins.odm_plugin.mappers import DocumentEntityMapper, get_mapper
+from fastapi_factory_utilities.example.entities.books import BookEntity, BookName, BookType
+from fastapi_factory_utilities.example.models.books import BookDocument
+
+NUMBER: int = 20_000
+
+
+def _report(name: str, legacy: Callable[[], object], mapper: Callable[[], object]) -> None:
+    legacy_cost: float = min(timeit.repeat(legacy, number=NUMBER, repeat=5)) / NUMBER
+    mapper_cost: float = min(timeit.repeat(mapper, number=NUMBER, repeat=5)) / NUMBER
+    print(
+        f"{name:<20} legacy {legacy_cost * 1e6:7.2f} us/object"
+        f" | mapper {mapper_cost * 1e6:7.2f} us/object"
+        f" | x{legacy_cost / mapper_cost:.1f}"
+    )
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    mapper: DocumentEntityMapper[BookDocument, BookEntity] = get_mapper(BookDocument, BookEntity)
+    entity: BookEntity = BookEntity(title=BookName("Book"), book_type=BookType.FANTASY)
+    document: BookDocument = mapper.to_document(entity)
+
+    print(f"trusted construction: {mapper.trusted_construction}")
+    _report("entity -> document", lambda: BookDocument(**entity.model_dump()), lambda: mapper.to_document(entity))
+    _report("document -> entity", lambda: BookEntity(**document.model_dump()), lambda: mapper.to_entity(document))
+    _report(
+        "round trip",
+        lambda: BookEntity(**BookDocument(**entity.model_dump()).model_dump()),
+        lambda: mapper.to_entity(mapper.to_document(entity)),
+    )
+
+
+if __name__ == "__main__":
+    # The benchmark does not hit the database, the document only needs its settings
+    with patch.object(BookDocument, "_document_settings", DocumentSettings()):
+        main()
@@ -0,0 +1,80 @@
+"""Provides unit tests for the fast path of the probes."""
+
+from collections.abc import Awaitable, Callable
+from http import HTTPStatus
+
+from fastapi import FastAPI, Request, Response
+from fastapi.testclient import TestClient
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from fastapi_factory_utilities.core.api import api
+from fastapi_factory_utilities.core.api.v1.sys.probes import HEALTH_PATH, READINESS_PATH, ProbesFastPath
+from fastapi_factory_utilities.core.api.v1.sys.readiness import add_readiness_check
+
+
+def build_asgi_app() -> FastAPI:
+    """Build an application with the API, its middlewares counting the calls going through them.
+
+    Returns:
+        FastAPI: The application, the calls counted in its `calls` state.
+    """
+    asgi_app: FastAPI = FastAPI()
+    asgi_app.include_router(api)
+    asgi_app.state.calls = 0
+
+    @asgi_app.middleware("http")
+    async def count_calls(request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+        asgi_app.state.calls += 1
+        return await call_next(request)
+
+    return asgi_app
+
+
+class TestProbesFastPath:
+    """Various tests for the fast path of the probes."""
+
+    def test_same_responses_as_the_routes(self) -> None:
+        """The probes are answered as the routes do, without going through the application."""
+        asgi_app: FastAPI = build_asgi_app()
+        indexes_built: list[bool] = [False]
+        add_readiness_check(asgi_app=asgi_app, name="indexes", check=lambda: indexes_built[0])
+        fast_client: TestClient = TestClient(app=ProbesFastPath(app=asgi_app))
+        client: TestClient = TestClient(app=asgi_app)
+
+        for path in (HEALTH_PATH, READINESS_PATH):
+            fast_response = fast_client.get(path)
+            response = client.get(path)
+            assert (fast_response.status_code, fast_response.content) == (response.status_code, response.content)
+            assert fast_response.headers["content-type"] == response.headers["content-type"]
+        indexes_built[0] = True
+        assert fast_client.get(READINESS_PATH).status_code == HTTPStatus.OK.value
+
+        assert asgi_app.state.calls == 2  # noqa: PLR2004
+
+    def test_other_calls_forwarded(self) -> None:
+        """The other paths and methods go to the application."""
+        asgi_app: FastAPI = build_asgi_app()
+        client: TestClient = TestClient(app=ProbesFastPath(app=asgi_app))
+
+        assert client.get("/api/v1/sys/unknown").status_code == HTTPStatus.NOT_FOUND.value
+        assert client.post(HEALTH_PATH).status_code == HTTPStatus.METHOD_NOT_ALLOWED.value
+        assert asgi_app.state.calls == 2  # noqa: PLR2004
+
+    def test_traced(self) -> None:
+        """The probes are traced only if asked for, with the tracer provider of the application."""
+        exporter = InMemorySpanExporter()
+        tracer_provider = TracerProvider()
+        tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+        asgi_app: FastAPI = build_asgi_app()
+        asgi_app.state.tracer_provider = tracer_provider
+
+        TestClient(app=ProbesFastPath(app=asgi_app)).get(HEALTH_PATH)
+        assert exporter.get_finished_spans() == ()
+
+        TestClient(app=ProbesFastPath(app=asgi_app, traced=True)).get(HEALTH_PATH)
+        spans = exporter.get_finished_spans()
+        assert [span.name for span in spans] == [f"GET {HEALTH_PATH}"]
+        assert spans[0].attributes is not None
+        assert spans[0].attributes["http.response.status_code"] == HTTPStatus.OK.value
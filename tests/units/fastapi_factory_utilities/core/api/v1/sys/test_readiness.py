@@ -0,0 +1,38 @@
+"""Provides unit tests for the readiness endpoint."""
+
+from http import HTTPStatus
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from fastapi_factory_utilities.core.api.v1.sys.readiness import add_readiness_check, api_v1_sys_readiness
+
+
+class TestApiV1SysReadiness:
+    """Various tests for the readiness endpoint."""
+
+    def test_ready_without_checks(self) -> None:
+        """The application is ready without any check."""
+        asgi_app: FastAPI = FastAPI()
+        asgi_app.include_router(api_v1_sys_readiness)
+
+        response = TestClient(app=asgi_app).get("/readiness")
+
+        assert response.status_code == HTTPStatus.OK.value
+        assert response.json() == {"status": "ready"}
+
+    def test_not_ready_until_the_checks_pass(self) -> None:
+        """The application is not ready while a check fails."""
+        asgi_app: FastAPI = FastAPI()
+        asgi_app.include_router(api_v1_sys_readiness)
+        indexes_built: list[bool] = [False]
+        add_readiness_check(asgi_app=asgi_app, name="ready", check=lambda: True)
+        add_readiness_check(asgi_app=asgi_app, name="indexes", check=lambda: indexes_built[0])
+        client: TestClient = TestClient(app=asgi_app)
+
+        response = client.get("/readiness")
+        assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE.value
+        assert response.json() == {"status": "not_ready"}
+
+        indexes_built[0] = True
+        assert client.get("/readiness").status_code == HTTPStatus.OK.value
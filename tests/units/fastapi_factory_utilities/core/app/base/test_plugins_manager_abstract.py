@@ -1 +1,200 @@
 """Provides unit tests for the `PluginsManagerAbstract` class."""
+
+# pyright: reportPrivateUsage=false
+
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from fastapi_factory_utilities.core.app.base.exceptions import (
+    ApplicationPluginManagerException,
+)
+from fastapi_factory_utilities.core.app.base.plugins_manager_abstract import (
+    ApplicationPluginManagerAbstract,
+    PluginsActivationList,
+)
+from fastapi_factory_utilities.core.plugins import PluginsEnum
+
+
+class PluginManagerForTest(ApplicationPluginManagerAbstract):
+    """Concrete plugin manager for the tests."""
+
+    PACKAGE_NAME: str = "tests"
+
+
+def build_fake_plugin(
+    depends_on: list[PluginsEnum], events: list[str], name: str, delay: float = 0.0
+) -> SimpleNamespace:
+    """Build a fake plugin module recording its startup and shutdown.
+
+    Args:
+        depends_on (list[PluginsEnum]): The plugin dependencies.
+        events (list[str]): The list where the events are recorded.
+        name (str): The name of the plugin used in the events.
+        delay (float): The duration in seconds of the startup and shutdown.
+
+    Returns:
+        SimpleNamespace: The fake plugin module.
+    """
+
+    async def on_startup(application: Any) -> None:
+        del application
+        events.append(f"{name}:startup:begin")
+        await asyncio.sleep(delay)
+        events.append(f"{name}:startup:end")
+
+    async def on_shutdown(application: Any) -> None:
+        del application
+        events.append(f"{name}:shutdown:begin")
+        await asyncio.sleep(delay)
+        events.append(f"{name}:shutdown:end")
+
+    return SimpleNamespace(DEPENDS_ON=depends_on, on_startup=on_startup, on_shutdown=on_shutdown)
+
+
+def build_manager(
+    plugins: dict[PluginsEnum, SimpleNamespace],
+    timeout: float = PluginsActivationList.DEFAULT_PLUGIN_TIMEOUT_IN_SECONDS,
+) -> PluginManagerForTest:
+    """Build a plugin manager with the fake plugins.
+
+    Args:
+        plugins (dict[PluginsEnum, SimpleNamespace]): The fake plugins.
+        timeout (float): The startup and shutdown timeout.
+
+    Returns:
+        PluginManagerForTest: The plugin manager.
+    """
+    manager = PluginManagerForTest(
+        plugin_activation_list=PluginsActivationList(activate=[], startup_timeout=timeout, shutdown_timeout=timeout)
+    )
+    manager._plugins = plugins  # type: ignore[assignment]
+    manager._plugins = {plugin: plugins[plugin] for plugin in manager._resolve_plugins_order()}  # type: ignore
+    return manager
+
+
+class TestApplicationPluginManagerAbstract:
+    """Unit tests for the ApplicationPluginManagerAbstract class."""
+
+    def test_resolve_plugins_order(self) -> None:
+        """The dependencies are ordered before their dependents."""
+        events: list[str] = []
+        manager: PluginManagerForTest = build_manager(
+            {
+                PluginsEnum.ODM_PLUGIN: build_fake_plugin([PluginsEnum.OPENTELEMETRY_PLUGIN], events, "odm"),
+                PluginsEnum.OPENTELEMETRY_PLUGIN: build_fake_plugin([], events, "otel"),
+            }
+        )
+
+        assert manager._resolve_plugins_order() == [PluginsEnum.OPENTELEMETRY_PLUGIN, PluginsEnum.ODM_PLUGIN]
+
+    def test_resolve_plugins_order_with_missing_dependency(self) -> None:
+        """A dependency on a plugin not activated is rejected."""
+        with pytest.raises(ApplicationPluginManagerException):
+            build_manager({PluginsEnum.ODM_PLUGIN: build_fake_plugin([PluginsEnum.OPENTELEMETRY_PLUGIN], [], "odm")})
+
+    def test_resolve_plugins_order_with_cycle(self) -> None:
+        """A dependency cycle is rejected."""
+        with pytest.raises(ApplicationPluginManagerException):
+            build_manager(
+                {
+                    PluginsEnum.ODM_PLUGIN: build_fake_plugin([PluginsEnum.OPENTELEMETRY_PLUGIN], [], "odm"),
+                    PluginsEnum.OPENTELEMETRY_PLUGIN: build_fake_plugin([PluginsEnum.ODM_PLUGIN], [], "otel"),
+                }
+            )
+
+    async def test_independent_plugins_start_concurrently(self) -> None:
+        """Independent plugins start in the time of the slowest one."""
+        events: list[str] = []
+        delay: float = 0.2
+        manager: PluginManagerForTest = build_manager(
+            {
+                PluginsEnum.ODM_PLUGIN: build_fake_plugin([], events, "odm", delay=delay),
+                PluginsEnum.OPENTELEMETRY_PLUGIN: build_fake_plugin([], events, "otel", delay=delay),
+            }
+        )
+
+        start_timer: float = time.perf_counter()
+        await manager.plugins_on_startup()
+
+        assert time.perf_counter() - start_timer < 2 * delay
+        assert set(manager.get_plugins_startup_timings()) == {PluginsEnum.ODM_PLUGIN, PluginsEnum.OPENTELEMETRY_PLUGIN}
+
+    async def test_dependent_plugins_start_and_stop_in_order(self) -> None:
+        """A plugin starts after and stops before its dependencies."""
+        events: list[str] = []
+        manager: PluginManagerForTest = build_manager(
+            {
+                PluginsEnum.ODM_PLUGIN: build_fake_plugin([PluginsEnum.OPENTELEMETRY_PLUGIN], events, "odm"),
+                PluginsEnum.OPENTELEMETRY_PLUGIN: build_fake_plugin([], events, "otel", delay=0.05),
+            }
+        )
+
+        await manager.plugins_on_startup()
+        await manager.plugins_on_shutdown()
+
+        assert events == [
+            "otel:startup:begin",
+            "otel:startup:end",
+            "odm:startup:begin",
+            "odm:startup:end",
+            "odm:shutdown:begin",
+            "odm:shutdown:end",
+            "otel:shutdown:begin",
+            "otel:shutdown:end",
+        ]
+
+    async def test_plugin_startup_timeout(self) -> None:
+        """A plugin exceeding the timeout fails the startup and its dependents are not started."""
+        events: list[str] = []
+        manager: PluginManagerForTest = build_manager(
+            {
+                PluginsEnum.ODM_PLUGIN: build_fake_plugin([PluginsEnum.OPENTELEMETRY_PLUGIN], events, "odm"),
+                PluginsEnum.OPENTELEMETRY_PLUGIN: build_fake_plugin([], events, "otel", delay=1.0),
+            },
+            timeout=0.05,
+        )
+
+        with pytest.raises(ApplicationPluginManagerException):
+            await manager.plugins_on_startup()
+
+        assert "odm:startup:begin" not in events
+
+    async def test_plugin_without_dependencies_declared(self) -> None:
+        """A plugin not declaring DEPENDS_ON has no dependency."""
+        events: list[str] = []
+        legacy_plugin: SimpleNamespace = build_fake_plugin([], events, "otel")
+        del legacy_plugin.DEPENDS_ON
+        manager: PluginManagerForTest = build_manager(
+            {
+                PluginsEnum.ODM_PLUGIN: build_fake_plugin([PluginsEnum.OPENTELEMETRY_PLUGIN], events, "odm"),
+                PluginsEnum.OPENTELEMETRY_PLUGIN: legacy_plugin,
+            }
+        )
+
+        await manager.plugins_on_startup()
+
+        assert events == ["otel:startup:begin", "otel:startup:end", "odm:startup:begin", "odm:startup:end"]
+
+    async def test_plugin_shutdown_is_best_effort(self) -> None:
+        """A plugin failing its shutdown does not prevent the others from stopping, the failures are raised after."""
+        events: list[str] = []
+        otel_plugin: SimpleNamespace = build_fake_plugin([], events, "otel")
+        odm_plugin: SimpleNamespace = build_fake_plugin([PluginsEnum.OPENTELEMETRY_PLUGIN], events, "odm")
+
+        async def fail(application: Any) -> None:
+            del application
+            raise RuntimeError("Unable to release the resources.")
+
+        odm_plugin.on_shutdown = fail
+        manager: PluginManagerForTest = build_manager(
+            {PluginsEnum.ODM_PLUGIN: odm_plugin, PluginsEnum.OPENTELEMETRY_PLUGIN: otel_plugin}
+        )
+
+        with pytest.raises(ApplicationPluginManagerException):
+            await manager.plugins_on_shutdown()
+
+        assert events == ["otel:shutdown:begin", "otel:shutdown:end"]
@@ -0,0 +1,40 @@
+"""Provides unit tests for the aggregation stages builders."""
+
+import pytest
+from pymongo import DESCENDING
+
+from fastapi_factory_utilities.core.plugins.odm_plugin.aggregations import (
+    count,
+    count_by,
+    facet,
+    group,
+    limit,
+    match,
+    sort,
+)
+
+
+class TestAggregations:
+    """Unit tests for the aggregation stages builders."""
+
+    def test_group(self) -> None:
+        """The groups are keyed by a field, the fields of a compound key, or none."""
+        assert group("book_type", pages={"$sum": "$pages"}) == {
+            "$group": {"_id": "$book_type", "pages": {"$sum": "$pages"}}
+        }
+        assert count_by({"type": "book_type", "author": "author.id"}) == {
+            "$group": {"_id": {"type": "$book_type", "author": "$author.id"}, "count": {"$sum": 1}}
+        }
+        assert count_by(None) == {"$group": {"_id": None, "count": {"$sum": 1}}}
+
+    def test_facet(self) -> None:
+        """The sub-pipelines are run on the same documents."""
+        assert facet(total=[count()], latest=[sort(("created_at", DESCENDING), ("id", DESCENDING)), limit(1)]) == {
+            "$facet": {
+                "total": [{"$count": "count"}],
+                "latest": [{"$sort": {"created_at": DESCENDING, "_id": DESCENDING}}, {"$limit": 1}],
+            }
+        }
+        assert match({"pages": {"$gt": 1}}) == {"$match": {"pages": {"$gt": 1}}}
+        with pytest.raises(ValueError):
+            limit(0)
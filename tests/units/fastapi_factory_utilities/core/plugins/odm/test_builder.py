@@ -0,0 +1,115 @@
+"""Provides unit tests for the ODMBuilder class."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pymongo.errors import ServerSelectionTimeoutError
+from pymongo.read_concern import ReadConcern
+from pymongo.read_preferences import SecondaryPreferred
+
+from fastapi_factory_utilities.core.plugins.odm_plugin.builder import ODMBuilder
+from fastapi_factory_utilities.core.plugins.odm_plugin.configs import ODMBackend, ODMConfig
+from fastapi_factory_utilities.core.plugins.odm_plugin.exceptions import (
+    ODMPluginConfigError,
+)
+from fastapi_factory_utilities.core.plugins.odm_plugin.in_memory import InMemoryClient
+from fastapi_factory_utilities.core.plugins.odm_plugin.read_options import (
+    ReadConcernLevel,
+    ReadOptions,
+    ReadPreferenceMode,
+)
+from fastapi_factory_utilities.core.plugins.odm_plugin.slow_queries import SlowQueryListener
+
+
+def build_odm_builder(ping: AsyncMock, connection_timeout_ms: int = 1000) -> ODMBuilder:
+    """Build an ODMBuilder with a client mock answering the ping with the provided mock.
+
+    Args:
+        ping (AsyncMock): The mock of the admin command.
+        connection_timeout_ms (int): The connection timeout in milliseconds.
+
+    Returns:
+        ODMBuilder: The ODM builder.
+    """
+    client: MagicMock = MagicMock()
+    client.admin.command = ping
+    return ODMBuilder(
+        application=MagicMock(),
+        odm_config=ODMConfig(uri="mongodb://localhost:27017", connection_timeout_ms=connection_timeout_ms),
+        odm_client=client,
+    )
+
+
+class TestODMBuilderWaitClientToBeReady:
+    """Unit tests for the readiness probe of the ODMBuilder."""
+
+    async def test_ready_after_retries(self) -> None:
+        """The probe retries the ping until the client answers."""
+        failures: int = 2
+        ping: AsyncMock = AsyncMock(
+            side_effect=[ServerSelectionTimeoutError("not ready"), ServerSelectionTimeoutError("not ready"), {"ok": 1}]
+        )
+
+        duration: float = await build_odm_builder(ping=ping).wait_client_to_be_ready()
+
+        assert ping.await_count == failures + 1
+        assert 0 <= duration < 1
+
+    async def test_not_ready_before_deadline(self) -> None:
+        """The probe raises once the connection timeout is reached."""
+        ping: AsyncMock = AsyncMock(side_effect=ServerSelectionTimeoutError("not ready"))
+
+        with pytest.raises(ODMPluginConfigError):
+            await build_odm_builder(ping=ping, connection_timeout_ms=100).wait_client_to_be_ready()
+
+        assert ping.await_count > 1
+
+    async def test_without_client(self) -> None:
+        """The probe requires the client to be built."""
+        with pytest.raises(ODMPluginConfigError):
+            await ODMBuilder(application=MagicMock()).wait_client_to_be_ready()
+
+
+class TestODMBuilderBuildClient:
+    """Unit tests for the client built by the ODMBuilder."""
+
+    async def test_read_options(self) -> None:
+        """The client reads with the read options of the configuration."""
+        odm_config: ODMConfig = ODMConfig(
+            uri="mongodb://localhost:27017",
+            read_options=ReadOptions(
+                read_preference=ReadPreferenceMode.SECONDARY_PREFERRED,
+                max_staleness_s=120,
+                read_concern=ReadConcernLevel.MAJORITY,
+            ),
+        )
+
+        client = ODMBuilder(application=MagicMock(), odm_config=odm_config).build_client().odm_client
+
+        assert client is not None
+        assert client.read_preference == SecondaryPreferred(max_staleness=120)
+        assert client.read_concern == ReadConcern(level="majority")
+        client.close()
+
+    async def test_slow_query_listener(self) -> None:
+        """The slow-query listener is registered only with a threshold."""
+        for threshold_ms, registered in ((None, False), (100, True)):
+            odm_config: ODMConfig = ODMConfig(uri="mongodb://localhost:27017", slow_query_threshold_ms=threshold_ms)
+
+            client = ODMBuilder(application=MagicMock(), odm_config=odm_config).build_client().odm_client
+
+            assert client is not None
+            event_listeners = client.options.event_listeners
+            assert any(isinstance(listener, SlowQueryListener) for listener in event_listeners) is registered
+            client.close()
+
+    async def test_in_memory_backend(self) -> None:
+        """The in-memory backend stands for the client, ready at once."""
+        odm_config: ODMConfig = ODMConfig(uri="", backend=ODMBackend.MEMORY, database="library")
+
+        builder: ODMBuilder = ODMBuilder(application=MagicMock(), odm_config=odm_config).build_all()
+        await builder.wait_client_to_be_ready()
+
+        assert isinstance(builder.odm_client, InMemoryClient)
+        assert builder.odm_database is not None
+        assert builder.odm_database.name == "library"
@@ -0,0 +1,147 @@
+"""Provides unit tests for the entity cache of the repositories."""
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock
+from uuid import UUID, uuid4
+
+import pytest
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from pydantic import BaseModel
+
+from fastapi_factory_utilities.core.plugins.odm_plugin.cache import EntityCache
+
+
+class EntityForTest(BaseModel):
+    """Entity for test."""
+
+    id: UUID
+    name: str
+
+
+class FakeClock:
+    """Clock moved by hand."""
+
+    def __init__(self) -> None:
+        """Start at zero."""
+        self.now: float = 0.0
+
+    def __call__(self) -> float:
+        """Get the time."""
+        return self.now
+
+
+def collect_counters(reader: InMemoryMetricReader) -> dict[str, list[Any]]:
+    """Collect the data points by metric name."""
+    metrics_data = reader.get_metrics_data()
+    assert metrics_data is not None
+    return {
+        metric.name: list(metric.data.data_points)
+        for resource_metrics in metrics_data.resource_metrics
+        for scope_metrics in resource_metrics.scope_metrics
+        for metric in scope_metrics.metrics
+    }
+
+
+def build_cache(max_size: int = 10) -> tuple[EntityCache[EntityForTest], InMemoryMetricReader, FakeClock]:
+    """Build a cache with a TTL of 10 seconds, its metric reader and its clock."""
+    reader = InMemoryMetricReader()
+    clock = FakeClock()
+    cache: EntityCache[EntityForTest] = EntityCache(
+        name="test",
+        max_size=max_size,
+        ttl_s=10.0,
+        meter=MeterProvider(metric_readers=[reader]).get_meter("test"),
+        clock=clock,
+    )
+    return cache, reader, clock
+
+
+class TestEntityCache:
+    """Unit tests for the EntityCache class."""
+
+    async def test_read_through(self) -> None:
+        """Test the first read loads the entity and the next ones are hits returning copies."""
+        cache, reader, _ = build_cache()
+        entity: EntityForTest = EntityForTest(id=uuid4(), name="name")
+        loader: AsyncMock = AsyncMock(return_value=entity)
+
+        first: EntityForTest | None = await cache.get_or_load(entity.id, loader)
+        second: EntityForTest | None = await cache.get_or_load(entity.id, loader)
+
+        assert first == entity and second == entity
+        assert second is not entity
+        loader.assert_awaited_once()
+        counters: dict[str, list[Any]] = collect_counters(reader)
+        assert counters[EntityCache.METER_COUNTER_HITS_NAME][0].value == 1
+        assert counters[EntityCache.METER_COUNTER_MISSES_NAME][0].value == 1
+
+    async def test_missing_entity_not_cached(self) -> None:
+        """Test the entities not found are loaded again."""
+        cache, _, _ = build_cache()
+        loader: AsyncMock = AsyncMock(return_value=None)
+
+        assert await cache.get_or_load(uuid4(), loader) is None
+        assert len(cache) == 0
+
+    async def test_stampede_guard(self) -> None:
+        """Test the concurrent reads of a key share a single load."""
+        cache, _, _ = build_cache()
+        entity: EntityForTest = EntityForTest(id=uuid4(), name="name")
+        release: asyncio.Event = asyncio.Event()
+        loads: list[UUID] = []
+
+        async def loader() -> EntityForTest:
+            loads.append(entity.id)
+            await release.wait()
+            return entity
+
+        readers = [asyncio.create_task(cache.get_or_load(entity.id, loader)) for _ in range(10)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*readers) == [entity] * 10
+        assert loads == [entity.id]
+
+    async def test_invalidation_during_load(self) -> None:
+        """Test a load started before an invalidation is not cached."""
+        cache, _, _ = build_cache()
+        entity: EntityForTest = EntityForTest(id=uuid4(), name="name")
+        release: asyncio.Event = asyncio.Event()
+
+        async def loader() -> EntityForTest:
+            await release.wait()
+            return entity
+
+        reader = asyncio.create_task(cache.get_or_load(entity.id, loader))
+        await asyncio.sleep(0)
+        cache.invalidate(entity.id)
+        release.set()
+
+        assert await reader == entity
+        assert len(cache) == 0
+
+    async def test_evictions(self) -> None:
+        """Test the least recently used and the expired entries are evicted."""
+        cache, reader, clock = build_cache(max_size=2)
+        entities: list[EntityForTest] = [EntityForTest(id=uuid4(), name=f"name_{index}") for index in range(3)]
+        for entity in entities:
+            await cache.get_or_load(entity.id, AsyncMock(return_value=entity))
+
+        assert len(cache) == 2  # noqa: PLR2004
+        clock.now = 11.0
+        loader: AsyncMock = AsyncMock(return_value=entities[2])
+        await cache.get_or_load(entities[2].id, loader)
+
+        loader.assert_awaited_once()
+        evictions: dict[str, int] = {
+            point.attributes["reason"]: point.value
+            for point in collect_counters(reader)[EntityCache.METER_COUNTER_EVICTIONS_NAME]
+        }
+        assert evictions == {EntityCache.EVICTION_REASON_SIZE: 1, EntityCache.EVICTION_REASON_EXPIRED: 1}
+
+    def test_invalid_bounds(self) -> None:
+        """Test the bounds must be positive."""
+        with pytest.raises(ValueError):
+            EntityCache(name="test", max_size=0)
@@ -0,0 +1,137 @@
+"""Provides unit tests for the change stream watchers of the ODM plugin."""
+
+import asyncio
+from collections.abc import AsyncIterator, Mapping
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+from bson import Binary
+from pydantic import BaseModel
+from pymongo.errors import AutoReconnect
+
+from fastapi_factory_utilities.core.plugins.odm_plugin.cache import CacheInvalidationBus, EntityCache
+from fastapi_factory_utilities.core.plugins.odm_plugin.change_streams import ChangeStreamInvalidationWatcher
+
+COLLECTION_NAME: str = "books"
+
+
+class EntityForTest(BaseModel):
+    """Entity for test."""
+
+    id: UUID
+
+
+class FakeChangeStream:
+    """Change stream yielding the changes given once the gate opens, then failing or waiting to be cancelled."""
+
+    def __init__(
+        self, changes: list[Mapping[str, Any]], error: Exception | None = None, gate: asyncio.Event | None = None
+    ) -> None:
+        """Initialize the stream with its changes, its error and its gate."""
+        self._changes: list[Mapping[str, Any]] = changes
+        self._error: Exception | None = error
+        self._gate: asyncio.Event | None = gate
+        self.resume_token: Mapping[str, Any] | None = None
+
+    async def __aenter__(self) -> "FakeChangeStream":
+        """Open the stream."""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Close the stream."""
+
+    async def __aiter__(self) -> AsyncIterator[Mapping[str, Any]]:
+        """Yield the changes, the resume token following them."""
+        if self._gate is not None:
+            await self._gate.wait()
+        for index, change in enumerate(self._changes):
+            self.resume_token = {"_data": str(index)}
+            yield change
+        if self._error is not None:
+            raise self._error
+        await asyncio.Event().wait()
+
+
+async def fill_cache(cache: EntityCache[EntityForTest], entity_ids: list[UUID]) -> None:
+    """Load the entities in the cache."""
+    for entity_id in entity_ids:
+        await cache.get_or_load(entity_id, AsyncMock(return_value=EntityForTest(id=entity_id)))
+
+
+class TestCacheInvalidationBus:
+    """Unit tests for the CacheInvalidationBus class."""
+
+    async def test_publish(self) -> None:
+        """Test the invalidations reach the caches of the collection only."""
+        bus: CacheInvalidationBus = CacheInvalidationBus()
+        books_cache: EntityCache[EntityForTest] = EntityCache(name="books")
+        authors_cache: EntityCache[EntityForTest] = EntityCache(name="authors")
+        bus.subscribe(COLLECTION_NAME, books_cache)
+        bus.subscribe("authors", authors_cache)
+        entity_ids: list[UUID] = [uuid4(), uuid4()]
+        await fill_cache(books_cache, entity_ids)
+        await fill_cache(authors_cache, entity_ids)
+
+        bus.publish(COLLECTION_NAME, entity_ids[:1])
+        assert (len(books_cache), len(authors_cache)) == (1, 2)
+
+        bus.publish(COLLECTION_NAME)
+        assert (len(books_cache), len(authors_cache)) == (0, 2)
+
+
+class TestChangeStreamInvalidationWatcher:
+    """Unit tests for the ChangeStreamInvalidationWatcher class."""
+
+    async def test_invalidation_and_resume_token(self) -> None:
+        """Test the changes invalidate the caches and the stream resumes after the last change on a reconnection."""
+        bus: CacheInvalidationBus = CacheInvalidationBus()
+        cache: EntityCache[EntityForTest] = EntityCache(name=COLLECTION_NAME)
+        bus.subscribe(COLLECTION_NAME, cache)
+        entity_ids: list[UUID] = [uuid4(), uuid4(), uuid4()]
+        gate: asyncio.Event = asyncio.Event()
+
+        stream: FakeChangeStream = FakeChangeStream(
+            changes=[
+                {"operationType": "update", "documentKey": {"_id": Binary.from_uuid(entity_ids[0])}},
+                {"operationType": "delete", "documentKey": {"_id": entity_ids[1]}},
+            ],
+            error=AutoReconnect("Election"),
+            gate=gate,
+        )
+        collection: MagicMock = MagicMock()
+        collection.name = COLLECTION_NAME
+        collection.watch = MagicMock(side_effect=[stream, FakeChangeStream(changes=[])])
+        watcher: ChangeStreamInvalidationWatcher = ChangeStreamInvalidationWatcher(collection=collection, bus=bus)
+        watcher.RETRY_BACKOFF_INITIAL_S = 0.0
+
+        watcher.start()
+        for _ in range(10):
+            await asyncio.sleep(0)
+        # Loaded once the stream is opened, the changes before being unknown
+        await fill_cache(cache, entity_ids)
+        gate.set()
+        for _ in range(10):
+            await asyncio.sleep(0)
+        await watcher.stop()
+
+        assert [call.kwargs["resume_after"] for call in collection.watch.call_args_list] == [None, {"_data": "1"}]
+        assert len(cache) == 1
+
+    async def test_start_without_resume_token(self) -> None:
+        """Test all the entities are invalidated when the stream starts without a resume token."""
+        bus: CacheInvalidationBus = CacheInvalidationBus()
+        cache: EntityCache[EntityForTest] = EntityCache(name=COLLECTION_NAME)
+        bus.subscribe(COLLECTION_NAME, cache)
+        await fill_cache(cache, [uuid4()])
+        collection: MagicMock = MagicMock()
+        collection.name = COLLECTION_NAME
+        collection.watch = MagicMock(return_value=FakeChangeStream(changes=[]))
+        watcher: ChangeStreamInvalidationWatcher = ChangeStreamInvalidationWatcher(collection=collection, bus=bus)
+
+        watcher.start()
+        for _ in range(10):
+            await asyncio.sleep(0)
+        await watcher.stop()
+
+        assert len(cache) == 0
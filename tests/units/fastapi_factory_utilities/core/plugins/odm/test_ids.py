@@ -0,0 +1,56 @@
+"""Provides unit tests for the ID strategies of the documents."""
+
+import time
+from typing import ClassVar
+from unittest.mock import patch
+from uuid import UUID
+
+from beanie.odm.settings.document import DocumentSettings
+
+from fastapi_factory_utilities.core.plugins.odm_plugin.documents import BaseDocument
+from fastapi_factory_utilities.core.plugins.odm_plugin.ids import IdStrategy, uuid7
+
+UUID7_VERSION: int = 7
+
+
+class TimeOrderedDocumentForTest(BaseDocument):
+    """Document for test, with time-ordered IDs."""
+
+    id_strategy: ClassVar[IdStrategy] = IdStrategy.UUID7
+
+
+class RandomDocumentForTest(BaseDocument):
+    """Document for test, with the default IDs."""
+
+
+class TestUuid7:
+    """Unit tests for the uuid7 function."""
+
+    def test_layout(self) -> None:
+        """The UUIDs have the version 7, the RFC variant, and the current timestamp."""
+        before_ms: int = time.time_ns() // 1_000_000
+        generated: UUID = uuid7()
+
+        assert generated.version == UUID7_VERSION
+        assert generated.variant == "specified in RFC 4122"
+        assert before_ms <= generated.int >> 80 <= before_ms + 1000
+
+    def test_monotonic(self) -> None:
+        """The UUIDs generated one after the other are ordered, even in the same millisecond."""
+        generated: list[UUID] = [uuid7() for _ in range(10_000)]
+
+        assert generated == sorted(generated)
+        assert len(set(generated)) == len(generated)
+
+
+class TestIdStrategy:
+    """Unit tests for the ID strategy of the documents."""
+
+    def test_document_ids(self) -> None:
+        """The documents get the IDs of their strategy."""
+        with (
+            patch.object(TimeOrderedDocumentForTest, "_document_settings", DocumentSettings()),
+            patch.object(RandomDocumentForTest, "_document_settings", DocumentSettings()),
+        ):
+            assert TimeOrderedDocumentForTest().id.version == UUID7_VERSION
+            assert RandomDocumentForTest().id.version == 4  # noqa: PLR2004
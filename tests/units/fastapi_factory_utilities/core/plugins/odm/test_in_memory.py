@@ -0,0 +1,337 @@
+"""Provides unit tests for the in-memory backend of the ODM plugin."""
+
+import asyncio
+import datetime
+from typing import Annotated, Any, cast
+from unittest.mock import patch
+from uuid import UUID, uuid4
+
+import pytest
+from beanie import Indexed, init_beanie  # pyright: ignore[reportUnknownVariableType]
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pydantic import BaseModel, Field
+from pymongo import ASCENDING, DESCENDING, IndexModel, InsertOne, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure
+
+from fastapi_factory_utilities.core.plugins.odm_plugin.aggregations import count, count_by, facet, match
+from fastapi_factory_utilities.core.plugins.odm_plugin.cache import EntityCache
+from fastapi_factory_utilities.core.plugins.odm_plugin.documents import BaseDocument
+from fastapi_factory_utilities.core.plugins.odm_plugin.exceptions import (
+    OperationError,
+    UnableToCreateEntitiesDueToDuplicateKeyError,
+    UnableToCreateEntityDueToDuplicateKeyError,
+)
+from fastapi_factory_utilities.core.plugins.odm_plugin.in_memory import (
+    InMemoryClient,
+    InMemoryCollection,
+)
+from fastapi_factory_utilities.core.plugins.odm_plugin.loaders import using_entity_loaders
+from fastapi_factory_utilities.core.plugins.odm_plugin.pagination import Page
+from fastapi_factory_utilities.core.plugins.odm_plugin.repositories import AbstractRepository
+from fastapi_factory_utilities.core.plugins.odm_plugin.resilience import (
+    CircuitBreaker,
+    CircuitBreakerPolicy,
+    CircuitState,
+    Resilience,
+    RetryPolicy,
+)
+from fastapi_factory_utilities.core.plugins.odm_plugin.unit_of_work import unit_of_work
+
+
+class InMemoryBookDocument(BaseDocument):
+    """Document of the tests of the in-memory backend."""
+
+    title: Annotated[str, Indexed(unique=True)] = Field(description="The title of the book.")
+    tags: list[str] = Field(default_factory=list, description="The tags of the book.")
+    genre: str | None = Field(default=None, description="The genre of the book.")
+
+
+class InMemoryBookEntity(BaseModel):
+    """Entity of the tests of the in-memory backend."""
+
+    id: UUID
+    title: str
+    tags: list[str] = []
+    genre: str | None = None
+
+
+class InMemoryGenreCount(BaseModel):
+    """Projection of the number of books by genre."""
+
+    genre: str = Field(alias="_id")
+    count: int
+
+
+class InMemoryFacets(BaseModel):
+    """Projection of the counts of the books, and of the novels."""
+
+    total: list[dict[str, int]]
+    novels: list[dict[str, int]]
+
+
+class InMemoryBookRepository(AbstractRepository[InMemoryBookDocument, InMemoryBookEntity]):
+    """Repository of the tests of the in-memory backend."""
+
+
+@pytest.fixture(name="collection")
+async def fixture_collection() -> InMemoryCollection:
+    """Provide an empty collection, with an index on the tags."""
+    collection: InMemoryCollection = InMemoryClient()["test"]["books"]
+    await collection.create_indexes([IndexModel([("tags", ASCENDING)], name="tags_1")])
+    return collection
+
+
+async def build_repository() -> tuple[InMemoryClient, InMemoryBookRepository]:
+    """Build a repository on an in-memory database initialized by beanie.
+
+    Returns:
+        tuple[InMemoryClient, InMemoryBookRepository]: The client and the repository.
+    """
+    client: InMemoryClient = InMemoryClient()
+    database: AsyncIOMotorDatabase[Any] = cast(AsyncIOMotorDatabase[Any], client["test"])
+    await init_beanie(database=database, document_models=[InMemoryBookDocument])
+    return client, InMemoryBookRepository(database=database)
+
+
+class TestInMemoryCollection:
+    """Unit tests for the in-memory collection."""
+
+    async def test_filters(self, collection: InMemoryCollection) -> None:
+        """The filters match as MongoDB does, through the arrays and the dotted paths, the others failing."""
+        await collection.bulk_write(
+            [
+                InsertOne({"_id": 1, "pages": 100, "tags": ["novel", "classic"], "author": {"name": "Hugo"}}),
+                InsertOne({"_id": 2, "pages": 300, "tags": ["essay"], "author": {"name": "Camus"}}),
+                InsertOne({"_id": 3, "pages": 200, "tags": [], "price": None}),
+            ]
+        )
+
+        async def ids(filters: dict[str, Any]) -> list[Any]:
+            return [document["_id"] async for document in collection.find(filters)]
+
+        assert await ids({"tags": "classic"}) == [1]
+        assert await ids({"tags": {"$in": ["essay", "novel"]}}) == [1, 2]
+        assert await ids({"pages": {"$gte": 200, "$lt": 300}}) == [3]
+        assert await ids({"author.name": {"$ne": "Hugo"}}) == [2, 3]
+        assert await ids({"price": None}) == [1, 2, 3]
+        assert await ids({"price": {"$exists": True}}) == [3]
+        assert await ids({"$or": [{"_id": 1}, {"pages": {"$gt": 250}}]}) == [1, 2]
+        for filters in (
+            {"$where": "true"},
+            {"author.name": {"$regex": "^c", "$options": "i"}},
+            {"tags": {"$size": 0}},
+            {"pages": {"$not": {"$gt": 150}}},
+        ):
+            with pytest.raises(OperationFailure):
+                await ids(filters)
+
+    async def test_sort_projection_and_slice(self, collection: InMemoryCollection) -> None:
+        """The documents are sorted, sliced and projected on the fields included only."""
+        await collection.bulk_write(
+            [InsertOne({"_id": index, "pages": index % 3, "title": f"t{index}"}) for index in range(6)]
+        )
+
+        documents: list[dict[str, Any]] = await collection.find(
+            {}, {"title": 1, "_id": 0}, sort=[("pages", DESCENDING), ("_id", ASCENDING)], skip=1, limit=3
+        ).to_list()
+
+        assert documents == [{"title": "t5"}, {"title": "t1"}, {"title": "t4"}]
+        with pytest.raises(OperationFailure):
+            await collection.find_one({}, {"title": 0})
+
+    async def test_updates(self, collection: InMemoryCollection) -> None:
+        """The update operators are applied, the upserts seeded by the filters, and the others fail."""
+        await collection.bulk_write([InsertOne({"_id": 1, "pages": 100, "tags": ["novel"]})])
+
+        await collection.update_one({"_id": 1}, {"$inc": {"pages": 5}, "$unset": {"tags": ""}})
+        upserted = await collection.update_one({"_id": 2}, {"$set": {"pages": 10}}, upsert=True)
+
+        assert await collection.find_one({"_id": 1}) == {"_id": 1, "pages": 105}
+        assert upserted.upserted_id == 2  # noqa: PLR2004
+        assert await collection.find_one({"_id": 2}) == {"_id": 2, "pages": 10}
+        with pytest.raises(OperationFailure):
+            await collection.update_one({"_id": 1}, {"$set": {"_id": 3}})
+        with pytest.raises(OperationFailure):
+            await collection.update_one({"_id": 1}, {"$addToSet": {"tags": "classic"}})
+        with pytest.raises(OperationFailure):
+            await collection.update_one({"_id": 1}, [{"$set": {"pages": 1}}])  # type: ignore[arg-type]
+
+    async def test_values_as_read_by_the_driver(self, collection: InMemoryCollection) -> None:
+        """The documents are read back as the driver decodes them, and are copies."""
+        book_id: UUID = uuid4()
+        created_at: datetime.datetime = datetime.datetime(2024, 1, 1, 12, 0, 0, 123456, tzinfo=datetime.UTC)
+        await collection.bulk_write([InsertOne({"_id": book_id, "created_at": created_at, "tags": ["novel"]})])
+
+        document: dict[str, Any] | None = await collection.find_one({"_id": book_id})
+        assert document is not None
+        document["tags"].append("changed")
+
+        assert document["created_at"] == datetime.datetime(2024, 1, 1, 12, 0, 0, 123000)
+        assert await collection.find_one({"_id": book_id}, {"tags": 1}) == {"_id": book_id, "tags": ["novel"]}
+
+    async def test_indexes(self, collection: InMemoryCollection) -> None:
+        """The equality filters are served by the indexes, kept up to date, and the unique ones enforced."""
+        await collection.create_indexes([IndexModel([("isbn", ASCENDING)], name="isbn_1", unique=True)])
+        await collection.bulk_write(
+            [InsertOne({"_id": 1, "isbn": "a", "tags": ["novel"]}), InsertOne({"_id": 2, "isbn": "b"})]
+        )
+        await collection.update_one({"_id": 2}, {"$set": {"tags": ["novel"]}})
+
+        # pylint: disable=protected-access
+        assert collection._indexes["tags_1"].lookup("novel") == {1, 2}  # pyright: ignore[reportPrivateUsage]
+        assert [document["_id"] async for document in collection.find({"tags": "novel", "isbn": "b"})] == [2]
+        with pytest.raises(DuplicateKeyError):
+            await collection.update_one({"_id": 3}, {"$set": {"isbn": "a"}}, upsert=True)
+        with pytest.raises(BulkWriteError) as exception_info:
+            await collection.bulk_write(
+                [InsertOne({"_id": 3, "isbn": "c"}), InsertOne({"_id": 1}), UpdateOne({"_id": 3}, {"$set": {"n": 1}})],
+                ordered=False,
+            )
+        assert [error["index"] for error in exception_info.value.details["writeErrors"]] == [1]
+        assert exception_info.value.details["nInserted"] == 1
+        assert exception_info.value.details["nModified"] == 1
+        assert "isbn_1" in await collection.index_information()
+
+
+class TestInMemoryRepository:
+    """Unit tests for the repositories on the in-memory backend."""
+
+    async def test_repository(self) -> None:
+        """The repositories write, read, page and delete the entities, the unique indexes being enforced."""
+        _, repository = await build_repository()
+        books: list[InMemoryBookEntity] = await repository.insert_many(
+            entities=[InMemoryBookEntity(id=uuid4(), title=f"Book {index}", tags=["novel"]) for index in range(5)]
+        )
+
+        with pytest.raises(UnableToCreateEntitiesDueToDuplicateKeyError):
+            await repository.insert_many(entities=[InMemoryBookEntity(id=uuid4(), title="Book 0")])
+        with pytest.raises(UnableToCreateEntityDueToDuplicateKeyError):
+            await repository.insert(entity=InMemoryBookEntity(id=uuid4(), title="Book 0"))
+        with pytest.raises(UnableToCreateEntityDueToDuplicateKeyError):
+            await repository.insert(entity=books[0])
+        assert await repository.get_one_by_id(entity_id=books[2].id) == books[2]
+        first_page: Page[InMemoryBookEntity] = await repository.find_page(limit=3)
+        assert first_page.next_cursor is not None
+        second_page: Page[InMemoryBookEntity] = await repository.find_page(limit=3, cursor=first_page.next_cursor)
+        assert {book.id for book in first_page.items + second_page.items} == {book.id for book in books}
+
+        await repository.delete_one_by_id(entity_id=books[0].id)
+        assert [book async for book in repository.find(filters={"tags": "novel"})] == books[1:]
+
+    async def test_unit_of_work_aborted(self) -> None:
+        """The writes of an aborted unit of work are rolled back."""
+        client, repository = await build_repository()
+        kept: InMemoryBookEntity = await repository.insert(entity=InMemoryBookEntity(id=uuid4(), title="Kept"))
+
+        with pytest.raises(OperationError):
+            async with unit_of_work(cast(AsyncIOMotorClient[Any], client)):
+                await repository.insert(entity=InMemoryBookEntity(id=uuid4(), title="Rolled back"))
+                await repository.delete_one_by_id(entity_id=kept.id)
+                raise OperationError("Abort the unit of work.")
+
+        assert [book async for book in repository.find()] == [kept]
+
+    async def test_entity_caches_invalidated_after_commit(self) -> None:
+        """The writes invalidate the caches of all the repositories of the collection, once committed."""
+        client, repository = await build_repository()
+        cache: EntityCache[InMemoryBookEntity] = EntityCache(name="books")
+        cached_repository: InMemoryBookRepository = InMemoryBookRepository(
+            database=cast(AsyncIOMotorDatabase[Any], client["test"]), entity_cache=cache
+        )
+        book: InMemoryBookEntity = await repository.insert(entity=InMemoryBookEntity(id=uuid4(), title="Draft"))
+        assert await cached_repository.get_one_by_id(entity_id=book.id) == book
+
+        async with unit_of_work(cast(AsyncIOMotorClient[Any], client)):
+            await repository.update_one_by_id(entity_id=book.id, update={"$set": {"title": "Final"}})
+            assert len(cache) == 1
+
+        assert len(cache) == 0
+        cached_book: InMemoryBookEntity | None = await cached_repository.get_one_by_id(entity_id=book.id)
+        assert cached_book is not None and cached_book.title == "Final"
+
+    async def test_reads_by_id_batched_in_entity_loaders(self) -> None:
+        """The reads by ID of an iteration are sent in one query, and the entities written are loaded again."""
+        _, repository = await build_repository()
+        books: list[InMemoryBookEntity] = await repository.insert_many(
+            entities=[InMemoryBookEntity(id=uuid4(), title=f"Book {index}") for index in range(3)]
+        )
+
+        with (
+            using_entity_loaders(),
+            patch.object(repository, "_load_many_by_ids", wraps=repository._load_many_by_ids) as load_many_by_ids,  # pylint: disable=protected-access
+        ):
+            loaded: list[InMemoryBookEntity | None] = await asyncio.gather(
+                *(repository.get_one_by_id(entity_id=book.id) for book in [*books, books[0]])
+            )
+            assert loaded == [*books, books[0]]
+            assert await repository.get_one_by_id(entity_id=books[1].id) is loaded[1]
+            load_many_by_ids.assert_awaited_once()
+
+            await repository.update_one_by_id(entity_id=books[1].id, update={"$set": {"title": "Final"}})
+            book: InMemoryBookEntity | None = await repository.get_one_by_id(entity_id=books[1].id)
+            assert book is not None and book.title == "Final"
+
+    async def test_entity_loaders_probe_once(self) -> None:
+        """A read by ID through the loaders is one operation for the circuit breaker, its probe closing it."""
+        client, _ = await build_repository()
+        now: list[float] = [0.0]
+        circuit_breaker = CircuitBreaker(
+            policy=CircuitBreakerPolicy(minimum_calls=1, open_duration_s=5, half_open_max_calls=1),
+            clock=lambda: now[0],
+        )
+        repository: InMemoryBookRepository = InMemoryBookRepository(
+            database=cast(AsyncIOMotorDatabase[Any], client["test"]),
+            resilience=Resilience(retry_policy=RetryPolicy(max_attempts=3), circuit_breaker=circuit_breaker),
+        )
+        book: InMemoryBookEntity = await repository.insert(entity=InMemoryBookEntity(id=uuid4(), title="Probe"))
+        circuit_breaker.record(failed=True)
+        now[0] = 5
+        assert circuit_breaker.state == CircuitState.HALF_OPEN
+
+        with (
+            using_entity_loaders(),
+            patch.object(repository, "get_many_by_ids", wraps=repository.get_many_by_ids) as get_many_by_ids,
+        ):
+            assert await repository.get_one_by_id(entity_id=book.id) == book
+
+        get_many_by_ids.assert_not_called()
+        assert circuit_breaker.state == CircuitState.CLOSED
+
+    async def test_aggregations(self) -> None:
+        """The aggregations, counts and distinct values are computed by the backend."""
+        _, repository = await build_repository()
+        books: list[InMemoryBookEntity] = await repository.insert_many(
+            entities=[
+                InMemoryBookEntity(id=uuid4(), title="Dune", tags=["novel", "classic"], genre="fiction"),
+                InMemoryBookEntity(id=uuid4(), title="Ubik", tags=["novel"], genre="fiction"),
+                InMemoryBookEntity(id=uuid4(), title="Walden", tags=["essay"], genre="nature"),
+            ]
+        )
+
+        genre_counts: list[InMemoryGenreCount] = [
+            genre_count
+            async for genre_count in repository.aggregate(
+                [count_by("genre"), {"$sort": {"count": -1, "_id": 1}}], projection=InMemoryGenreCount
+            )
+        ]
+        facets: list[InMemoryFacets] = [
+            facets
+            async for facets in repository.aggregate(
+                [facet(total=[count()], novels=[match({"tags": "novel"}), count()])], projection=InMemoryFacets
+            )
+        ]
+
+        assert [(genre_count.genre, genre_count.count) for genre_count in genre_counts] == [
+            ("fiction", 2),
+            ("nature", 1),
+        ]
+        assert facets == [InMemoryFacets(total=[{"count": 3}], novels=[{"count": 2}])]
+        assert [book async for book in repository.aggregate([match({"tags": "essay"})])] == [books[2]]
+        assert await repository.count({"tags": "novel"}) == 2  # noqa: PLR2004
+        assert await repository.count(limit=1) == 1
+        assert await repository.exists({"title": "Ubik"})
+        assert not await repository.exists({"title": "Emma"})
+        assert sorted(await repository.distinct("tags")) == ["classic", "essay", "novel"]
+        assert await repository.distinct("id", {"title": "Dune"}) == [books[0].id]
+        with pytest.raises(OperationError):
+            await repository.aggregate([{"$unwind": "$tags"}]).__anext__()
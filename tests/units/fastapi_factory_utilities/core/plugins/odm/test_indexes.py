@@ -0,0 +1,90 @@
+"""Provides unit tests for the synchronization of the indexes."""
+
+from collections.abc import Iterator
+from typing import Annotated, Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from beanie import Indexed
+from beanie.odm.settings.document import DocumentSettings
+from pymongo import DESCENDING, IndexModel
+from pymongo.errors import OperationFailure
+
+from fastapi_factory_utilities.core.plugins.odm_plugin.documents import BaseDocument
+from fastapi_factory_utilities.core.plugins.odm_plugin.exceptions import OperationError
+from fastapi_factory_utilities.core.plugins.odm_plugin.indexes import (
+    IndexSyncMode,
+    get_declared_indexes,
+    sync_document_models_indexes,
+    sync_indexes,
+)
+
+
+class DocumentForTest(BaseDocument):
+    """Document for test."""
+
+    name: Annotated[str, Indexed(unique=True)]
+
+
+@pytest.fixture(name="collection")
+def fixture_collection() -> Iterator[MagicMock]:
+    """Patch the collection of the document, without the index of the settings and with an index not declared."""
+    collection: MagicMock = MagicMock()
+    collection.name = "documents"
+    collection.index_information = AsyncMock(
+        return_value={
+            "_id_": {"key": [("_id", 1)], "v": 2},
+            "created_at_-1": {"key": [("created_at", -1)], "v": 2},
+            "updated_at_-1": {"key": [("updated_at", -1)], "v": 2},
+            "name_1": {"key": [("name", 1)], "unique": True, "v": 2},
+            "legacy_1": {"key": [("legacy", 1)], "v": 2},
+        }
+    )
+    collection.create_indexes = AsyncMock(side_effect=lambda indexes: [index.document["name"] for index in indexes])
+    settings: DocumentSettings = DocumentSettings(
+        indexes=[IndexModel([("created_at", DESCENDING), ("_id", DESCENDING)], name="created_at_id")]
+    )
+    with (
+        patch.object(DocumentForTest, "get_settings", return_value=settings),
+        patch.object(DocumentForTest, "get_motor_collection", return_value=collection),
+    ):
+        yield collection
+
+
+class TestIndexes:
+    """Various tests for the synchronization of the indexes."""
+
+    def test_get_declared_indexes(self, collection: Any) -> None:
+        """The indexes are declared on the fields and in the settings."""
+        del collection
+        assert {index.name for index in get_declared_indexes(DocumentForTest)} == {
+            "created_at_-1",
+            "updated_at_-1",
+            "name_1",
+            "created_at_id",
+        }
+
+    async def test_blocking(self, collection: MagicMock) -> None:
+        """The missing indexes are built, the extra ones are only reported."""
+        report = await sync_indexes(DocumentForTest, IndexSyncMode.BLOCKING)
+
+        assert report.missing == ["created_at_id"]
+        assert report.created == ["created_at_id"]
+        assert report.extra == ["legacy_1"]
+        assert report.duration_s >= 0
+        collection.create_indexes.assert_awaited_once()
+
+    async def test_verify_only(self, collection: MagicMock) -> None:
+        """The missing indexes are not built."""
+        reports = await sync_document_models_indexes([DocumentForTest], IndexSyncMode.VERIFY_ONLY)
+
+        assert [report.missing for report in reports] == [["created_at_id"]]
+        assert [report.created for report in reports] == [[]]
+        collection.create_indexes.assert_not_awaited()
+
+    async def test_failure(self, collection: MagicMock) -> None:
+        """The failures of the database are raised as operation errors."""
+        collection.create_indexes.side_effect = OperationFailure("Index build failed")
+
+        with pytest.raises(OperationError):
+            await sync_indexes(DocumentForTest, IndexSyncMode.BACKGROUND)
@@ -0,0 +1,113 @@
+"""Provides unit tests for the pymongo event listeners of the ODM plugin."""
+
+from typing import Any
+
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from pymongo import monitoring
+
+from fastapi_factory_utilities.core.plugins.odm_plugin.listeners import (
+    PoolMetricsListener,
+    sanitize_command,
+)
+
+ADDRESS: tuple[str, int] = ("localhost", 27017)
+
+
+def collect_metrics(reader: InMemoryMetricReader) -> dict[str, list[Any]]:
+    """Collect the data points by metric name.
+
+    Args:
+        reader (InMemoryMetricReader): The metric reader.
+
+    Returns:
+        dict[str, list[Any]]: The data points by metric name.
+    """
+    metrics_data = reader.get_metrics_data()
+    assert metrics_data is not None
+    return {
+        metric.name: list(metric.data.data_points)
+        for resource_metrics in metrics_data.resource_metrics
+        for scope_metrics in resource_metrics.scope_metrics
+        for metric in scope_metrics.metrics
+    }
+
+
+class TestPoolMetricsListener:
+    """Unit tests for the PoolMetricsListener class."""
+
+    def test_connection_lifecycle(self) -> None:
+        """The usage and wait time follow the connections lifecycle."""
+        reader = InMemoryMetricReader()
+        listener = PoolMetricsListener(meter=MeterProvider(metric_readers=[reader]).get_meter("test"))
+
+        listener.connection_created(monitoring.ConnectionCreatedEvent(ADDRESS, 1))
+        listener.connection_created(monitoring.ConnectionCreatedEvent(ADDRESS, 2))
+        listener.connection_checked_out(monitoring.ConnectionCheckedOutEvent(ADDRESS, 1, 0.5))
+
+        data_points: dict[str, list[Any]] = collect_metrics(reader)
+        usage: dict[str, int] = {
+            point.attributes["state"]: point.value
+            for point in data_points[PoolMetricsListener.METER_UP_DOWN_COUNTER_USAGE_NAME]
+        }
+        assert usage == {PoolMetricsListener.STATE_IDLE: 1, PoolMetricsListener.STATE_USED: 1}
+        wait_time = data_points[PoolMetricsListener.METER_HISTOGRAM_WAIT_TIME_NAME][0]
+        assert wait_time.count == 1
+        assert wait_time.sum == 0.5  # noqa: PLR2004
+
+        listener.connection_checked_in(monitoring.ConnectionCheckedInEvent(ADDRESS, 1))
+        listener.connection_closed(monitoring.ConnectionClosedEvent(ADDRESS, 1, monitoring.ConnectionClosedReason.IDLE))
+
+        data_points = collect_metrics(reader)
+        usage = {
+            point.attributes["state"]: point.value
+            for point in data_points[PoolMetricsListener.METER_UP_DOWN_COUNTER_USAGE_NAME]
+        }
+        assert usage == {PoolMetricsListener.STATE_IDLE: 1, PoolMetricsListener.STATE_USED: 0}
+
+    def test_checkout_failure(self) -> None:
+        """The failed check outs are counted by reason."""
+        reader = InMemoryMetricReader()
+        listener = PoolMetricsListener(meter=MeterProvider(metric_readers=[reader]).get_meter("test"))
+
+        listener.connection_check_out_failed(
+            monitoring.ConnectionCheckOutFailedEvent(ADDRESS, monitoring.ConnectionCheckOutFailedReason.TIMEOUT, 1.0)
+        )
+
+        failures = collect_metrics(reader)[PoolMetricsListener.METER_COUNTER_CHECKOUT_FAILURES_NAME]
+        assert failures[0].value == 1
+        assert failures[0].attributes["reason"] == monitoring.ConnectionCheckOutFailedReason.TIMEOUT
+
+
+class TestSanitizeCommand:
+    """Unit tests for the sanitize_command function."""
+
+    def test_values_are_sanitized(self) -> None:
+        """The values of the filters are replaced, the field names, operators and query options are kept."""
+        statement: str = sanitize_command(
+            "find",
+            {
+                "find": "books",
+                "filter": {"title": "Dune", "_id": {"$in": ["a", "b", "c"]}},
+                "sort": {"created_at": 1},
+                "limit": 10,
+                "lsid": {"id": "session"},
+            },
+        )
+
+        assert statement == (
+            'find {"filter": {"title": "?", "_id": {"$in": ["?"]}}, "sort": {"created_at": 1}, "limit": 10}'
+        )
+
+    def test_documents_are_sanitized_by_shape(self) -> None:
+        """The documents of the same shape are kept once."""
+        statement: str = sanitize_command(
+            "insert",
+            {"insert": "books", "documents": [{"title": "Dune"}, {"title": "Solaris"}, {"title": "Ubik", "pages": 1}]},
+        )
+
+        assert statement == 'insert {"documents": [{"title": "?"}, {"title": "?", "pages": "?"}]}'
+
+    def test_command_without_values(self) -> None:
+        """The commands without any field kept are reduced to their name."""
+        assert sanitize_command("ping", {"ping": 1}) == "ping"
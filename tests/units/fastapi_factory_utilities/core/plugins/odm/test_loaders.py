@@ -0,0 +1,140 @@
+"""Provides unit tests for the entity loader of the repositories."""
+
+import asyncio
+from collections.abc import Mapping
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from fastapi_factory_utilities.core.plugins.odm_plugin.exceptions import OperationError
+from fastapi_factory_utilities.core.plugins.odm_plugin.loaders import (
+    EntityLoader,
+    EntityLoadersMiddleware,
+    get_entity_loader,
+)
+
+
+class EntityForTest(BaseModel):
+    """Entity for test."""
+
+    id: UUID
+
+
+class FakeBatchLoad:
+    """Batch load recording its calls, finding all the IDs but the missing ones."""
+
+    def __init__(self, missing_ids: frozenset[UUID] = frozenset()) -> None:
+        """Initialize without calls."""
+        self.calls: list[list[UUID]] = []
+        self.missing_ids: frozenset[UUID] = missing_ids
+        self.error: BaseException | None = None
+
+    async def __call__(self, entity_ids: list[UUID]) -> Mapping[UUID, EntityForTest]:
+        """Record the call and load the entities."""
+        self.calls.append(entity_ids)
+        if self.error is not None:
+            raise self.error
+        return {entity_id: EntityForTest(id=entity_id) for entity_id in entity_ids if entity_id not in self.missing_ids}
+
+
+class TestEntityLoader:
+    """Various tests for the EntityLoader class."""
+
+    async def test_batches_and_dedupes_the_loads(self) -> None:
+        """The concurrent loads are sent in one batch, without duplicates."""
+        batch_load = FakeBatchLoad()
+        loader: EntityLoader[EntityForTest] = EntityLoader(batch_load=batch_load)
+        first_id, second_id = uuid4(), uuid4()
+
+        entities = await asyncio.gather(loader.load(first_id), loader.load(second_id), loader.load(first_id))
+
+        assert batch_load.calls == [[first_id, second_id]]
+        assert [entity.id for entity in entities if entity is not None] == [first_id, second_id, first_id]
+        assert entities[0] is entities[2]
+
+    async def test_identity_map(self) -> None:
+        """A second load of an ID returns the same entity without any batch."""
+        batch_load = FakeBatchLoad()
+        loader: EntityLoader[EntityForTest] = EntityLoader(batch_load=batch_load)
+        entity_id: UUID = uuid4()
+
+        entity = await loader.load(entity_id)
+
+        assert await loader.load(entity_id) is entity
+        assert len(batch_load.calls) == 1
+
+    async def test_missing_entity(self) -> None:
+        """The entities not found are loaded as None."""
+        missing_id: UUID = uuid4()
+        loader: EntityLoader[EntityForTest] = EntityLoader(
+            batch_load=FakeBatchLoad(missing_ids=frozenset({missing_id}))
+        )
+
+        entities = await loader.load_many([uuid4(), missing_id])
+
+        assert entities[0] is not None
+        assert entities[1] is None
+
+    async def test_max_batch_size(self) -> None:
+        """The batches are split at the maximum batch size."""
+        batch_load = FakeBatchLoad()
+        loader: EntityLoader[EntityForTest] = EntityLoader(batch_load=batch_load, max_batch_size=2)
+
+        await loader.load_many([uuid4() for _ in range(5)])
+
+        assert [len(call) for call in batch_load.calls] == [2, 2, 1]
+
+    async def test_failure_is_not_cached(self) -> None:
+        """The failure of a batch is raised to its readers, and the IDs are loaded again on the next load."""
+        batch_load = FakeBatchLoad()
+        batch_load.error = OperationError("Failed to get documents")
+        loader: EntityLoader[EntityForTest] = EntityLoader(batch_load=batch_load)
+        entity_id: UUID = uuid4()
+
+        with pytest.raises(OperationError):
+            await loader.load(entity_id)
+
+        batch_load.error = None
+        entity = await loader.load(entity_id)
+        assert entity is not None
+        assert len(batch_load.calls) == 2  # noqa: PLR2004
+
+    async def test_clear(self) -> None:
+        """The entities cleared are loaded again."""
+        batch_load = FakeBatchLoad()
+        loader: EntityLoader[EntityForTest] = EntityLoader(batch_load=batch_load)
+        first_id, second_id = uuid4(), uuid4()
+        await loader.load_many([first_id, second_id])
+
+        loader.clear(first_id)
+        await loader.load_many([first_id, second_id])
+        loader.clear()
+        await loader.load(second_id)
+
+        assert batch_load.calls == [[first_id, second_id], [first_id], [second_id]]
+
+    def test_max_batch_size_must_be_positive(self) -> None:
+        """The maximum batch size must be positive."""
+        with pytest.raises(ValueError):
+            EntityLoader(batch_load=FakeBatchLoad(), max_batch_size=0)
+
+
+def test_entity_loaders_middleware() -> None:
+    """Each request batches its loads in its own loaders, none being available outside of a request."""
+    batch_load = FakeBatchLoad()
+    asgi_app: FastAPI = FastAPI()
+    asgi_app.add_middleware(EntityLoadersMiddleware)
+
+    @asgi_app.get("/entities")
+    async def get_entities() -> int:
+        loader: EntityLoader[EntityForTest] | None = get_entity_loader("entities", key="test", batch_load=batch_load)
+        assert loader is not None
+        await loader.load_many([uuid4(), uuid4(), uuid4()])
+        return len(batch_load.calls)
+
+    with TestClient(app=asgi_app) as client:
+        assert [client.get("/entities").json() for _ in range(2)] == [1, 2]
+    assert get_entity_loader("entities", key="test", batch_load=batch_load) is None
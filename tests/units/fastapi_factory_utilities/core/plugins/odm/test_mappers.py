@@ -0,0 +1,137 @@
+"""Provides unit tests for the mappers module."""
+
+from collections.abc import Iterator
+from unittest.mock import patch
+from uuid import UUID, uuid4
+
+import pytest
+from beanie.odm.settings.document import DocumentSettings
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
+
+from fastapi_factory_utilities.core.plugins.odm_plugin.documents import BaseDocument
+from fastapi_factory_utilities.core.plugins.odm_plugin.mappers import DocumentEntityMapper, get_mapper
+
+
+class NestedForTest(BaseModel):
+    """Nested model for test."""
+
+    value: int
+
+
+class DocumentForTest(BaseDocument):
+    """Document for test."""
+
+    name: str = Field(max_length=10)
+    nested: NestedForTest
+    tags: list[str] = Field(default_factory=list)
+
+
+class EntityForTest(BaseModel):
+    """Entity for test, with the layout of the document."""
+
+    id: UUID
+    name: str
+    nested: NestedForTest
+    tags: list[str]
+    comment: str | None = None
+
+
+class ValidatedEntityForTest(BaseModel):
+    """Entity for test, with a validator."""
+
+    id: UUID
+    name: str
+    nested: NestedForTest
+
+    @field_validator("name")
+    @classmethod
+    def upper_name(cls, value: str) -> str:
+        """Upper the name."""
+        return value.upper()
+
+
+class NestedDictEntityForTest(BaseModel):
+    """Entity for test, with another layout than the document."""
+
+    model_config = ConfigDict(extra="ignore")
+
+    id: UUID
+    name: str
+    nested: dict[str, int]
+
+
+class RevisionedEntityForTest(BaseModel):
+    """Entity for test, with a validator and the revision of the document."""
+
+    id: UUID
+    name: str
+    nested: NestedForTest
+    revision_id: UUID | None = None
+
+    @field_validator("name")
+    @classmethod
+    def strip_name(cls, value: str) -> str:
+        """Strip the name."""
+        return value.strip()
+
+
+class TestDocumentEntityMapper:
+    """Unit tests for the DocumentEntityMapper class."""
+
+    @pytest.fixture(autouse=True)
+    def document_settings(self) -> Iterator[None]:
+        """Provide the settings of the document, as if beanie was initialized."""
+        with patch.object(DocumentForTest, "get_settings", return_value=DocumentSettings()):
+            yield
+
+    def test_round_trip_with_trusted_construction(self) -> None:
+        """Test an entity with the layout of the document is built without validation."""
+        mapper: DocumentEntityMapper[DocumentForTest, EntityForTest] = DocumentEntityMapper(
+            DocumentForTest, EntityForTest
+        )
+        entity: EntityForTest = EntityForTest(id=uuid4(), name="name", nested=NestedForTest(value=1), tags=["a"])
+
+        document: DocumentForTest = mapper.to_document(entity)
+        entity_mapped: EntityForTest = mapper.to_entity(document)
+
+        assert mapper.trusted_construction
+        assert document.id == entity.id
+        assert entity_mapped == entity
+
+    def test_to_document_validates_the_entity(self) -> None:
+        """Test the document constraints are enforced on the entity."""
+        mapper: DocumentEntityMapper[DocumentForTest, EntityForTest] = DocumentEntityMapper(
+            DocumentForTest, EntityForTest
+        )
+        entity: EntityForTest = EntityForTest(id=uuid4(), name="too long name", nested=NestedForTest(value=1), tags=[])
+
+        with pytest.raises(ValidationError):
+            mapper.to_document(entity)
+
+    @pytest.mark.parametrize("entity_type", [ValidatedEntityForTest, NestedDictEntityForTest])
+    def test_to_entity_falls_back_to_validation(self, entity_type: type[BaseModel]) -> None:
+        """Test the entities with validators or another layout are validated."""
+        mapper: DocumentEntityMapper[DocumentForTest, BaseModel] = DocumentEntityMapper(DocumentForTest, entity_type)
+        document: DocumentForTest = DocumentForTest(id=uuid4(), name="name", nested=NestedForTest(value=1))
+
+        entity: BaseModel = mapper.to_entity(document)
+
+        assert not mapper.trusted_construction
+        assert entity == entity_type.model_validate(document.model_dump())
+
+    def test_to_entity_maps_the_revision(self) -> None:
+        """Test the revision, excluded from the dumps of the documents, is mapped to the entities validated."""
+        mapper: DocumentEntityMapper[DocumentForTest, RevisionedEntityForTest] = DocumentEntityMapper(
+            DocumentForTest, RevisionedEntityForTest
+        )
+        document: DocumentForTest = DocumentForTest(id=uuid4(), name="name", nested=NestedForTest(value=1))
+        document.revision_id = uuid4()
+
+        entity: RevisionedEntityForTest = mapper.to_entity(document)
+
+        assert not mapper.trusted_construction
+        assert entity.revision_id == document.revision_id
+
+    def test_get_mapper_compiles_once(self) -> None:
+        """Test the mapper of a pair is compiled once."""
+        assert get_mapper(DocumentForTest, EntityForTest) is get_mapper(DocumentForTest, EntityForTest)
@@ -0,0 +1,39 @@
+"""Provides unit tests for the metrics of the repository operations."""
+
+from typing import Any
+
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+from fastapi_factory_utilities.core.plugins.odm_plugin.exceptions import OperationError
+from fastapi_factory_utilities.core.plugins.odm_plugin.metrics import RepositoryMetrics
+
+
+class TestRepositoryMetrics:
+    """Unit tests for the RepositoryMetrics class."""
+
+    def test_record(self) -> None:
+        """The durations are recorded by collection and operation, the errors are counted by type."""
+        reader = InMemoryMetricReader()
+        repository_metrics = RepositoryMetrics(meter=MeterProvider(metric_readers=[reader]).get_meter("test"))
+
+        repository_metrics.record(collection="books", operation="insert", duration_s=0.25)
+        repository_metrics.record(
+            collection="books", operation="insert", duration_s=0.5, error=OperationError("Failed")
+        )
+
+        metrics_data = reader.get_metrics_data()
+        assert metrics_data is not None
+        data_points: dict[str, list[Any]] = {
+            metric.name: list(metric.data.data_points)
+            for resource_metrics in metrics_data.resource_metrics
+            for scope_metrics in resource_metrics.scope_metrics
+            for metric in scope_metrics.metrics
+        }
+        duration = data_points[RepositoryMetrics.METER_HISTOGRAM_DURATION_NAME][0]
+        assert duration.count == 2  # noqa: PLR2004
+        assert duration.sum == 0.75  # noqa: PLR2004
+        assert duration.attributes == {"db.collection.name": "books", "db.operation.name": "insert"}
+        errors = data_points[RepositoryMetrics.METER_COUNTER_ERRORS_NAME][0]
+        assert errors.value == 1
+        assert errors.attributes["error.type"] == "OperationError"
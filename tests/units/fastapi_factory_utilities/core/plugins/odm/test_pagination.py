@@ -0,0 +1,39 @@
+"""Provides unit tests for the pagination module."""
+
+import datetime
+from uuid import uuid4
+
+import pytest
+
+from fastapi_factory_utilities.core.plugins.odm_plugin.exceptions import InvalidPageCursorError
+from fastapi_factory_utilities.core.plugins.odm_plugin.pagination import PageCursor
+
+
+class TestPageCursor:
+    """Unit tests for the PageCursor class."""
+
+    def test_encode_decode_round_trip(self) -> None:
+        """Test a decoded token gives back the encoded cursor."""
+        cursor: PageCursor = PageCursor(created_at=datetime.datetime.now(tz=datetime.UTC), id=uuid4())
+
+        token: str = cursor.encode()
+
+        assert "=" not in token
+        assert PageCursor.decode(token) == cursor
+
+    @pytest.mark.parametrize("token", ["", "not a token", "e30", "eyJjIjogMX0"])
+    def test_decode_invalid_token(self, token: str) -> None:
+        """Test an invalid token raises InvalidPageCursorError."""
+        with pytest.raises(InvalidPageCursorError):
+            PageCursor.decode(token)
+
+    def test_to_filter(self) -> None:
+        """Test the filter selects the documents strictly after the cursor."""
+        cursor: PageCursor = PageCursor(created_at=datetime.datetime.now(tz=datetime.UTC), id=uuid4())
+
+        assert cursor.to_filter() == {
+            "$or": [
+                {"created_at": {"$lt": cursor.created_at}},
+                {"created_at": cursor.created_at, "_id": {"$lt": cursor.id}},
+            ]
+        }
@@ -0,0 +1,81 @@
+"""Provides unit tests for the startup and shutdown of the ODM plugin."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from fastapi import FastAPI
+
+from fastapi_factory_utilities.core.api.v1.sys.readiness import get_not_ready_components
+from fastapi_factory_utilities.core.plugins import odm_plugin
+from fastapi_factory_utilities.core.plugins.odm_plugin.configs import ODMConfig
+
+
+def build_application() -> MagicMock:
+    """Build an application without document models, on a FastAPI application.
+
+    Returns:
+        MagicMock: The application.
+    """
+    application: MagicMock = MagicMock()
+    application.ODM_DOCUMENT_MODELS = []
+    application.get_asgi_app.return_value = FastAPI()
+    return application
+
+
+def build_odm_factory(client_ready: asyncio.Event) -> MagicMock:
+    """Build an ODM factory whose client is ready once the event is set.
+
+    Args:
+        client_ready (asyncio.Event): The event.
+
+    Returns:
+        MagicMock: The ODM factory.
+    """
+
+    async def wait_client_to_be_ready() -> float:
+        await client_ready.wait()
+        return 0.0
+
+    odm_factory: MagicMock = MagicMock()
+    odm_factory.config = ODMConfig(uri="mongodb://localhost:27017")
+    odm_factory.wait_client_to_be_ready = wait_client_to_be_ready
+    return odm_factory
+
+
+class TestODMPluginStartup:
+    """Unit tests for the startup of the ODM plugin."""
+
+    async def test_startup_does_not_wait_for_the_client(self) -> None:
+        """The startup returns at once, the application being not ready until the client answers."""
+        application: MagicMock = build_application()
+        client_ready: asyncio.Event = asyncio.Event()
+
+        with (
+            patch.object(odm_plugin, "ODMBuilder") as odm_builder,
+            patch.object(odm_plugin, "init_beanie", new_callable=AsyncMock) as init_beanie,
+            patch.object(odm_plugin, "sync_document_models_indexes", new_callable=AsyncMock),
+        ):
+            odm_builder.return_value.build_all.return_value = build_odm_factory(client_ready)
+            await odm_plugin.on_startup(application)
+
+            assert get_not_ready_components(application.get_asgi_app()) == ["odm"]
+            init_beanie.assert_not_awaited()
+
+            client_ready.set()
+            await application.get_asgi_app().state.odm_startup_task
+
+            assert get_not_ready_components(application.get_asgi_app()) == []
+            init_beanie.assert_awaited_once()
+
+    async def test_shutdown_cancels_the_connection(self) -> None:
+        """The shutdown cancels the connection still in progress, and closes the client."""
+        application: MagicMock = build_application()
+        odm_factory: MagicMock = build_odm_factory(asyncio.Event())
+
+        with patch.object(odm_plugin, "ODMBuilder") as odm_builder:
+            odm_builder.return_value.build_all.return_value = odm_factory
+            await odm_plugin.on_startup(application)
+            await odm_plugin.on_shutdown(application)
+
+        assert application.get_asgi_app().state.odm_startup_task.cancelled()
+        odm_factory.odm_client.close.assert_called_once()
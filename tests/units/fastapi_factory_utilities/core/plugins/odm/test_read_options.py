@@ -0,0 +1,64 @@
+"""Provides unit tests for the read options of the repository reads."""
+
+import pytest
+from pymongo.read_concern import ReadConcern
+from pymongo.read_preferences import Nearest, Primary, SecondaryPreferred
+
+from fastapi_factory_utilities.core.plugins.odm_plugin.read_options import (
+    ReadConcernLevel,
+    ReadOptions,
+    ReadPreferenceMode,
+    get_read_options,
+    using_read_options,
+    with_read_options,
+)
+
+SECONDARY_READS: ReadOptions = ReadOptions(
+    read_preference=ReadPreferenceMode.SECONDARY_PREFERRED, max_staleness_s=120, read_concern=ReadConcernLevel.LOCAL
+)
+
+
+class TestReadOptions:
+    """Various tests for the ReadOptions class."""
+
+    def test_driver_options(self) -> None:
+        """The read options are converted to the ones of the driver."""
+        assert SECONDARY_READS.get_read_preference() == SecondaryPreferred(max_staleness=120)
+        assert SECONDARY_READS.get_read_concern() == ReadConcern(level="local")
+        assert ReadOptions(read_preference=ReadPreferenceMode.PRIMARY).get_read_preference() == Primary()
+        assert ReadOptions(read_preference=ReadPreferenceMode.NEAREST).get_read_preference() == Nearest()
+
+    def test_defaults_keep_the_client_options(self) -> None:
+        """The read options not set keep the ones of the client."""
+        assert ReadOptions().get_read_preference() is None
+        assert ReadOptions().get_read_concern() is None
+
+    @pytest.mark.parametrize(
+        "read_preference, max_staleness_s",
+        [(None, 120), (ReadPreferenceMode.PRIMARY, 120), (ReadPreferenceMode.NEAREST, 10)],
+    )
+    def test_invalid_max_staleness(self, read_preference: ReadPreferenceMode | None, max_staleness_s: int) -> None:
+        """The staleness needs a mode reading from the secondaries, and at least 90 seconds."""
+        with pytest.raises(ValueError):
+            ReadOptions(read_preference=read_preference, max_staleness_s=max_staleness_s)
+
+
+class TestContextReadOptions:
+    """Various tests for the read options of the context."""
+
+    def test_using_read_options(self) -> None:
+        """The read options are set for the block only."""
+        assert get_read_options() is None
+        with using_read_options(SECONDARY_READS):
+            assert get_read_options() is SECONDARY_READS
+        assert get_read_options() is None
+
+    async def test_with_read_options(self) -> None:
+        """The read options are set for the coroutine function only."""
+
+        @with_read_options(SECONDARY_READS)
+        async def read() -> ReadOptions | None:
+            return get_read_options()
+
+        assert await read() is SECONDARY_READS
+        assert get_read_options() is None
@@ -1,11 +1,29 @@
 """Provides unit tests for the repositories module."""
 
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
 from pydantic import BaseModel
+from pymongo.errors import AutoReconnect
+from pymongo.read_preferences import Nearest, SecondaryPreferred
 
 from fastapi_factory_utilities.core.plugins.odm_plugin.documents import BaseDocument
+from fastapi_factory_utilities.core.plugins.odm_plugin.exceptions import OperationError
+from fastapi_factory_utilities.core.plugins.odm_plugin.read_options import (
+    ReadOptions,
+    ReadPreferenceMode,
+    using_read_options,
+)
 from fastapi_factory_utilities.core.plugins.odm_plugin.repositories import (
     AbstractRepository,
+    managed_session,
+    measured,
+    resilient,
 )
+from fastapi_factory_utilities.core.plugins.odm_plugin.resilience import Resilience, RetryPolicy
+from fastapi_factory_utilities.core.plugins.odm_plugin.unit_of_work import unit_of_work
 
 
 class TestRepositories:
@@ -32,3 +50,150 @@ class TestRepositories:
         # pylint: disable=protected-access
         assert repository._document_type == ConcreteDocument  # pyright: ignore[reportPrivateUsage]
         assert repository._entity_type == ConcreteEntity  # pyright: ignore[reportPrivateUsage]
+
+    async def test_managed_session(self) -> None:
+        """Test the session given, else the session of the unit of work, else no session is passed."""
+
+        # Given
+        @managed_session()
+        async def operation(repository: Any, session: Any = None) -> Any:
+            del repository
+            return session
+
+        session: MagicMock = MagicMock()
+        session.__aenter__ = AsyncMock(return_value=session)
+        session.__aexit__ = AsyncMock(return_value=False)
+        session.commit_transaction = AsyncMock()
+        client: MagicMock = MagicMock(start_session=AsyncMock(return_value=session))
+        given_session: MagicMock = MagicMock()
+
+        # When / Then
+        assert await operation(None) is None
+        assert await operation(None, session=given_session) is given_session
+        async with unit_of_work(client):
+            assert await operation(None) is session
+
+    def test_read_collection(self) -> None:
+        """Test the read options given, else the ones of the context, else the ones of the repository are used."""
+
+        # Given
+        class ConcreteDocument(BaseDocument):
+            pass
+
+        class ConcreteEntity(BaseModel):
+            pass
+
+        class ConcreteRepository(AbstractRepository[ConcreteDocument, ConcreteEntity]):
+            pass
+
+        secondary_reads: ReadOptions = ReadOptions(read_preference=ReadPreferenceMode.SECONDARY_PREFERRED)
+        nearest_reads: ReadOptions = ReadOptions(read_preference=ReadPreferenceMode.NEAREST)
+        collection: MagicMock = MagicMock()
+        collection.with_options.side_effect = lambda read_preference, read_concern: (read_preference, read_concern)
+        transaction_session: MagicMock = MagicMock(in_transaction=True)
+
+        with patch.object(ConcreteDocument, "get_motor_collection", return_value=collection):
+            repository = ConcreteRepository(database=None, read_options=secondary_reads)  # type: ignore
+            # pylint: disable=protected-access
+            get_read_collection = repository._get_read_collection  # pyright: ignore[reportPrivateUsage]
+
+            # When / Then
+            assert get_read_collection(session=None, read_options=None) == (SecondaryPreferred(), None)
+            assert get_read_collection(session=None, read_options=nearest_reads) == (Nearest(), None)
+            with using_read_options(nearest_reads):
+                assert get_read_collection(session=None, read_options=None) == (Nearest(), None)
+            assert get_read_collection(session=transaction_session, read_options=nearest_reads) is collection
+            # The collections routed are reused
+            get_read_collection(session=None, read_options=None)
+            assert collection.with_options.call_count == 2  # noqa: PLR2004
+
+    async def test_measured(self) -> None:
+        """Test the operations are recorded with their collection and name, the cancellations are not errors."""
+
+        # Given
+        class ConcreteDocument(BaseDocument):
+            pass
+
+        class ConcreteEntity(BaseModel):
+            pass
+
+        class ConcreteRepository(AbstractRepository[ConcreteDocument, ConcreteEntity]):
+            @measured()
+            async def succeed(self) -> int:
+                return 1
+
+            @measured(operation="fail")
+            async def raise_error(self, error: BaseException) -> None:
+                raise error
+
+            @measured()
+            async def stream(self) -> Any:
+                yield 1
+                yield 2
+
+        metrics: MagicMock = MagicMock()
+
+        with patch.object(ConcreteDocument, "get_collection_name", return_value="concrete"):
+            repository = ConcreteRepository(database=None, metrics=metrics)  # type: ignore
+
+            # When
+            assert await repository.succeed() == 1
+            with pytest.raises(OperationError):
+                await repository.raise_error(OperationError("Failed"))
+            with pytest.raises(asyncio.CancelledError):
+                await repository.raise_error(asyncio.CancelledError())
+            assert [item async for item in repository.stream()] == [1, 2]
+
+        # Then
+        recorded: list[tuple[str, str, type[BaseException] | None]] = [
+            (call.kwargs["collection"], call.kwargs["operation"], type(call.kwargs["error"]))
+            for call in metrics.record.call_args_list
+        ]
+        assert recorded == [
+            ("concrete", "succeed", type(None)),
+            ("concrete", "fail", OperationError),
+            ("concrete", "fail", type(None)),
+            ("concrete", "stream", type(None)),
+        ]
+
+    @patch("asyncio.sleep", new_callable=AsyncMock)
+    async def test_resilient(self, sleep: AsyncMock) -> None:
+        """Test the idempotent operations are retried on transient errors, but not the writes nor in a session."""
+        del sleep
+
+        # Given
+        class ConcreteDocument(BaseDocument):
+            pass
+
+        class ConcreteEntity(BaseModel):
+            pass
+
+        class ConcreteRepository(AbstractRepository[ConcreteDocument, ConcreteEntity]):
+            def __init__(self, **kwargs: Any) -> None:
+                super().__init__(**kwargs)
+                self.attempts: int = 0
+
+            async def _fail_once(self) -> int:
+                self.attempts += 1
+                if self.attempts == 1:
+                    raise OperationError("Failed") from AutoReconnect("Election")
+                return self.attempts
+
+            @resilient(retry=True)
+            async def read(self, session: Any = None) -> int:
+                del session
+                return await self._fail_once()
+
+            @resilient()
+            async def write(self) -> int:
+                return await self._fail_once()
+
+        resilience = Resilience(retry_policy=RetryPolicy(max_attempts=3))
+
+        with patch.object(ConcreteDocument, "get_collection_name", return_value="concrete"):
+            # When / Then
+            assert await ConcreteRepository(database=None, resilience=resilience).read() == 2  # noqa: PLR2004
+            with pytest.raises(OperationError):
+                await ConcreteRepository(database=None, resilience=resilience).read(session=MagicMock())
+            with pytest.raises(OperationError):
+                await ConcreteRepository(database=None, resilience=resilience).write()
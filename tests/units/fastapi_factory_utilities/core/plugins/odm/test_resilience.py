@@ -0,0 +1,208 @@
+"""Provides unit tests for the retries and the circuit breaker of the repository operations."""
+
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from pymongo.errors import AutoReconnect, DuplicateKeyError, NotPrimaryError, OperationFailure
+
+from fastapi_factory_utilities.core.plugins.odm_plugin.exceptions import CircuitOpenError, OperationError
+from fastapi_factory_utilities.core.plugins.odm_plugin.resilience import (
+    CircuitBreaker,
+    CircuitBreakerPolicy,
+    CircuitState,
+    Resilience,
+    RetryPolicy,
+    is_retryable_error,
+)
+
+ATTRIBUTES: dict[str, str] = {"db.collection.name": "books", "db.operation.name": "get_one_by_id"}
+
+
+class FakeClock:
+    """Clock moved forward by the tests."""
+
+    def __init__(self) -> None:
+        """Initialize the clock at zero."""
+        self.now: float = 0.0
+
+    def __call__(self) -> float:
+        """Get the time."""
+        return self.now
+
+
+def wrapped(error: BaseException) -> OperationError:
+    """Wrap a driver error as the repositories do.
+
+    Args:
+        error (BaseException): The driver error.
+
+    Returns:
+        OperationError: The error raised by the repositories.
+    """
+    try:
+        raise OperationError("Failed") from error
+    except OperationError as operation_error:
+        return operation_error
+
+
+def test_is_retryable_error() -> None:
+    """The network errors and the elections are retryable, through the causes, the other errors are not."""
+    assert is_retryable_error(wrapped(AutoReconnect("Connection reset")))
+    assert is_retryable_error(NotPrimaryError("Not primary"))
+    assert is_retryable_error(OperationFailure("Interrupted due to repl state change", code=11602))
+    assert not is_retryable_error(wrapped(DuplicateKeyError("Duplicate key", code=11000)))
+    assert not is_retryable_error(OperationFailure("Bad value", code=2))
+    assert not is_retryable_error(ValueError("Invalid"))
+
+
+def test_retry_policy_delays() -> None:
+    """The delays are drawn between the base and the maximum delays, growing with the previous one."""
+    retry_policy = RetryPolicy(base_delay_s=0.1, max_delay_s=1.0)
+    delay_s: float | None = None
+    for _ in range(100):
+        next_delay_s: float = retry_policy.next_delay(delay_s)
+        assert 0.1 <= next_delay_s <= min(1.0, (delay_s or 0.1) * 3)  # noqa: PLR2004
+        delay_s = next_delay_s
+
+
+class TestCircuitBreaker:
+    """Unit tests for the CircuitBreaker class."""
+
+    def test_opens_on_failure_rate(self) -> None:
+        """The circuit opens once the failure rate of the window crosses the threshold, the old outcomes expiring."""
+        clock = FakeClock()
+        circuit_breaker = CircuitBreaker(
+            policy=CircuitBreakerPolicy(failure_rate_threshold=0.5, minimum_calls=4, window_s=10), clock=clock
+        )
+        for failed in (True, True, False):
+            circuit_breaker.record(failed=failed)
+        clock.now = 11
+        circuit_breaker.record(failed=True)
+        circuit_breaker.record(failed=False)
+        assert circuit_breaker.state == CircuitState.CLOSED
+
+        circuit_breaker.record(failed=True)
+        circuit_breaker.record(failed=True)
+
+        assert circuit_breaker.state == CircuitState.OPEN
+        with pytest.raises(CircuitOpenError):
+            circuit_breaker.acquire()
+
+    def test_half_open_probes(self) -> None:
+        """After the open duration, one probe goes through, closing the circuit or opening it again."""
+        clock = FakeClock()
+        circuit_breaker = CircuitBreaker(policy=CircuitBreakerPolicy(minimum_calls=1, open_duration_s=5), clock=clock)
+        circuit_breaker.record(failed=True)
+        clock.now = 5
+
+        assert circuit_breaker.state == CircuitState.HALF_OPEN
+        circuit_breaker.acquire()
+        with pytest.raises(CircuitOpenError):
+            circuit_breaker.acquire()
+        circuit_breaker.record(failed=True)
+        assert circuit_breaker.state == CircuitState.OPEN
+
+        clock.now = 10
+        circuit_breaker.acquire()
+        circuit_breaker.release()
+        circuit_breaker.acquire()
+        circuit_breaker.record(failed=False)
+        assert circuit_breaker.state == CircuitState.CLOSED
+
+
+def test_release_without_outcome() -> None:
+    """An operation failed fast by the circuit breaker frees its probe, without closing the circuit."""
+    clock = FakeClock()
+    circuit_breaker = CircuitBreaker(
+        policy=CircuitBreakerPolicy(minimum_calls=1, open_duration_s=5, half_open_max_calls=1), clock=clock
+    )
+    resilience = Resilience(circuit_breaker=circuit_breaker)
+    circuit_breaker.record(failed=True)
+    clock.now = 5
+
+    resilience.acquire(ATTRIBUTES)
+    resilience.release(CircuitOpenError("The circuit breaker of the ODM operations is half-open, probing."))
+
+    assert circuit_breaker.state == CircuitState.HALF_OPEN
+    resilience.acquire(ATTRIBUTES)
+
+
+class TestResilience:
+    """Unit tests for the Resilience class."""
+
+    @staticmethod
+    def build(circuit_breaker: CircuitBreaker | None = None) -> tuple[Resilience, InMemoryMetricReader]:
+        """Build a resilience retrying three times, with its metric reader."""
+        reader = InMemoryMetricReader()
+        resilience = Resilience(
+            retry_policy=RetryPolicy(max_attempts=3),
+            circuit_breaker=circuit_breaker,
+            meter=MeterProvider(metric_readers=[reader]).get_meter("test"),
+        )
+        return resilience, reader
+
+    @staticmethod
+    def data_points(reader: InMemoryMetricReader) -> dict[str, list[Any]]:
+        """Get the data points by metric name."""
+        metrics_data = reader.get_metrics_data()
+        assert metrics_data is not None
+        return {
+            metric.name: list(metric.data.data_points)
+            for resource_metrics in metrics_data.resource_metrics
+            for scope_metrics in resource_metrics.scope_metrics
+            for metric in scope_metrics.metrics
+        }
+
+    @patch("asyncio.sleep", new_callable=AsyncMock)
+    async def test_retries_transient_errors(self, sleep: AsyncMock) -> None:
+        """The transient errors are retried, after a delay, and counted."""
+        resilience, reader = self.build()
+        operation = AsyncMock(side_effect=[wrapped(AutoReconnect("Election")), "book"])
+
+        assert await resilience.run(operation, attributes=ATTRIBUTES) == "book"
+
+        assert operation.await_count == 2  # noqa: PLR2004
+        sleep.assert_awaited_once()
+        retries = self.data_points(reader)[Resilience.METER_COUNTER_RETRIES_NAME][0]
+        assert retries.value == 1
+        assert retries.attributes == {**ATTRIBUTES, "error.type": "OperationError"}
+
+    @patch("asyncio.sleep", new_callable=AsyncMock)
+    async def test_bounded_and_selective_retries(self, sleep: AsyncMock) -> None:
+        """The retries stop after the maximum attempts, and the other errors or operations are not retried."""
+        resilience, _ = self.build()
+        transient = AsyncMock(side_effect=wrapped(AutoReconnect("Election")))
+        duplicate = AsyncMock(side_effect=wrapped(DuplicateKeyError("Duplicate key", code=11000)))
+        write = AsyncMock(side_effect=wrapped(AutoReconnect("Election")))
+
+        with pytest.raises(OperationError):
+            await resilience.run(transient, attributes=ATTRIBUTES)
+        with pytest.raises(OperationError):
+            await resilience.run(duplicate, attributes=ATTRIBUTES)
+        with pytest.raises(OperationError):
+            await resilience.run(write, attributes=ATTRIBUTES, retry=False)
+
+        assert transient.await_count == 3  # noqa: PLR2004
+        assert duplicate.await_count == 1
+        assert write.await_count == 1
+        assert sleep.await_count == 2  # noqa: PLR2004
+
+    @patch("asyncio.sleep", new_callable=AsyncMock)
+    async def test_fails_fast_when_open(self, sleep: AsyncMock) -> None:
+        """Once the circuit is open, the operations fail fast, counted, and the state is exported."""
+        del sleep
+        resilience, reader = self.build(CircuitBreaker(policy=CircuitBreakerPolicy(minimum_calls=2)))
+        operation = AsyncMock(side_effect=wrapped(AutoReconnect("Election")))
+
+        with pytest.raises(CircuitOpenError):
+            await resilience.run(operation, attributes=ATTRIBUTES)
+        with pytest.raises(CircuitOpenError):
+            await resilience.run(operation, attributes=ATTRIBUTES)
+
+        assert operation.await_count == 2  # noqa: PLR2004
+        data_points: dict[str, list[Any]] = self.data_points(reader)
+        assert data_points[Resilience.METER_GAUGE_CIRCUIT_STATE_NAME][0].value == 2  # noqa: PLR2004
+        assert data_points[Resilience.METER_COUNTER_REJECTIONS_NAME][0].value == 2  # noqa: PLR2004
@@ -0,0 +1,60 @@
+"""Provides unit tests for the response of the raw documents."""
+
+import datetime
+import json
+from decimal import Decimal
+from uuid import UUID, uuid4
+
+import pytest
+from bson import BSON, Binary, Decimal128, ObjectId
+from bson.raw_bson import RawBSONDocument
+
+from fastapi_factory_utilities.core.plugins.odm_plugin.responses import BSONJSONResponse
+
+
+class TestBSONJSONResponse:
+    """Unit tests for the BSONJSONResponse class."""
+
+    def test_render_bson_values(self) -> None:
+        """The BSON values are rendered as strings."""
+        book_id: UUID = uuid4()
+        object_id: ObjectId = ObjectId()
+        created_at: datetime.datetime = datetime.datetime(2024, 1, 2, 3, 4, 5)
+
+        response = BSONJSONResponse(
+            content=[
+                {
+                    "_id": Binary.from_uuid(book_id),
+                    "author_id": object_id,
+                    "created_at": created_at,
+                    "price": Decimal128(Decimal("9.99")),
+                }
+            ]
+        )
+
+        assert json.loads(response.body) == [
+            {
+                "_id": str(book_id),
+                "author_id": str(object_id),
+                "created_at": "2024-01-02T03:04:05",
+                "price": "9.99",
+            }
+        ]
+
+    def test_render_raw_bson_documents(self) -> None:
+        """The raw BSON documents, and their embedded documents, are decoded when rendered."""
+        book_id: UUID = uuid4()
+        raw_document = RawBSONDocument(
+            BSON.encode({"_id": Binary.from_uuid(book_id), "title": "Dune", "author": {"name": "Herbert"}})
+        )
+
+        response = BSONJSONResponse(content={"items": [raw_document]})
+
+        assert response.body == (
+            f'{{"items":[{{"_id":"{book_id}","title":"Dune","author":{{"name":"Herbert"}}}}]}}'.encode()
+        )
+
+    def test_render_unknown_value(self) -> None:
+        """The values unknown to the encoder are refused."""
+        with pytest.raises(TypeError):
+            BSONJSONResponse(content={"value": object()})
@@ -0,0 +1,147 @@
+"""Provides unit tests for the slow-query log of the ODM plugin."""
+
+import asyncio
+from datetime import timedelta
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pymongo import monitoring
+
+from fastapi_factory_utilities.core.plugins.odm_plugin.slow_queries import (
+    SlowQueryListener,
+    build_explain_command,
+    summarize_explain,
+)
+
+ADDRESS: tuple[str, int] = ("localhost", 27017)
+
+FIND_EXPLAIN: dict[str, Any] = {
+    "queryPlanner": {
+        "winningPlan": {
+            "stage": "FETCH",
+            "inputStage": {"stage": "IXSCAN", "indexName": "book_type_1", "keyPattern": {"book_type": 1}},
+        },
+        "rejectedPlans": [{"stage": "COLLSCAN"}],
+    },
+    "executionStats": {"nReturned": 2, "totalKeysExamined": 2, "totalDocsExamined": 2},
+}
+
+
+class TestSummarizeExplain:
+    """Unit tests for the summarize_explain function."""
+
+    def test_index_scan(self) -> None:
+        """The stages and the indexes of the winning plan are summarized, not the ones of the rejected plans."""
+        summary = summarize_explain(FIND_EXPLAIN)
+
+        assert summary.stages == ["FETCH", "IXSCAN"]
+        assert summary.indexes == ["book_type_1"]
+        assert not summary.collection_scan
+        assert (summary.docs_examined, summary.keys_examined, summary.docs_returned) == (2, 2, 2)
+
+    def test_aggregation_collection_scan(self) -> None:
+        """The plan of an aggregation is read from its $cursor stage."""
+        summary = summarize_explain(
+            {
+                "stages": [
+                    {
+                        "$cursor": {
+                            "queryPlanner": {"winningPlan": {"stage": "COLLSCAN"}},
+                            "executionStats": {"nReturned": 1, "totalKeysExamined": 0, "totalDocsExamined": 1000},
+                        }
+                    },
+                    {"$group": {"_id": "$book_type"}},
+                ]
+            }
+        )
+
+        assert summary.collection_scan
+        assert summary.indexes == []
+        assert summary.docs_examined == 1000  # noqa: PLR2004
+
+
+class TestBuildExplainCommand:
+    """Unit tests for the build_explain_command function."""
+
+    def test_session_fields_are_removed(self) -> None:
+        """The fields bound to the session and the connection are removed."""
+        explain_command = build_explain_command(
+            "find", {"find": "books", "filter": {"book_type": "NOVEL"}, "lsid": {"id": 1}, "$db": "library"}
+        )
+
+        assert explain_command == {
+            "explain": {"find": "books", "filter": {"book_type": "NOVEL"}},
+            "verbosity": "executionStats",
+        }
+
+    @pytest.mark.parametrize(
+        "command_name, command",
+        [
+            ("insert", {"insert": "books", "documents": [{}]}),
+            ("update", {"update": "books", "updates": [{"q": {}, "u": {}}, {"q": {}, "u": {}}]}),
+            ("aggregate", {"aggregate": "books", "pipeline": [{"$match": {}}, {"$out": "archives"}]}),
+        ],
+    )
+    def test_unexplainable_commands(self, command_name: str, command: dict[str, Any]) -> None:
+        """The commands which cannot be explained are refused."""
+        assert build_explain_command(command_name, command) is None
+
+
+class TestSlowQueryListener:
+    """Unit tests for the SlowQueryListener class."""
+
+    @staticmethod
+    def run_command(listener: SlowQueryListener, command: dict[str, Any], duration_micros: int) -> None:
+        """Notify the listener of a command started and succeeded.
+
+        Args:
+            listener (SlowQueryListener): The listener.
+            command (dict[str, Any]): The command.
+            duration_micros (int): The duration of the command, in microseconds.
+        """
+        command_name: str = next(iter(command))
+        listener.started(monitoring.CommandStartedEvent(command, "library", 1, ADDRESS, None))
+        listener.succeeded(
+            monitoring.CommandSucceededEvent(
+                timedelta(microseconds=duration_micros),
+                {"ok": 1},
+                command_name,
+                1,
+                ADDRESS,
+                None,
+                database_name="library",
+            )
+        )
+
+    async def test_slow_queries_are_explained(self) -> None:
+        """The slow commands sampled are explained, the fast ones are not."""
+        database: MagicMock = MagicMock(command=AsyncMock(return_value=FIND_EXPLAIN))
+        client: MagicMock = MagicMock(get_io_loop=MagicMock(return_value=asyncio.get_running_loop()))
+        client.__getitem__.return_value = database
+        listener = SlowQueryListener(threshold_ms=100, explain_sample_rate=1.0)
+        listener.attach(client)
+
+        self.run_command(listener, {"find": "books", "filter": {"book_type": "NOVEL"}}, duration_micros=50_000)
+        self.run_command(listener, {"find": "books", "filter": {"book_type": "POEM"}}, duration_micros=150_000)
+        await asyncio.sleep(0.01)
+
+        database.command.assert_awaited_once_with(
+            {"explain": {"find": "books", "filter": {"book_type": "POEM"}}, "verbosity": "executionStats"}
+        )
+
+    async def test_slow_queries_are_not_explained_without_sampling(self) -> None:
+        """The slow commands are only logged when none is sampled."""
+        client: MagicMock = MagicMock(get_io_loop=MagicMock(return_value=asyncio.get_running_loop()))
+        listener = SlowQueryListener(threshold_ms=100)
+        listener.attach(client)
+
+        self.run_command(listener, {"find": "books", "filter": {}}, duration_micros=150_000)
+        await asyncio.sleep(0.01)
+
+        client.__getitem__.assert_not_called()
+
+    def test_invalid_sample_rate(self) -> None:
+        """The sample rate must be between 0 and 1."""
+        with pytest.raises(ValueError):
+            SlowQueryListener(threshold_ms=100, explain_sample_rate=2.0)
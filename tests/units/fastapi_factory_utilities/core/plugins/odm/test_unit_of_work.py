@@ -0,0 +1,124 @@
+"""Provides unit tests for the unit_of_work module."""
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pymongo.errors import OperationFailure
+
+from fastapi_factory_utilities.core.plugins.odm_plugin.exceptions import OperationError
+from fastapi_factory_utilities.core.plugins.odm_plugin.unit_of_work import (
+    TRANSIENT_TRANSACTION_ERROR_LABEL,
+    UNKNOWN_TRANSACTION_COMMIT_RESULT_LABEL,
+    call_after_commit,
+    get_unit_of_work_session,
+    run_in_unit_of_work,
+    unit_of_work,
+)
+
+
+def build_client() -> tuple[MagicMock, MagicMock]:
+    """Build a client mock and the mock of the sessions it starts."""
+    session: MagicMock = MagicMock()
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=False)
+    session.commit_transaction = AsyncMock()
+    session.abort_transaction = AsyncMock()
+    client: MagicMock = MagicMock()
+    client.start_session = AsyncMock(return_value=session)
+    return client, session
+
+
+def build_error(label: str) -> OperationFailure:
+    """Build a MongoDB error with the label."""
+    return OperationFailure("error", details={"errorLabels": [label]})
+
+
+class TestUnitOfWork:
+    """Unit tests for the unit_of_work function."""
+
+    async def test_commit_and_share_the_session(self) -> None:
+        """Test the session is shared inside the block and the transaction committed."""
+        client, session = build_client()
+
+        async with unit_of_work(client) as session_yielded:
+            assert session_yielded is session
+            assert get_unit_of_work_session() is session
+            async with unit_of_work(client) as nested_session:
+                assert nested_session is session
+
+        assert get_unit_of_work_session() is None
+        client.start_session.assert_awaited_once()
+        session.start_transaction.assert_called_once()
+        session.commit_transaction.assert_awaited_once()
+        session.abort_transaction.assert_not_awaited()
+
+    async def test_abort_on_error(self) -> None:
+        """Test the transaction is aborted when the block raises."""
+        client, session = build_client()
+
+        with pytest.raises(ValueError):
+            async with unit_of_work(client):
+                raise ValueError("error")
+
+        assert get_unit_of_work_session() is None
+        session.abort_transaction.assert_awaited_once()
+        session.commit_transaction.assert_not_awaited()
+
+    async def test_commit_retried_on_unknown_result(self) -> None:
+        """Test the commit is retried while its result is unknown."""
+        client, session = build_client()
+        session.commit_transaction.side_effect = [build_error(UNKNOWN_TRANSACTION_COMMIT_RESULT_LABEL), None]
+
+        async with unit_of_work(client):
+            pass
+
+        assert session.commit_transaction.await_count == 2  # noqa: PLR2004
+
+    async def test_call_after_commit(self) -> None:
+        """Test the callbacks are called once committed, never when aborted, and at once outside of a unit of work."""
+        client, session = build_client()
+        callback: MagicMock = MagicMock(side_effect=session.commit_transaction.assert_awaited_once)
+
+        async with unit_of_work(client):
+            call_after_commit(callback)
+            callback.assert_not_called()
+        callback.assert_called_once()
+
+        aborted_callback: MagicMock = MagicMock()
+        with pytest.raises(ValueError):
+            async with unit_of_work(client):
+                call_after_commit(aborted_callback)
+                raise ValueError("error")
+        aborted_callback.assert_not_called()
+
+        call_after_commit(aborted_callback)
+        aborted_callback.assert_called_once()
+
+
+class TestRunInUnitOfWork:
+    """Unit tests for the run_in_unit_of_work function."""
+
+    async def test_retry_on_transient_transaction_error(self) -> None:
+        """Test the callback is run again in a new unit of work on a transient transaction error."""
+        client, _ = build_client()
+        # As raised by the repositories, wrapping the MongoDB error
+        error: OperationError = OperationError("error")
+        error.__cause__ = build_error(TRANSIENT_TRANSACTION_ERROR_LABEL)
+        callback: AsyncMock = AsyncMock(side_effect=[error, "result"])
+
+        result: Any = await run_in_unit_of_work(client=client, callback=callback)
+
+        assert result == "result"
+        assert callback.await_count == 2  # noqa: PLR2004
+        assert client.start_session.await_count == 2  # noqa: PLR2004
+
+    async def test_no_retry_on_other_errors(self) -> None:
+        """Test the other errors are raised without retry."""
+        client, _ = build_client()
+        callback: AsyncMock = AsyncMock(side_effect=build_error("OtherLabel"))
+
+        with pytest.raises(OperationFailure):
+            await run_in_unit_of_work(client=client, callback=callback)
+
+        callback.assert_awaited_once()
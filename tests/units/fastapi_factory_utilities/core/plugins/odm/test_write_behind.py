@@ -0,0 +1,159 @@
+"""Provides unit tests for the write-behind buffer of the repositories."""
+
+import asyncio
+from collections.abc import Sequence
+from uuid import UUID, uuid4
+
+import pytest
+from pydantic import BaseModel
+
+from fastapi_factory_utilities.core.plugins.odm_plugin.exceptions import (
+    OperationError,
+    UnableToCreateEntityDueToDuplicateKeyError,
+    WriteBehindBufferClosedError,
+)
+from fastapi_factory_utilities.core.plugins.odm_plugin.write_behind import (
+    WriteBehindBuffer,
+    close_write_behind_buffers,
+)
+
+
+class EntityForTest(BaseModel):
+    """Entity for test."""
+
+    id: UUID
+
+
+class FakeWriteBatch:
+    """Batch write recording its batches, rejecting the duplicates as such."""
+
+    def __init__(self, duplicate_ids: frozenset[UUID] = frozenset()) -> None:
+        """Initialize without batches."""
+        self.batches: list[list[EntityForTest]] = []
+        self.duplicate_ids: frozenset[UUID] = duplicate_ids
+        self.error: BaseException | None = None
+        self.release: asyncio.Event = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self, entities: list[EntityForTest]) -> Sequence[EntityForTest | BaseException]:
+        """Record the batch and write it once released."""
+        self.batches.append(entities)
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return [
+            UnableToCreateEntityDueToDuplicateKeyError("duplicate") if entity.id in self.duplicate_ids else entity
+            for entity in entities
+        ]
+
+
+class TestWriteBehindBuffer:
+    """Various tests for the WriteBehindBuffer class."""
+
+    async def test_flush_on_size(self) -> None:
+        """A full batch is written without waiting for the delay."""
+        write_batch = FakeWriteBatch()
+        buffer: WriteBehindBuffer[EntityForTest] = WriteBehindBuffer(
+            write_batch=write_batch, max_batch_size=2, max_delay_s=60
+        )
+        entities: list[EntityForTest] = [EntityForTest(id=uuid4()) for _ in range(2)]
+
+        written = [await buffer.insert(entity) for entity in entities]
+
+        assert await asyncio.wait_for(asyncio.gather(*written), timeout=1) == entities
+        assert write_batch.batches == [entities]
+        await buffer.close()
+
+    async def test_flush_on_delay(self) -> None:
+        """A batch not full is written after the delay."""
+        write_batch = FakeWriteBatch()
+        buffer: WriteBehindBuffer[EntityForTest] = WriteBehindBuffer(
+            write_batch=write_batch, max_batch_size=100, max_delay_s=0.01
+        )
+        entity: EntityForTest = EntityForTest(id=uuid4())
+
+        assert await asyncio.wait_for(await buffer.insert(entity), timeout=1) == entity
+        assert write_batch.batches == [[entity]]
+        await buffer.close()
+
+    async def test_errors_by_entity(self) -> None:
+        """The futures are resolved with the error of their entity, or of their batch."""
+        duplicate: EntityForTest = EntityForTest(id=uuid4())
+        write_batch = FakeWriteBatch(duplicate_ids=frozenset({duplicate.id}))
+        buffer: WriteBehindBuffer[EntityForTest] = WriteBehindBuffer(
+            write_batch=write_batch, max_batch_size=2, max_delay_s=60
+        )
+        entity: EntityForTest = EntityForTest(id=uuid4())
+
+        written, rejected = await buffer.insert(entity), await buffer.insert(duplicate)
+        assert await written == entity
+        with pytest.raises(UnableToCreateEntityDueToDuplicateKeyError):
+            await rejected
+
+        write_batch.error = OperationError("Failed to bulk write documents")
+        failed = [await buffer.insert(EntityForTest(id=uuid4())) for _ in range(2)]
+        for future in failed:
+            with pytest.raises(OperationError):
+                await future
+        await buffer.close()
+
+    async def test_backpressure(self) -> None:
+        """The inserts wait while the pending entities are at the maximum."""
+        write_batch = FakeWriteBatch()
+        write_batch.release.clear()
+        buffer: WriteBehindBuffer[EntityForTest] = WriteBehindBuffer(
+            write_batch=write_batch, max_batch_size=2, max_delay_s=60, max_pending=2
+        )
+        written = [await buffer.insert(EntityForTest(id=uuid4())) for _ in range(2)]
+
+        blocked_insert = asyncio.ensure_future(buffer.insert(EntityForTest(id=uuid4())))
+        await asyncio.sleep(0.01)
+        assert not blocked_insert.done()
+
+        write_batch.release.set()
+        await asyncio.gather(*written)
+        assert not (await asyncio.wait_for(blocked_insert, timeout=1)).done()
+        await buffer.close()
+
+    async def test_close_flushes(self) -> None:
+        """Closing writes the entities queued, and refuses the next ones."""
+        write_batch = FakeWriteBatch()
+        buffer: WriteBehindBuffer[EntityForTest] = WriteBehindBuffer(
+            write_batch=write_batch, max_batch_size=100, max_delay_s=60
+        )
+        written = await buffer.insert(EntityForTest(id=uuid4()))
+
+        await close_write_behind_buffers()
+
+        assert written.done()
+        assert len(buffer) == 0
+        with pytest.raises(WriteBehindBufferClosedError):
+            await buffer.insert(EntityForTest(id=uuid4()))
+
+    async def test_restarts_after_cancellation(self) -> None:
+        """The entities queued when the writes are cancelled are cancelled, the next inserts being written."""
+        write_batch = FakeWriteBatch()
+        write_batch.release.clear()
+        buffer: WriteBehindBuffer[EntityForTest] = WriteBehindBuffer(
+            write_batch=write_batch, max_batch_size=1, max_delay_s=60
+        )
+        in_flight = await buffer.insert(EntityForTest(id=uuid4()))
+        await asyncio.sleep(0.01)
+        queued = await buffer.insert(EntityForTest(id=uuid4()))
+
+        # pylint: disable-next=protected-access
+        task: asyncio.Task[None] | None = buffer._task  # pyright: ignore[reportPrivateUsage]
+        assert task is not None
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        assert in_flight.cancelled() and queued.cancelled()
+
+        write_batch.release.set()
+        entity: EntityForTest = EntityForTest(id=uuid4())
+        assert await asyncio.wait_for(await buffer.insert(entity), timeout=1) == entity
+        await buffer.close()
+
+    def test_invalid_thresholds(self) -> None:
+        """The thresholds must be positive, and the pending entities at least a batch."""
+        with pytest.raises(ValueError):
+            WriteBehindBuffer(write_batch=FakeWriteBatch(), max_batch_size=10, max_pending=5)
@@ -1,12 +1,17 @@
 """Provides unit tests for the YamlFileReader class."""
 
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 from unittest.mock import mock_open, patch
 
 import pytest
 
-from fastapi_factory_utilities.core.utils.yaml_reader import YamlFileReader
+from fastapi_factory_utilities.core.utils.yaml_reader import (
+    UnableToReadYamlFileError,
+    YamlFileReader,
+    yaml_documents_cache,
+)
 
 
 class TestYamlFileReader:
@@ -242,3 +247,76 @@ class TestYamlFileReader:
                 mock_open_mock.assert_called_once_with(file=Path("file_path"), encoding="UTF-8")
 
                 assert read_data == {yaml_test_key: yaml_test_value}
+
+
+class TestYamlFileReaderWithCache:
+    """Provides unit tests for the YamlFileReader class with the documents cache."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self) -> Iterator[None]:
+        """Isolate the process-wide documents cache between the tests."""
+        yaml_documents_cache.invalidate()
+        yield
+        yaml_documents_cache.invalidate()
+
+    def test_sections_are_sliced_from_one_parse(self, tmp_path: Path) -> None:
+        """Tests reading several sections parses the file only once."""
+        file_path: Path = tmp_path / "application.yaml"
+        file_path.write_text("first:\n  key: value1\nsecond:\n  key: value2\n", encoding="UTF-8")
+
+        with patch.object(
+            YamlFileReader, "_read_yaml_file", autospec=True, side_effect=YamlFileReader._read_yaml_file
+        ) as mock:
+            first: dict[str, Any] = YamlFileReader(file_path=file_path, yaml_base_key="first", use_cache=True).read()
+            second: dict[str, Any] = YamlFileReader(file_path=file_path, yaml_base_key="second", use_cache=True).read()
+            again: dict[str, Any] = YamlFileReader(file_path=file_path, yaml_base_key="first", use_cache=True).read()
+
+            assert mock.call_count == 1
+
+        assert first == {"key": "value1"}
+        assert second == {"key": "value2"}
+        assert again == first
+        assert again is not first
+
+    def test_environment_change_is_injected_again(self, tmp_path: Path) -> None:
+        """Tests a change of a referenced environment variable is reflected without parsing again."""
+        file_path: Path = tmp_path / "application.yaml"
+        file_path.write_text("base:\n  key: ${ENV_VALUE:default}\n", encoding="UTF-8")
+
+        with patch.object(
+            YamlFileReader, "_read_yaml_file", autospec=True, side_effect=YamlFileReader._read_yaml_file
+        ) as mock:
+            with patch.dict("os.environ", {"ENV_VALUE": "value1"}):
+                assert YamlFileReader(file_path=file_path, yaml_base_key="base", use_cache=True).read() == {
+                    "key": "value1"
+                }
+            with patch.dict("os.environ", {"ENV_VALUE": "value2"}):
+                assert YamlFileReader(file_path=file_path, yaml_base_key="base", use_cache=True).read() == {
+                    "key": "value2"
+                }
+
+            assert mock.call_count == 1
+
+    def test_file_change_and_invalidation_parse_again(self, tmp_path: Path) -> None:
+        """Tests a modified file or an invalidated cache is parsed again."""
+        file_path: Path = tmp_path / "application.yaml"
+        file_path.write_text("base:\n  key: value\n", encoding="UTF-8")
+        YamlFileReader(file_path=file_path, yaml_base_key="base", use_cache=True).read()
+
+        file_path.write_text("base:\n  key: changed value\n", encoding="UTF-8")
+        assert YamlFileReader(file_path=file_path, yaml_base_key="base", use_cache=True).read() == {
+            "key": "changed value"
+        }
+
+        with patch.object(
+            YamlFileReader, "_read_yaml_file", autospec=True, side_effect=YamlFileReader._read_yaml_file
+        ) as mock:
+            yaml_documents_cache.invalidate(file_path=file_path)
+            YamlFileReader(file_path=file_path, yaml_base_key="base", use_cache=True).read()
+
+            assert mock.call_count == 1
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        """Tests reading a missing file raises an error."""
+        with pytest.raises(UnableToReadYamlFileError):
+            YamlFileReader(file_path=tmp_path / "missing.yaml", use_cache=True).read()
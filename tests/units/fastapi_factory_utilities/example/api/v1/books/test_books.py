@@ -1,15 +1,18 @@
 """Tests for the books API."""
 
 from http import HTTPStatus
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 from fastapi.testclient import TestClient
 
 from fastapi_factory_utilities.core.app.base.plugins_manager_abstract import (
     PluginsActivationList,
 )
+from fastapi_factory_utilities.core.plugins.odm_plugin.exceptions import InvalidPageCursorError
+from fastapi_factory_utilities.core.plugins.odm_plugin.pagination import Page
 from fastapi_factory_utilities.example.api.books.routes import get_book_service
 from fastapi_factory_utilities.example.app.app import App
+from fastapi_factory_utilities.example.entities.books import BookEntity, BookName, BookType
 from fastapi_factory_utilities.example.services.books.services import BookService
 
 
@@ -20,12 +23,69 @@ class TestBookApi:
         """Test get_books."""
         application: App = App.build(plugin_activation_list=PluginsActivationList(activate=[]))
 
-        application.get_asgi_app().dependency_overrides[get_book_service] = lambda: MagicMock(
-            spec=BookService, return_value=[]
-        )
+        books_service: MagicMock = MagicMock(spec=BookService)
+        books_service.get_books_page = AsyncMock(return_value=Page[BookEntity](items=[]))
+        application.get_asgi_app().dependency_overrides[get_book_service] = lambda: books_service
 
         with TestClient(application) as client:
             response = client.get("/api/v1/books")
 
             assert response.status_code == HTTPStatus.OK
             assert response.json()["books"] == []
+            assert response.json()["next_cursor"] is None
+
+    def test_get_books_with_cursor(self) -> None:
+        """Test get_books forwards the limit and the cursor and returns the next cursor."""
+        application: App = App.build(plugin_activation_list=PluginsActivationList(activate=[]))
+        book: BookEntity = BookEntity(title=BookName("Book"), book_type=BookType.FANTASY)
+        books_service: MagicMock = MagicMock(spec=BookService)
+        books_service.get_books_page = AsyncMock(return_value=Page[BookEntity](items=[book], next_cursor="next"))
+        application.get_asgi_app().dependency_overrides[get_book_service] = lambda: books_service
+
+        with TestClient(application) as client:
+            response = client.get("/api/v1/books", params={"limit": 1, "cursor": "current"})
+
+            assert response.status_code == HTTPStatus.OK
+            assert response.json()["books"] == [{"id": str(book.id), "title": "Book", "book_type": "fantasy"}]
+            assert response.json()["next_cursor"] == "next"
+            books_service.get_books_page.assert_awaited_once_with(limit=1, cursor="current")
+
+    def test_get_books_with_invalid_cursor(self) -> None:
+        """Test get_books answers a bad request on an invalid cursor."""
+        application: App = App.build(plugin_activation_list=PluginsActivationList(activate=[]))
+        books_service: MagicMock = MagicMock(spec=BookService)
+        books_service.get_books_page = AsyncMock(side_effect=InvalidPageCursorError("Invalid page cursor"))
+        application.get_asgi_app().dependency_overrides[get_book_service] = lambda: books_service
+
+        with TestClient(application) as client:
+            response = client.get("/api/v1/books", params={"cursor": "invalid"})
+
+            assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_get_books_stats(self) -> None:
+        """Test get_books_stats answers the number of books by type and their total."""
+        application: App = App.build(plugin_activation_list=PluginsActivationList(activate=[]))
+        books_service: MagicMock = MagicMock(spec=BookService)
+        books_service.count_books_per_type = AsyncMock(return_value={BookType.FANTASY: 2, BookType.MYSTERY: 1})
+        application.get_asgi_app().dependency_overrides[get_book_service] = lambda: books_service
+
+        with TestClient(application) as client:
+            response = client.get("/api/v1/books/stats")
+
+            assert response.status_code == HTTPStatus.OK
+            assert response.json() == {"total": 3, "per_book_type": {"fantasy": 2, "mystery": 1}}
+
+    def test_get_book(self) -> None:
+        """Test get_book answers the book, or not found."""
+        application: App = App.build(plugin_activation_list=PluginsActivationList(activate=[]))
+        book: BookEntity = BookEntity(title=BookName("Book"), book_type=BookType.FANTASY)
+        books_service: MagicMock = MagicMock(spec=BookService)
+        books_service.get_book = AsyncMock(side_effect=[book, ValueError(f"Book with id {book.id} does not exist.")])
+        application.get_asgi_app().dependency_overrides[get_book_service] = lambda: books_service
+
+        with TestClient(application) as client:
+            response = client.get(f"/api/v1/books/{book.id}")
+            assert response.status_code == HTTPStatus.OK
+            assert response.json() == {"id": str(book.id), "title": "Book", "book_type": "fantasy"}
+
+            assert client.get(f"/api/v1/books/{book.id}").status_code == HTTPStatus.NOT_FOUND
@@ -1,131 +1,133 @@
 """Test the services module."""
 
-from unittest.mock import MagicMock
+from typing import Any, cast
+from unittest.mock import AsyncMock, MagicMock
 from uuid import UUID
 
+import pytest
+from beanie import init_beanie  # pyright: ignore[reportUnknownVariableType]
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from fastapi_factory_utilities.core.plugins.odm_plugin.in_memory import InMemoryClient
+from fastapi_factory_utilities.core.plugins.odm_plugin.pagination import Page
 from fastapi_factory_utilities.example.entities.books import (
     BookEntity,
     BookName,
     BookType,
 )
+from fastapi_factory_utilities.example.models.books.document import BookDocument
 from fastapi_factory_utilities.example.models.books.repository import BookRepository
 from fastapi_factory_utilities.example.services.books.services import BookService
 
+MISSING_BOOK_ID: UUID = UUID("00000000-0000-0000-0000-000000000000")
+
+
+@pytest.fixture(name="book_service")
+async def fixture_book_service() -> BookService:
+    """Provide a book service on an in-memory database, with two books."""
+    database: AsyncIOMotorDatabase[Any] = cast(AsyncIOMotorDatabase[Any], InMemoryClient()["test"])
+    await init_beanie(database=database, document_models=[BookDocument])
+    book_service = BookService(book_repository=BookRepository(database))
+    await book_service.add_book(book=BookEntity(title=BookName("Book 1"), book_type=BookType.FANTASY))
+    await book_service.add_book(book=BookEntity(title=BookName("Book 2"), book_type=BookType.MYSTERY))
+    return book_service
+
 
 class TestBookService:
     """Test the BookService class."""
 
-    def test_get_all_books(self) -> None:
+    async def test_get_all_books(self, book_service: BookService) -> None:
         """Test get_all_books."""
-        book_service = BookService(
-            book_repository=MagicMock(BookRepository),
-        )
-        books: list[BookEntity] = book_service.get_all_books()
+        books: list[BookEntity] = await book_service.get_all_books()
 
-        assert len(books) >= 0
+        assert [book.title for book in books] == ["Book 1", "Book 2"]
 
-    def test_get_book(self) -> None:
+    async def test_get_book(self, book_service: BookService) -> None:
         """Test get_book."""
-        book_service = BookService(book_repository=MagicMock(BookRepository))
-        books: list[BookEntity] = book_service.get_all_books()
+        books: list[BookEntity] = await book_service.get_all_books()
 
         for book in books:
-            assert book == book_service.get_book(book_id=book.id)
+            assert book == await book_service.get_book(book_id=book.id)
 
-    def test_add_book(
-        self,
-    ) -> None:
-        """Test add_book."""
-        # meter_mock: MagicMock = MagicMock(spec=Meter)
+    async def test_get_book_does_not_exist(self, book_service: BookService) -> None:
+        """Test get_book with a book that does not exist."""
+        with pytest.raises(ValueError, match=f"Book with id {MISSING_BOOK_ID} does not exist."):
+            await book_service.get_book(book_id=MISSING_BOOK_ID)
 
-        book_service = BookService(book_repository=MagicMock(BookRepository))
-        books: list[BookEntity] = book_service.get_all_books()
+    async def test_add_book(self, book_service: BookService) -> None:
+        """Test add_book, the book being listed and paged."""
+        books: list[BookEntity] = await book_service.get_all_books()
 
         book = BookEntity(title=BookName("Test Book"), book_type=BookType.FANTASY)
-        book_service.add_book(book=book)
-
-        assert book == book_service.get_book(book_id=book.id)
-        assert book in book_service.get_all_books()
-        assert len(book_service.get_all_books()) == len(books) + 1
+        await book_service.add_book(book=book)
 
-        # counter_add_call = next((call for call in meter_mock.create_counter.mock_calls if call[0] == "().add"), None)
+        assert book == await book_service.get_book(book_id=book.id)
+        assert book in await book_service.get_all_books()
+        assert len(await book_service.get_all_books()) == len(books) + 1
+        assert book in (await book_service.get_books_page(limit=10)).items
 
-        # assert counter_add_call is not None
-        # assert counter_add_call[2]["amount"] == 1
-
-    def test_add_book_already_exists(self) -> None:
+    async def test_add_book_already_exists(self, book_service: BookService) -> None:
         """Test add_book with a book that already exists."""
-        book_service = BookService(book_repository=MagicMock(BookRepository))
-        books: list[BookEntity] = book_service.get_all_books()
+        books: list[BookEntity] = await book_service.get_all_books()
 
         book = books[0]
 
-        try:
-            book_service.add_book(book=book)
-            assert False
-        except ValueError as error:
-            assert str(error) == f"Book with id {book.id} already exists."
+        with pytest.raises(ValueError, match=f"Book with id {book.id} or title {book.title} already exists."):
+            await book_service.add_book(book=book)
 
-        assert book in book_service.get_all_books()
-        assert len(book_service.get_all_books()) == len(books)
+        assert len(await book_service.get_all_books()) == len(books)
 
-    def test_remove_book(self) -> None:
+    async def test_remove_book(self, book_service: BookService) -> None:
         """Test remove_book."""
-        book_service = BookService(book_repository=MagicMock(BookRepository))
-        books: list[BookEntity] = book_service.get_all_books()
+        books: list[BookEntity] = await book_service.get_all_books()
 
         book = books[0]
-        book_service.remove_book(book_id=book.id)
+        await book_service.remove_book(book_id=book.id)
 
-        assert book not in book_service.get_all_books()
-        assert len(book_service.get_all_books()) == len(books) - 1
+        assert book not in await book_service.get_all_books()
+        assert len(await book_service.get_all_books()) == len(books) - 1
 
-    def test_remove_book_does_not_exist(self) -> None:
+    async def test_remove_book_does_not_exist(self, book_service: BookService) -> None:
         """Test remove_book with a book that does not exist."""
-        book_service = BookService(book_repository=MagicMock(BookRepository))
-        books: list[BookEntity] = book_service.get_all_books()
-
-        book_id = "00000000-0000-0000-0000-000000000000"
+        books: list[BookEntity] = await book_service.get_all_books()
 
-        try:
-            book_service.remove_book(book_id=UUID(book_id))
-            assert False
-        except ValueError as error:
-            assert str(error) == f"Book with id {book_id} does not exist."
+        with pytest.raises(ValueError, match=f"Book with id {MISSING_BOOK_ID} does not exist."):
+            await book_service.remove_book(book_id=MISSING_BOOK_ID)
 
-        assert len(book_service.get_all_books()) == len(books)
+        assert len(await book_service.get_all_books()) == len(books)
 
-    def test_update_book(self) -> None:
+    async def test_update_book(self, book_service: BookService) -> None:
         """Test update_book."""
-        book_service = BookService(book_repository=MagicMock(BookRepository))
-        books: list[BookEntity] = book_service.get_all_books()
+        books: list[BookEntity] = await book_service.get_all_books()
 
         book = books[0]
         book.title = BookName("Updated Title")
-        book.book_type = BookType.FANTASY
+        book.book_type = BookType.SCIENCE_FICTION
 
-        book_service.update_book(book=book)
+        await book_service.update_book(book=book)
 
-        assert book == book_service.get_book(book_id=book.id)
-        assert book in book_service.get_all_books()
-        assert len(book_service.get_all_books()) == len(books)
+        assert book == await book_service.get_book(book_id=book.id)
+        assert len(await book_service.get_all_books()) == len(books)
 
-    def test_update_book_does_not_exist(self) -> None:
+    async def test_update_book_does_not_exist(self, book_service: BookService) -> None:
         """Test update_book with a book that does not exist."""
-        book_service = BookService(book_repository=MagicMock(BookRepository))
-        books: list[BookEntity] = book_service.get_all_books()
+        books: list[BookEntity] = await book_service.get_all_books()
 
-        book = BookEntity(
-            id=UUID("00000000-0000-0000-0000-000000000000"),
-            title=BookName("Updated Title"),
-            book_type=BookType.FANTASY,
-        )
+        book = BookEntity(id=MISSING_BOOK_ID, title=BookName("Updated Title"), book_type=BookType.FANTASY)
 
-        try:
-            book_service.update_book(book=book)
-            assert False
-        except ValueError as error:
-            assert str(error) == f"Book with id {book.id} does not exist."
+        with pytest.raises(ValueError, match=f"Book with id {book.id} does not exist."):
+            await book_service.update_book(book=book)
+
+        assert len(await book_service.get_all_books()) == len(books)
+
+    async def test_get_books_page(self) -> None:
+        """Test get_books_page delegates to the repository keyset pagination."""
+        book_repository: MagicMock = MagicMock(BookRepository)
+        page: Page[BookEntity] = Page[BookEntity](
+            items=[BookEntity(title=BookName("Book"), book_type=BookType.FANTASY)], next_cursor="next"
+        )
+        book_repository.find_page = AsyncMock(return_value=page)
+        book_service = BookService(book_repository=book_repository)
 
-        assert len(book_service.get_all_books()) == len(books)
-        assert len(book_service.get_all_books()) == len(books)
+        assert await book_service.get_books_page(limit=1, cursor="current") == page
+        book_repository.find_page.assert_awaited_once_with(limit=1, cursor="current")